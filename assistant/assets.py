@@ -0,0 +1,51 @@
+import json
+import os
+
+from django.conf import settings
+
+# Written by `vite build` (build.manifest in frontend/vite.config.js)
+VITE_MANIFEST = os.path.join(".vite", "manifest.json")
+
+# manifest path -> (mtime, URLs), so a rebuild is picked up without a restart
+_manifest_cache = {}
+
+
+def fingerprinted_files(root) -> set:
+    """Paths (relative to root) of every content-hashed file listed in Vite's manifest."""
+    with open(os.path.join(root, VITE_MANIFEST)) as f:
+        manifest = json.load(f)
+    files = set()
+    for chunk in manifest.values():
+        files.add(chunk["file"])
+        files.update(chunk.get("css", []))
+        files.update(chunk.get("assets", []))
+    return files
+
+
+def fingerprinted_urls() -> frozenset:
+    """URLs of the hashed files in the current build (empty if there is no manifest)."""
+    path = os.path.join(settings.WHITENOISE_ROOT, VITE_MANIFEST)
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return frozenset()
+    cached = _manifest_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        try:
+            urls = frozenset("/" + name for name in fingerprinted_files(settings.WHITENOISE_ROOT))
+        except (OSError, ValueError, KeyError):
+            urls = frozenset()
+        cached = _manifest_cache[path] = (mtime, urls)
+    return cached[1]
+
+
+def immutable_file_test(path, url):
+    """WhiteNoise hook: hashed files never change under the same name, so cache them forever."""
+    return url in fingerprinted_urls()
+
+
+def add_headers(headers, path, url):
+    """WhiteNoise hook: anything without a content hash (index.html, files from public/)
+    can change under the same name, so browsers must revalidate it."""
+    if url not in fingerprinted_urls():
+        headers["Cache-Control"] = "no-cache"
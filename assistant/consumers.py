@@ -1,11 +1,16 @@
 import asyncio
 import os
 import re
+from collections import deque
+from urllib.parse import parse_qs
 
 import ptyprocess
+from channels.exceptions import ChannelFull
 from channels.generic.websocket import AsyncWebsocketConsumer
 from dotenv import load_dotenv
 
+from assistant.registry import get_pty_registry
+
 load_dotenv()  # ensure .env is loaded when the consumer module is imported
 
 # Strip ANSI escape sequences before sending to the browser
@@ -16,11 +21,40 @@ def _strip_ansi(text: str) -> str:
     return _ANSI_RE.sub('', text)
 
 
+# Programs that accept bracketed paste (readline, IPython) announce it with these
+_PASTE_ON  = '\x1b[?2004h'
+_PASTE_OFF = '\x1b[?2004l'
+
+# Terminal ids come from the browser and become part of a channel-layer group name
+TERMINAL_ID_RE = re.compile(r'^[\w-]{1,64}$')
+
+
+def terminal_group(terminal_id: str) -> str:
+    """Channel-layer group a terminal joins so GangaBot can pipe code into it."""
+    return f'terminal_{terminal_id}'
+
+
 # ── Shell to launch ────────────────────────────────────────────────────────────────
 # Set GANGAFLOW_SHELL in .env to launch a different shell, e.g.:
 #   GANGAFLOW_SHELL=/path/to/.venv/bin/ganga
 DEFAULT_SHELL = 'bash'
 
+# A relay waits this long for the owner to acknowledge terminal.attach
+# before it treats the owner as gone and claims the session again
+ATTACH_TIMEOUT  = 3    # seconds
+ATTACH_ATTEMPTS = 3
+
+# How often an owner tells the PTY registry it is still alive
+HEARTBEAT_INTERVAL = 10   # seconds
+
+# Shells that read Python; anything else is treated as a POSIX shell
+_PYTHON_SHELLS = ('ganga', 'python', 'ipython')
+
+
+def shell_lang(shell: str) -> str:
+    """Which kind of GangaBot code block ('python' or 'shell') the given shell can run."""
+    return 'python' if os.path.basename(shell).lower().startswith(_PYTHON_SHELLS) else 'shell'
+
 
 class TerminalConsumer(AsyncWebsocketConsumer):
     """
@@ -28,13 +62,54 @@ class TerminalConsumer(AsyncWebsocketConsumer):
 
     Browser → WS text  →  PTY stdin
     PTY stdout         →  WS text  →  Browser
+    GangaBot code      →  channel layer  →  PTY stdin
+
+    The browser may pass ``?id=<terminal_id>``; the consumer then joins the
+    matching channel-layer group and runs the code blocks that the chat
+    stream sends to it.
+
+    With several workers, each terminal id is owned by the consumer that
+    spawned its PTY (recorded in the PTY registry). A connection for the same
+    id that lands elsewhere spawns nothing and relays through the channel layer:
+
+    Relay WS text  →  terminal.input   →  owner PTY stdin
+    owner PTY out  →  terminal.output  →  Relay WS text
+
+    The owner acknowledges every terminal.attach with terminal.attached; a
+    relay that hears nothing back drops the stale owner, sends it
+    terminal.evict in case it was only slow, and claims again. Relays ignore
+    any message that does not come from the owner they are attached to.
     """
 
     async def connect(self):
         await self.accept()
+        self.connected = True
         self.running = False
         self._pty = None
+        self._group = None
+        self._terminal_id = None
+        self._owner = None               # owning consumer's channel, when relaying
+        self._attached = asyncio.Event()  # set once the owner acknowledges us
+        self._relays = set()             # relay channels, when owning
+        self._pending = deque()          # code blocks awaiting confirmation
+        self._bracketed_paste = False
+        self._shell_lang = None
+
+        # GangaBot code blocks wait until the user presses Enter on an empty prompt.
+        # Set GANGAFLOW_AUTORUN_CODE=1 in .env to run them as soon as they arrive.
+        self.autorun_code = os.environ.get('GANGAFLOW_AUTORUN_CODE') == '1'
+
+        # Claim the session, or relay to the worker that already owns it
+        terminal_id = parse_qs(self.scope.get('query_string', b'').decode()).get('id', [''])[0]
+        if self.channel_layer is not None and TERMINAL_ID_RE.match(terminal_id):
+            self._terminal_id = terminal_id
+            if await self._claim_or_attach():
+                return
+
+        await self._start_shell()
 
+    async def _start_shell(self):
+        """Spawn this connection's own PTY and start serving it."""
         # Read shell at connection time so .env changes apply after a server restart
         shell = os.environ.get('GANGAFLOW_SHELL', DEFAULT_SHELL)
 
@@ -44,12 +119,19 @@ class TerminalConsumer(AsyncWebsocketConsumer):
                 [shell],
                 dimensions=(24, 140),   # rows × cols
             )
+            self._shell_lang = shell_lang(shell)
             self.running = True
         except Exception as exc:
             await self.send(text_data=f'[GangaFlow] Failed to start shell: {exc}\r\n')
             await self.close()
             return
 
+        # Register for code blocks piped in from GangaBot
+        if self._terminal_id:
+            self._group = terminal_group(self._terminal_id)
+            await self.channel_layer.group_add(self._group, self.channel_name)
+            asyncio.ensure_future(self._heartbeat())
+
         # Start the background reader
         asyncio.ensure_future(self._read_loop())
 
@@ -59,18 +141,28 @@ class TerminalConsumer(AsyncWebsocketConsumer):
         )
 
     async def disconnect(self, close_code):
+        self.connected = False
         self.running = False
-        if self._pty and self._pty.isalive():
-            try:
-                self._pty.terminate(force=True)
-            except Exception:
-                pass
+        if self._owner:
+            await self.channel_layer.send(self._owner, {'type': 'terminal.detach', 'channel': self.channel_name})
+            return
+        await self._end_session()
 
     async def receive(self, text_data=None, bytes_data=None):
         """Forward browser keystrokes / commands to the PTY."""
+        if self._owner:
+            if bytes_data is not None:
+                text_data = bytes_data.decode('utf-8', errors='replace')
+            await self.channel_layer.send(self._owner, {'type': 'terminal.input', 'text': text_data})
+            return
+
         if not self._pty or not self._pty.isalive():
             return
         try:
+            # A bare Enter confirms the oldest code block GangaBot offered
+            if text_data == '\r' and self._pending:
+                self._paste(*self._pending.popleft())
+                return
             if text_data is not None:
                 self._pty.write(text_data.encode('utf-8', errors='replace'))
             elif bytes_data is not None:
@@ -78,8 +170,160 @@ class TerminalConsumer(AsyncWebsocketConsumer):
         except EOFError:
             pass
 
+    # ── Channel-layer handlers ────────────────────────────────────────────────
+
+    async def terminal_attach(self, event):
+        """Owner: a connection on another worker wants this session's output."""
+        if not self.running:
+            await self.channel_layer.send(event['channel'], {'type': 'terminal.closed', 'channel': self.channel_name})
+            return
+        self._relays.add(event['channel'])
+        await self.channel_layer.send(event['channel'], {'type': 'terminal.attached', 'channel': self.channel_name})
+
+    async def terminal_attached(self, event):
+        """Relay: the owner acknowledged terminal.attach."""
+        if self._from_owner(event):
+            self._attached.set()
+
+    async def terminal_detach(self, event):
+        """Owner: a relay's browser went away."""
+        self._relays.discard(event['channel'])
+
+    async def terminal_input(self, event):
+        """Owner: keystrokes typed into a relay's browser."""
+        await self.receive(text_data=event['text'])
+
+    async def terminal_output(self, event):
+        """Relay: PTY output from the owning worker."""
+        if self._from_owner(event):
+            await self.send(text_data=event['text'])
+
+    async def terminal_closed(self, event):
+        """Relay: the owning connection ended the session."""
+        if self._from_owner(event):
+            self._owner = None
+            await self.send(text_data='\r\n[GangaFlow] Shell session ended.\r\n')
+            await self.close()
+
+    async def terminal_evict(self, event):
+        """Owner: a relay gave up waiting for us and has taken the session over."""
+        if self._owner or not self._terminal_id:
+            return
+        await self._send_all('\r\n[GangaFlow] Shell session taken over by another connection.\r\n')
+        await self._end_session()
+        await self.close()
+
+    async def terminal_run(self, event):
+        """Channel-layer handler: a complete code block from the GangaBot stream."""
+        if not self._pty or not self._pty.isalive():
+            return
+        lang, code = event['lang'], event['code']
+        notice = f'\r\n[GangaBot] {lang} block ready ({len(code.splitlines())} lines)'
+        if lang != self._shell_lang:
+            # e.g. Python typed into bash — never run it, just say it is there
+            await self._send_all(f'{notice}; not run, this terminal expects {self._shell_lang}.\r\n')
+            return
+        if not self.autorun_code:
+            self._pending.append((lang, code))
+            await self._send_all(f'{notice}. Press Enter on an empty prompt to run it.\r\n')
+            return
+        try:
+            self._paste(lang, code)
+        except EOFError:
+            pass
+
     # ── Private ───────────────────────────────────────────────────────────────
 
+    async def _claim_or_attach(self, attempt=1):
+        """Claim the session; if another consumer owns it, relay to it and return True."""
+        owner = await get_pty_registry().claim(self._terminal_id, self.channel_name)
+        if owner == self.channel_name:
+            return False
+        self._owner = owner
+        self._attached.clear()
+        await self.channel_layer.send(owner, {'type': 'terminal.attach', 'channel': self.channel_name})
+        # Wait in the background — the ack is dispatched like any other message
+        asyncio.ensure_future(self._await_attach(owner, attempt))
+        return True
+
+    async def _await_attach(self, owner, attempt):
+        try:
+            await asyncio.wait_for(self._attached.wait(), ATTACH_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+        if not self.connected:
+            return   # browser left while we were waiting
+        if self._attached.is_set():
+            await self.send(text_data='[GangaFlow] Attached to a running shell session.\r\n')
+            return
+
+        # The owner was closing, or its worker is gone: drop its entry and claim again.
+        # If it was only slow, evict it so two PTYs never serve the same terminal id.
+        self._owner = None
+        await get_pty_registry().release(self._terminal_id, owner)
+        try:
+            await self.channel_layer.send(owner, {'type': 'terminal.evict'})
+        except ChannelFull:
+            pass
+        if attempt >= ATTACH_ATTEMPTS:
+            await self.send(text_data='[GangaFlow] Could not reach the shell session.\r\n')
+            await self.close()
+        elif not await self._claim_or_attach(attempt + 1):
+            await self._start_shell()
+
+    def _from_owner(self, event):
+        """Relay: whether an event comes from the owner we are attached to."""
+        return self._owner is not None and event.get('channel') == self._owner
+
+    async def _end_session(self):
+        """Owner: leave the group, free the terminal id, close relays and kill the PTY."""
+        self.running = False
+        if self._group:
+            await self.channel_layer.group_discard(self._group, self.channel_name)
+            self._group = None
+        if self._terminal_id:
+            await get_pty_registry().release(self._terminal_id, self.channel_name)
+        relays, self._relays = self._relays, set()
+        for relay in relays:
+            try:
+                await self.channel_layer.send(relay, {'type': 'terminal.closed', 'channel': self.channel_name})
+            except ChannelFull:
+                pass
+        if self._pty and self._pty.isalive():
+            try:
+                self._pty.terminate(force=True)
+            except Exception:
+                pass
+
+    async def _send_all(self, text):
+        """Owner: show text in this browser and in every relay's."""
+        await self.send(text_data=text)
+        for relay in list(self._relays):
+            try:
+                await self.channel_layer.send(
+                    relay, {'type': 'terminal.output', 'text': text, 'channel': self.channel_name}
+                )
+            except ChannelFull:
+                pass   # a lagging relay drops output rather than stalling the shell
+
+    async def _heartbeat(self):
+        """Keep this owner's registry entry from expiring while the shell runs."""
+        while self.running:
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            if self.running:
+                await get_pty_registry().refresh(self._terminal_id, self.channel_name)
+
+    def _paste(self, lang, code):
+        """Write a whole code block to the PTY in a single write, then run it."""
+        body = code.replace('\r\n', '\n').replace('\n', '\r')
+        if self._bracketed_paste:
+            # The shell inserts the block as one unit (no auto-indent, no early execution)
+            body = f'\x1b[200~{body}\x1b[201~'
+        body += '\r'
+        if lang == 'python':
+            body += '\r'   # blank line closes any open Python block
+        self._pty.write(body.encode('utf-8', errors='replace'))
+
     async def _read_loop(self):
         """Continuously read PTY output and forward to the WebSocket."""
         loop = asyncio.get_event_loop()
@@ -87,8 +331,11 @@ class TerminalConsumer(AsyncWebsocketConsumer):
             try:
                 raw = await loop.run_in_executor(None, self._pty.read, 4096)
                 text = raw.decode('utf-8', errors='replace')
+                on, off = text.rfind(_PASTE_ON), text.rfind(_PASTE_OFF)
+                if on != off:
+                    self._bracketed_paste = on > off
                 text = _strip_ansi(text)
-                await self.send(text_data=text)
+                await self._send_all(text)
             except EOFError:
                 # Shell exited normally
                 self.running = False
@@ -0,0 +1,167 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from channels.exceptions import ChannelFull
+from channels.layers import BaseChannelLayer
+
+
+class SQLiteChannelLayer(BaseChannelLayer):
+    """
+    Channel layer shared by every worker process on one host via a SQLite file.
+
+    A dependency-free stand-in for channels_redis: messages and group
+    memberships live in two tables, and receivers poll for new rows.
+    Messages must be JSON-serialisable.
+    """
+
+    extensions = ["groups", "flush"]
+
+    # Receivers poll quickly right after traffic, backing off while idle
+    MIN_POLL = 0.005
+    MAX_POLL = 0.05
+
+    def __init__(self, path, expiry=60, group_expiry=86400, capacity=100, channel_capacity=None, **kwargs):
+        super().__init__(expiry=expiry, capacity=capacity, channel_capacity=channel_capacity, **kwargs)
+        self.path = str(path)
+        self.group_expiry = group_expiry
+        self._lock = threading.Lock()
+        self._conn = None
+        # One thread is enough — every query holds the lock anyway — and keeps
+        # polling off the default executor, where PTY reads block for long periods
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-layer")
+
+    # ── Channel layer API ─────────────────────────────────────────────────────
+
+    async def send(self, channel, message):
+        """Send a message onto a channel."""
+        assert isinstance(message, dict), "message is not a dict"
+        self.require_valid_channel_name(channel)
+        body = json.dumps(message)
+        if not await self._run(self._insert, channel, body, self.get_capacity(channel)):
+            raise ChannelFull(channel)
+
+    async def receive(self, channel):
+        """Wait for and return the oldest unexpired message on the channel."""
+        self.require_valid_channel_name(channel)
+        delay = self.MIN_POLL
+        while True:
+            body = await self._run(self._pop, channel)
+            if body is not None:
+                return json.loads(body)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.MAX_POLL)
+
+    async def new_channel(self, prefix="specific."):
+        return f"{prefix}sqlite!{uuid.uuid4().hex}"
+
+    async def flush(self):
+        await self._run(self._execute, "DELETE FROM messages", "DELETE FROM groups")
+
+    async def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── Groups extension ──────────────────────────────────────────────────────
+
+    async def group_add(self, group, channel):
+        self.require_valid_group_name(group)
+        self.require_valid_channel_name(channel)
+        await self._run(self._write, "INSERT OR REPLACE INTO groups (grp, channel, joined) VALUES (?, ?, ?)",
+                        (group, channel, time.time()))
+
+    async def group_discard(self, group, channel):
+        self.require_valid_group_name(group)
+        self.require_valid_channel_name(channel)
+        await self._run(self._write, "DELETE FROM groups WHERE grp = ? AND channel = ?", (group, channel))
+
+    async def group_send(self, group, message):
+        assert isinstance(message, dict), "message is not a dict"
+        self.require_valid_group_name(group)
+        channels = await self._run(self._members, group)
+        for channel in channels:
+            try:
+                await self.send(channel, message)
+            except ChannelFull:
+                pass
+
+    # ── Private (run in a worker thread) ──────────────────────────────────────
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _connect(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS messages ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT, channel TEXT NOT NULL,"
+                " expires REAL NOT NULL, body TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS messages_channel ON messages (channel, id)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS groups ("
+                " grp TEXT NOT NULL, channel TEXT NOT NULL, joined REAL NOT NULL,"
+                " PRIMARY KEY (grp, channel))"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _execute(self, *statements):
+        with self._lock:
+            conn = self._connect()
+            for sql in statements:
+                conn.execute(sql)
+
+    def _write(self, sql, params):
+        with self._lock:
+            self._connect().execute(sql, params)
+
+    def _insert(self, channel, body, capacity):
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM messages WHERE expires < ?", (now,))
+                (queued,) = conn.execute("SELECT COUNT(*) FROM messages WHERE channel = ?", (channel,)).fetchone()
+                if queued >= capacity:
+                    return False
+                conn.execute("INSERT INTO messages (channel, expires, body) VALUES (?, ?, ?)",
+                             (channel, now + self.expiry, body))
+                return True
+            finally:
+                conn.execute("COMMIT")
+
+    def _pop(self, channel):
+        with self._lock:
+            conn = self._connect()
+            # Cheap read first so idle receivers never take the write lock
+            if conn.execute("SELECT 1 FROM messages WHERE channel = ? LIMIT 1", (channel,)).fetchone() is None:
+                return None
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT id, body FROM messages WHERE channel = ? AND expires >= ? ORDER BY id LIMIT 1",
+                    (channel, time.time()),
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute("DELETE FROM messages WHERE id = ?", (row[0],))
+                return row[1]
+            finally:
+                conn.execute("COMMIT")
+
+    def _members(self, group):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM groups WHERE joined < ?", (time.time() - self.group_expiry,))
+            return [channel for (channel,) in conn.execute("SELECT channel FROM groups WHERE grp = ?", (group,))]
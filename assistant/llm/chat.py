@@ -37,6 +37,18 @@ class GangaBot():
         # 3. Add bot reply to history for context
         self.history.append({"role": "assistant", "content": reply})
         return reply
+
+    def stream(self, user_message: str):
+        """Like send(), but yields the reply in pieces as the model produces them."""
+        self.history.append({"role": "user", "content": user_message})
+
+        parts = []
+        for delta in self.client.stream_completion(self.history):
+            parts.append(delta)
+            yield delta
+
+        # Only remember the reply once it has fully arrived
+        self.history.append({"role": "assistant", "content": "".join(parts)})
 	
     def reset(self):
         """Clear history but keep system prompt (start a new conversation)."""
@@ -2,6 +2,24 @@ import requests
 import json
 
 
+def _raise_for_status(response):
+    """Raise the error type matching a non-200 response from the Blablador API."""
+    if response.status_code == 400:
+        raise ValueError(f"Bad Request (400): Invalid parameters or malformed request. Response: {response.text}")
+    elif response.status_code == 401:
+        raise PermissionError(f"Unauthorized (401): Invalid or missing API key. Response: {response.text}")
+    elif response.status_code == 403:
+        raise PermissionError(f"Forbidden (403): Access denied. Response: {response.text}")
+    elif response.status_code == 404:
+        raise ValueError(f"Not Found (404): Endpoint or model not found. Response: {response.text}")
+    elif response.status_code == 429:
+        raise RuntimeError(f"Too Many Requests (429): Rate limit exceeded. Response: {response.text}")
+    elif response.status_code >= 500:
+        raise RuntimeError(f"Server Error ({response.status_code}): The API server encountered an error. Response: {response.text}")
+    else:
+        raise RuntimeError(f"Unexpected Error ({response.status_code}): {response.text}")
+
+
 class Models():
    
     def __init__(self, api_key):
@@ -72,22 +90,46 @@ class ChatCompletions():
         response = requests.post(url = self.url, headers = self.headers, data=payload)
         
         # Error handling for different status codes
-        if response.status_code == 200:
-            return response.text
-        elif response.status_code == 400:
-            raise ValueError(f"Bad Request (400): Invalid parameters or malformed request. Response: {response.text}")
-        elif response.status_code == 401:
-            raise PermissionError(f"Unauthorized (401): Invalid or missing API key. Response: {response.text}")
-        elif response.status_code == 403:
-            raise PermissionError(f"Forbidden (403): Access denied. Response: {response.text}")
-        elif response.status_code == 404:
-            raise ValueError(f"Not Found (404): Endpoint or model not found. Response: {response.text}")
-        elif response.status_code == 429:
-            raise RuntimeError(f"Too Many Requests (429): Rate limit exceeded. Response: {response.text}")
-        elif response.status_code >= 500:
-            raise RuntimeError(f"Server Error ({response.status_code}): The API server encountered an error. Response: {response.text}")
-        else:
-            raise RuntimeError(f"Unexpected Error ({response.status_code}): {response.text}")
+        if response.status_code != 200:
+            _raise_for_status(response)
+        return response.text
+
+    def stream_completion(self, messages):
+        """Like get_completion, but yields the reply text delta by delta as it is generated."""
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "n": self.choices,
+            "max_tokens": self.max_tokens,
+            "stop": None,
+            "stream": True,
+            "presence_penalty": self.presence_penalty,
+            "frequency_penalty": self.frequency_penalty,
+            "user": self.user
+        }
+        payload = json.dumps(payload)
+
+        with requests.post(url = self.url, headers = self.headers, data=payload, stream=True) as response:
+            if response.status_code != 200:
+                _raise_for_status(response)
+
+            # Server-sent events: one "data: {...}" line per chunk, terminated by "data: [DONE]"
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    chunk = json.loads(data)
+                except ValueError:
+                    raise RuntimeError(f"Invalid stream chunk from {self.url}: {data[:500]}")
+                for choice in chunk.get("choices", []):
+                    delta = choice.get("delta", {}).get("content")
+                    if delta:
+                        yield delta
 
 class Completions():
 
@@ -133,19 +175,6 @@ class Completions():
         response = requests.post(url = self.url, headers = self.headers, data=payload)
         
         # Error handling for different status codes
-        if response.status_code == 200:
-            return response.text
-        elif response.status_code == 400:
-            raise ValueError(f"Bad Request (400): Invalid parameters or malformed request. Response: {response.text}")
-        elif response.status_code == 401:
-            raise PermissionError(f"Unauthorized (401): Invalid or missing API key. Response: {response.text}")
-        elif response.status_code == 403:
-            raise PermissionError(f"Forbidden (403): Access denied. Response: {response.text}")
-        elif response.status_code == 404:
-            raise ValueError(f"Not Found (404): Endpoint or model not found. Response: {response.text}")
-        elif response.status_code == 429:
-            raise RuntimeError(f"Too Many Requests (429): Rate limit exceeded. Response: {response.text}")
-        elif response.status_code >= 500:
-            raise RuntimeError(f"Server Error ({response.status_code}): The API server encountered an error. Response: {response.text}")
-        else:
-            raise RuntimeError(f"Unexpected Error ({response.status_code}): {response.text}")
\ No newline at end of file
+        if response.status_code != 200:
+            _raise_for_status(response)
+        return response.text
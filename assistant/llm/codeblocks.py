@@ -0,0 +1,71 @@
+import re
+
+# Fence languages that can be piped straight into the Ganga shell / bash PTY.
+# Untagged fences are skipped: replies use them for sample output too.
+PYTHON_LANGS = {"python", "py", "python3", "ipython", "ganga"}
+SHELL_LANGS  = {"bash", "sh", "shell", "zsh"}
+
+# Any indentation is accepted, since LLM replies often nest blocks in (numbered) lists
+_FENCE_OPEN_RE  = re.compile(r"^([ \t]*)(`{3,}|~{3,})\s*([\w+-]*)[^\n]*$")
+
+
+class CodeBlockExtractor():
+    """Incrementally detect complete fenced code blocks in streamed text.
+
+    Feed the assistant reply chunk by chunk; each call returns the blocks
+    whose closing fence arrived in that chunk as ``(lang, code)`` tuples.
+    Only Python and shell blocks are returned — anything else is skipped.
+    """
+
+    def __init__(self):
+        self._buffer = ""      # trailing partial line
+        self._fence  = None    # opening fence string while inside a block
+        self._lang   = ""
+        self._indent = 0       # opening fence's indentation, removed from code lines
+        self._lines  = []
+
+    def feed(self, text: str) -> list:
+        """Consume a chunk of reply text and return newly completed blocks."""
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split("\n")
+        blocks = []
+        for line in lines:
+            block = self._consume(line)
+            if block:
+                blocks.append(block)
+        return blocks
+
+    def flush(self) -> list:
+        """Finish the stream; a block left unclosed at the end is discarded."""
+        block = self._consume(self._buffer) if self._buffer else None
+        self._buffer = ""
+        self._fence  = None
+        self._lines  = []
+        return [block] if block else []
+
+    # ── Private ───────────────────────────────────────────────────────────────
+
+    def _consume(self, line: str):
+        line = line.rstrip("\r")
+        if self._fence is None:
+            match = _FENCE_OPEN_RE.match(line)
+            if match:
+                self._indent = len(match.group(1))
+                self._fence  = match.group(2)
+                self._lang   = match.group(3).lower()
+                self._lines  = []
+            return None
+
+        stripped = line.strip()
+        if stripped.startswith(self._fence) and not stripped.lstrip(self._fence[0]):
+            lang, code = self._lang, "\n".join(self._lines)
+            self._fence = None
+            self._lines = []
+            if code.strip() and (lang in PYTHON_LANGS or lang in SHELL_LANGS):
+                return ("python" if lang in PYTHON_LANGS else "shell", code)
+            return None
+
+        # As in CommonMark, drop up to the fence's own indentation from each line
+        indent = len(line) - len(line.lstrip(" \t"))
+        self._lines.append(line[min(indent, self._indent):])
+        return None
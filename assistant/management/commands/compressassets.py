@@ -0,0 +1,48 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from whitenoise.compress import Compressor
+
+from assistant.assets import VITE_MANIFEST, fingerprinted_files
+
+
+class Command(BaseCommand):
+    help = (
+        "Precompress the built frontend (gzip + brotli). The content-hashed files "
+        "listed in Vite's manifest are served with far-future immutable caching. "
+        "Run after every `npm run build`."
+    )
+
+    def handle(self, *args, **options):
+        root = str(settings.WHITENOISE_ROOT)
+        if not os.path.isfile(os.path.join(root, "index.html")):
+            raise CommandError(f"No frontend build in {root} — run `cd frontend && npm run build` first.")
+
+        try:
+            hashed = fingerprinted_files(root)
+        except OSError:
+            hashed = set()
+            self.stdout.write(self.style.WARNING(
+                f"No {VITE_MANIFEST} in the build, so nothing will be cached immutably — "
+                "rebuild with the current frontend/vite.config.js."
+            ))
+
+        compressor = Compressor(quiet=True)
+        if not compressor.use_brotli:
+            self.stdout.write("Brotli is not installed (pip install whitenoise[brotli]); writing gzip only.")
+
+        paths = [
+            os.path.join(dirpath, filename)
+            for dirpath, _dirs, files in os.walk(root)
+            for filename in files
+            if compressor.should_compress(filename)
+        ]
+        with ThreadPoolExecutor() as executor:
+            written = [name for names in executor.map(compressor.compress, paths) for name in names]
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(hashed)} fingerprinted file(s) in the Vite manifest; "
+            f"{len(written)} compressed variant(s) written."
+        ))
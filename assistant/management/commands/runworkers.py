@@ -0,0 +1,72 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Run several Daphne workers that share one listening socket, so chat and "
+        "terminal load spreads across all cores. Each PTY stays on the worker that "
+        "spawned it; other workers reach it through the channel layer."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                            help="Number of Daphne processes (default: one per core).")
+        parser.add_argument("--bind", default="127.0.0.1", help="Address to listen on.")
+        parser.add_argument("--port", type=int, default=8000, help="Port to listen on.")
+
+    def handle(self, *args, **options):
+        workers = max(1, options["workers"])
+        env = os.environ.copy()
+
+        # An in-memory channel layer cannot reach PTYs owned by a sibling worker
+        if workers > 1 and settings.CHANNEL_LAYER_KIND == "memory":
+            if "GANGAFLOW_CHANNEL_LAYER" in os.environ:
+                raise CommandError(
+                    "GANGAFLOW_CHANNEL_LAYER=memory cannot share sessions between workers; "
+                    "use 'sqlite' or 'redis', or --workers 1."
+                )
+            env["GANGAFLOW_CHANNEL_LAYER"] = "sqlite"
+            self.stdout.write("GANGAFLOW_CHANNEL_LAYER is unset; using 'sqlite' so workers can share sessions.")
+
+        # Bind once here; the kernel spreads accepted connections across the workers
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((options["bind"], options["port"]))
+        sock.listen(1024)
+        sock.set_inheritable(True)
+        fd = sock.fileno()
+
+        application = ":".join(settings.ASGI_APPLICATION.rsplit(".", 1))
+        procs = [
+            # Run from the project root so the workers can import it wherever we were started
+            subprocess.Popen(
+                [sys.executable, "-m", "daphne", "--fd", str(fd), application],
+                pass_fds=(fd,), env=env, cwd=settings.BASE_DIR,
+            )
+            for _ in range(workers)
+        ]
+        self.stdout.write(self.style.SUCCESS(
+            f"{workers} worker(s) listening on http://{options['bind']}:{options['port']}"
+        ))
+
+        def stop(signum, frame):
+            for proc in procs:
+                proc.terminate()
+
+        signal.signal(signal.SIGTERM, stop)
+        try:
+            for proc in procs:
+                proc.wait()
+        except KeyboardInterrupt:
+            stop(None, None)
+            for proc in procs:
+                proc.wait()
+        finally:
+            sock.close()
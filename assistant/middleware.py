@@ -0,0 +1,18 @@
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+# Build metadata written next to the frontend (Vite's manifest) — not for browsers
+_PRIVATE_PREFIX = "/.vite/"
+
+
+class FrontendWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoise for the built frontend, minus Vite's build metadata."""
+
+    def add_file_to_dictionary(self, url, path, stat_cache=None):
+        # Files indexed at startup (DEBUG off)
+        if not url.startswith(_PRIVATE_PREFIX):
+            super().add_file_to_dictionary(url, path, stat_cache=stat_cache)
+
+    def find_file(self, url):
+        # Files looked up per request (autorefresh, DEBUG on)
+        if not url.startswith(_PRIVATE_PREFIX):
+            return super().find_file(url)
@@ -0,0 +1,174 @@
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+# Identifies the worker process that owns a PTY
+HOSTNAME = socket.gethostname()
+
+
+def _owner_alive(entry: dict) -> bool:
+    """An owner on this host is alive while its worker process is; remote owners are trusted
+    (the Redis registry expires their entries once they stop refreshing them)."""
+    if entry.get("host") != HOSTNAME:
+        return True
+    try:
+        os.kill(entry["pid"], 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class MemoryPtyRegistry():
+    """Registry for a single worker process — the default."""
+
+    def __init__(self):
+        self._owners = {}
+
+    async def claim(self, terminal_id: str, channel_name: str) -> str:
+        """Register channel_name as the owner unless the session already has one; return the owner."""
+        return self._owners.setdefault(terminal_id, channel_name)
+
+    async def release(self, terminal_id: str, channel_name: str):
+        """Forget the session, but only if channel_name still owns it."""
+        if self._owners.get(terminal_id) == channel_name:
+            del self._owners[terminal_id]
+
+    async def refresh(self, terminal_id: str, channel_name: str):
+        """Heartbeat from a live owner; only registries with expiring entries need it."""
+
+
+class SQLitePtyRegistry():
+    """Registry shared by every worker process on one host via a SQLite file."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = None
+        # Kept off the default executor, where PTY reads block for long periods
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pty-registry")
+
+    async def claim(self, terminal_id: str, channel_name: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._claim, terminal_id, channel_name)
+
+    async def release(self, terminal_id: str, channel_name: str):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._release, terminal_id, channel_name)
+
+    async def refresh(self, terminal_id: str, channel_name: str):
+        """Nothing to do: owners on this host are checked by pid instead."""
+
+    # ── Private ───────────────────────────────────────────────────────────────
+
+    def _connect(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS pty_owners ("
+                " terminal_id TEXT PRIMARY KEY, channel TEXT NOT NULL,"
+                " host TEXT NOT NULL, pid INTEGER NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _claim(self, terminal_id, channel_name):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT channel, host, pid FROM pty_owners WHERE terminal_id = ?", (terminal_id,)
+                ).fetchone()
+                if row and _owner_alive({"host": row[1], "pid": row[2]}):
+                    return row[0]
+                # Unowned, or left behind by a worker that has died — take it over
+                conn.execute(
+                    "INSERT OR REPLACE INTO pty_owners (terminal_id, channel, host, pid) VALUES (?, ?, ?, ?)",
+                    (terminal_id, channel_name, HOSTNAME, os.getpid()),
+                )
+                return channel_name
+            finally:
+                conn.execute("COMMIT")
+
+    def _release(self, terminal_id, channel_name):
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM pty_owners WHERE terminal_id = ? AND channel = ?", (terminal_id, channel_name)
+            )
+
+
+class RedisPtyRegistry():
+    """Registry in Redis, for workers spread over several hosts (pip install redis).
+
+    Entries expire after ``ttl`` seconds unless the owner refreshes them, so the
+    sessions of a crashed host are released on their own.
+    """
+
+    KEY_PREFIX = "gangaflow:pty:"
+
+    def __init__(self, url="redis://localhost:6379/0", ttl=30):
+        self.ttl = ttl
+        try:
+            from redis import asyncio as aioredis
+            from redis.exceptions import WatchError
+        except ImportError:
+            raise ImproperlyConfigured("RedisPtyRegistry requires the 'redis' package (pip install redis).")
+        self._redis = aioredis.from_url(url)
+        self._WatchError = WatchError
+
+    async def claim(self, terminal_id: str, channel_name: str) -> str:
+        key = self.KEY_PREFIX + terminal_id
+        value = json.dumps({"channel": channel_name, "host": HOSTNAME, "pid": os.getpid()})
+        if await self._redis.set(key, value, nx=True, ex=self.ttl):
+            return channel_name
+        current = await self._redis.get(key)
+        if current is None:
+            return await self.claim(terminal_id, channel_name)   # released meanwhile
+        entry = json.loads(current)
+        if _owner_alive(entry):
+            return entry["channel"]
+
+        # Owner died without releasing — take it over unless another worker beats us to it
+        async with self._redis.pipeline(transaction=True) as pipe:
+            await pipe.watch(key)
+            if await pipe.get(key) != current:
+                return await self.claim(terminal_id, channel_name)
+            pipe.multi()
+            pipe.set(key, value, ex=self.ttl)
+            try:
+                await pipe.execute()
+            except self._WatchError:
+                return await self.claim(terminal_id, channel_name)
+        return channel_name
+
+    async def release(self, terminal_id: str, channel_name: str):
+        key = self.KEY_PREFIX + terminal_id
+        current = await self._redis.get(key)
+        if current is not None and json.loads(current)["channel"] == channel_name:
+            await self._redis.delete(key)
+
+    async def refresh(self, terminal_id: str, channel_name: str):
+        key = self.KEY_PREFIX + terminal_id
+        current = await self._redis.get(key)
+        if current is not None and json.loads(current)["channel"] == channel_name:
+            await self._redis.expire(key, self.ttl)
+
+
+@lru_cache(maxsize=None)
+def get_pty_registry():
+    """Return the registry configured by settings.PTY_REGISTRY (in-memory if unset)."""
+    config = getattr(settings, "PTY_REGISTRY", {"BACKEND": "assistant.registry.MemoryPtyRegistry"})
+    backend = import_string(config["BACKEND"])
+    return backend(**config.get("CONFIG", {}))
@@ -1,3 +1,479 @@
-from django.test import TestCase
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import uuid
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from channels.exceptions import ChannelFull
+from channels.layers import get_channel_layer
+from channels.testing import WebsocketCommunicator
+import ptyprocess
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+
+from assistant.assets import VITE_MANIFEST, add_headers, fingerprinted_files, immutable_file_test
+from assistant import consumers
+from assistant.consumers import TerminalConsumer, shell_lang, terminal_group
+from assistant.layers import SQLiteChannelLayer
+from assistant.llm.client import ChatCompletions
+from assistant.llm.codeblocks import CodeBlockExtractor
+from assistant.models import ChatMessage
+from assistant.registry import HOSTNAME, SQLitePtyRegistry, get_pty_registry
+
+
+def _feed_in_chunks(text, size):
+    extractor = CodeBlockExtractor()
+    blocks = []
+    for i in range(0, len(text), size):
+        blocks += extractor.feed(text[i:i + size])
+    return blocks + extractor.flush()
+
+
+class CodeBlockExtractorTests(SimpleTestCase):
+    """Fenced blocks are detected incrementally, whatever the chunking."""
+
+    REPLY = (
+        "Create the job:\n"
+        "```python\n"
+        "j = Job()\n"
+        "for i in range(2):\n"
+        "    print(i)\n"
+        "```\n"
+        "Then list files:\n"
+        "```bash\n"
+        "ls -l\n"
+        "```\n"
+    )
+
+    def test_blocks_independent_of_chunk_boundaries(self):
+        expected = [
+            ("python", "j = Job()\nfor i in range(2):\n    print(i)"),
+            ("shell", "ls -l"),
+        ]
+        for size in (1, 3, 7, len(self.REPLY)):
+            with self.subTest(size=size):
+                self.assertEqual(_feed_in_chunks(self.REPLY, size), expected)
+
+    def test_block_returned_when_closing_fence_arrives(self):
+        extractor = CodeBlockExtractor()
+        self.assertEqual(extractor.feed("```python\nj = Job()\n"), [])
+        self.assertEqual(extractor.feed("``"), [])
+        self.assertEqual(extractor.feed("`\nmore text"), [("python", "j = Job()")])
+
+    def test_closing_fence_without_trailing_newline(self):
+        self.assertEqual(_feed_in_chunks("```bash\necho hi\n```", 4), [("shell", "echo hi")])
+
+    def test_unclosed_block_is_discarded(self):
+        self.assertEqual(_feed_in_chunks("```python\nj = Job()\nj.sub", 5), [])
+
+    def test_tilde_fences(self):
+        text = "~~~python\nprint('```')\n~~~\n"
+        self.assertEqual(_feed_in_chunks(text, 2), [("python", "print('```')")])
+
+    def test_fence_indentation_is_removed(self):
+        text = (
+            "1. Create a job:\n"
+            "   ```python\n"
+            "   for i in range(2):\n"
+            "       print(i)\n"
+            "   ```\n"
+        )
+        self.assertEqual(_feed_in_chunks(text, 4), [("python", "for i in range(2):\n    print(i)")])
+
+    def test_fence_in_nested_list_item(self):
+        text = (
+            "- Submit it:\n"
+            "    1. Run:\n"
+            "       ```bash\n"
+            "       ganga submit.py\n"
+            "      echo less-indented\n"
+            "       ```\n"
+        )
+        self.assertEqual(_feed_in_chunks(text, 5), [("shell", "ganga submit.py\necho less-indented")])
+
+    def test_other_and_untagged_languages_are_skipped(self):
+        text = (
+            "```python\nj = Job()\n```\n"
+            "Output:\n```\nJob submitted id 3\n```\n"
+            "```json\n{}\n```\n"
+        )
+        self.assertEqual(_feed_in_chunks(text, 3), [("python", "j = Job()")])
+
+
+async def _read_until(communicator, needle):
+    """Collect terminal output until needle shows up (fails after a few seconds)."""
+    text = ""
+    while needle not in text:
+        text += await communicator.receive_from(timeout=5)
+    return text
+
+
+@override_settings(CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}})
+class TerminalConsumerTestCase(SimpleTestCase):
+    """Runs TerminalConsumer against a real bash PTY and the in-memory channel layer."""
+
+    def setUp(self):
+        self.terminal_id = uuid.uuid4().hex
+        patcher = mock.patch.dict(os.environ, {"GANGAFLOW_SHELL": "bash"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def connect(self, expect="Shell started"):
+        communicator = WebsocketCommunicator(TerminalConsumer.as_asgi(), f"/ws/terminal/?id={self.terminal_id}")
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        if expect:
+            await _read_until(communicator, expect)
+        return communicator
+
+
+class ShellLangTests(SimpleTestCase):
+
+    def test_python_shells(self):
+        for shell in ("/home/u/.venv/bin/ganga", "python3", "ipython"):
+            with self.subTest(shell=shell):
+                self.assertEqual(shell_lang(shell), "python")
+
+    def test_posix_shells(self):
+        for shell in ("bash", "/bin/zsh"):
+            with self.subTest(shell=shell):
+                self.assertEqual(shell_lang(shell), "shell")
+
+
+class TerminalRunTests(TerminalConsumerTestCase):
+    """GangaBot blocks reach the PTY only once confirmed, and only if the shell can run them."""
+
+    async def run_block(self, lang, code):
+        await get_channel_layer().group_send(
+            terminal_group(self.terminal_id), {"type": "terminal.run", "lang": lang, "code": code}
+        )
+
+    async def test_block_waits_for_enter_then_runs_in_one_write(self):
+        terminal = await self.connect()
+        with mock.patch.object(ptyprocess.PtyProcess, "write", autospec=True,
+                               side_effect=ptyprocess.PtyProcess.write) as write:
+            await self.run_block("shell", "echo one-$((1+1))\necho two-$((1+2))")
+            await _read_until(terminal, "shell block ready (2 lines). Press Enter")
+            write.assert_not_called()
+
+            await terminal.send_to(text_data="\r")
+            await _read_until(terminal, "two-3")
+        self.assertEqual(write.call_count, 1)
+        written = write.call_args.args[1]
+        self.assertIn(b"echo one-$((1+1))\recho two-$((1+2))", written)
+        self.assertTrue(written.endswith(b"\r"))
+        await terminal.disconnect()
+
+    async def test_block_for_another_language_is_not_run(self):
+        terminal = await self.connect()
+        with mock.patch.object(ptyprocess.PtyProcess, "write", autospec=True) as write:
+            await self.run_block("python", "print('hi')")
+            await _read_until(terminal, "not run, this terminal expects shell")
+            await terminal.send_to(text_data="\r")
+            await terminal.receive_nothing(timeout=0.2)   # let the consumer handle it
+        # Nothing was held, so the Enter goes to bash as usual
+        write.assert_called_once()
+        self.assertEqual(write.call_args.args[1], b"\r")
+        await terminal.disconnect()
+
+
+class _FakeChatCompletions():
+    """Stands in for the Blablador client; streams DELTAS, then raises ERROR if set."""
+
+    DELTAS = []
+    ERROR = None
+
+    def __init__(self, **kwargs):
+        pass
+
+    def stream_completion(self, messages):
+        yield from self.DELTAS
+        if self.ERROR:
+            raise self.ERROR
+
+
+@override_settings(CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}})
+@mock.patch("assistant.llm.chat.ChatCompletions", _FakeChatCompletions)
+class ChatStreamTests(TestCase):
+
+    async def post(self, **body):
+        response = await self.async_client.post("/api/chat/stream/", body, content_type="application/json")
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        content = b"".join([chunk async for chunk in response.streaming_content])
+        return [json.loads(line) for line in content.decode().splitlines()]
+
+    async def test_events_and_blocks_sent_to_terminal(self):
+        layer = get_channel_layer()
+        listener = await layer.new_channel()
+        await layer.group_add(terminal_group("t1"), listener)
+
+        with mock.patch.object(_FakeChatCompletions, "DELTAS", ["Run:\n```ba", "sh\nls\n```\n", "Done."]):
+            events = await self.post(message="list files", terminal_id="t1")
+
+        self.assertEqual([e["type"] for e in events], ["session", "delta", "delta", "block", "delta", "done"])
+        self.assertEqual(events[3], {"type": "block", "lang": "shell", "code": "ls"})
+        self.assertEqual(events[-1]["reply"], "Run:\n```bash\nls\n```\nDone.")
+        self.assertEqual(await layer.receive(listener), {"type": "terminal.run", "lang": "shell", "code": "ls"})
+        self.assertEqual(
+            await ChatMessage.objects.filter(role="assistant").values_list("content", flat=True).aget(),
+            events[-1]["reply"],
+        )
+
+    async def test_error_event(self):
+        with mock.patch.multiple(_FakeChatCompletions, DELTAS=["Hel"], ERROR=PermissionError("Unauthorized (401)")):
+            events = await self.post(message="hello")
+        self.assertEqual(events[1:], [
+            {"type": "delta", "text": "Hel"},
+            {"type": "error", "error": "Unauthorized (401)"},
+        ])
+        self.assertFalse(await ChatMessage.objects.filter(role="assistant").aexists())
+
+    async def test_invalid_terminal_id(self):
+        response = await self.async_client.post(
+            "/api/chat/stream/", {"message": "hi", "terminal_id": "a b"}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(await ChatMessage.objects.aexists())
+
+
+class StreamCompletionTests(SimpleTestCase):
+    """Server-sent events from the Blablador API become plain text deltas."""
+
+    def stream(self, status_code, lines):
+        response = mock.MagicMock(status_code=status_code, text="nope")
+        response.__enter__.return_value = response
+        response.iter_lines.return_value = iter(lines)
+        client = ChatCompletions(api_key="key", model="model")
+        with mock.patch("assistant.llm.client.requests.post", return_value=response) as post:
+            deltas = list(client.stream_completion([{"role": "user", "content": "hi"}]))
+        self.assertTrue(json.loads(post.call_args.kwargs["data"])["stream"])
+        return deltas
+
+    def test_deltas_until_done(self):
+        def chunk(content):
+            return "data: " + json.dumps({"choices": [{"delta": {"content": content}}]})
+        lines = [
+            ": keep-alive",
+            "data: " + json.dumps({"choices": [{"delta": {"role": "assistant"}}]}),
+            chunk("Hel"),
+            "",
+            chunk("lo"),
+            "data: [DONE]",
+            chunk("ignored"),
+        ]
+        self.assertEqual(self.stream(200, lines), ["Hel", "lo"])
+
+    def test_error_status(self):
+        with self.assertRaises(PermissionError):
+            self.stream(401, [])
+
+    def test_invalid_chunk(self):
+        with self.assertRaises(RuntimeError):
+            self.stream(200, ["data: {not json"])
+
+
+class SQLiteChannelLayerTests(SimpleTestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "layer.sqlite3")
+        self.layer = SQLiteChannelLayer(self.path, capacity=2)
+        self.addCleanup(async_to_sync(self.layer.close))
+
+    async def test_send_receive_in_order(self):
+        await self.layer.send("specific.a", {"type": "x", "n": 1})
+        await self.layer.send("specific.a", {"type": "x", "n": 2})
+        self.assertEqual((await self.layer.receive("specific.a"))["n"], 1)
+        self.assertEqual((await self.layer.receive("specific.a"))["n"], 2)
+
+    async def test_messages_cross_layer_instances(self):
+        # Two instances on one file stand in for two worker processes
+        other = SQLiteChannelLayer(self.path)
+        await other.send("specific.b", {"type": "x"})
+        self.assertEqual(await self.layer.receive("specific.b"), {"type": "x"})
+        await other.close()
+
+    async def test_capacity(self):
+        await self.layer.send("specific.c", {"type": "x"})
+        await self.layer.send("specific.c", {"type": "x"})
+        with self.assertRaises(ChannelFull):
+            await self.layer.send("specific.c", {"type": "x"})
+
+    async def test_group_send(self):
+        await self.layer.group_add("terminal_t1", "specific.d")
+        await self.layer.group_add("terminal_t1", "specific.e")
+        await self.layer.group_discard("terminal_t1", "specific.e")
+        await self.layer.group_send("terminal_t1", {"type": "terminal.run"})
+        self.assertEqual(await self.layer.receive("specific.d"), {"type": "terminal.run"})
+        await self.layer.send("specific.e", {"type": "marker"})
+        self.assertEqual(await self.layer.receive("specific.e"), {"type": "marker"})
+
+
+class SQLitePtyRegistryTests(SimpleTestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "registry.sqlite3")
+        self.registry = SQLitePtyRegistry(self.path)
+
+    async def test_first_claim_wins(self):
+        self.assertEqual(await self.registry.claim("t1", "specific.owner"), "specific.owner")
+        self.assertEqual(await self.registry.claim("t1", "specific.other"), "specific.owner")
+
+    async def test_release_only_by_owner(self):
+        await self.registry.claim("t1", "specific.owner")
+        await self.registry.release("t1", "specific.other")
+        self.assertEqual(await self.registry.claim("t1", "specific.other"), "specific.owner")
+        await self.registry.release("t1", "specific.owner")
+        self.assertEqual(await self.registry.claim("t1", "specific.other"), "specific.other")
+
+    async def test_takes_over_from_dead_worker(self):
+        dead = subprocess.Popen([sys.executable, "-c", "pass"])
+        dead.wait()
+        await self.registry.claim("t1", "specific.owner")   # creates the table
+        conn = sqlite3.connect(self.path)
+        conn.execute("UPDATE pty_owners SET pid = ?, host = ? WHERE terminal_id = 't1'", (dead.pid, HOSTNAME))
+        conn.commit()
+        conn.close()
+        self.assertEqual(await self.registry.claim("t1", "specific.new"), "specific.new")
+
+
+class AssetCachingTests(SimpleTestCase):
+    """Only files Vite fingerprinted are cached forever."""
+
+    MANIFEST = {
+        "index.html": {
+            "file": "assets/index-B1x2y3z4.js",
+            "isEntry": True,
+            "css": ["assets/index-C9d8e7f6.css"],
+            "assets": ["assets/ganga-D5e6f7g8.svg"],
+            "dynamicImports": ["_chunk-E1f2g3h4.js"],
+        },
+        "_chunk-E1f2g3h4.js": {"file": "assets/chunk-E1f2g3h4.js"},
+    }
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        self._write_manifest(self.MANIFEST)
+        settings = override_settings(WHITENOISE_ROOT=self.root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def _write_manifest(self, manifest, mtime=None):
+        path = os.path.join(self.root, VITE_MANIFEST)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(manifest, f)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    def test_fingerprinted_files_from_manifest(self):
+        self.assertEqual(fingerprinted_files(self.root), {
+            "assets/index-B1x2y3z4.js",
+            "assets/index-C9d8e7f6.css",
+            "assets/ganga-D5e6f7g8.svg",
+            "assets/chunk-E1f2g3h4.js",
+        })
+
+    def test_only_hashed_files_are_immutable(self):
+        self.assertTrue(immutable_file_test("", "/assets/index-B1x2y3z4.js"))
+        # Copied verbatim from public/ — the name merely looks hashed
+        self.assertFalse(immutable_file_test("", "/logo-abcdefgh.png"))
+        self.assertFalse(immutable_file_test("", "/.vite/manifest.json"))
+        self.assertFalse(immutable_file_test("", "/index.html"))
+
+    def test_rebuild_is_picked_up(self):
+        self.assertTrue(immutable_file_test("", "/assets/index-B1x2y3z4.js"))
+        self._write_manifest({"index.html": {"file": "assets/index-F0a1b2c3.js"}}, mtime=1)
+        self.assertFalse(immutable_file_test("", "/assets/index-B1x2y3z4.js"))
+        self.assertTrue(immutable_file_test("", "/assets/index-F0a1b2c3.js"))
+
+    def test_no_manifest(self):
+        os.remove(os.path.join(self.root, VITE_MANIFEST))
+        self.assertFalse(immutable_file_test("", "/assets/index-B1x2y3z4.js"))
+
+    def test_add_headers(self):
+        for url in ("/", "/index.html", "/vite.svg", "/logo-abcdefgh.png"):
+            with self.subTest(url=url):
+                headers = {"Cache-Control": "max-age=60, public"}
+                add_headers(headers, os.path.join(self.root, url.lstrip("/")), url)
+                self.assertEqual(headers, {"Cache-Control": "no-cache"})
+        headers = {"Cache-Control": "max-age=315360000, public, immutable"}
+        add_headers(headers, os.path.join(self.root, "assets", "index-B1x2y3z4.js"), "/assets/index-B1x2y3z4.js")
+        self.assertEqual(headers, {"Cache-Control": "max-age=315360000, public, immutable"})
+
+    def test_served_headers(self):
+        for name in ("index.html", "vite.svg", "assets/index-B1x2y3z4.js"):
+            os.makedirs(os.path.dirname(os.path.join(self.root, name)), exist_ok=True)
+            with open(os.path.join(self.root, name), "w") as f:
+                f.write("x")
+        for autorefresh in (False, True):
+            with self.subTest(autorefresh=autorefresh), override_settings(WHITENOISE_AUTOREFRESH=autorefresh):
+                client = Client()   # a new client builds the middleware with these settings
+                self.assertEqual(client.get("/")["Cache-Control"], "no-cache")
+                self.assertEqual(client.get("/vite.svg")["Cache-Control"], "no-cache")
+                self.assertIn("immutable", client.get("/assets/index-B1x2y3z4.js")["Cache-Control"])
+                self.assertEqual(client.get("/.vite/manifest.json").status_code, 404)
+
+
+class TerminalAttachTests(TerminalConsumerTestCase):
+    """A second connection for the same terminal id relays to the PTY owner."""
+
+    async def test_relay_shares_the_owners_pty(self):
+        owner = await self.connect()
+        relay = await self.connect(expect="Attached to a running shell session")
+
+        await relay.send_to(text_data="echo relayed-$((6*7))\r")
+        await _read_until(relay, "relayed-42")
+        await _read_until(owner, "relayed-42")
+
+        await owner.disconnect()
+        await _read_until(relay, "Shell session ended")
+        self.assertEqual((await relay.receive_output(timeout=5))["type"], "websocket.close")
+
+    async def test_relay_only_listens_to_its_owner(self):
+        layer = get_channel_layer()
+        fake_owner = await layer.new_channel()
+        await get_pty_registry().claim(self.terminal_id, fake_owner)
+        relay = await self.connect(expect=None)
+        attach = await layer.receive(fake_owner)
+        self.assertEqual(attach["type"], "terminal.attach")
+
+        stranger = {"type": "terminal.output", "text": "stray", "channel": "specific.stranger"}
+        await layer.send(attach["channel"], stranger)
+        await layer.send(attach["channel"], {"type": "terminal.closed", "channel": "specific.stranger"})
+        self.assertTrue(await relay.receive_nothing(timeout=0.2))
+
+        await layer.send(attach["channel"], {"type": "terminal.attached", "channel": fake_owner})
+        await _read_until(relay, "Attached")
+        await relay.send_to(text_data="ls\r")
+        self.assertEqual(await layer.receive(fake_owner), {"type": "terminal.input", "text": "ls\r"})
+        await relay.disconnect()
+
+    @mock.patch.object(consumers, "ATTACH_TIMEOUT", 0.2)
+    async def test_takes_over_when_owner_never_acknowledges(self):
+        layer = get_channel_layer()
+        stale_owner = await layer.new_channel()
+        await get_pty_registry().claim(self.terminal_id, stale_owner)
+        relay = await self.connect()
+
+        self.assertEqual((await layer.receive(stale_owner))["type"], "terminal.attach")
+        self.assertEqual(await layer.receive(stale_owner), {"type": "terminal.evict"})
+        self.assertNotEqual(await get_pty_registry().claim(self.terminal_id, stale_owner), stale_owner)
+        await relay.disconnect()
+
+    async def test_evicted_owner_ends_its_session(self):
+        owner = await self.connect()
+        channel = await get_pty_registry().claim(self.terminal_id, "specific.probe")
+        await get_channel_layer().send(channel, {"type": "terminal.evict"})
+
+        await _read_until(owner, "taken over by another connection")
+        self.assertEqual((await owner.receive_output(timeout=5))["type"], "websocket.close")
+        self.assertEqual(await get_pty_registry().claim(self.terminal_id, "specific.probe"), "specific.probe")
@@ -1,7 +1,8 @@
 from django.urls import path
-from assistant.views import chat, chat_history
+from assistant.views import chat, chat_stream, chat_history
 
 urlpatterns = [
     path("chat/",                          chat,         name="chat"),
+    path("chat/stream/",                   chat_stream,  name="chat-stream"),
     path("chat/<str:session_id>/history/", chat_history, name="chat-history"),
 ]
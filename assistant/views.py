@@ -1,19 +1,22 @@
 import json
-from django.http import JsonResponse
+from asgiref.sync import sync_to_async
+from channels.layers import get_channel_layer
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 
+from assistant.consumers import terminal_group, TERMINAL_ID_RE
 from assistant.models import ChatSession, ChatMessage
 from assistant.llm.chat import GangaBot
+from assistant.llm.codeblocks import CodeBlockExtractor
 
 
-@csrf_exempt
-@require_http_methods(["POST"])
-def chat(request):
+def _begin_turn(request):
     """
-    POST /api/chat/
-    Body:  { "message": "...", "session_id": "<uuid>" (optional) }
-    Reply: { "reply": "...", "session_id": "<uuid>" }
+    Shared setup for chat and chat_stream: parse the body, load or create the
+    session, rebuild GangaBot's history and persist the user message.
+    Returns (body, session, bot) — body["message"] is the stripped message —
+    or a JsonResponse describing the error.
     """
     try:
         body = json.loads(request.body)
@@ -23,6 +26,12 @@ def chat(request):
     user_message = body.get("message", "").strip()
     if not user_message:
         return JsonResponse({"error": "'message' field is required."}, status=400)
+    body["message"] = user_message
+
+    # Checked before anything is saved; only chat_stream uses it
+    terminal_id = body.get("terminal_id") or ""
+    if terminal_id and not TERMINAL_ID_RE.match(terminal_id):
+        return JsonResponse({"error": "Invalid 'terminal_id'."}, status=400)
 
     session_id = body.get("session_id")
 
@@ -42,9 +51,25 @@ def chat(request):
     # ── Persist user message ─────────────────────────────────────────────────
     ChatMessage.objects.create(session=session, role="user", content=user_message)
 
+    return body, session, bot
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def chat(request):
+    """
+    POST /api/chat/
+    Body:  { "message": "...", "session_id": "<uuid>" (optional) }
+    Reply: { "reply": "...", "session_id": "<uuid>" }
+    """
+    turn = _begin_turn(request)
+    if isinstance(turn, JsonResponse):
+        return turn
+    body, session, bot = turn
+
     # ── Call the LLM ─────────────────────────────────────────────────────────
     try:
-        reply = bot.send(user_message)
+        reply = bot.send(body["message"])
     except Exception as exc:
         return JsonResponse({"error": str(exc)}, status=502)
 
@@ -54,6 +79,73 @@ def chat(request):
     return JsonResponse({"reply": reply, "session_id": str(session.id)})
 
 
+@csrf_exempt
+@require_http_methods(["POST"])
+def chat_stream(request):
+    """
+    POST /api/chat/stream/
+    Body:  { "message": "...", "session_id": "<uuid>" (optional),
+             "terminal_id": "<id>" (optional) }
+    Reply: newline-delimited JSON events, in order:
+           { "type": "session", "session_id": "<uuid>" }
+           { "type": "delta",   "text": "..." }                    (repeated)
+           { "type": "block",   "lang": "python|shell", "code": "..." }
+           { "type": "done",    "reply": "..." }  or  { "type": "error", "error": "..." }
+
+    When terminal_id names a connected terminal, each complete Python/shell
+    block is piped into that terminal's PTY as soon as its closing fence arrives.
+    """
+    turn = _begin_turn(request)
+    if isinstance(turn, JsonResponse):
+        return turn
+    body, session, bot = turn
+
+    response = StreamingHttpResponse(
+        _stream_reply(bot, body["message"], session, body.get("terminal_id") or ""),
+        content_type="application/x-ndjson",
+    )
+    response["Cache-Control"] = "no-cache"
+    return response
+
+
+async def _stream_reply(bot, user_message, session, terminal_id):
+    """Relay LLM deltas to the client and complete code blocks to the terminal."""
+    def event(**fields):
+        return json.dumps(fields) + "\n"
+
+    yield event(type="session", session_id=str(session.id))
+
+    channel_layer = get_channel_layer() if terminal_id else None
+    extractor = CodeBlockExtractor()
+    deltas = bot.stream(user_message)
+    # The HTTP client is blocking, so pull each delta in a worker thread
+    next_delta = sync_to_async(next, thread_sensitive=False)
+
+    try:
+        while True:
+            delta = await next_delta(deltas, None)
+            blocks = extractor.feed(delta) if delta is not None else extractor.flush()
+            if delta is not None:
+                yield event(type="delta", text=delta)
+            for lang, code in blocks:
+                if channel_layer is not None:
+                    await channel_layer.group_send(
+                        terminal_group(terminal_id),
+                        {"type": "terminal.run", "lang": lang, "code": code},
+                    )
+                yield event(type="block", lang=lang, code=code)
+            if delta is None:
+                break
+    except Exception as exc:
+        yield event(type="error", error=str(exc))
+        return
+
+    # ── Persist assistant reply ──────────────────────────────────────────────
+    reply = bot.history[-1]["content"]
+    await sync_to_async(ChatMessage.objects.create)(session=session, role="assistant", content=reply)
+    yield event(type="done", reply=reply)
+
+
 @require_http_methods(["GET"])
 def chat_history(request, session_id):
     """
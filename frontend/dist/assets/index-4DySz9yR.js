@@ -1,157 +0,0 @@
-(function(){const n=document.createElement("link").relList;if(n&&n.supports&&n.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const i of l)if(i.type==="childList")for(const o of i.addedNodes)o.tagName==="LINK"&&o.rel==="modulepreload"&&r(o)}).observe(document,{childList:!0,subtree:!0});function t(l){const i={};return l.integrity&&(i.integrity=l.integrity),l.referrerPolicy&&(i.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?i.credentials="include":l.crossOrigin==="anonymous"?i.credentials="omit":i.credentials="same-origin",i}function r(l){if(l.ep)return;l.ep=!0;const i=t(l);fetch(l.href,i)}})();var Bl=typeof globalThis<"u"?globalThis:typeof window<"u"?window:typeof global<"u"?global:typeof self<"u"?self:{};function Fc(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var Bc={exports:{}},pi={},Uc={exports:{}},Q={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var qr=Symbol.for("react.element"),qd=Symbol.for("react.portal"),Zd=Symbol.for("react.fragment"),Jd=Symbol.for("react.strict_mode"),eh=Symbol.for("react.profiler"),nh=Symbol.for("react.provider"),th=Symbol.for("react.context"),rh=Symbol.for("react.forward_ref"),lh=Symbol.for("react.suspense"),ih=Symbol.for("react.memo"),oh=Symbol.for("react.lazy"),js=Symbol.iterator;function uh(e){return e===null||typeof e!="object"?null:(e=js&&e[js]||e["@@iterator"],typeof e=="function"?e:null)}var Vc={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Hc=Object.assign,$c={};function er(e,n,t){this.props=e,this.context=n,this.refs=$c,this.updater=t||Vc}er.prototype.isReactComponent={};er.prototype.setState=function(e,n){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,n,"setState")};er.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function Wc(){}Wc.prototype=er.prototype;function wu(e,n,t){this.props=e,this.context=n,this.refs=$c,this.updater=t||Vc}var Su=wu.prototype=new Wc;Su.constructor=wu;Hc(Su,er.prototype);Su.isPureReactComponent=!0;var As=Array.isArray,Qc=Object.prototype.hasOwnProperty,Eu={current:null},bc={key:!0,ref:!0,__self:!0,__source:!0};function Kc(e,n,t){var r,l={},i=null,o=null;if(n!=null)for(r in n.ref!==void 0&&(o=n.ref),n.key!==void 0&&(i=""+n.key),n)Qc.call(n,r)&&!bc.hasOwnProperty(r)&&(l[r]=n[r]);var u=arguments.length-2;if(u===1)l.children=t;else if(1<u){for(var s=Array(u),a=0;a<u;a++)s[a]=arguments[a+2];l.children=s}if(e&&e.defaultProps)for(r in u=e.defaultProps,u)l[r]===void 0&&(l[r]=u[r]);return{$$typeof:qr,type:e,key:i,ref:o,props:l,_owner:Eu.current}}function sh(e,n){return{$$typeof:qr,type:e.type,key:n,ref:e.ref,props:e.props,_owner:e._owner}}function Cu(e){return typeof e=="object"&&e!==null&&e.$$typeof===qr}function ah(e){var n={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(t){return n[t]})}var Fs=/\/+/g;function Ri(e,n){return typeof e=="object"&&e!==null&&e.key!=null?ah(""+e.key):n.toString(36)}function Nl(e,n,t,r,l){var i=typeof e;(i==="undefined"||i==="boolean")&&(e=null);var o=!1;if(e===null)o=!0;else switch(i){case"string":case"number":o=!0;break;case"object":switch(e.$$typeof){case qr:case qd:o=!0}}if(o)return o=e,l=l(o),e=r===""?"."+Ri(o,0):r,As(l)?(t="",e!=null&&(t=e.replace(Fs,"$&/")+"/"),Nl(l,n,t,"",function(a){return a})):l!=null&&(Cu(l)&&(l=sh(l,t+(!l.key||o&&o.key===l.key?"":(""+l.key).replace(Fs,"$&/")+"/")+e)),n.push(l)),1;if(o=0,r=r===""?".":r+":",As(e))for(var u=0;u<e.length;u++){i=e[u];var s=r+Ri(i,u);o+=Nl(i,n,t,s,l)}else if(s=uh(e),typeof s=="function")for(e=s.call(e),u=0;!(i=e.next()).done;)i=i.value,s=r+Ri(i,u++),o+=Nl(i,n,t,s,l);else if(i==="object")throw n=String(e),Error("Objects are not valid as a React child (found: "+(n==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":n)+"). If you meant to render a collection of children, use an array instead.");return o}function il(e,n,t){if(e==null)return e;var r=[],l=0;return Nl(e,r,"","",function(i){return n.call(t,i,l++)}),r}function ch(e){if(e._status===-1){var n=e._result;n=n(),n.then(function(t){(e._status===0||e._status===-1)&&(e._status=1,e._result=t)},function(t){(e._status===0||e._status===-1)&&(e._status=2,e._result=t)}),e._status===-1&&(e._status=0,e._result=n)}if(e._status===1)return e._result.default;throw e._result}var Re={current:null},Pl={transition:null},fh={ReactCurrentDispatcher:Re,ReactCurrentBatchConfig:Pl,ReactCurrentOwner:Eu};function Yc(){throw Error("act(...) is not supported in production builds of React.")}Q.Children={map:il,forEach:function(e,n,t){il(e,function(){n.apply(this,arguments)},t)},count:function(e){var n=0;return il(e,function(){n++}),n},toArray:function(e){return il(e,function(n){return n})||[]},only:function(e){if(!Cu(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};Q.Component=er;Q.Fragment=Zd;Q.Profiler=eh;Q.PureComponent=wu;Q.StrictMode=Jd;Q.Suspense=lh;Q.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=fh;Q.act=Yc;Q.cloneElement=function(e,n,t){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=Hc({},e.props),l=e.key,i=e.ref,o=e._owner;if(n!=null){if(n.ref!==void 0&&(i=n.ref,o=Eu.current),n.key!==void 0&&(l=""+n.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in n)Qc.call(n,s)&&!bc.hasOwnProperty(s)&&(r[s]=n[s]===void 0&&u!==void 0?u[s]:n[s])}var s=arguments.length-2;if(s===1)r.children=t;else if(1<s){u=Array(s);for(var a=0;a<s;a++)u[a]=arguments[a+2];r.children=u}return{$$typeof:qr,type:e.type,key:l,ref:i,props:r,_owner:o}};Q.createContext=function(e){return e={$$typeof:th,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:nh,_context:e},e.Consumer=e};Q.createElement=Kc;Q.createFactory=function(e){var n=Kc.bind(null,e);return n.type=e,n};Q.createRef=function(){return{current:null}};Q.forwardRef=function(e){return{$$typeof:rh,render:e}};Q.isValidElement=Cu;Q.lazy=function(e){return{$$typeof:oh,_payload:{_status:-1,_result:e},_init:ch}};Q.memo=function(e,n){return{$$typeof:ih,type:e,compare:n===void 0?null:n}};Q.startTransition=function(e){var n=Pl.transition;Pl.transition={};try{e()}finally{Pl.transition=n}};Q.unstable_act=Yc;Q.useCallback=function(e,n){return Re.current.useCallback(e,n)};Q.useContext=function(e){return Re.current.useContext(e)};Q.useDebugValue=function(){};Q.useDeferredValue=function(e){return Re.current.useDeferredValue(e)};Q.useEffect=function(e,n){return Re.current.useEffect(e,n)};Q.useId=function(){return Re.current.useId()};Q.useImperativeHandle=function(e,n,t){return Re.current.useImperativeHandle(e,n,t)};Q.useInsertionEffect=function(e,n){return Re.current.useInsertionEffect(e,n)};Q.useLayoutEffect=function(e,n){return Re.current.useLayoutEffect(e,n)};Q.useMemo=function(e,n){return Re.current.useMemo(e,n)};Q.useReducer=function(e,n,t){return Re.current.useReducer(e,n,t)};Q.useRef=function(e){return Re.current.useRef(e)};Q.useState=function(e){return Re.current.useState(e)};Q.useSyncExternalStore=function(e,n,t){return Re.current.useSyncExternalStore(e,n,t)};Q.useTransition=function(){return Re.current.useTransition()};Q.version="18.3.1";Uc.exports=Q;var W=Uc.exports;/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var ph=W,dh=Symbol.for("react.element"),hh=Symbol.for("react.fragment"),mh=Object.prototype.hasOwnProperty,gh=ph.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,yh={key:!0,ref:!0,__self:!0,__source:!0};function Gc(e,n,t){var r,l={},i=null,o=null;t!==void 0&&(i=""+t),n.key!==void 0&&(i=""+n.key),n.ref!==void 0&&(o=n.ref);for(r in n)mh.call(n,r)&&!yh.hasOwnProperty(r)&&(l[r]=n[r]);if(e&&e.defaultProps)for(r in n=e.defaultProps,n)l[r]===void 0&&(l[r]=n[r]);return{$$typeof:dh,type:e,key:i,ref:o,props:l,_owner:gh.current}}pi.Fragment=hh;pi.jsx=Gc;pi.jsxs=Gc;Bc.exports=pi;var C=Bc.exports,Xc={exports:{}},Ge={},qc={exports:{}},Zc={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function n(D,F){var g=D.length;D.push(F);e:for(;0<g;){var K=g-1>>>1,q=D[K];if(0<l(q,F))D[K]=F,D[g]=q,g=K;else break e}}function t(D){return D.length===0?null:D[0]}function r(D){if(D.length===0)return null;var F=D[0],g=D.pop();if(g!==F){D[0]=g;e:for(var K=0,q=D.length,v=q>>>1;K<v;){var ge=2*(K+1)-1,on=D[ge],re=ge+1,mn=D[re];if(0>l(on,g))re<q&&0>l(mn,on)?(D[K]=mn,D[re]=g,K=re):(D[K]=on,D[ge]=g,K=ge);else if(re<q&&0>l(mn,g))D[K]=mn,D[re]=g,K=re;else break e}}return F}function l(D,F){var g=D.sortIndex-F.sortIndex;return g!==0?g:D.id-F.id}if(typeof performance=="object"&&typeof performance.now=="function"){var i=performance;e.unstable_now=function(){return i.now()}}else{var o=Date,u=o.now();e.unstable_now=function(){return o.now()-u}}var s=[],a=[],c=1,f=null,d=3,p=!1,k=!1,x=!1,I=typeof setTimeout=="function"?setTimeout:null,h=typeof clearTimeout=="function"?clearTimeout:null,m=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function y(D){for(var F=t(a);F!==null;){if(F.callback===null)r(a);else if(F.startTime<=D)r(a),F.sortIndex=F.expirationTime,n(s,F);else break;F=t(a)}}function S(D){if(x=!1,y(D),!k)if(t(s)!==null)k=!0,de(N);else{var F=t(a);F!==null&&fe(S,F.startTime-D)}}function N(D,F){k=!1,x&&(x=!1,h(R),R=-1),p=!0;var g=d;try{for(y(F),f=t(s);f!==null&&(!(f.expirationTime>F)||D&&!P());){var K=f.callback;if(typeof K=="function"){f.callback=null,d=f.priorityLevel;var q=K(f.expirationTime<=F);F=e.unstable_now(),typeof q=="function"?f.callback=q:f===t(s)&&r(s),y(F)}else r(s);f=t(s)}if(f!==null)var v=!0;else{var ge=t(a);ge!==null&&fe(S,ge.startTime-F),v=!1}return v}finally{f=null,d=g,p=!1}}var w=!1,T=null,R=-1,A=5,j=-1;function P(){return!(e.unstable_now()-j<A)}function L(){if(T!==null){var D=e.unstable_now();j=D;var F=!0;try{F=T(!0,D)}finally{F?V():(w=!1,T=null)}}else w=!1}var V;if(typeof m=="function")V=function(){m(L)};else if(typeof MessageChannel<"u"){var Z=new MessageChannel,$=Z.port2;Z.port1.onmessage=L,V=function(){$.postMessage(null)}}else V=function(){I(L,0)};function de(D){T=D,w||(w=!0,V())}function fe(D,F){R=I(function(){D(e.unstable_now())},F)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(D){D.callback=null},e.unstable_continueExecution=function(){k||p||(k=!0,de(N))},e.unstable_forceFrameRate=function(D){0>D||125<D?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):A=0<D?Math.floor(1e3/D):5},e.unstable_getCurrentPriorityLevel=function(){return d},e.unstable_getFirstCallbackNode=function(){return t(s)},e.unstable_next=function(D){switch(d){case 1:case 2:case 3:var F=3;break;default:F=d}var g=d;d=F;try{return D()}finally{d=g}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(D,F){switch(D){case 1:case 2:case 3:case 4:case 5:break;default:D=3}var g=d;d=D;try{return F()}finally{d=g}},e.unstable_scheduleCallback=function(D,F,g){var K=e.unstable_now();switch(typeof g=="object"&&g!==null?(g=g.delay,g=typeof g=="number"&&0<g?K+g:K):g=K,D){case 1:var q=-1;break;case 2:q=250;break;case 5:q=1073741823;break;case 4:q=1e4;break;default:q=5e3}return q=g+q,D={id:c++,callback:F,priorityLevel:D,startTime:g,expirationTime:q,sortIndex:-1},g>K?(D.sortIndex=g,n(a,D),t(s)===null&&D===t(a)&&(x?(h(R),R=-1):x=!0,fe(S,g-K))):(D.sortIndex=q,n(s,D),k||p||(k=!0,de(N))),D},e.unstable_shouldYield=P,e.unstable_wrapCallback=function(D){var F=d;return function(){var g=d;d=F;try{return D.apply(this,arguments)}finally{d=g}}}})(Zc);qc.exports=Zc;var vh=qc.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var kh=W,Ye=vh;function _(e){for(var n="https://reactjs.org/docs/error-decoder.html?invariant="+e,t=1;t<arguments.length;t++)n+="&args[]="+encodeURIComponent(arguments[t]);return"Minified React error #"+e+"; visit "+n+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var Jc=new Set,Or={};function kt(e,n){Kt(e,n),Kt(e+"Capture",n)}function Kt(e,n){for(Or[e]=n,e=0;e<n.length;e++)Jc.add(n[e])}var Ln=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),yo=Object.prototype.hasOwnProperty,xh=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Bs={},Us={};function wh(e){return yo.call(Us,e)?!0:yo.call(Bs,e)?!1:xh.test(e)?Us[e]=!0:(Bs[e]=!0,!1)}function Sh(e,n,t,r){if(t!==null&&t.type===0)return!1;switch(typeof n){case"function":case"symbol":return!0;case"boolean":return r?!1:t!==null?!t.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function Eh(e,n,t,r){if(n===null||typeof n>"u"||Sh(e,n,t,r))return!0;if(r)return!1;if(t!==null)switch(t.type){case 3:return!n;case 4:return n===!1;case 5:return isNaN(n);case 6:return isNaN(n)||1>n}return!1}function Oe(e,n,t,r,l,i,o){this.acceptsBooleans=n===2||n===3||n===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=t,this.propertyName=e,this.type=n,this.sanitizeURL=i,this.removeEmptyString=o}var Ee={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){Ee[e]=new Oe(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var n=e[0];Ee[n]=new Oe(n,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){Ee[e]=new Oe(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){Ee[e]=new Oe(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){Ee[e]=new Oe(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){Ee[e]=new Oe(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){Ee[e]=new Oe(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){Ee[e]=new Oe(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){Ee[e]=new Oe(e,5,!1,e.toLowerCase(),null,!1,!1)});var Nu=/[\-:]([a-z])/g;function Pu(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var n=e.replace(Nu,Pu);Ee[n]=new Oe(n,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var n=e.replace(Nu,Pu);Ee[n]=new Oe(n,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var n=e.replace(Nu,Pu);Ee[n]=new Oe(n,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){Ee[e]=new Oe(e,1,!1,e.toLowerCase(),null,!1,!1)});Ee.xlinkHref=new Oe("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){Ee[e]=new Oe(e,1,!1,e.toLowerCase(),null,!0,!0)});function _u(e,n,t,r){var l=Ee.hasOwnProperty(n)?Ee[n]:null;(l!==null?l.type!==0:r||!(2<n.length)||n[0]!=="o"&&n[0]!=="O"||n[1]!=="n"&&n[1]!=="N")&&(Eh(n,t,l,r)&&(t=null),r||l===null?wh(n)&&(t===null?e.removeAttribute(n):e.setAttribute(n,""+t)):l.mustUseProperty?e[l.propertyName]=t===null?l.type===3?!1:"":t:(n=l.attributeName,r=l.attributeNamespace,t===null?e.removeAttribute(n):(l=l.type,t=l===3||l===4&&t===!0?"":""+t,r?e.setAttributeNS(r,n,t):e.setAttribute(n,t))))}var Mn=kh.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,ol=Symbol.for("react.element"),_t=Symbol.for("react.portal"),Tt=Symbol.for("react.fragment"),Tu=Symbol.for("react.strict_mode"),vo=Symbol.for("react.profiler"),ef=Symbol.for("react.provider"),nf=Symbol.for("react.context"),zu=Symbol.for("react.forward_ref"),ko=Symbol.for("react.suspense"),xo=Symbol.for("react.suspense_list"),Iu=Symbol.for("react.memo"),Bn=Symbol.for("react.lazy"),tf=Symbol.for("react.offscreen"),Vs=Symbol.iterator;function ur(e){return e===null||typeof e!="object"?null:(e=Vs&&e[Vs]||e["@@iterator"],typeof e=="function"?e:null)}var ae=Object.assign,Oi;function yr(e){if(Oi===void 0)try{throw Error()}catch(t){var n=t.stack.trim().match(/\n( *(at )?)/);Oi=n&&n[1]||""}return`
-`+Oi+e}var Di=!1;function Mi(e,n){if(!e||Di)return"";Di=!0;var t=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(n)if(n=function(){throw Error()},Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(n,[])}catch(a){var r=a}Reflect.construct(e,[],n)}else{try{n.call()}catch(a){r=a}e.call(n.prototype)}else{try{throw Error()}catch(a){r=a}e()}}catch(a){if(a&&r&&typeof a.stack=="string"){for(var l=a.stack.split(`
-`),i=r.stack.split(`
-`),o=l.length-1,u=i.length-1;1<=o&&0<=u&&l[o]!==i[u];)u--;for(;1<=o&&0<=u;o--,u--)if(l[o]!==i[u]){if(o!==1||u!==1)do if(o--,u--,0>u||l[o]!==i[u]){var s=`
-`+l[o].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=o&&0<=u);break}}}finally{Di=!1,Error.prepareStackTrace=t}return(e=e?e.displayName||e.name:"")?yr(e):""}function Ch(e){switch(e.tag){case 5:return yr(e.type);case 16:return yr("Lazy");case 13:return yr("Suspense");case 19:return yr("SuspenseList");case 0:case 2:case 15:return e=Mi(e.type,!1),e;case 11:return e=Mi(e.type.render,!1),e;case 1:return e=Mi(e.type,!0),e;default:return""}}function wo(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case Tt:return"Fragment";case _t:return"Portal";case vo:return"Profiler";case Tu:return"StrictMode";case ko:return"Suspense";case xo:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case nf:return(e.displayName||"Context")+".Consumer";case ef:return(e._context.displayName||"Context")+".Provider";case zu:var n=e.render;return e=e.displayName,e||(e=n.displayName||n.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case Iu:return n=e.displayName||null,n!==null?n:wo(e.type)||"Memo";case Bn:n=e._payload,e=e._init;try{return wo(e(n))}catch{}}return null}function Nh(e){var n=e.type;switch(e.tag){case 24:return"Cache";case 9:return(n.displayName||"Context")+".Consumer";case 10:return(n._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=n.render,e=e.displayName||e.name||"",n.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return n;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return wo(n);case 8:return n===Tu?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof n=="function")return n.displayName||n.name||null;if(typeof n=="string")return n}return null}function Jn(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function rf(e){var n=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(n==="checkbox"||n==="radio")}function Ph(e){var n=rf(e)?"checked":"value",t=Object.getOwnPropertyDescriptor(e.constructor.prototype,n),r=""+e[n];if(!e.hasOwnProperty(n)&&typeof t<"u"&&typeof t.get=="function"&&typeof t.set=="function"){var l=t.get,i=t.set;return Object.defineProperty(e,n,{configurable:!0,get:function(){return l.call(this)},set:function(o){r=""+o,i.call(this,o)}}),Object.defineProperty(e,n,{enumerable:t.enumerable}),{getValue:function(){return r},setValue:function(o){r=""+o},stopTracking:function(){e._valueTracker=null,delete e[n]}}}}function ul(e){e._valueTracker||(e._valueTracker=Ph(e))}function lf(e){if(!e)return!1;var n=e._valueTracker;if(!n)return!0;var t=n.getValue(),r="";return e&&(r=rf(e)?e.checked?"true":"false":e.value),e=r,e!==t?(n.setValue(e),!0):!1}function Ul(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function So(e,n){var t=n.checked;return ae({},n,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:t??e._wrapperState.initialChecked})}function Hs(e,n){var t=n.defaultValue==null?"":n.defaultValue,r=n.checked!=null?n.checked:n.defaultChecked;t=Jn(n.value!=null?n.value:t),e._wrapperState={initialChecked:r,initialValue:t,controlled:n.type==="checkbox"||n.type==="radio"?n.checked!=null:n.value!=null}}function of(e,n){n=n.checked,n!=null&&_u(e,"checked",n,!1)}function Eo(e,n){of(e,n);var t=Jn(n.value),r=n.type;if(t!=null)r==="number"?(t===0&&e.value===""||e.value!=t)&&(e.value=""+t):e.value!==""+t&&(e.value=""+t);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}n.hasOwnProperty("value")?Co(e,n.type,t):n.hasOwnProperty("defaultValue")&&Co(e,n.type,Jn(n.defaultValue)),n.checked==null&&n.defaultChecked!=null&&(e.defaultChecked=!!n.defaultChecked)}function $s(e,n,t){if(n.hasOwnProperty("value")||n.hasOwnProperty("defaultValue")){var r=n.type;if(!(r!=="submit"&&r!=="reset"||n.value!==void 0&&n.value!==null))return;n=""+e._wrapperState.initialValue,t||n===e.value||(e.value=n),e.defaultValue=n}t=e.name,t!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,t!==""&&(e.name=t)}function Co(e,n,t){(n!=="number"||Ul(e.ownerDocument)!==e)&&(t==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+t&&(e.defaultValue=""+t))}var vr=Array.isArray;function Bt(e,n,t,r){if(e=e.options,n){n={};for(var l=0;l<t.length;l++)n["$"+t[l]]=!0;for(t=0;t<e.length;t++)l=n.hasOwnProperty("$"+e[t].value),e[t].selected!==l&&(e[t].selected=l),l&&r&&(e[t].defaultSelected=!0)}else{for(t=""+Jn(t),n=null,l=0;l<e.length;l++){if(e[l].value===t){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}n!==null||e[l].disabled||(n=e[l])}n!==null&&(n.selected=!0)}}function No(e,n){if(n.dangerouslySetInnerHTML!=null)throw Error(_(91));return ae({},n,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Ws(e,n){var t=n.value;if(t==null){if(t=n.children,n=n.defaultValue,t!=null){if(n!=null)throw Error(_(92));if(vr(t)){if(1<t.length)throw Error(_(93));t=t[0]}n=t}n==null&&(n=""),t=n}e._wrapperState={initialValue:Jn(t)}}function uf(e,n){var t=Jn(n.value),r=Jn(n.defaultValue);t!=null&&(t=""+t,t!==e.value&&(e.value=t),n.defaultValue==null&&e.defaultValue!==t&&(e.defaultValue=t)),r!=null&&(e.defaultValue=""+r)}function Qs(e){var n=e.textContent;n===e._wrapperState.initialValue&&n!==""&&n!==null&&(e.value=n)}function sf(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function Po(e,n){return e==null||e==="http://www.w3.org/1999/xhtml"?sf(n):e==="http://www.w3.org/2000/svg"&&n==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var sl,af=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(n,t,r,l){MSApp.execUnsafeLocalFunction(function(){return e(n,t,r,l)})}:e}(function(e,n){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=n;else{for(sl=sl||document.createElement("div"),sl.innerHTML="<svg>"+n.valueOf().toString()+"</svg>",n=sl.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;n.firstChild;)e.appendChild(n.firstChild)}});function Dr(e,n){if(n){var t=e.firstChild;if(t&&t===e.lastChild&&t.nodeType===3){t.nodeValue=n;return}}e.textContent=n}var wr={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},_h=["Webkit","ms","Moz","O"];Object.keys(wr).forEach(function(e){_h.forEach(function(n){n=n+e.charAt(0).toUpperCase()+e.substring(1),wr[n]=wr[e]})});function cf(e,n,t){return n==null||typeof n=="boolean"||n===""?"":t||typeof n!="number"||n===0||wr.hasOwnProperty(e)&&wr[e]?(""+n).trim():n+"px"}function ff(e,n){e=e.style;for(var t in n)if(n.hasOwnProperty(t)){var r=t.indexOf("--")===0,l=cf(t,n[t],r);t==="float"&&(t="cssFloat"),r?e.setProperty(t,l):e[t]=l}}var Th=ae({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function _o(e,n){if(n){if(Th[e]&&(n.children!=null||n.dangerouslySetInnerHTML!=null))throw Error(_(137,e));if(n.dangerouslySetInnerHTML!=null){if(n.children!=null)throw Error(_(60));if(typeof n.dangerouslySetInnerHTML!="object"||!("__html"in n.dangerouslySetInnerHTML))throw Error(_(61))}if(n.style!=null&&typeof n.style!="object")throw Error(_(62))}}function To(e,n){if(e.indexOf("-")===-1)return typeof n.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var zo=null;function Lu(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var Io=null,Ut=null,Vt=null;function bs(e){if(e=el(e)){if(typeof Io!="function")throw Error(_(280));var n=e.stateNode;n&&(n=yi(n),Io(e.stateNode,e.type,n))}}function pf(e){Ut?Vt?Vt.push(e):Vt=[e]:Ut=e}function df(){if(Ut){var e=Ut,n=Vt;if(Vt=Ut=null,bs(e),n)for(e=0;e<n.length;e++)bs(n[e])}}function hf(e,n){return e(n)}function mf(){}var ji=!1;function gf(e,n,t){if(ji)return e(n,t);ji=!0;try{return hf(e,n,t)}finally{ji=!1,(Ut!==null||Vt!==null)&&(mf(),df())}}function Mr(e,n){var t=e.stateNode;if(t===null)return null;var r=yi(t);if(r===null)return null;t=r[n];e:switch(n){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(t&&typeof t!="function")throw Error(_(231,n,typeof t));return t}var Lo=!1;if(Ln)try{var sr={};Object.defineProperty(sr,"passive",{get:function(){Lo=!0}}),window.addEventListener("test",sr,sr),window.removeEventListener("test",sr,sr)}catch{Lo=!1}function zh(e,n,t,r,l,i,o,u,s){var a=Array.prototype.slice.call(arguments,3);try{n.apply(t,a)}catch(c){this.onError(c)}}var Sr=!1,Vl=null,Hl=!1,Ro=null,Ih={onError:function(e){Sr=!0,Vl=e}};function Lh(e,n,t,r,l,i,o,u,s){Sr=!1,Vl=null,zh.apply(Ih,arguments)}function Rh(e,n,t,r,l,i,o,u,s){if(Lh.apply(this,arguments),Sr){if(Sr){var a=Vl;Sr=!1,Vl=null}else throw Error(_(198));Hl||(Hl=!0,Ro=a)}}function xt(e){var n=e,t=e;if(e.alternate)for(;n.return;)n=n.return;else{e=n;do n=e,n.flags&4098&&(t=n.return),e=n.return;while(e)}return n.tag===3?t:null}function yf(e){if(e.tag===13){var n=e.memoizedState;if(n===null&&(e=e.alternate,e!==null&&(n=e.memoizedState)),n!==null)return n.dehydrated}return null}function Ks(e){if(xt(e)!==e)throw Error(_(188))}function Oh(e){var n=e.alternate;if(!n){if(n=xt(e),n===null)throw Error(_(188));return n!==e?null:e}for(var t=e,r=n;;){var l=t.return;if(l===null)break;var i=l.alternate;if(i===null){if(r=l.return,r!==null){t=r;continue}break}if(l.child===i.child){for(i=l.child;i;){if(i===t)return Ks(l),e;if(i===r)return Ks(l),n;i=i.sibling}throw Error(_(188))}if(t.return!==r.return)t=l,r=i;else{for(var o=!1,u=l.child;u;){if(u===t){o=!0,t=l,r=i;break}if(u===r){o=!0,r=l,t=i;break}u=u.sibling}if(!o){for(u=i.child;u;){if(u===t){o=!0,t=i,r=l;break}if(u===r){o=!0,r=i,t=l;break}u=u.sibling}if(!o)throw Error(_(189))}}if(t.alternate!==r)throw Error(_(190))}if(t.tag!==3)throw Error(_(188));return t.stateNode.current===t?e:n}function vf(e){return e=Oh(e),e!==null?kf(e):null}function kf(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var n=kf(e);if(n!==null)return n;e=e.sibling}return null}var xf=Ye.unstable_scheduleCallback,Ys=Ye.unstable_cancelCallback,Dh=Ye.unstable_shouldYield,Mh=Ye.unstable_requestPaint,pe=Ye.unstable_now,jh=Ye.unstable_getCurrentPriorityLevel,Ru=Ye.unstable_ImmediatePriority,wf=Ye.unstable_UserBlockingPriority,$l=Ye.unstable_NormalPriority,Ah=Ye.unstable_LowPriority,Sf=Ye.unstable_IdlePriority,di=null,wn=null;function Fh(e){if(wn&&typeof wn.onCommitFiberRoot=="function")try{wn.onCommitFiberRoot(di,e,void 0,(e.current.flags&128)===128)}catch{}}var pn=Math.clz32?Math.clz32:Vh,Bh=Math.log,Uh=Math.LN2;function Vh(e){return e>>>=0,e===0?32:31-(Bh(e)/Uh|0)|0}var al=64,cl=4194304;function kr(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Wl(e,n){var t=e.pendingLanes;if(t===0)return 0;var r=0,l=e.suspendedLanes,i=e.pingedLanes,o=t&268435455;if(o!==0){var u=o&~l;u!==0?r=kr(u):(i&=o,i!==0&&(r=kr(i)))}else o=t&~l,o!==0?r=kr(o):i!==0&&(r=kr(i));if(r===0)return 0;if(n!==0&&n!==r&&!(n&l)&&(l=r&-r,i=n&-n,l>=i||l===16&&(i&4194240)!==0))return n;if(r&4&&(r|=t&16),n=e.entangledLanes,n!==0)for(e=e.entanglements,n&=r;0<n;)t=31-pn(n),l=1<<t,r|=e[t],n&=~l;return r}function Hh(e,n){switch(e){case 1:case 2:case 4:return n+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return n+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function $h(e,n){for(var t=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,i=e.pendingLanes;0<i;){var o=31-pn(i),u=1<<o,s=l[o];s===-1?(!(u&t)||u&r)&&(l[o]=Hh(u,n)):s<=n&&(e.expiredLanes|=u),i&=~u}}function Oo(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Ef(){var e=al;return al<<=1,!(al&4194240)&&(al=64),e}function Ai(e){for(var n=[],t=0;31>t;t++)n.push(e);return n}function Zr(e,n,t){e.pendingLanes|=n,n!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,n=31-pn(n),e[n]=t}function Wh(e,n){var t=e.pendingLanes&~n;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=n,e.mutableReadLanes&=n,e.entangledLanes&=n,n=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<t;){var l=31-pn(t),i=1<<l;n[l]=0,r[l]=-1,e[l]=-1,t&=~i}}function Ou(e,n){var t=e.entangledLanes|=n;for(e=e.entanglements;t;){var r=31-pn(t),l=1<<r;l&n|e[r]&n&&(e[r]|=n),t&=~l}}var X=0;function Cf(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Nf,Du,Pf,_f,Tf,Do=!1,fl=[],Qn=null,bn=null,Kn=null,jr=new Map,Ar=new Map,Vn=[],Qh="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Gs(e,n){switch(e){case"focusin":case"focusout":Qn=null;break;case"dragenter":case"dragleave":bn=null;break;case"mouseover":case"mouseout":Kn=null;break;case"pointerover":case"pointerout":jr.delete(n.pointerId);break;case"gotpointercapture":case"lostpointercapture":Ar.delete(n.pointerId)}}function ar(e,n,t,r,l,i){return e===null||e.nativeEvent!==i?(e={blockedOn:n,domEventName:t,eventSystemFlags:r,nativeEvent:i,targetContainers:[l]},n!==null&&(n=el(n),n!==null&&Du(n)),e):(e.eventSystemFlags|=r,n=e.targetContainers,l!==null&&n.indexOf(l)===-1&&n.push(l),e)}function bh(e,n,t,r,l){switch(n){case"focusin":return Qn=ar(Qn,e,n,t,r,l),!0;case"dragenter":return bn=ar(bn,e,n,t,r,l),!0;case"mouseover":return Kn=ar(Kn,e,n,t,r,l),!0;case"pointerover":var i=l.pointerId;return jr.set(i,ar(jr.get(i)||null,e,n,t,r,l)),!0;case"gotpointercapture":return i=l.pointerId,Ar.set(i,ar(Ar.get(i)||null,e,n,t,r,l)),!0}return!1}function zf(e){var n=at(e.target);if(n!==null){var t=xt(n);if(t!==null){if(n=t.tag,n===13){if(n=yf(t),n!==null){e.blockedOn=n,Tf(e.priority,function(){Pf(t)});return}}else if(n===3&&t.stateNode.current.memoizedState.isDehydrated){e.blockedOn=t.tag===3?t.stateNode.containerInfo:null;return}}}e.blockedOn=null}function _l(e){if(e.blockedOn!==null)return!1;for(var n=e.targetContainers;0<n.length;){var t=Mo(e.domEventName,e.eventSystemFlags,n[0],e.nativeEvent);if(t===null){t=e.nativeEvent;var r=new t.constructor(t.type,t);zo=r,t.target.dispatchEvent(r),zo=null}else return n=el(t),n!==null&&Du(n),e.blockedOn=t,!1;n.shift()}return!0}function Xs(e,n,t){_l(e)&&t.delete(n)}function Kh(){Do=!1,Qn!==null&&_l(Qn)&&(Qn=null),bn!==null&&_l(bn)&&(bn=null),Kn!==null&&_l(Kn)&&(Kn=null),jr.forEach(Xs),Ar.forEach(Xs)}function cr(e,n){e.blockedOn===n&&(e.blockedOn=null,Do||(Do=!0,Ye.unstable_scheduleCallback(Ye.unstable_NormalPriority,Kh)))}function Fr(e){function n(l){return cr(l,e)}if(0<fl.length){cr(fl[0],e);for(var t=1;t<fl.length;t++){var r=fl[t];r.blockedOn===e&&(r.blockedOn=null)}}for(Qn!==null&&cr(Qn,e),bn!==null&&cr(bn,e),Kn!==null&&cr(Kn,e),jr.forEach(n),Ar.forEach(n),t=0;t<Vn.length;t++)r=Vn[t],r.blockedOn===e&&(r.blockedOn=null);for(;0<Vn.length&&(t=Vn[0],t.blockedOn===null);)zf(t),t.blockedOn===null&&Vn.shift()}var Ht=Mn.ReactCurrentBatchConfig,Ql=!0;function Yh(e,n,t,r){var l=X,i=Ht.transition;Ht.transition=null;try{X=1,Mu(e,n,t,r)}finally{X=l,Ht.transition=i}}function Gh(e,n,t,r){var l=X,i=Ht.transition;Ht.transition=null;try{X=4,Mu(e,n,t,r)}finally{X=l,Ht.transition=i}}function Mu(e,n,t,r){if(Ql){var l=Mo(e,n,t,r);if(l===null)Ki(e,n,r,bl,t),Gs(e,r);else if(bh(l,e,n,t,r))r.stopPropagation();else if(Gs(e,r),n&4&&-1<Qh.indexOf(e)){for(;l!==null;){var i=el(l);if(i!==null&&Nf(i),i=Mo(e,n,t,r),i===null&&Ki(e,n,r,bl,t),i===l)break;l=i}l!==null&&r.stopPropagation()}else Ki(e,n,r,null,t)}}var bl=null;function Mo(e,n,t,r){if(bl=null,e=Lu(r),e=at(e),e!==null)if(n=xt(e),n===null)e=null;else if(t=n.tag,t===13){if(e=yf(n),e!==null)return e;e=null}else if(t===3){if(n.stateNode.current.memoizedState.isDehydrated)return n.tag===3?n.stateNode.containerInfo:null;e=null}else n!==e&&(e=null);return bl=e,null}function If(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(jh()){case Ru:return 1;case wf:return 4;case $l:case Ah:return 16;case Sf:return 536870912;default:return 16}default:return 16}}var $n=null,ju=null,Tl=null;function Lf(){if(Tl)return Tl;var e,n=ju,t=n.length,r,l="value"in $n?$n.value:$n.textContent,i=l.length;for(e=0;e<t&&n[e]===l[e];e++);var o=t-e;for(r=1;r<=o&&n[t-r]===l[i-r];r++);return Tl=l.slice(e,1<r?1-r:void 0)}function zl(e){var n=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&n===13&&(e=13)):e=n,e===10&&(e=13),32<=e||e===13?e:0}function pl(){return!0}function qs(){return!1}function Xe(e){function n(t,r,l,i,o){this._reactName=t,this._targetInst=l,this.type=r,this.nativeEvent=i,this.target=o,this.currentTarget=null;for(var u in e)e.hasOwnProperty(u)&&(t=e[u],this[u]=t?t(i):i[u]);return this.isDefaultPrevented=(i.defaultPrevented!=null?i.defaultPrevented:i.returnValue===!1)?pl:qs,this.isPropagationStopped=qs,this}return ae(n.prototype,{preventDefault:function(){this.defaultPrevented=!0;var t=this.nativeEvent;t&&(t.preventDefault?t.preventDefault():typeof t.returnValue!="unknown"&&(t.returnValue=!1),this.isDefaultPrevented=pl)},stopPropagation:function(){var t=this.nativeEvent;t&&(t.stopPropagation?t.stopPropagation():typeof t.cancelBubble!="unknown"&&(t.cancelBubble=!0),this.isPropagationStopped=pl)},persist:function(){},isPersistent:pl}),n}var nr={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Au=Xe(nr),Jr=ae({},nr,{view:0,detail:0}),Xh=Xe(Jr),Fi,Bi,fr,hi=ae({},Jr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Fu,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==fr&&(fr&&e.type==="mousemove"?(Fi=e.screenX-fr.screenX,Bi=e.screenY-fr.screenY):Bi=Fi=0,fr=e),Fi)},movementY:function(e){return"movementY"in e?e.movementY:Bi}}),Zs=Xe(hi),qh=ae({},hi,{dataTransfer:0}),Zh=Xe(qh),Jh=ae({},Jr,{relatedTarget:0}),Ui=Xe(Jh),em=ae({},nr,{animationName:0,elapsedTime:0,pseudoElement:0}),nm=Xe(em),tm=ae({},nr,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),rm=Xe(tm),lm=ae({},nr,{data:0}),Js=Xe(lm),im={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},om={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},um={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function sm(e){var n=this.nativeEvent;return n.getModifierState?n.getModifierState(e):(e=um[e])?!!n[e]:!1}function Fu(){return sm}var am=ae({},Jr,{key:function(e){if(e.key){var n=im[e.key]||e.key;if(n!=="Unidentified")return n}return e.type==="keypress"?(e=zl(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?om[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Fu,charCode:function(e){return e.type==="keypress"?zl(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?zl(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),cm=Xe(am),fm=ae({},hi,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),ea=Xe(fm),pm=ae({},Jr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Fu}),dm=Xe(pm),hm=ae({},nr,{propertyName:0,elapsedTime:0,pseudoElement:0}),mm=Xe(hm),gm=ae({},hi,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),ym=Xe(gm),vm=[9,13,27,32],Bu=Ln&&"CompositionEvent"in window,Er=null;Ln&&"documentMode"in document&&(Er=document.documentMode);var km=Ln&&"TextEvent"in window&&!Er,Rf=Ln&&(!Bu||Er&&8<Er&&11>=Er),na=" ",ta=!1;function Of(e,n){switch(e){case"keyup":return vm.indexOf(n.keyCode)!==-1;case"keydown":return n.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Df(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var zt=!1;function xm(e,n){switch(e){case"compositionend":return Df(n);case"keypress":return n.which!==32?null:(ta=!0,na);case"textInput":return e=n.data,e===na&&ta?null:e;default:return null}}function wm(e,n){if(zt)return e==="compositionend"||!Bu&&Of(e,n)?(e=Lf(),Tl=ju=$n=null,zt=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(n.ctrlKey||n.altKey||n.metaKey)||n.ctrlKey&&n.altKey){if(n.char&&1<n.char.length)return n.char;if(n.which)return String.fromCharCode(n.which)}return null;case"compositionend":return Rf&&n.locale!=="ko"?null:n.data;default:return null}}var Sm={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function ra(e){var n=e&&e.nodeName&&e.nodeName.toLowerCase();return n==="input"?!!Sm[e.type]:n==="textarea"}function Mf(e,n,t,r){pf(r),n=Kl(n,"onChange"),0<n.length&&(t=new Au("onChange","change",null,t,r),e.push({event:t,listeners:n}))}var Cr=null,Br=null;function Em(e){bf(e,0)}function mi(e){var n=Rt(e);if(lf(n))return e}function Cm(e,n){if(e==="change")return n}var jf=!1;if(Ln){var Vi;if(Ln){var Hi="oninput"in document;if(!Hi){var la=document.createElement("div");la.setAttribute("oninput","return;"),Hi=typeof la.oninput=="function"}Vi=Hi}else Vi=!1;jf=Vi&&(!document.documentMode||9<document.documentMode)}function ia(){Cr&&(Cr.detachEvent("onpropertychange",Af),Br=Cr=null)}function Af(e){if(e.propertyName==="value"&&mi(Br)){var n=[];Mf(n,Br,e,Lu(e)),gf(Em,n)}}function Nm(e,n,t){e==="focusin"?(ia(),Cr=n,Br=t,Cr.attachEvent("onpropertychange",Af)):e==="focusout"&&ia()}function Pm(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return mi(Br)}function _m(e,n){if(e==="click")return mi(n)}function Tm(e,n){if(e==="input"||e==="change")return mi(n)}function zm(e,n){return e===n&&(e!==0||1/e===1/n)||e!==e&&n!==n}var hn=typeof Object.is=="function"?Object.is:zm;function Ur(e,n){if(hn(e,n))return!0;if(typeof e!="object"||e===null||typeof n!="object"||n===null)return!1;var t=Object.keys(e),r=Object.keys(n);if(t.length!==r.length)return!1;for(r=0;r<t.length;r++){var l=t[r];if(!yo.call(n,l)||!hn(e[l],n[l]))return!1}return!0}function oa(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function ua(e,n){var t=oa(e);e=0;for(var r;t;){if(t.nodeType===3){if(r=e+t.textContent.length,e<=n&&r>=n)return{node:t,offset:n-e};e=r}e:{for(;t;){if(t.nextSibling){t=t.nextSibling;break e}t=t.parentNode}t=void 0}t=oa(t)}}function Ff(e,n){return e&&n?e===n?!0:e&&e.nodeType===3?!1:n&&n.nodeType===3?Ff(e,n.parentNode):"contains"in e?e.contains(n):e.compareDocumentPosition?!!(e.compareDocumentPosition(n)&16):!1:!1}function Bf(){for(var e=window,n=Ul();n instanceof e.HTMLIFrameElement;){try{var t=typeof n.contentWindow.location.href=="string"}catch{t=!1}if(t)e=n.contentWindow;else break;n=Ul(e.document)}return n}function Uu(e){var n=e&&e.nodeName&&e.nodeName.toLowerCase();return n&&(n==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||n==="textarea"||e.contentEditable==="true")}function Im(e){var n=Bf(),t=e.focusedElem,r=e.selectionRange;if(n!==t&&t&&t.ownerDocument&&Ff(t.ownerDocument.documentElement,t)){if(r!==null&&Uu(t)){if(n=r.start,e=r.end,e===void 0&&(e=n),"selectionStart"in t)t.selectionStart=n,t.selectionEnd=Math.min(e,t.value.length);else if(e=(n=t.ownerDocument||document)&&n.defaultView||window,e.getSelection){e=e.getSelection();var l=t.textContent.length,i=Math.min(r.start,l);r=r.end===void 0?i:Math.min(r.end,l),!e.extend&&i>r&&(l=r,r=i,i=l),l=ua(t,i);var o=ua(t,r);l&&o&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==o.node||e.focusOffset!==o.offset)&&(n=n.createRange(),n.setStart(l.node,l.offset),e.removeAllRanges(),i>r?(e.addRange(n),e.extend(o.node,o.offset)):(n.setEnd(o.node,o.offset),e.addRange(n)))}}for(n=[],e=t;e=e.parentNode;)e.nodeType===1&&n.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof t.focus=="function"&&t.focus(),t=0;t<n.length;t++)e=n[t],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var Lm=Ln&&"documentMode"in document&&11>=document.documentMode,It=null,jo=null,Nr=null,Ao=!1;function sa(e,n,t){var r=t.window===t?t.document:t.nodeType===9?t:t.ownerDocument;Ao||It==null||It!==Ul(r)||(r=It,"selectionStart"in r&&Uu(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),Nr&&Ur(Nr,r)||(Nr=r,r=Kl(jo,"onSelect"),0<r.length&&(n=new Au("onSelect","select",null,n,t),e.push({event:n,listeners:r}),n.target=It)))}function dl(e,n){var t={};return t[e.toLowerCase()]=n.toLowerCase(),t["Webkit"+e]="webkit"+n,t["Moz"+e]="moz"+n,t}var Lt={animationend:dl("Animation","AnimationEnd"),animationiteration:dl("Animation","AnimationIteration"),animationstart:dl("Animation","AnimationStart"),transitionend:dl("Transition","TransitionEnd")},$i={},Uf={};Ln&&(Uf=document.createElement("div").style,"AnimationEvent"in window||(delete Lt.animationend.animation,delete Lt.animationiteration.animation,delete Lt.animationstart.animation),"TransitionEvent"in window||delete Lt.transitionend.transition);function gi(e){if($i[e])return $i[e];if(!Lt[e])return e;var n=Lt[e],t;for(t in n)if(n.hasOwnProperty(t)&&t in Uf)return $i[e]=n[t];return e}var Vf=gi("animationend"),Hf=gi("animationiteration"),$f=gi("animationstart"),Wf=gi("transitionend"),Qf=new Map,aa="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function nt(e,n){Qf.set(e,n),kt(n,[e])}for(var Wi=0;Wi<aa.length;Wi++){var Qi=aa[Wi],Rm=Qi.toLowerCase(),Om=Qi[0].toUpperCase()+Qi.slice(1);nt(Rm,"on"+Om)}nt(Vf,"onAnimationEnd");nt(Hf,"onAnimationIteration");nt($f,"onAnimationStart");nt("dblclick","onDoubleClick");nt("focusin","onFocus");nt("focusout","onBlur");nt(Wf,"onTransitionEnd");Kt("onMouseEnter",["mouseout","mouseover"]);Kt("onMouseLeave",["mouseout","mouseover"]);Kt("onPointerEnter",["pointerout","pointerover"]);Kt("onPointerLeave",["pointerout","pointerover"]);kt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));kt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));kt("onBeforeInput",["compositionend","keypress","textInput","paste"]);kt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));kt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));kt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var xr="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Dm=new Set("cancel close invalid load scroll toggle".split(" ").concat(xr));function ca(e,n,t){var r=e.type||"unknown-event";e.currentTarget=t,Rh(r,n,void 0,e),e.currentTarget=null}function bf(e,n){n=(n&4)!==0;for(var t=0;t<e.length;t++){var r=e[t],l=r.event;r=r.listeners;e:{var i=void 0;if(n)for(var o=r.length-1;0<=o;o--){var u=r[o],s=u.instance,a=u.currentTarget;if(u=u.listener,s!==i&&l.isPropagationStopped())break e;ca(l,u,a),i=s}else for(o=0;o<r.length;o++){if(u=r[o],s=u.instance,a=u.currentTarget,u=u.listener,s!==i&&l.isPropagationStopped())break e;ca(l,u,a),i=s}}}if(Hl)throw e=Ro,Hl=!1,Ro=null,e}function le(e,n){var t=n[Ho];t===void 0&&(t=n[Ho]=new Set);var r=e+"__bubble";t.has(r)||(Kf(n,e,2,!1),t.add(r))}function bi(e,n,t){var r=0;n&&(r|=4),Kf(t,e,r,n)}var hl="_reactListening"+Math.random().toString(36).slice(2);function Vr(e){if(!e[hl]){e[hl]=!0,Jc.forEach(function(t){t!=="selectionchange"&&(Dm.has(t)||bi(t,!1,e),bi(t,!0,e))});var n=e.nodeType===9?e:e.ownerDocument;n===null||n[hl]||(n[hl]=!0,bi("selectionchange",!1,n))}}function Kf(e,n,t,r){switch(If(n)){case 1:var l=Yh;break;case 4:l=Gh;break;default:l=Mu}t=l.bind(null,n,t,e),l=void 0,!Lo||n!=="touchstart"&&n!=="touchmove"&&n!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(n,t,{capture:!0,passive:l}):e.addEventListener(n,t,!0):l!==void 0?e.addEventListener(n,t,{passive:l}):e.addEventListener(n,t,!1)}function Ki(e,n,t,r,l){var i=r;if(!(n&1)&&!(n&2)&&r!==null)e:for(;;){if(r===null)return;var o=r.tag;if(o===3||o===4){var u=r.stateNode.containerInfo;if(u===l||u.nodeType===8&&u.parentNode===l)break;if(o===4)for(o=r.return;o!==null;){var s=o.tag;if((s===3||s===4)&&(s=o.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;o=o.return}for(;u!==null;){if(o=at(u),o===null)return;if(s=o.tag,s===5||s===6){r=i=o;continue e}u=u.parentNode}}r=r.return}gf(function(){var a=i,c=Lu(t),f=[];e:{var d=Qf.get(e);if(d!==void 0){var p=Au,k=e;switch(e){case"keypress":if(zl(t)===0)break e;case"keydown":case"keyup":p=cm;break;case"focusin":k="focus",p=Ui;break;case"focusout":k="blur",p=Ui;break;case"beforeblur":case"afterblur":p=Ui;break;case"click":if(t.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":p=Zs;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":p=Zh;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":p=dm;break;case Vf:case Hf:case $f:p=nm;break;case Wf:p=mm;break;case"scroll":p=Xh;break;case"wheel":p=ym;break;case"copy":case"cut":case"paste":p=rm;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":p=ea}var x=(n&4)!==0,I=!x&&e==="scroll",h=x?d!==null?d+"Capture":null:d;x=[];for(var m=a,y;m!==null;){y=m;var S=y.stateNode;if(y.tag===5&&S!==null&&(y=S,h!==null&&(S=Mr(m,h),S!=null&&x.push(Hr(m,S,y)))),I)break;m=m.return}0<x.length&&(d=new p(d,k,null,t,c),f.push({event:d,listeners:x}))}}if(!(n&7)){e:{if(d=e==="mouseover"||e==="pointerover",p=e==="mouseout"||e==="pointerout",d&&t!==zo&&(k=t.relatedTarget||t.fromElement)&&(at(k)||k[Rn]))break e;if((p||d)&&(d=c.window===c?c:(d=c.ownerDocument)?d.defaultView||d.parentWindow:window,p?(k=t.relatedTarget||t.toElement,p=a,k=k?at(k):null,k!==null&&(I=xt(k),k!==I||k.tag!==5&&k.tag!==6)&&(k=null)):(p=null,k=a),p!==k)){if(x=Zs,S="onMouseLeave",h="onMouseEnter",m="mouse",(e==="pointerout"||e==="pointerover")&&(x=ea,S="onPointerLeave",h="onPointerEnter",m="pointer"),I=p==null?d:Rt(p),y=k==null?d:Rt(k),d=new x(S,m+"leave",p,t,c),d.target=I,d.relatedTarget=y,S=null,at(c)===a&&(x=new x(h,m+"enter",k,t,c),x.target=y,x.relatedTarget=I,S=x),I=S,p&&k)n:{for(x=p,h=k,m=0,y=x;y;y=Nt(y))m++;for(y=0,S=h;S;S=Nt(S))y++;for(;0<m-y;)x=Nt(x),m--;for(;0<y-m;)h=Nt(h),y--;for(;m--;){if(x===h||h!==null&&x===h.alternate)break n;x=Nt(x),h=Nt(h)}x=null}else x=null;p!==null&&fa(f,d,p,x,!1),k!==null&&I!==null&&fa(f,I,k,x,!0)}}e:{if(d=a?Rt(a):window,p=d.nodeName&&d.nodeName.toLowerCase(),p==="select"||p==="input"&&d.type==="file")var N=Cm;else if(ra(d))if(jf)N=Tm;else{N=Pm;var w=Nm}else(p=d.nodeName)&&p.toLowerCase()==="input"&&(d.type==="checkbox"||d.type==="radio")&&(N=_m);if(N&&(N=N(e,a))){Mf(f,N,t,c);break e}w&&w(e,d,a),e==="focusout"&&(w=d._wrapperState)&&w.controlled&&d.type==="number"&&Co(d,"number",d.value)}switch(w=a?Rt(a):window,e){case"focusin":(ra(w)||w.contentEditable==="true")&&(It=w,jo=a,Nr=null);break;case"focusout":Nr=jo=It=null;break;case"mousedown":Ao=!0;break;case"contextmenu":case"mouseup":case"dragend":Ao=!1,sa(f,t,c);break;case"selectionchange":if(Lm)break;case"keydown":case"keyup":sa(f,t,c)}var T;if(Bu)e:{switch(e){case"compositionstart":var R="onCompositionStart";break e;case"compositionend":R="onCompositionEnd";break e;case"compositionupdate":R="onCompositionUpdate";break e}R=void 0}else zt?Of(e,t)&&(R="onCompositionEnd"):e==="keydown"&&t.keyCode===229&&(R="onCompositionStart");R&&(Rf&&t.locale!=="ko"&&(zt||R!=="onCompositionStart"?R==="onCompositionEnd"&&zt&&(T=Lf()):($n=c,ju="value"in $n?$n.value:$n.textContent,zt=!0)),w=Kl(a,R),0<w.length&&(R=new Js(R,e,null,t,c),f.push({event:R,listeners:w}),T?R.data=T:(T=Df(t),T!==null&&(R.data=T)))),(T=km?xm(e,t):wm(e,t))&&(a=Kl(a,"onBeforeInput"),0<a.length&&(c=new Js("onBeforeInput","beforeinput",null,t,c),f.push({event:c,listeners:a}),c.data=T))}bf(f,n)})}function Hr(e,n,t){return{instance:e,listener:n,currentTarget:t}}function Kl(e,n){for(var t=n+"Capture",r=[];e!==null;){var l=e,i=l.stateNode;l.tag===5&&i!==null&&(l=i,i=Mr(e,t),i!=null&&r.unshift(Hr(e,i,l)),i=Mr(e,n),i!=null&&r.push(Hr(e,i,l))),e=e.return}return r}function Nt(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function fa(e,n,t,r,l){for(var i=n._reactName,o=[];t!==null&&t!==r;){var u=t,s=u.alternate,a=u.stateNode;if(s!==null&&s===r)break;u.tag===5&&a!==null&&(u=a,l?(s=Mr(t,i),s!=null&&o.unshift(Hr(t,s,u))):l||(s=Mr(t,i),s!=null&&o.push(Hr(t,s,u)))),t=t.return}o.length!==0&&e.push({event:n,listeners:o})}var Mm=/\r\n?/g,jm=/\u0000|\uFFFD/g;function pa(e){return(typeof e=="string"?e:""+e).replace(Mm,`
-`).replace(jm,"")}function ml(e,n,t){if(n=pa(n),pa(e)!==n&&t)throw Error(_(425))}function Yl(){}var Fo=null,Bo=null;function Uo(e,n){return e==="textarea"||e==="noscript"||typeof n.children=="string"||typeof n.children=="number"||typeof n.dangerouslySetInnerHTML=="object"&&n.dangerouslySetInnerHTML!==null&&n.dangerouslySetInnerHTML.__html!=null}var Vo=typeof setTimeout=="function"?setTimeout:void 0,Am=typeof clearTimeout=="function"?clearTimeout:void 0,da=typeof Promise=="function"?Promise:void 0,Fm=typeof queueMicrotask=="function"?queueMicrotask:typeof da<"u"?function(e){return da.resolve(null).then(e).catch(Bm)}:Vo;function Bm(e){setTimeout(function(){throw e})}function Yi(e,n){var t=n,r=0;do{var l=t.nextSibling;if(e.removeChild(t),l&&l.nodeType===8)if(t=l.data,t==="/$"){if(r===0){e.removeChild(l),Fr(n);return}r--}else t!=="$"&&t!=="$?"&&t!=="$!"||r++;t=l}while(t);Fr(n)}function Yn(e){for(;e!=null;e=e.nextSibling){var n=e.nodeType;if(n===1||n===3)break;if(n===8){if(n=e.data,n==="$"||n==="$!"||n==="$?")break;if(n==="/$")return null}}return e}function ha(e){e=e.previousSibling;for(var n=0;e;){if(e.nodeType===8){var t=e.data;if(t==="$"||t==="$!"||t==="$?"){if(n===0)return e;n--}else t==="/$"&&n++}e=e.previousSibling}return null}var tr=Math.random().toString(36).slice(2),kn="__reactFiber$"+tr,$r="__reactProps$"+tr,Rn="__reactContainer$"+tr,Ho="__reactEvents$"+tr,Um="__reactListeners$"+tr,Vm="__reactHandles$"+tr;function at(e){var n=e[kn];if(n)return n;for(var t=e.parentNode;t;){if(n=t[Rn]||t[kn]){if(t=n.alternate,n.child!==null||t!==null&&t.child!==null)for(e=ha(e);e!==null;){if(t=e[kn])return t;e=ha(e)}return n}e=t,t=e.parentNode}return null}function el(e){return e=e[kn]||e[Rn],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function Rt(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(_(33))}function yi(e){return e[$r]||null}var $o=[],Ot=-1;function tt(e){return{current:e}}function ie(e){0>Ot||(e.current=$o[Ot],$o[Ot]=null,Ot--)}function ne(e,n){Ot++,$o[Ot]=e.current,e.current=n}var et={},_e=tt(et),Ae=tt(!1),ht=et;function Yt(e,n){var t=e.type.contextTypes;if(!t)return et;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===n)return r.__reactInternalMemoizedMaskedChildContext;var l={},i;for(i in t)l[i]=n[i];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=n,e.__reactInternalMemoizedMaskedChildContext=l),l}function Fe(e){return e=e.childContextTypes,e!=null}function Gl(){ie(Ae),ie(_e)}function ma(e,n,t){if(_e.current!==et)throw Error(_(168));ne(_e,n),ne(Ae,t)}function Yf(e,n,t){var r=e.stateNode;if(n=n.childContextTypes,typeof r.getChildContext!="function")return t;r=r.getChildContext();for(var l in r)if(!(l in n))throw Error(_(108,Nh(e)||"Unknown",l));return ae({},t,r)}function Xl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||et,ht=_e.current,ne(_e,e),ne(Ae,Ae.current),!0}function ga(e,n,t){var r=e.stateNode;if(!r)throw Error(_(169));t?(e=Yf(e,n,ht),r.__reactInternalMemoizedMergedChildContext=e,ie(Ae),ie(_e),ne(_e,e)):ie(Ae),ne(Ae,t)}var _n=null,vi=!1,Gi=!1;function Gf(e){_n===null?_n=[e]:_n.push(e)}function Hm(e){vi=!0,Gf(e)}function rt(){if(!Gi&&_n!==null){Gi=!0;var e=0,n=X;try{var t=_n;for(X=1;e<t.length;e++){var r=t[e];do r=r(!0);while(r!==null)}_n=null,vi=!1}catch(l){throw _n!==null&&(_n=_n.slice(e+1)),xf(Ru,rt),l}finally{X=n,Gi=!1}}return null}var Dt=[],Mt=0,ql=null,Zl=0,Ze=[],Je=0,mt=null,Tn=1,zn="";function ot(e,n){Dt[Mt++]=Zl,Dt[Mt++]=ql,ql=e,Zl=n}function Xf(e,n,t){Ze[Je++]=Tn,Ze[Je++]=zn,Ze[Je++]=mt,mt=e;var r=Tn;e=zn;var l=32-pn(r)-1;r&=~(1<<l),t+=1;var i=32-pn(n)+l;if(30<i){var o=l-l%5;i=(r&(1<<o)-1).toString(32),r>>=o,l-=o,Tn=1<<32-pn(n)+l|t<<l|r,zn=i+e}else Tn=1<<i|t<<l|r,zn=e}function Vu(e){e.return!==null&&(ot(e,1),Xf(e,1,0))}function Hu(e){for(;e===ql;)ql=Dt[--Mt],Dt[Mt]=null,Zl=Dt[--Mt],Dt[Mt]=null;for(;e===mt;)mt=Ze[--Je],Ze[Je]=null,zn=Ze[--Je],Ze[Je]=null,Tn=Ze[--Je],Ze[Je]=null}var Ke=null,Qe=null,oe=!1,fn=null;function qf(e,n){var t=nn(5,null,null,0);t.elementType="DELETED",t.stateNode=n,t.return=e,n=e.deletions,n===null?(e.deletions=[t],e.flags|=16):n.push(t)}function ya(e,n){switch(e.tag){case 5:var t=e.type;return n=n.nodeType!==1||t.toLowerCase()!==n.nodeName.toLowerCase()?null:n,n!==null?(e.stateNode=n,Ke=e,Qe=Yn(n.firstChild),!0):!1;case 6:return n=e.pendingProps===""||n.nodeType!==3?null:n,n!==null?(e.stateNode=n,Ke=e,Qe=null,!0):!1;case 13:return n=n.nodeType!==8?null:n,n!==null?(t=mt!==null?{id:Tn,overflow:zn}:null,e.memoizedState={dehydrated:n,treeContext:t,retryLane:1073741824},t=nn(18,null,null,0),t.stateNode=n,t.return=e,e.child=t,Ke=e,Qe=null,!0):!1;default:return!1}}function Wo(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Qo(e){if(oe){var n=Qe;if(n){var t=n;if(!ya(e,n)){if(Wo(e))throw Error(_(418));n=Yn(t.nextSibling);var r=Ke;n&&ya(e,n)?qf(r,t):(e.flags=e.flags&-4097|2,oe=!1,Ke=e)}}else{if(Wo(e))throw Error(_(418));e.flags=e.flags&-4097|2,oe=!1,Ke=e}}}function va(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Ke=e}function gl(e){if(e!==Ke)return!1;if(!oe)return va(e),oe=!0,!1;var n;if((n=e.tag!==3)&&!(n=e.tag!==5)&&(n=e.type,n=n!=="head"&&n!=="body"&&!Uo(e.type,e.memoizedProps)),n&&(n=Qe)){if(Wo(e))throw Zf(),Error(_(418));for(;n;)qf(e,n),n=Yn(n.nextSibling)}if(va(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(_(317));e:{for(e=e.nextSibling,n=0;e;){if(e.nodeType===8){var t=e.data;if(t==="/$"){if(n===0){Qe=Yn(e.nextSibling);break e}n--}else t!=="$"&&t!=="$!"&&t!=="$?"||n++}e=e.nextSibling}Qe=null}}else Qe=Ke?Yn(e.stateNode.nextSibling):null;return!0}function Zf(){for(var e=Qe;e;)e=Yn(e.nextSibling)}function Gt(){Qe=Ke=null,oe=!1}function $u(e){fn===null?fn=[e]:fn.push(e)}var $m=Mn.ReactCurrentBatchConfig;function pr(e,n,t){if(e=t.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(t._owner){if(t=t._owner,t){if(t.tag!==1)throw Error(_(309));var r=t.stateNode}if(!r)throw Error(_(147,e));var l=r,i=""+e;return n!==null&&n.ref!==null&&typeof n.ref=="function"&&n.ref._stringRef===i?n.ref:(n=function(o){var u=l.refs;o===null?delete u[i]:u[i]=o},n._stringRef=i,n)}if(typeof e!="string")throw Error(_(284));if(!t._owner)throw Error(_(290,e))}return e}function yl(e,n){throw e=Object.prototype.toString.call(n),Error(_(31,e==="[object Object]"?"object with keys {"+Object.keys(n).join(", ")+"}":e))}function ka(e){var n=e._init;return n(e._payload)}function Jf(e){function n(h,m){if(e){var y=h.deletions;y===null?(h.deletions=[m],h.flags|=16):y.push(m)}}function t(h,m){if(!e)return null;for(;m!==null;)n(h,m),m=m.sibling;return null}function r(h,m){for(h=new Map;m!==null;)m.key!==null?h.set(m.key,m):h.set(m.index,m),m=m.sibling;return h}function l(h,m){return h=Zn(h,m),h.index=0,h.sibling=null,h}function i(h,m,y){return h.index=y,e?(y=h.alternate,y!==null?(y=y.index,y<m?(h.flags|=2,m):y):(h.flags|=2,m)):(h.flags|=1048576,m)}function o(h){return e&&h.alternate===null&&(h.flags|=2),h}function u(h,m,y,S){return m===null||m.tag!==6?(m=to(y,h.mode,S),m.return=h,m):(m=l(m,y),m.return=h,m)}function s(h,m,y,S){var N=y.type;return N===Tt?c(h,m,y.props.children,S,y.key):m!==null&&(m.elementType===N||typeof N=="object"&&N!==null&&N.$$typeof===Bn&&ka(N)===m.type)?(S=l(m,y.props),S.ref=pr(h,m,y),S.return=h,S):(S=jl(y.type,y.key,y.props,null,h.mode,S),S.ref=pr(h,m,y),S.return=h,S)}function a(h,m,y,S){return m===null||m.tag!==4||m.stateNode.containerInfo!==y.containerInfo||m.stateNode.implementation!==y.implementation?(m=ro(y,h.mode,S),m.return=h,m):(m=l(m,y.children||[]),m.return=h,m)}function c(h,m,y,S,N){return m===null||m.tag!==7?(m=dt(y,h.mode,S,N),m.return=h,m):(m=l(m,y),m.return=h,m)}function f(h,m,y){if(typeof m=="string"&&m!==""||typeof m=="number")return m=to(""+m,h.mode,y),m.return=h,m;if(typeof m=="object"&&m!==null){switch(m.$$typeof){case ol:return y=jl(m.type,m.key,m.props,null,h.mode,y),y.ref=pr(h,null,m),y.return=h,y;case _t:return m=ro(m,h.mode,y),m.return=h,m;case Bn:var S=m._init;return f(h,S(m._payload),y)}if(vr(m)||ur(m))return m=dt(m,h.mode,y,null),m.return=h,m;yl(h,m)}return null}function d(h,m,y,S){var N=m!==null?m.key:null;if(typeof y=="string"&&y!==""||typeof y=="number")return N!==null?null:u(h,m,""+y,S);if(typeof y=="object"&&y!==null){switch(y.$$typeof){case ol:return y.key===N?s(h,m,y,S):null;case _t:return y.key===N?a(h,m,y,S):null;case Bn:return N=y._init,d(h,m,N(y._payload),S)}if(vr(y)||ur(y))return N!==null?null:c(h,m,y,S,null);yl(h,y)}return null}function p(h,m,y,S,N){if(typeof S=="string"&&S!==""||typeof S=="number")return h=h.get(y)||null,u(m,h,""+S,N);if(typeof S=="object"&&S!==null){switch(S.$$typeof){case ol:return h=h.get(S.key===null?y:S.key)||null,s(m,h,S,N);case _t:return h=h.get(S.key===null?y:S.key)||null,a(m,h,S,N);case Bn:var w=S._init;return p(h,m,y,w(S._payload),N)}if(vr(S)||ur(S))return h=h.get(y)||null,c(m,h,S,N,null);yl(m,S)}return null}function k(h,m,y,S){for(var N=null,w=null,T=m,R=m=0,A=null;T!==null&&R<y.length;R++){T.index>R?(A=T,T=null):A=T.sibling;var j=d(h,T,y[R],S);if(j===null){T===null&&(T=A);break}e&&T&&j.alternate===null&&n(h,T),m=i(j,m,R),w===null?N=j:w.sibling=j,w=j,T=A}if(R===y.length)return t(h,T),oe&&ot(h,R),N;if(T===null){for(;R<y.length;R++)T=f(h,y[R],S),T!==null&&(m=i(T,m,R),w===null?N=T:w.sibling=T,w=T);return oe&&ot(h,R),N}for(T=r(h,T);R<y.length;R++)A=p(T,h,R,y[R],S),A!==null&&(e&&A.alternate!==null&&T.delete(A.key===null?R:A.key),m=i(A,m,R),w===null?N=A:w.sibling=A,w=A);return e&&T.forEach(function(P){return n(h,P)}),oe&&ot(h,R),N}function x(h,m,y,S){var N=ur(y);if(typeof N!="function")throw Error(_(150));if(y=N.call(y),y==null)throw Error(_(151));for(var w=N=null,T=m,R=m=0,A=null,j=y.next();T!==null&&!j.done;R++,j=y.next()){T.index>R?(A=T,T=null):A=T.sibling;var P=d(h,T,j.value,S);if(P===null){T===null&&(T=A);break}e&&T&&P.alternate===null&&n(h,T),m=i(P,m,R),w===null?N=P:w.sibling=P,w=P,T=A}if(j.done)return t(h,T),oe&&ot(h,R),N;if(T===null){for(;!j.done;R++,j=y.next())j=f(h,j.value,S),j!==null&&(m=i(j,m,R),w===null?N=j:w.sibling=j,w=j);return oe&&ot(h,R),N}for(T=r(h,T);!j.done;R++,j=y.next())j=p(T,h,R,j.value,S),j!==null&&(e&&j.alternate!==null&&T.delete(j.key===null?R:j.key),m=i(j,m,R),w===null?N=j:w.sibling=j,w=j);return e&&T.forEach(function(L){return n(h,L)}),oe&&ot(h,R),N}function I(h,m,y,S){if(typeof y=="object"&&y!==null&&y.type===Tt&&y.key===null&&(y=y.props.children),typeof y=="object"&&y!==null){switch(y.$$typeof){case ol:e:{for(var N=y.key,w=m;w!==null;){if(w.key===N){if(N=y.type,N===Tt){if(w.tag===7){t(h,w.sibling),m=l(w,y.props.children),m.return=h,h=m;break e}}else if(w.elementType===N||typeof N=="object"&&N!==null&&N.$$typeof===Bn&&ka(N)===w.type){t(h,w.sibling),m=l(w,y.props),m.ref=pr(h,w,y),m.return=h,h=m;break e}t(h,w);break}else n(h,w);w=w.sibling}y.type===Tt?(m=dt(y.props.children,h.mode,S,y.key),m.return=h,h=m):(S=jl(y.type,y.key,y.props,null,h.mode,S),S.ref=pr(h,m,y),S.return=h,h=S)}return o(h);case _t:e:{for(w=y.key;m!==null;){if(m.key===w)if(m.tag===4&&m.stateNode.containerInfo===y.containerInfo&&m.stateNode.implementation===y.implementation){t(h,m.sibling),m=l(m,y.children||[]),m.return=h,h=m;break e}else{t(h,m);break}else n(h,m);m=m.sibling}m=ro(y,h.mode,S),m.return=h,h=m}return o(h);case Bn:return w=y._init,I(h,m,w(y._payload),S)}if(vr(y))return k(h,m,y,S);if(ur(y))return x(h,m,y,S);yl(h,y)}return typeof y=="string"&&y!==""||typeof y=="number"?(y=""+y,m!==null&&m.tag===6?(t(h,m.sibling),m=l(m,y),m.return=h,h=m):(t(h,m),m=to(y,h.mode,S),m.return=h,h=m),o(h)):t(h,m)}return I}var Xt=Jf(!0),ep=Jf(!1),Jl=tt(null),ei=null,jt=null,Wu=null;function Qu(){Wu=jt=ei=null}function bu(e){var n=Jl.current;ie(Jl),e._currentValue=n}function bo(e,n,t){for(;e!==null;){var r=e.alternate;if((e.childLanes&n)!==n?(e.childLanes|=n,r!==null&&(r.childLanes|=n)):r!==null&&(r.childLanes&n)!==n&&(r.childLanes|=n),e===t)break;e=e.return}}function $t(e,n){ei=e,Wu=jt=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&n&&(je=!0),e.firstContext=null)}function rn(e){var n=e._currentValue;if(Wu!==e)if(e={context:e,memoizedValue:n,next:null},jt===null){if(ei===null)throw Error(_(308));jt=e,ei.dependencies={lanes:0,firstContext:e}}else jt=jt.next=e;return n}var ct=null;function Ku(e){ct===null?ct=[e]:ct.push(e)}function np(e,n,t,r){var l=n.interleaved;return l===null?(t.next=t,Ku(n)):(t.next=l.next,l.next=t),n.interleaved=t,On(e,r)}function On(e,n){e.lanes|=n;var t=e.alternate;for(t!==null&&(t.lanes|=n),t=e,e=e.return;e!==null;)e.childLanes|=n,t=e.alternate,t!==null&&(t.childLanes|=n),t=e,e=e.return;return t.tag===3?t.stateNode:null}var Un=!1;function Yu(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function tp(e,n){e=e.updateQueue,n.updateQueue===e&&(n.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function In(e,n){return{eventTime:e,lane:n,tag:0,payload:null,callback:null,next:null}}function Gn(e,n,t){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,Y&2){var l=r.pending;return l===null?n.next=n:(n.next=l.next,l.next=n),r.pending=n,On(e,t)}return l=r.interleaved,l===null?(n.next=n,Ku(r)):(n.next=l.next,l.next=n),r.interleaved=n,On(e,t)}function Il(e,n,t){if(n=n.updateQueue,n!==null&&(n=n.shared,(t&4194240)!==0)){var r=n.lanes;r&=e.pendingLanes,t|=r,n.lanes=t,Ou(e,t)}}function xa(e,n){var t=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,t===r)){var l=null,i=null;if(t=t.firstBaseUpdate,t!==null){do{var o={eventTime:t.eventTime,lane:t.lane,tag:t.tag,payload:t.payload,callback:t.callback,next:null};i===null?l=i=o:i=i.next=o,t=t.next}while(t!==null);i===null?l=i=n:i=i.next=n}else l=i=n;t={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:i,shared:r.shared,effects:r.effects},e.updateQueue=t;return}e=t.lastBaseUpdate,e===null?t.firstBaseUpdate=n:e.next=n,t.lastBaseUpdate=n}function ni(e,n,t,r){var l=e.updateQueue;Un=!1;var i=l.firstBaseUpdate,o=l.lastBaseUpdate,u=l.shared.pending;if(u!==null){l.shared.pending=null;var s=u,a=s.next;s.next=null,o===null?i=a:o.next=a,o=s;var c=e.alternate;c!==null&&(c=c.updateQueue,u=c.lastBaseUpdate,u!==o&&(u===null?c.firstBaseUpdate=a:u.next=a,c.lastBaseUpdate=s))}if(i!==null){var f=l.baseState;o=0,c=a=s=null,u=i;do{var d=u.lane,p=u.eventTime;if((r&d)===d){c!==null&&(c=c.next={eventTime:p,lane:0,tag:u.tag,payload:u.payload,callback:u.callback,next:null});e:{var k=e,x=u;switch(d=n,p=t,x.tag){case 1:if(k=x.payload,typeof k=="function"){f=k.call(p,f,d);break e}f=k;break e;case 3:k.flags=k.flags&-65537|128;case 0:if(k=x.payload,d=typeof k=="function"?k.call(p,f,d):k,d==null)break e;f=ae({},f,d);break e;case 2:Un=!0}}u.callback!==null&&u.lane!==0&&(e.flags|=64,d=l.effects,d===null?l.effects=[u]:d.push(u))}else p={eventTime:p,lane:d,tag:u.tag,payload:u.payload,callback:u.callback,next:null},c===null?(a=c=p,s=f):c=c.next=p,o|=d;if(u=u.next,u===null){if(u=l.shared.pending,u===null)break;d=u,u=d.next,d.next=null,l.lastBaseUpdate=d,l.shared.pending=null}}while(!0);if(c===null&&(s=f),l.baseState=s,l.firstBaseUpdate=a,l.lastBaseUpdate=c,n=l.shared.interleaved,n!==null){l=n;do o|=l.lane,l=l.next;while(l!==n)}else i===null&&(l.shared.lanes=0);yt|=o,e.lanes=o,e.memoizedState=f}}function wa(e,n,t){if(e=n.effects,n.effects=null,e!==null)for(n=0;n<e.length;n++){var r=e[n],l=r.callback;if(l!==null){if(r.callback=null,r=t,typeof l!="function")throw Error(_(191,l));l.call(r)}}}var nl={},Sn=tt(nl),Wr=tt(nl),Qr=tt(nl);function ft(e){if(e===nl)throw Error(_(174));return e}function Gu(e,n){switch(ne(Qr,n),ne(Wr,e),ne(Sn,nl),e=n.nodeType,e){case 9:case 11:n=(n=n.documentElement)?n.namespaceURI:Po(null,"");break;default:e=e===8?n.parentNode:n,n=e.namespaceURI||null,e=e.tagName,n=Po(n,e)}ie(Sn),ne(Sn,n)}function qt(){ie(Sn),ie(Wr),ie(Qr)}function rp(e){ft(Qr.current);var n=ft(Sn.current),t=Po(n,e.type);n!==t&&(ne(Wr,e),ne(Sn,t))}function Xu(e){Wr.current===e&&(ie(Sn),ie(Wr))}var ue=tt(0);function ti(e){for(var n=e;n!==null;){if(n.tag===13){var t=n.memoizedState;if(t!==null&&(t=t.dehydrated,t===null||t.data==="$?"||t.data==="$!"))return n}else if(n.tag===19&&n.memoizedProps.revealOrder!==void 0){if(n.flags&128)return n}else if(n.child!==null){n.child.return=n,n=n.child;continue}if(n===e)break;for(;n.sibling===null;){if(n.return===null||n.return===e)return null;n=n.return}n.sibling.return=n.return,n=n.sibling}return null}var Xi=[];function qu(){for(var e=0;e<Xi.length;e++)Xi[e]._workInProgressVersionPrimary=null;Xi.length=0}var Ll=Mn.ReactCurrentDispatcher,qi=Mn.ReactCurrentBatchConfig,gt=0,se=null,ye=null,ke=null,ri=!1,Pr=!1,br=0,Wm=0;function Ce(){throw Error(_(321))}function Zu(e,n){if(n===null)return!1;for(var t=0;t<n.length&&t<e.length;t++)if(!hn(e[t],n[t]))return!1;return!0}function Ju(e,n,t,r,l,i){if(gt=i,se=n,n.memoizedState=null,n.updateQueue=null,n.lanes=0,Ll.current=e===null||e.memoizedState===null?Ym:Gm,e=t(r,l),Pr){i=0;do{if(Pr=!1,br=0,25<=i)throw Error(_(301));i+=1,ke=ye=null,n.updateQueue=null,Ll.current=Xm,e=t(r,l)}while(Pr)}if(Ll.current=li,n=ye!==null&&ye.next!==null,gt=0,ke=ye=se=null,ri=!1,n)throw Error(_(300));return e}function es(){var e=br!==0;return br=0,e}function yn(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return ke===null?se.memoizedState=ke=e:ke=ke.next=e,ke}function ln(){if(ye===null){var e=se.alternate;e=e!==null?e.memoizedState:null}else e=ye.next;var n=ke===null?se.memoizedState:ke.next;if(n!==null)ke=n,ye=e;else{if(e===null)throw Error(_(310));ye=e,e={memoizedState:ye.memoizedState,baseState:ye.baseState,baseQueue:ye.baseQueue,queue:ye.queue,next:null},ke===null?se.memoizedState=ke=e:ke=ke.next=e}return ke}function Kr(e,n){return typeof n=="function"?n(e):n}function Zi(e){var n=ln(),t=n.queue;if(t===null)throw Error(_(311));t.lastRenderedReducer=e;var r=ye,l=r.baseQueue,i=t.pending;if(i!==null){if(l!==null){var o=l.next;l.next=i.next,i.next=o}r.baseQueue=l=i,t.pending=null}if(l!==null){i=l.next,r=r.baseState;var u=o=null,s=null,a=i;do{var c=a.lane;if((gt&c)===c)s!==null&&(s=s.next={lane:0,action:a.action,hasEagerState:a.hasEagerState,eagerState:a.eagerState,next:null}),r=a.hasEagerState?a.eagerState:e(r,a.action);else{var f={lane:c,action:a.action,hasEagerState:a.hasEagerState,eagerState:a.eagerState,next:null};s===null?(u=s=f,o=r):s=s.next=f,se.lanes|=c,yt|=c}a=a.next}while(a!==null&&a!==i);s===null?o=r:s.next=u,hn(r,n.memoizedState)||(je=!0),n.memoizedState=r,n.baseState=o,n.baseQueue=s,t.lastRenderedState=r}if(e=t.interleaved,e!==null){l=e;do i=l.lane,se.lanes|=i,yt|=i,l=l.next;while(l!==e)}else l===null&&(t.lanes=0);return[n.memoizedState,t.dispatch]}function Ji(e){var n=ln(),t=n.queue;if(t===null)throw Error(_(311));t.lastRenderedReducer=e;var r=t.dispatch,l=t.pending,i=n.memoizedState;if(l!==null){t.pending=null;var o=l=l.next;do i=e(i,o.action),o=o.next;while(o!==l);hn(i,n.memoizedState)||(je=!0),n.memoizedState=i,n.baseQueue===null&&(n.baseState=i),t.lastRenderedState=i}return[i,r]}function lp(){}function ip(e,n){var t=se,r=ln(),l=n(),i=!hn(r.memoizedState,l);if(i&&(r.memoizedState=l,je=!0),r=r.queue,ns(sp.bind(null,t,r,e),[e]),r.getSnapshot!==n||i||ke!==null&&ke.memoizedState.tag&1){if(t.flags|=2048,Yr(9,up.bind(null,t,r,l,n),void 0,null),xe===null)throw Error(_(349));gt&30||op(t,n,l)}return l}function op(e,n,t){e.flags|=16384,e={getSnapshot:n,value:t},n=se.updateQueue,n===null?(n={lastEffect:null,stores:null},se.updateQueue=n,n.stores=[e]):(t=n.stores,t===null?n.stores=[e]:t.push(e))}function up(e,n,t,r){n.value=t,n.getSnapshot=r,ap(n)&&cp(e)}function sp(e,n,t){return t(function(){ap(n)&&cp(e)})}function ap(e){var n=e.getSnapshot;e=e.value;try{var t=n();return!hn(e,t)}catch{return!0}}function cp(e){var n=On(e,1);n!==null&&dn(n,e,1,-1)}function Sa(e){var n=yn();return typeof e=="function"&&(e=e()),n.memoizedState=n.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:Kr,lastRenderedState:e},n.queue=e,e=e.dispatch=Km.bind(null,se,e),[n.memoizedState,e]}function Yr(e,n,t,r){return e={tag:e,create:n,destroy:t,deps:r,next:null},n=se.updateQueue,n===null?(n={lastEffect:null,stores:null},se.updateQueue=n,n.lastEffect=e.next=e):(t=n.lastEffect,t===null?n.lastEffect=e.next=e:(r=t.next,t.next=e,e.next=r,n.lastEffect=e)),e}function fp(){return ln().memoizedState}function Rl(e,n,t,r){var l=yn();se.flags|=e,l.memoizedState=Yr(1|n,t,void 0,r===void 0?null:r)}function ki(e,n,t,r){var l=ln();r=r===void 0?null:r;var i=void 0;if(ye!==null){var o=ye.memoizedState;if(i=o.destroy,r!==null&&Zu(r,o.deps)){l.memoizedState=Yr(n,t,i,r);return}}se.flags|=e,l.memoizedState=Yr(1|n,t,i,r)}function Ea(e,n){return Rl(8390656,8,e,n)}function ns(e,n){return ki(2048,8,e,n)}function pp(e,n){return ki(4,2,e,n)}function dp(e,n){return ki(4,4,e,n)}function hp(e,n){if(typeof n=="function")return e=e(),n(e),function(){n(null)};if(n!=null)return e=e(),n.current=e,function(){n.current=null}}function mp(e,n,t){return t=t!=null?t.concat([e]):null,ki(4,4,hp.bind(null,n,e),t)}function ts(){}function gp(e,n){var t=ln();n=n===void 0?null:n;var r=t.memoizedState;return r!==null&&n!==null&&Zu(n,r[1])?r[0]:(t.memoizedState=[e,n],e)}function yp(e,n){var t=ln();n=n===void 0?null:n;var r=t.memoizedState;return r!==null&&n!==null&&Zu(n,r[1])?r[0]:(e=e(),t.memoizedState=[e,n],e)}function vp(e,n,t){return gt&21?(hn(t,n)||(t=Ef(),se.lanes|=t,yt|=t,e.baseState=!0),n):(e.baseState&&(e.baseState=!1,je=!0),e.memoizedState=t)}function Qm(e,n){var t=X;X=t!==0&&4>t?t:4,e(!0);var r=qi.transition;qi.transition={};try{e(!1),n()}finally{X=t,qi.transition=r}}function kp(){return ln().memoizedState}function bm(e,n,t){var r=qn(e);if(t={lane:r,action:t,hasEagerState:!1,eagerState:null,next:null},xp(e))wp(n,t);else if(t=np(e,n,t,r),t!==null){var l=Le();dn(t,e,r,l),Sp(t,n,r)}}function Km(e,n,t){var r=qn(e),l={lane:r,action:t,hasEagerState:!1,eagerState:null,next:null};if(xp(e))wp(n,l);else{var i=e.alternate;if(e.lanes===0&&(i===null||i.lanes===0)&&(i=n.lastRenderedReducer,i!==null))try{var o=n.lastRenderedState,u=i(o,t);if(l.hasEagerState=!0,l.eagerState=u,hn(u,o)){var s=n.interleaved;s===null?(l.next=l,Ku(n)):(l.next=s.next,s.next=l),n.interleaved=l;return}}catch{}finally{}t=np(e,n,l,r),t!==null&&(l=Le(),dn(t,e,r,l),Sp(t,n,r))}}function xp(e){var n=e.alternate;return e===se||n!==null&&n===se}function wp(e,n){Pr=ri=!0;var t=e.pending;t===null?n.next=n:(n.next=t.next,t.next=n),e.pending=n}function Sp(e,n,t){if(t&4194240){var r=n.lanes;r&=e.pendingLanes,t|=r,n.lanes=t,Ou(e,t)}}var li={readContext:rn,useCallback:Ce,useContext:Ce,useEffect:Ce,useImperativeHandle:Ce,useInsertionEffect:Ce,useLayoutEffect:Ce,useMemo:Ce,useReducer:Ce,useRef:Ce,useState:Ce,useDebugValue:Ce,useDeferredValue:Ce,useTransition:Ce,useMutableSource:Ce,useSyncExternalStore:Ce,useId:Ce,unstable_isNewReconciler:!1},Ym={readContext:rn,useCallback:function(e,n){return yn().memoizedState=[e,n===void 0?null:n],e},useContext:rn,useEffect:Ea,useImperativeHandle:function(e,n,t){return t=t!=null?t.concat([e]):null,Rl(4194308,4,hp.bind(null,n,e),t)},useLayoutEffect:function(e,n){return Rl(4194308,4,e,n)},useInsertionEffect:function(e,n){return Rl(4,2,e,n)},useMemo:function(e,n){var t=yn();return n=n===void 0?null:n,e=e(),t.memoizedState=[e,n],e},useReducer:function(e,n,t){var r=yn();return n=t!==void 0?t(n):n,r.memoizedState=r.baseState=n,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:n},r.queue=e,e=e.dispatch=bm.bind(null,se,e),[r.memoizedState,e]},useRef:function(e){var n=yn();return e={current:e},n.memoizedState=e},useState:Sa,useDebugValue:ts,useDeferredValue:function(e){return yn().memoizedState=e},useTransition:function(){var e=Sa(!1),n=e[0];return e=Qm.bind(null,e[1]),yn().memoizedState=e,[n,e]},useMutableSource:function(){},useSyncExternalStore:function(e,n,t){var r=se,l=yn();if(oe){if(t===void 0)throw Error(_(407));t=t()}else{if(t=n(),xe===null)throw Error(_(349));gt&30||op(r,n,t)}l.memoizedState=t;var i={value:t,getSnapshot:n};return l.queue=i,Ea(sp.bind(null,r,i,e),[e]),r.flags|=2048,Yr(9,up.bind(null,r,i,t,n),void 0,null),t},useId:function(){var e=yn(),n=xe.identifierPrefix;if(oe){var t=zn,r=Tn;t=(r&~(1<<32-pn(r)-1)).toString(32)+t,n=":"+n+"R"+t,t=br++,0<t&&(n+="H"+t.toString(32)),n+=":"}else t=Wm++,n=":"+n+"r"+t.toString(32)+":";return e.memoizedState=n},unstable_isNewReconciler:!1},Gm={readContext:rn,useCallback:gp,useContext:rn,useEffect:ns,useImperativeHandle:mp,useInsertionEffect:pp,useLayoutEffect:dp,useMemo:yp,useReducer:Zi,useRef:fp,useState:function(){return Zi(Kr)},useDebugValue:ts,useDeferredValue:function(e){var n=ln();return vp(n,ye.memoizedState,e)},useTransition:function(){var e=Zi(Kr)[0],n=ln().memoizedState;return[e,n]},useMutableSource:lp,useSyncExternalStore:ip,useId:kp,unstable_isNewReconciler:!1},Xm={readContext:rn,useCallback:gp,useContext:rn,useEffect:ns,useImperativeHandle:mp,useInsertionEffect:pp,useLayoutEffect:dp,useMemo:yp,useReducer:Ji,useRef:fp,useState:function(){return Ji(Kr)},useDebugValue:ts,useDeferredValue:function(e){var n=ln();return ye===null?n.memoizedState=e:vp(n,ye.memoizedState,e)},useTransition:function(){var e=Ji(Kr)[0],n=ln().memoizedState;return[e,n]},useMutableSource:lp,useSyncExternalStore:ip,useId:kp,unstable_isNewReconciler:!1};function an(e,n){if(e&&e.defaultProps){n=ae({},n),e=e.defaultProps;for(var t in e)n[t]===void 0&&(n[t]=e[t]);return n}return n}function Ko(e,n,t,r){n=e.memoizedState,t=t(r,n),t=t==null?n:ae({},n,t),e.memoizedState=t,e.lanes===0&&(e.updateQueue.baseState=t)}var xi={isMounted:function(e){return(e=e._reactInternals)?xt(e)===e:!1},enqueueSetState:function(e,n,t){e=e._reactInternals;var r=Le(),l=qn(e),i=In(r,l);i.payload=n,t!=null&&(i.callback=t),n=Gn(e,i,l),n!==null&&(dn(n,e,l,r),Il(n,e,l))},enqueueReplaceState:function(e,n,t){e=e._reactInternals;var r=Le(),l=qn(e),i=In(r,l);i.tag=1,i.payload=n,t!=null&&(i.callback=t),n=Gn(e,i,l),n!==null&&(dn(n,e,l,r),Il(n,e,l))},enqueueForceUpdate:function(e,n){e=e._reactInternals;var t=Le(),r=qn(e),l=In(t,r);l.tag=2,n!=null&&(l.callback=n),n=Gn(e,l,r),n!==null&&(dn(n,e,r,t),Il(n,e,r))}};function Ca(e,n,t,r,l,i,o){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,i,o):n.prototype&&n.prototype.isPureReactComponent?!Ur(t,r)||!Ur(l,i):!0}function Ep(e,n,t){var r=!1,l=et,i=n.contextType;return typeof i=="object"&&i!==null?i=rn(i):(l=Fe(n)?ht:_e.current,r=n.contextTypes,i=(r=r!=null)?Yt(e,l):et),n=new n(t,i),e.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=xi,e.stateNode=n,n._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=i),n}function Na(e,n,t,r){e=n.state,typeof n.componentWillReceiveProps=="function"&&n.componentWillReceiveProps(t,r),typeof n.UNSAFE_componentWillReceiveProps=="function"&&n.UNSAFE_componentWillReceiveProps(t,r),n.state!==e&&xi.enqueueReplaceState(n,n.state,null)}function Yo(e,n,t,r){var l=e.stateNode;l.props=t,l.state=e.memoizedState,l.refs={},Yu(e);var i=n.contextType;typeof i=="object"&&i!==null?l.context=rn(i):(i=Fe(n)?ht:_e.current,l.context=Yt(e,i)),l.state=e.memoizedState,i=n.getDerivedStateFromProps,typeof i=="function"&&(Ko(e,n,i,t),l.state=e.memoizedState),typeof n.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(n=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),n!==l.state&&xi.enqueueReplaceState(l,l.state,null),ni(e,t,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function Zt(e,n){try{var t="",r=n;do t+=Ch(r),r=r.return;while(r);var l=t}catch(i){l=`
-Error generating stack: `+i.message+`
-`+i.stack}return{value:e,source:n,stack:l,digest:null}}function eo(e,n,t){return{value:e,source:null,stack:t??null,digest:n??null}}function Go(e,n){try{console.error(n.value)}catch(t){setTimeout(function(){throw t})}}var qm=typeof WeakMap=="function"?WeakMap:Map;function Cp(e,n,t){t=In(-1,t),t.tag=3,t.payload={element:null};var r=n.value;return t.callback=function(){oi||(oi=!0,iu=r),Go(e,n)},t}function Np(e,n,t){t=In(-1,t),t.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=n.value;t.payload=function(){return r(l)},t.callback=function(){Go(e,n)}}var i=e.stateNode;return i!==null&&typeof i.componentDidCatch=="function"&&(t.callback=function(){Go(e,n),typeof r!="function"&&(Xn===null?Xn=new Set([this]):Xn.add(this));var o=n.stack;this.componentDidCatch(n.value,{componentStack:o!==null?o:""})}),t}function Pa(e,n,t){var r=e.pingCache;if(r===null){r=e.pingCache=new qm;var l=new Set;r.set(n,l)}else l=r.get(n),l===void 0&&(l=new Set,r.set(n,l));l.has(t)||(l.add(t),e=fg.bind(null,e,n,t),n.then(e,e))}function _a(e){do{var n;if((n=e.tag===13)&&(n=e.memoizedState,n=n!==null?n.dehydrated!==null:!0),n)return e;e=e.return}while(e!==null);return null}function Ta(e,n,t,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===n?e.flags|=65536:(e.flags|=128,t.flags|=131072,t.flags&=-52805,t.tag===1&&(t.alternate===null?t.tag=17:(n=In(-1,1),n.tag=2,Gn(t,n,1))),t.lanes|=1),e)}var Zm=Mn.ReactCurrentOwner,je=!1;function Ie(e,n,t,r){n.child=e===null?ep(n,null,t,r):Xt(n,e.child,t,r)}function za(e,n,t,r,l){t=t.render;var i=n.ref;return $t(n,l),r=Ju(e,n,t,r,i,l),t=es(),e!==null&&!je?(n.updateQueue=e.updateQueue,n.flags&=-2053,e.lanes&=~l,Dn(e,n,l)):(oe&&t&&Vu(n),n.flags|=1,Ie(e,n,r,l),n.child)}function Ia(e,n,t,r,l){if(e===null){var i=t.type;return typeof i=="function"&&!cs(i)&&i.defaultProps===void 0&&t.compare===null&&t.defaultProps===void 0?(n.tag=15,n.type=i,Pp(e,n,i,r,l)):(e=jl(t.type,null,r,n,n.mode,l),e.ref=n.ref,e.return=n,n.child=e)}if(i=e.child,!(e.lanes&l)){var o=i.memoizedProps;if(t=t.compare,t=t!==null?t:Ur,t(o,r)&&e.ref===n.ref)return Dn(e,n,l)}return n.flags|=1,e=Zn(i,r),e.ref=n.ref,e.return=n,n.child=e}function Pp(e,n,t,r,l){if(e!==null){var i=e.memoizedProps;if(Ur(i,r)&&e.ref===n.ref)if(je=!1,n.pendingProps=r=i,(e.lanes&l)!==0)e.flags&131072&&(je=!0);else return n.lanes=e.lanes,Dn(e,n,l)}return Xo(e,n,t,r,l)}function _p(e,n,t){var r=n.pendingProps,l=r.children,i=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(n.mode&1))n.memoizedState={baseLanes:0,cachePool:null,transitions:null},ne(Ft,We),We|=t;else{if(!(t&1073741824))return e=i!==null?i.baseLanes|t:t,n.lanes=n.childLanes=1073741824,n.memoizedState={baseLanes:e,cachePool:null,transitions:null},n.updateQueue=null,ne(Ft,We),We|=e,null;n.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=i!==null?i.baseLanes:t,ne(Ft,We),We|=r}else i!==null?(r=i.baseLanes|t,n.memoizedState=null):r=t,ne(Ft,We),We|=r;return Ie(e,n,l,t),n.child}function Tp(e,n){var t=n.ref;(e===null&&t!==null||e!==null&&e.ref!==t)&&(n.flags|=512,n.flags|=2097152)}function Xo(e,n,t,r,l){var i=Fe(t)?ht:_e.current;return i=Yt(n,i),$t(n,l),t=Ju(e,n,t,r,i,l),r=es(),e!==null&&!je?(n.updateQueue=e.updateQueue,n.flags&=-2053,e.lanes&=~l,Dn(e,n,l)):(oe&&r&&Vu(n),n.flags|=1,Ie(e,n,t,l),n.child)}function La(e,n,t,r,l){if(Fe(t)){var i=!0;Xl(n)}else i=!1;if($t(n,l),n.stateNode===null)Ol(e,n),Ep(n,t,r),Yo(n,t,r,l),r=!0;else if(e===null){var o=n.stateNode,u=n.memoizedProps;o.props=u;var s=o.context,a=t.contextType;typeof a=="object"&&a!==null?a=rn(a):(a=Fe(t)?ht:_e.current,a=Yt(n,a));var c=t.getDerivedStateFromProps,f=typeof c=="function"||typeof o.getSnapshotBeforeUpdate=="function";f||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(u!==r||s!==a)&&Na(n,o,r,a),Un=!1;var d=n.memoizedState;o.state=d,ni(n,r,o,l),s=n.memoizedState,u!==r||d!==s||Ae.current||Un?(typeof c=="function"&&(Ko(n,t,c,r),s=n.memoizedState),(u=Un||Ca(n,t,u,r,d,s,a))?(f||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount()),typeof o.componentDidMount=="function"&&(n.flags|=4194308)):(typeof o.componentDidMount=="function"&&(n.flags|=4194308),n.memoizedProps=r,n.memoizedState=s),o.props=r,o.state=s,o.context=a,r=u):(typeof o.componentDidMount=="function"&&(n.flags|=4194308),r=!1)}else{o=n.stateNode,tp(e,n),u=n.memoizedProps,a=n.type===n.elementType?u:an(n.type,u),o.props=a,f=n.pendingProps,d=o.context,s=t.contextType,typeof s=="object"&&s!==null?s=rn(s):(s=Fe(t)?ht:_e.current,s=Yt(n,s));var p=t.getDerivedStateFromProps;(c=typeof p=="function"||typeof o.getSnapshotBeforeUpdate=="function")||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(u!==f||d!==s)&&Na(n,o,r,s),Un=!1,d=n.memoizedState,o.state=d,ni(n,r,o,l);var k=n.memoizedState;u!==f||d!==k||Ae.current||Un?(typeof p=="function"&&(Ko(n,t,p,r),k=n.memoizedState),(a=Un||Ca(n,t,a,r,d,k,s)||!1)?(c||typeof o.UNSAFE_componentWillUpdate!="function"&&typeof o.componentWillUpdate!="function"||(typeof o.componentWillUpdate=="function"&&o.componentWillUpdate(r,k,s),typeof o.UNSAFE_componentWillUpdate=="function"&&o.UNSAFE_componentWillUpdate(r,k,s)),typeof o.componentDidUpdate=="function"&&(n.flags|=4),typeof o.getSnapshotBeforeUpdate=="function"&&(n.flags|=1024)):(typeof o.componentDidUpdate!="function"||u===e.memoizedProps&&d===e.memoizedState||(n.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&d===e.memoizedState||(n.flags|=1024),n.memoizedProps=r,n.memoizedState=k),o.props=r,o.state=k,o.context=s,r=a):(typeof o.componentDidUpdate!="function"||u===e.memoizedProps&&d===e.memoizedState||(n.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&d===e.memoizedState||(n.flags|=1024),r=!1)}return qo(e,n,t,r,i,l)}function qo(e,n,t,r,l,i){Tp(e,n);var o=(n.flags&128)!==0;if(!r&&!o)return l&&ga(n,t,!1),Dn(e,n,i);r=n.stateNode,Zm.current=n;var u=o&&typeof t.getDerivedStateFromError!="function"?null:r.render();return n.flags|=1,e!==null&&o?(n.child=Xt(n,e.child,null,i),n.child=Xt(n,null,u,i)):Ie(e,n,u,i),n.memoizedState=r.state,l&&ga(n,t,!0),n.child}function zp(e){var n=e.stateNode;n.pendingContext?ma(e,n.pendingContext,n.pendingContext!==n.context):n.context&&ma(e,n.context,!1),Gu(e,n.containerInfo)}function Ra(e,n,t,r,l){return Gt(),$u(l),n.flags|=256,Ie(e,n,t,r),n.child}var Zo={dehydrated:null,treeContext:null,retryLane:0};function Jo(e){return{baseLanes:e,cachePool:null,transitions:null}}function Ip(e,n,t){var r=n.pendingProps,l=ue.current,i=!1,o=(n.flags&128)!==0,u;if((u=o)||(u=e!==null&&e.memoizedState===null?!1:(l&2)!==0),u?(i=!0,n.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),ne(ue,l&1),e===null)return Qo(n),e=n.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(n.mode&1?e.data==="$!"?n.lanes=8:n.lanes=1073741824:n.lanes=1,null):(o=r.children,e=r.fallback,i?(r=n.mode,i=n.child,o={mode:"hidden",children:o},!(r&1)&&i!==null?(i.childLanes=0,i.pendingProps=o):i=Ei(o,r,0,null),e=dt(e,r,t,null),i.return=n,e.return=n,i.sibling=e,n.child=i,n.child.memoizedState=Jo(t),n.memoizedState=Zo,e):rs(n,o));if(l=e.memoizedState,l!==null&&(u=l.dehydrated,u!==null))return Jm(e,n,o,r,u,l,t);if(i){i=r.fallback,o=n.mode,l=e.child,u=l.sibling;var s={mode:"hidden",children:r.children};return!(o&1)&&n.child!==l?(r=n.child,r.childLanes=0,r.pendingProps=s,n.deletions=null):(r=Zn(l,s),r.subtreeFlags=l.subtreeFlags&14680064),u!==null?i=Zn(u,i):(i=dt(i,o,t,null),i.flags|=2),i.return=n,r.return=n,r.sibling=i,n.child=r,r=i,i=n.child,o=e.child.memoizedState,o=o===null?Jo(t):{baseLanes:o.baseLanes|t,cachePool:null,transitions:o.transitions},i.memoizedState=o,i.childLanes=e.childLanes&~t,n.memoizedState=Zo,r}return i=e.child,e=i.sibling,r=Zn(i,{mode:"visible",children:r.children}),!(n.mode&1)&&(r.lanes=t),r.return=n,r.sibling=null,e!==null&&(t=n.deletions,t===null?(n.deletions=[e],n.flags|=16):t.push(e)),n.child=r,n.memoizedState=null,r}function rs(e,n){return n=Ei({mode:"visible",children:n},e.mode,0,null),n.return=e,e.child=n}function vl(e,n,t,r){return r!==null&&$u(r),Xt(n,e.child,null,t),e=rs(n,n.pendingProps.children),e.flags|=2,n.memoizedState=null,e}function Jm(e,n,t,r,l,i,o){if(t)return n.flags&256?(n.flags&=-257,r=eo(Error(_(422))),vl(e,n,o,r)):n.memoizedState!==null?(n.child=e.child,n.flags|=128,null):(i=r.fallback,l=n.mode,r=Ei({mode:"visible",children:r.children},l,0,null),i=dt(i,l,o,null),i.flags|=2,r.return=n,i.return=n,r.sibling=i,n.child=r,n.mode&1&&Xt(n,e.child,null,o),n.child.memoizedState=Jo(o),n.memoizedState=Zo,i);if(!(n.mode&1))return vl(e,n,o,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var u=r.dgst;return r=u,i=Error(_(419)),r=eo(i,r,void 0),vl(e,n,o,r)}if(u=(o&e.childLanes)!==0,je||u){if(r=xe,r!==null){switch(o&-o){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|o)?0:l,l!==0&&l!==i.retryLane&&(i.retryLane=l,On(e,l),dn(r,e,l,-1))}return as(),r=eo(Error(_(421))),vl(e,n,o,r)}return l.data==="$?"?(n.flags|=128,n.child=e.child,n=pg.bind(null,e),l._reactRetry=n,null):(e=i.treeContext,Qe=Yn(l.nextSibling),Ke=n,oe=!0,fn=null,e!==null&&(Ze[Je++]=Tn,Ze[Je++]=zn,Ze[Je++]=mt,Tn=e.id,zn=e.overflow,mt=n),n=rs(n,r.children),n.flags|=4096,n)}function Oa(e,n,t){e.lanes|=n;var r=e.alternate;r!==null&&(r.lanes|=n),bo(e.return,n,t)}function no(e,n,t,r,l){var i=e.memoizedState;i===null?e.memoizedState={isBackwards:n,rendering:null,renderingStartTime:0,last:r,tail:t,tailMode:l}:(i.isBackwards=n,i.rendering=null,i.renderingStartTime=0,i.last=r,i.tail=t,i.tailMode=l)}function Lp(e,n,t){var r=n.pendingProps,l=r.revealOrder,i=r.tail;if(Ie(e,n,r.children,t),r=ue.current,r&2)r=r&1|2,n.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=n.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Oa(e,t,n);else if(e.tag===19)Oa(e,t,n);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===n)break e;for(;e.sibling===null;){if(e.return===null||e.return===n)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(ne(ue,r),!(n.mode&1))n.memoizedState=null;else switch(l){case"forwards":for(t=n.child,l=null;t!==null;)e=t.alternate,e!==null&&ti(e)===null&&(l=t),t=t.sibling;t=l,t===null?(l=n.child,n.child=null):(l=t.sibling,t.sibling=null),no(n,!1,l,t,i);break;case"backwards":for(t=null,l=n.child,n.child=null;l!==null;){if(e=l.alternate,e!==null&&ti(e)===null){n.child=l;break}e=l.sibling,l.sibling=t,t=l,l=e}no(n,!0,t,null,i);break;case"together":no(n,!1,null,null,void 0);break;default:n.memoizedState=null}return n.child}function Ol(e,n){!(n.mode&1)&&e!==null&&(e.alternate=null,n.alternate=null,n.flags|=2)}function Dn(e,n,t){if(e!==null&&(n.dependencies=e.dependencies),yt|=n.lanes,!(t&n.childLanes))return null;if(e!==null&&n.child!==e.child)throw Error(_(153));if(n.child!==null){for(e=n.child,t=Zn(e,e.pendingProps),n.child=t,t.return=n;e.sibling!==null;)e=e.sibling,t=t.sibling=Zn(e,e.pendingProps),t.return=n;t.sibling=null}return n.child}function eg(e,n,t){switch(n.tag){case 3:zp(n),Gt();break;case 5:rp(n);break;case 1:Fe(n.type)&&Xl(n);break;case 4:Gu(n,n.stateNode.containerInfo);break;case 10:var r=n.type._context,l=n.memoizedProps.value;ne(Jl,r._currentValue),r._currentValue=l;break;case 13:if(r=n.memoizedState,r!==null)return r.dehydrated!==null?(ne(ue,ue.current&1),n.flags|=128,null):t&n.child.childLanes?Ip(e,n,t):(ne(ue,ue.current&1),e=Dn(e,n,t),e!==null?e.sibling:null);ne(ue,ue.current&1);break;case 19:if(r=(t&n.childLanes)!==0,e.flags&128){if(r)return Lp(e,n,t);n.flags|=128}if(l=n.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),ne(ue,ue.current),r)break;return null;case 22:case 23:return n.lanes=0,_p(e,n,t)}return Dn(e,n,t)}var Rp,eu,Op,Dp;Rp=function(e,n){for(var t=n.child;t!==null;){if(t.tag===5||t.tag===6)e.appendChild(t.stateNode);else if(t.tag!==4&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===n)break;for(;t.sibling===null;){if(t.return===null||t.return===n)return;t=t.return}t.sibling.return=t.return,t=t.sibling}};eu=function(){};Op=function(e,n,t,r){var l=e.memoizedProps;if(l!==r){e=n.stateNode,ft(Sn.current);var i=null;switch(t){case"input":l=So(e,l),r=So(e,r),i=[];break;case"select":l=ae({},l,{value:void 0}),r=ae({},r,{value:void 0}),i=[];break;case"textarea":l=No(e,l),r=No(e,r),i=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=Yl)}_o(t,r);var o;t=null;for(a in l)if(!r.hasOwnProperty(a)&&l.hasOwnProperty(a)&&l[a]!=null)if(a==="style"){var u=l[a];for(o in u)u.hasOwnProperty(o)&&(t||(t={}),t[o]="")}else a!=="dangerouslySetInnerHTML"&&a!=="children"&&a!=="suppressContentEditableWarning"&&a!=="suppressHydrationWarning"&&a!=="autoFocus"&&(Or.hasOwnProperty(a)?i||(i=[]):(i=i||[]).push(a,null));for(a in r){var s=r[a];if(u=l!=null?l[a]:void 0,r.hasOwnProperty(a)&&s!==u&&(s!=null||u!=null))if(a==="style")if(u){for(o in u)!u.hasOwnProperty(o)||s&&s.hasOwnProperty(o)||(t||(t={}),t[o]="");for(o in s)s.hasOwnProperty(o)&&u[o]!==s[o]&&(t||(t={}),t[o]=s[o])}else t||(i||(i=[]),i.push(a,t)),t=s;else a==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,u=u?u.__html:void 0,s!=null&&u!==s&&(i=i||[]).push(a,s)):a==="children"?typeof s!="string"&&typeof s!="number"||(i=i||[]).push(a,""+s):a!=="suppressContentEditableWarning"&&a!=="suppressHydrationWarning"&&(Or.hasOwnProperty(a)?(s!=null&&a==="onScroll"&&le("scroll",e),i||u===s||(i=[])):(i=i||[]).push(a,s))}t&&(i=i||[]).push("style",t);var a=i;(n.updateQueue=a)&&(n.flags|=4)}};Dp=function(e,n,t,r){t!==r&&(n.flags|=4)};function dr(e,n){if(!oe)switch(e.tailMode){case"hidden":n=e.tail;for(var t=null;n!==null;)n.alternate!==null&&(t=n),n=n.sibling;t===null?e.tail=null:t.sibling=null;break;case"collapsed":t=e.tail;for(var r=null;t!==null;)t.alternate!==null&&(r=t),t=t.sibling;r===null?n||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Ne(e){var n=e.alternate!==null&&e.alternate.child===e.child,t=0,r=0;if(n)for(var l=e.child;l!==null;)t|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)t|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=t,n}function ng(e,n,t){var r=n.pendingProps;switch(Hu(n),n.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Ne(n),null;case 1:return Fe(n.type)&&Gl(),Ne(n),null;case 3:return r=n.stateNode,qt(),ie(Ae),ie(_e),qu(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(gl(n)?n.flags|=4:e===null||e.memoizedState.isDehydrated&&!(n.flags&256)||(n.flags|=1024,fn!==null&&(su(fn),fn=null))),eu(e,n),Ne(n),null;case 5:Xu(n);var l=ft(Qr.current);if(t=n.type,e!==null&&n.stateNode!=null)Op(e,n,t,r,l),e.ref!==n.ref&&(n.flags|=512,n.flags|=2097152);else{if(!r){if(n.stateNode===null)throw Error(_(166));return Ne(n),null}if(e=ft(Sn.current),gl(n)){r=n.stateNode,t=n.type;var i=n.memoizedProps;switch(r[kn]=n,r[$r]=i,e=(n.mode&1)!==0,t){case"dialog":le("cancel",r),le("close",r);break;case"iframe":case"object":case"embed":le("load",r);break;case"video":case"audio":for(l=0;l<xr.length;l++)le(xr[l],r);break;case"source":le("error",r);break;case"img":case"image":case"link":le("error",r),le("load",r);break;case"details":le("toggle",r);break;case"input":Hs(r,i),le("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!i.multiple},le("invalid",r);break;case"textarea":Ws(r,i),le("invalid",r)}_o(t,i),l=null;for(var o in i)if(i.hasOwnProperty(o)){var u=i[o];o==="children"?typeof u=="string"?r.textContent!==u&&(i.suppressHydrationWarning!==!0&&ml(r.textContent,u,e),l=["children",u]):typeof u=="number"&&r.textContent!==""+u&&(i.suppressHydrationWarning!==!0&&ml(r.textContent,u,e),l=["children",""+u]):Or.hasOwnProperty(o)&&u!=null&&o==="onScroll"&&le("scroll",r)}switch(t){case"input":ul(r),$s(r,i,!0);break;case"textarea":ul(r),Qs(r);break;case"select":case"option":break;default:typeof i.onClick=="function"&&(r.onclick=Yl)}r=l,n.updateQueue=r,r!==null&&(n.flags|=4)}else{o=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=sf(t)),e==="http://www.w3.org/1999/xhtml"?t==="script"?(e=o.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=o.createElement(t,{is:r.is}):(e=o.createElement(t),t==="select"&&(o=e,r.multiple?o.multiple=!0:r.size&&(o.size=r.size))):e=o.createElementNS(e,t),e[kn]=n,e[$r]=r,Rp(e,n,!1,!1),n.stateNode=e;e:{switch(o=To(t,r),t){case"dialog":le("cancel",e),le("close",e),l=r;break;case"iframe":case"object":case"embed":le("load",e),l=r;break;case"video":case"audio":for(l=0;l<xr.length;l++)le(xr[l],e);l=r;break;case"source":le("error",e),l=r;break;case"img":case"image":case"link":le("error",e),le("load",e),l=r;break;case"details":le("toggle",e),l=r;break;case"input":Hs(e,r),l=So(e,r),le("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=ae({},r,{value:void 0}),le("invalid",e);break;case"textarea":Ws(e,r),l=No(e,r),le("invalid",e);break;default:l=r}_o(t,l),u=l;for(i in u)if(u.hasOwnProperty(i)){var s=u[i];i==="style"?ff(e,s):i==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&af(e,s)):i==="children"?typeof s=="string"?(t!=="textarea"||s!=="")&&Dr(e,s):typeof s=="number"&&Dr(e,""+s):i!=="suppressContentEditableWarning"&&i!=="suppressHydrationWarning"&&i!=="autoFocus"&&(Or.hasOwnProperty(i)?s!=null&&i==="onScroll"&&le("scroll",e):s!=null&&_u(e,i,s,o))}switch(t){case"input":ul(e),$s(e,r,!1);break;case"textarea":ul(e),Qs(e);break;case"option":r.value!=null&&e.setAttribute("value",""+Jn(r.value));break;case"select":e.multiple=!!r.multiple,i=r.value,i!=null?Bt(e,!!r.multiple,i,!1):r.defaultValue!=null&&Bt(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=Yl)}switch(t){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(n.flags|=4)}n.ref!==null&&(n.flags|=512,n.flags|=2097152)}return Ne(n),null;case 6:if(e&&n.stateNode!=null)Dp(e,n,e.memoizedProps,r);else{if(typeof r!="string"&&n.stateNode===null)throw Error(_(166));if(t=ft(Qr.current),ft(Sn.current),gl(n)){if(r=n.stateNode,t=n.memoizedProps,r[kn]=n,(i=r.nodeValue!==t)&&(e=Ke,e!==null))switch(e.tag){case 3:ml(r.nodeValue,t,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&ml(r.nodeValue,t,(e.mode&1)!==0)}i&&(n.flags|=4)}else r=(t.nodeType===9?t:t.ownerDocument).createTextNode(r),r[kn]=n,n.stateNode=r}return Ne(n),null;case 13:if(ie(ue),r=n.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(oe&&Qe!==null&&n.mode&1&&!(n.flags&128))Zf(),Gt(),n.flags|=98560,i=!1;else if(i=gl(n),r!==null&&r.dehydrated!==null){if(e===null){if(!i)throw Error(_(318));if(i=n.memoizedState,i=i!==null?i.dehydrated:null,!i)throw Error(_(317));i[kn]=n}else Gt(),!(n.flags&128)&&(n.memoizedState=null),n.flags|=4;Ne(n),i=!1}else fn!==null&&(su(fn),fn=null),i=!0;if(!i)return n.flags&65536?n:null}return n.flags&128?(n.lanes=t,n):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(n.child.flags|=8192,n.mode&1&&(e===null||ue.current&1?ve===0&&(ve=3):as())),n.updateQueue!==null&&(n.flags|=4),Ne(n),null);case 4:return qt(),eu(e,n),e===null&&Vr(n.stateNode.containerInfo),Ne(n),null;case 10:return bu(n.type._context),Ne(n),null;case 17:return Fe(n.type)&&Gl(),Ne(n),null;case 19:if(ie(ue),i=n.memoizedState,i===null)return Ne(n),null;if(r=(n.flags&128)!==0,o=i.rendering,o===null)if(r)dr(i,!1);else{if(ve!==0||e!==null&&e.flags&128)for(e=n.child;e!==null;){if(o=ti(e),o!==null){for(n.flags|=128,dr(i,!1),r=o.updateQueue,r!==null&&(n.updateQueue=r,n.flags|=4),n.subtreeFlags=0,r=t,t=n.child;t!==null;)i=t,e=r,i.flags&=14680066,o=i.alternate,o===null?(i.childLanes=0,i.lanes=e,i.child=null,i.subtreeFlags=0,i.memoizedProps=null,i.memoizedState=null,i.updateQueue=null,i.dependencies=null,i.stateNode=null):(i.childLanes=o.childLanes,i.lanes=o.lanes,i.child=o.child,i.subtreeFlags=0,i.deletions=null,i.memoizedProps=o.memoizedProps,i.memoizedState=o.memoizedState,i.updateQueue=o.updateQueue,i.type=o.type,e=o.dependencies,i.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),t=t.sibling;return ne(ue,ue.current&1|2),n.child}e=e.sibling}i.tail!==null&&pe()>Jt&&(n.flags|=128,r=!0,dr(i,!1),n.lanes=4194304)}else{if(!r)if(e=ti(o),e!==null){if(n.flags|=128,r=!0,t=e.updateQueue,t!==null&&(n.updateQueue=t,n.flags|=4),dr(i,!0),i.tail===null&&i.tailMode==="hidden"&&!o.alternate&&!oe)return Ne(n),null}else 2*pe()-i.renderingStartTime>Jt&&t!==1073741824&&(n.flags|=128,r=!0,dr(i,!1),n.lanes=4194304);i.isBackwards?(o.sibling=n.child,n.child=o):(t=i.last,t!==null?t.sibling=o:n.child=o,i.last=o)}return i.tail!==null?(n=i.tail,i.rendering=n,i.tail=n.sibling,i.renderingStartTime=pe(),n.sibling=null,t=ue.current,ne(ue,r?t&1|2:t&1),n):(Ne(n),null);case 22:case 23:return ss(),r=n.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(n.flags|=8192),r&&n.mode&1?We&1073741824&&(Ne(n),n.subtreeFlags&6&&(n.flags|=8192)):Ne(n),null;case 24:return null;case 25:return null}throw Error(_(156,n.tag))}function tg(e,n){switch(Hu(n),n.tag){case 1:return Fe(n.type)&&Gl(),e=n.flags,e&65536?(n.flags=e&-65537|128,n):null;case 3:return qt(),ie(Ae),ie(_e),qu(),e=n.flags,e&65536&&!(e&128)?(n.flags=e&-65537|128,n):null;case 5:return Xu(n),null;case 13:if(ie(ue),e=n.memoizedState,e!==null&&e.dehydrated!==null){if(n.alternate===null)throw Error(_(340));Gt()}return e=n.flags,e&65536?(n.flags=e&-65537|128,n):null;case 19:return ie(ue),null;case 4:return qt(),null;case 10:return bu(n.type._context),null;case 22:case 23:return ss(),null;case 24:return null;default:return null}}var kl=!1,Pe=!1,rg=typeof WeakSet=="function"?WeakSet:Set,M=null;function At(e,n){var t=e.ref;if(t!==null)if(typeof t=="function")try{t(null)}catch(r){ce(e,n,r)}else t.current=null}function nu(e,n,t){try{t()}catch(r){ce(e,n,r)}}var Da=!1;function lg(e,n){if(Fo=Ql,e=Bf(),Uu(e)){if("selectionStart"in e)var t={start:e.selectionStart,end:e.selectionEnd};else e:{t=(t=e.ownerDocument)&&t.defaultView||window;var r=t.getSelection&&t.getSelection();if(r&&r.rangeCount!==0){t=r.anchorNode;var l=r.anchorOffset,i=r.focusNode;r=r.focusOffset;try{t.nodeType,i.nodeType}catch{t=null;break e}var o=0,u=-1,s=-1,a=0,c=0,f=e,d=null;n:for(;;){for(var p;f!==t||l!==0&&f.nodeType!==3||(u=o+l),f!==i||r!==0&&f.nodeType!==3||(s=o+r),f.nodeType===3&&(o+=f.nodeValue.length),(p=f.firstChild)!==null;)d=f,f=p;for(;;){if(f===e)break n;if(d===t&&++a===l&&(u=o),d===i&&++c===r&&(s=o),(p=f.nextSibling)!==null)break;f=d,d=f.parentNode}f=p}t=u===-1||s===-1?null:{start:u,end:s}}else t=null}t=t||{start:0,end:0}}else t=null;for(Bo={focusedElem:e,selectionRange:t},Ql=!1,M=n;M!==null;)if(n=M,e=n.child,(n.subtreeFlags&1028)!==0&&e!==null)e.return=n,M=e;else for(;M!==null;){n=M;try{var k=n.alternate;if(n.flags&1024)switch(n.tag){case 0:case 11:case 15:break;case 1:if(k!==null){var x=k.memoizedProps,I=k.memoizedState,h=n.stateNode,m=h.getSnapshotBeforeUpdate(n.elementType===n.type?x:an(n.type,x),I);h.__reactInternalSnapshotBeforeUpdate=m}break;case 3:var y=n.stateNode.containerInfo;y.nodeType===1?y.textContent="":y.nodeType===9&&y.documentElement&&y.removeChild(y.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(_(163))}}catch(S){ce(n,n.return,S)}if(e=n.sibling,e!==null){e.return=n.return,M=e;break}M=n.return}return k=Da,Da=!1,k}function _r(e,n,t){var r=n.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var i=l.destroy;l.destroy=void 0,i!==void 0&&nu(n,t,i)}l=l.next}while(l!==r)}}function wi(e,n){if(n=n.updateQueue,n=n!==null?n.lastEffect:null,n!==null){var t=n=n.next;do{if((t.tag&e)===e){var r=t.create;t.destroy=r()}t=t.next}while(t!==n)}}function tu(e){var n=e.ref;if(n!==null){var t=e.stateNode;switch(e.tag){case 5:e=t;break;default:e=t}typeof n=="function"?n(e):n.current=e}}function Mp(e){var n=e.alternate;n!==null&&(e.alternate=null,Mp(n)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(n=e.stateNode,n!==null&&(delete n[kn],delete n[$r],delete n[Ho],delete n[Um],delete n[Vm])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function jp(e){return e.tag===5||e.tag===3||e.tag===4}function Ma(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||jp(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function ru(e,n,t){var r=e.tag;if(r===5||r===6)e=e.stateNode,n?t.nodeType===8?t.parentNode.insertBefore(e,n):t.insertBefore(e,n):(t.nodeType===8?(n=t.parentNode,n.insertBefore(e,t)):(n=t,n.appendChild(e)),t=t._reactRootContainer,t!=null||n.onclick!==null||(n.onclick=Yl));else if(r!==4&&(e=e.child,e!==null))for(ru(e,n,t),e=e.sibling;e!==null;)ru(e,n,t),e=e.sibling}function lu(e,n,t){var r=e.tag;if(r===5||r===6)e=e.stateNode,n?t.insertBefore(e,n):t.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(lu(e,n,t),e=e.sibling;e!==null;)lu(e,n,t),e=e.sibling}var we=null,cn=!1;function An(e,n,t){for(t=t.child;t!==null;)Ap(e,n,t),t=t.sibling}function Ap(e,n,t){if(wn&&typeof wn.onCommitFiberUnmount=="function")try{wn.onCommitFiberUnmount(di,t)}catch{}switch(t.tag){case 5:Pe||At(t,n);case 6:var r=we,l=cn;we=null,An(e,n,t),we=r,cn=l,we!==null&&(cn?(e=we,t=t.stateNode,e.nodeType===8?e.parentNode.removeChild(t):e.removeChild(t)):we.removeChild(t.stateNode));break;case 18:we!==null&&(cn?(e=we,t=t.stateNode,e.nodeType===8?Yi(e.parentNode,t):e.nodeType===1&&Yi(e,t),Fr(e)):Yi(we,t.stateNode));break;case 4:r=we,l=cn,we=t.stateNode.containerInfo,cn=!0,An(e,n,t),we=r,cn=l;break;case 0:case 11:case 14:case 15:if(!Pe&&(r=t.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var i=l,o=i.destroy;i=i.tag,o!==void 0&&(i&2||i&4)&&nu(t,n,o),l=l.next}while(l!==r)}An(e,n,t);break;case 1:if(!Pe&&(At(t,n),r=t.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=t.memoizedProps,r.state=t.memoizedState,r.componentWillUnmount()}catch(u){ce(t,n,u)}An(e,n,t);break;case 21:An(e,n,t);break;case 22:t.mode&1?(Pe=(r=Pe)||t.memoizedState!==null,An(e,n,t),Pe=r):An(e,n,t);break;default:An(e,n,t)}}function ja(e){var n=e.updateQueue;if(n!==null){e.updateQueue=null;var t=e.stateNode;t===null&&(t=e.stateNode=new rg),n.forEach(function(r){var l=dg.bind(null,e,r);t.has(r)||(t.add(r),r.then(l,l))})}}function sn(e,n){var t=n.deletions;if(t!==null)for(var r=0;r<t.length;r++){var l=t[r];try{var i=e,o=n,u=o;e:for(;u!==null;){switch(u.tag){case 5:we=u.stateNode,cn=!1;break e;case 3:we=u.stateNode.containerInfo,cn=!0;break e;case 4:we=u.stateNode.containerInfo,cn=!0;break e}u=u.return}if(we===null)throw Error(_(160));Ap(i,o,l),we=null,cn=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(a){ce(l,n,a)}}if(n.subtreeFlags&12854)for(n=n.child;n!==null;)Fp(n,e),n=n.sibling}function Fp(e,n){var t=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(sn(n,e),gn(e),r&4){try{_r(3,e,e.return),wi(3,e)}catch(x){ce(e,e.return,x)}try{_r(5,e,e.return)}catch(x){ce(e,e.return,x)}}break;case 1:sn(n,e),gn(e),r&512&&t!==null&&At(t,t.return);break;case 5:if(sn(n,e),gn(e),r&512&&t!==null&&At(t,t.return),e.flags&32){var l=e.stateNode;try{Dr(l,"")}catch(x){ce(e,e.return,x)}}if(r&4&&(l=e.stateNode,l!=null)){var i=e.memoizedProps,o=t!==null?t.memoizedProps:i,u=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{u==="input"&&i.type==="radio"&&i.name!=null&&of(l,i),To(u,o);var a=To(u,i);for(o=0;o<s.length;o+=2){var c=s[o],f=s[o+1];c==="style"?ff(l,f):c==="dangerouslySetInnerHTML"?af(l,f):c==="children"?Dr(l,f):_u(l,c,f,a)}switch(u){case"input":Eo(l,i);break;case"textarea":uf(l,i);break;case"select":var d=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!i.multiple;var p=i.value;p!=null?Bt(l,!!i.multiple,p,!1):d!==!!i.multiple&&(i.defaultValue!=null?Bt(l,!!i.multiple,i.defaultValue,!0):Bt(l,!!i.multiple,i.multiple?[]:"",!1))}l[$r]=i}catch(x){ce(e,e.return,x)}}break;case 6:if(sn(n,e),gn(e),r&4){if(e.stateNode===null)throw Error(_(162));l=e.stateNode,i=e.memoizedProps;try{l.nodeValue=i}catch(x){ce(e,e.return,x)}}break;case 3:if(sn(n,e),gn(e),r&4&&t!==null&&t.memoizedState.isDehydrated)try{Fr(n.containerInfo)}catch(x){ce(e,e.return,x)}break;case 4:sn(n,e),gn(e);break;case 13:sn(n,e),gn(e),l=e.child,l.flags&8192&&(i=l.memoizedState!==null,l.stateNode.isHidden=i,!i||l.alternate!==null&&l.alternate.memoizedState!==null||(os=pe())),r&4&&ja(e);break;case 22:if(c=t!==null&&t.memoizedState!==null,e.mode&1?(Pe=(a=Pe)||c,sn(n,e),Pe=a):sn(n,e),gn(e),r&8192){if(a=e.memoizedState!==null,(e.stateNode.isHidden=a)&&!c&&e.mode&1)for(M=e,c=e.child;c!==null;){for(f=M=c;M!==null;){switch(d=M,p=d.child,d.tag){case 0:case 11:case 14:case 15:_r(4,d,d.return);break;case 1:At(d,d.return);var k=d.stateNode;if(typeof k.componentWillUnmount=="function"){r=d,t=d.return;try{n=r,k.props=n.memoizedProps,k.state=n.memoizedState,k.componentWillUnmount()}catch(x){ce(r,t,x)}}break;case 5:At(d,d.return);break;case 22:if(d.memoizedState!==null){Fa(f);continue}}p!==null?(p.return=d,M=p):Fa(f)}c=c.sibling}e:for(c=null,f=e;;){if(f.tag===5){if(c===null){c=f;try{l=f.stateNode,a?(i=l.style,typeof i.setProperty=="function"?i.setProperty("display","none","important"):i.display="none"):(u=f.stateNode,s=f.memoizedProps.style,o=s!=null&&s.hasOwnProperty("display")?s.display:null,u.style.display=cf("display",o))}catch(x){ce(e,e.return,x)}}}else if(f.tag===6){if(c===null)try{f.stateNode.nodeValue=a?"":f.memoizedProps}catch(x){ce(e,e.return,x)}}else if((f.tag!==22&&f.tag!==23||f.memoizedState===null||f===e)&&f.child!==null){f.child.return=f,f=f.child;continue}if(f===e)break e;for(;f.sibling===null;){if(f.return===null||f.return===e)break e;c===f&&(c=null),f=f.return}c===f&&(c=null),f.sibling.return=f.return,f=f.sibling}}break;case 19:sn(n,e),gn(e),r&4&&ja(e);break;case 21:break;default:sn(n,e),gn(e)}}function gn(e){var n=e.flags;if(n&2){try{e:{for(var t=e.return;t!==null;){if(jp(t)){var r=t;break e}t=t.return}throw Error(_(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(Dr(l,""),r.flags&=-33);var i=Ma(e);lu(e,i,l);break;case 3:case 4:var o=r.stateNode.containerInfo,u=Ma(e);ru(e,u,o);break;default:throw Error(_(161))}}catch(s){ce(e,e.return,s)}e.flags&=-3}n&4096&&(e.flags&=-4097)}function ig(e,n,t){M=e,Bp(e)}function Bp(e,n,t){for(var r=(e.mode&1)!==0;M!==null;){var l=M,i=l.child;if(l.tag===22&&r){var o=l.memoizedState!==null||kl;if(!o){var u=l.alternate,s=u!==null&&u.memoizedState!==null||Pe;u=kl;var a=Pe;if(kl=o,(Pe=s)&&!a)for(M=l;M!==null;)o=M,s=o.child,o.tag===22&&o.memoizedState!==null?Ba(l):s!==null?(s.return=o,M=s):Ba(l);for(;i!==null;)M=i,Bp(i),i=i.sibling;M=l,kl=u,Pe=a}Aa(e)}else l.subtreeFlags&8772&&i!==null?(i.return=l,M=i):Aa(e)}}function Aa(e){for(;M!==null;){var n=M;if(n.flags&8772){var t=n.alternate;try{if(n.flags&8772)switch(n.tag){case 0:case 11:case 15:Pe||wi(5,n);break;case 1:var r=n.stateNode;if(n.flags&4&&!Pe)if(t===null)r.componentDidMount();else{var l=n.elementType===n.type?t.memoizedProps:an(n.type,t.memoizedProps);r.componentDidUpdate(l,t.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var i=n.updateQueue;i!==null&&wa(n,i,r);break;case 3:var o=n.updateQueue;if(o!==null){if(t=null,n.child!==null)switch(n.child.tag){case 5:t=n.child.stateNode;break;case 1:t=n.child.stateNode}wa(n,o,t)}break;case 5:var u=n.stateNode;if(t===null&&n.flags&4){t=u;var s=n.memoizedProps;switch(n.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&t.focus();break;case"img":s.src&&(t.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(n.memoizedState===null){var a=n.alternate;if(a!==null){var c=a.memoizedState;if(c!==null){var f=c.dehydrated;f!==null&&Fr(f)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(_(163))}Pe||n.flags&512&&tu(n)}catch(d){ce(n,n.return,d)}}if(n===e){M=null;break}if(t=n.sibling,t!==null){t.return=n.return,M=t;break}M=n.return}}function Fa(e){for(;M!==null;){var n=M;if(n===e){M=null;break}var t=n.sibling;if(t!==null){t.return=n.return,M=t;break}M=n.return}}function Ba(e){for(;M!==null;){var n=M;try{switch(n.tag){case 0:case 11:case 15:var t=n.return;try{wi(4,n)}catch(s){ce(n,t,s)}break;case 1:var r=n.stateNode;if(typeof r.componentDidMount=="function"){var l=n.return;try{r.componentDidMount()}catch(s){ce(n,l,s)}}var i=n.return;try{tu(n)}catch(s){ce(n,i,s)}break;case 5:var o=n.return;try{tu(n)}catch(s){ce(n,o,s)}}}catch(s){ce(n,n.return,s)}if(n===e){M=null;break}var u=n.sibling;if(u!==null){u.return=n.return,M=u;break}M=n.return}}var og=Math.ceil,ii=Mn.ReactCurrentDispatcher,ls=Mn.ReactCurrentOwner,tn=Mn.ReactCurrentBatchConfig,Y=0,xe=null,me=null,Se=0,We=0,Ft=tt(0),ve=0,Gr=null,yt=0,Si=0,is=0,Tr=null,Me=null,os=0,Jt=1/0,Pn=null,oi=!1,iu=null,Xn=null,xl=!1,Wn=null,ui=0,zr=0,ou=null,Dl=-1,Ml=0;function Le(){return Y&6?pe():Dl!==-1?Dl:Dl=pe()}function qn(e){return e.mode&1?Y&2&&Se!==0?Se&-Se:$m.transition!==null?(Ml===0&&(Ml=Ef()),Ml):(e=X,e!==0||(e=window.event,e=e===void 0?16:If(e.type)),e):1}function dn(e,n,t,r){if(50<zr)throw zr=0,ou=null,Error(_(185));Zr(e,t,r),(!(Y&2)||e!==xe)&&(e===xe&&(!(Y&2)&&(Si|=t),ve===4&&Hn(e,Se)),Be(e,r),t===1&&Y===0&&!(n.mode&1)&&(Jt=pe()+500,vi&&rt()))}function Be(e,n){var t=e.callbackNode;$h(e,n);var r=Wl(e,e===xe?Se:0);if(r===0)t!==null&&Ys(t),e.callbackNode=null,e.callbackPriority=0;else if(n=r&-r,e.callbackPriority!==n){if(t!=null&&Ys(t),n===1)e.tag===0?Hm(Ua.bind(null,e)):Gf(Ua.bind(null,e)),Fm(function(){!(Y&6)&&rt()}),t=null;else{switch(Cf(r)){case 1:t=Ru;break;case 4:t=wf;break;case 16:t=$l;break;case 536870912:t=Sf;break;default:t=$l}t=Kp(t,Up.bind(null,e))}e.callbackPriority=n,e.callbackNode=t}}function Up(e,n){if(Dl=-1,Ml=0,Y&6)throw Error(_(327));var t=e.callbackNode;if(Wt()&&e.callbackNode!==t)return null;var r=Wl(e,e===xe?Se:0);if(r===0)return null;if(r&30||r&e.expiredLanes||n)n=si(e,r);else{n=r;var l=Y;Y|=2;var i=Hp();(xe!==e||Se!==n)&&(Pn=null,Jt=pe()+500,pt(e,n));do try{ag();break}catch(u){Vp(e,u)}while(!0);Qu(),ii.current=i,Y=l,me!==null?n=0:(xe=null,Se=0,n=ve)}if(n!==0){if(n===2&&(l=Oo(e),l!==0&&(r=l,n=uu(e,l))),n===1)throw t=Gr,pt(e,0),Hn(e,r),Be(e,pe()),t;if(n===6)Hn(e,r);else{if(l=e.current.alternate,!(r&30)&&!ug(l)&&(n=si(e,r),n===2&&(i=Oo(e),i!==0&&(r=i,n=uu(e,i))),n===1))throw t=Gr,pt(e,0),Hn(e,r),Be(e,pe()),t;switch(e.finishedWork=l,e.finishedLanes=r,n){case 0:case 1:throw Error(_(345));case 2:ut(e,Me,Pn);break;case 3:if(Hn(e,r),(r&130023424)===r&&(n=os+500-pe(),10<n)){if(Wl(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){Le(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=Vo(ut.bind(null,e,Me,Pn),n);break}ut(e,Me,Pn);break;case 4:if(Hn(e,r),(r&4194240)===r)break;for(n=e.eventTimes,l=-1;0<r;){var o=31-pn(r);i=1<<o,o=n[o],o>l&&(l=o),r&=~i}if(r=l,r=pe()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*og(r/1960))-r,10<r){e.timeoutHandle=Vo(ut.bind(null,e,Me,Pn),r);break}ut(e,Me,Pn);break;case 5:ut(e,Me,Pn);break;default:throw Error(_(329))}}}return Be(e,pe()),e.callbackNode===t?Up.bind(null,e):null}function uu(e,n){var t=Tr;return e.current.memoizedState.isDehydrated&&(pt(e,n).flags|=256),e=si(e,n),e!==2&&(n=Me,Me=t,n!==null&&su(n)),e}function su(e){Me===null?Me=e:Me.push.apply(Me,e)}function ug(e){for(var n=e;;){if(n.flags&16384){var t=n.updateQueue;if(t!==null&&(t=t.stores,t!==null))for(var r=0;r<t.length;r++){var l=t[r],i=l.getSnapshot;l=l.value;try{if(!hn(i(),l))return!1}catch{return!1}}}if(t=n.child,n.subtreeFlags&16384&&t!==null)t.return=n,n=t;else{if(n===e)break;for(;n.sibling===null;){if(n.return===null||n.return===e)return!0;n=n.return}n.sibling.return=n.return,n=n.sibling}}return!0}function Hn(e,n){for(n&=~is,n&=~Si,e.suspendedLanes|=n,e.pingedLanes&=~n,e=e.expirationTimes;0<n;){var t=31-pn(n),r=1<<t;e[t]=-1,n&=~r}}function Ua(e){if(Y&6)throw Error(_(327));Wt();var n=Wl(e,0);if(!(n&1))return Be(e,pe()),null;var t=si(e,n);if(e.tag!==0&&t===2){var r=Oo(e);r!==0&&(n=r,t=uu(e,r))}if(t===1)throw t=Gr,pt(e,0),Hn(e,n),Be(e,pe()),t;if(t===6)throw Error(_(345));return e.finishedWork=e.current.alternate,e.finishedLanes=n,ut(e,Me,Pn),Be(e,pe()),null}function us(e,n){var t=Y;Y|=1;try{return e(n)}finally{Y=t,Y===0&&(Jt=pe()+500,vi&&rt())}}function vt(e){Wn!==null&&Wn.tag===0&&!(Y&6)&&Wt();var n=Y;Y|=1;var t=tn.transition,r=X;try{if(tn.transition=null,X=1,e)return e()}finally{X=r,tn.transition=t,Y=n,!(Y&6)&&rt()}}function ss(){We=Ft.current,ie(Ft)}function pt(e,n){e.finishedWork=null,e.finishedLanes=0;var t=e.timeoutHandle;if(t!==-1&&(e.timeoutHandle=-1,Am(t)),me!==null)for(t=me.return;t!==null;){var r=t;switch(Hu(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Gl();break;case 3:qt(),ie(Ae),ie(_e),qu();break;case 5:Xu(r);break;case 4:qt();break;case 13:ie(ue);break;case 19:ie(ue);break;case 10:bu(r.type._context);break;case 22:case 23:ss()}t=t.return}if(xe=e,me=e=Zn(e.current,null),Se=We=n,ve=0,Gr=null,is=Si=yt=0,Me=Tr=null,ct!==null){for(n=0;n<ct.length;n++)if(t=ct[n],r=t.interleaved,r!==null){t.interleaved=null;var l=r.next,i=t.pending;if(i!==null){var o=i.next;i.next=l,r.next=o}t.pending=r}ct=null}return e}function Vp(e,n){do{var t=me;try{if(Qu(),Ll.current=li,ri){for(var r=se.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}ri=!1}if(gt=0,ke=ye=se=null,Pr=!1,br=0,ls.current=null,t===null||t.return===null){ve=1,Gr=n,me=null;break}e:{var i=e,o=t.return,u=t,s=n;if(n=Se,u.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var a=s,c=u,f=c.tag;if(!(c.mode&1)&&(f===0||f===11||f===15)){var d=c.alternate;d?(c.updateQueue=d.updateQueue,c.memoizedState=d.memoizedState,c.lanes=d.lanes):(c.updateQueue=null,c.memoizedState=null)}var p=_a(o);if(p!==null){p.flags&=-257,Ta(p,o,u,i,n),p.mode&1&&Pa(i,a,n),n=p,s=a;var k=n.updateQueue;if(k===null){var x=new Set;x.add(s),n.updateQueue=x}else k.add(s);break e}else{if(!(n&1)){Pa(i,a,n),as();break e}s=Error(_(426))}}else if(oe&&u.mode&1){var I=_a(o);if(I!==null){!(I.flags&65536)&&(I.flags|=256),Ta(I,o,u,i,n),$u(Zt(s,u));break e}}i=s=Zt(s,u),ve!==4&&(ve=2),Tr===null?Tr=[i]:Tr.push(i),i=o;do{switch(i.tag){case 3:i.flags|=65536,n&=-n,i.lanes|=n;var h=Cp(i,s,n);xa(i,h);break e;case 1:u=s;var m=i.type,y=i.stateNode;if(!(i.flags&128)&&(typeof m.getDerivedStateFromError=="function"||y!==null&&typeof y.componentDidCatch=="function"&&(Xn===null||!Xn.has(y)))){i.flags|=65536,n&=-n,i.lanes|=n;var S=Np(i,u,n);xa(i,S);break e}}i=i.return}while(i!==null)}Wp(t)}catch(N){n=N,me===t&&t!==null&&(me=t=t.return);continue}break}while(!0)}function Hp(){var e=ii.current;return ii.current=li,e===null?li:e}function as(){(ve===0||ve===3||ve===2)&&(ve=4),xe===null||!(yt&268435455)&&!(Si&268435455)||Hn(xe,Se)}function si(e,n){var t=Y;Y|=2;var r=Hp();(xe!==e||Se!==n)&&(Pn=null,pt(e,n));do try{sg();break}catch(l){Vp(e,l)}while(!0);if(Qu(),Y=t,ii.current=r,me!==null)throw Error(_(261));return xe=null,Se=0,ve}function sg(){for(;me!==null;)$p(me)}function ag(){for(;me!==null&&!Dh();)$p(me)}function $p(e){var n=bp(e.alternate,e,We);e.memoizedProps=e.pendingProps,n===null?Wp(e):me=n,ls.current=null}function Wp(e){var n=e;do{var t=n.alternate;if(e=n.return,n.flags&32768){if(t=tg(t,n),t!==null){t.flags&=32767,me=t;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{ve=6,me=null;return}}else if(t=ng(t,n,We),t!==null){me=t;return}if(n=n.sibling,n!==null){me=n;return}me=n=e}while(n!==null);ve===0&&(ve=5)}function ut(e,n,t){var r=X,l=tn.transition;try{tn.transition=null,X=1,cg(e,n,t,r)}finally{tn.transition=l,X=r}return null}function cg(e,n,t,r){do Wt();while(Wn!==null);if(Y&6)throw Error(_(327));t=e.finishedWork;var l=e.finishedLanes;if(t===null)return null;if(e.finishedWork=null,e.finishedLanes=0,t===e.current)throw Error(_(177));e.callbackNode=null,e.callbackPriority=0;var i=t.lanes|t.childLanes;if(Wh(e,i),e===xe&&(me=xe=null,Se=0),!(t.subtreeFlags&2064)&&!(t.flags&2064)||xl||(xl=!0,Kp($l,function(){return Wt(),null})),i=(t.flags&15990)!==0,t.subtreeFlags&15990||i){i=tn.transition,tn.transition=null;var o=X;X=1;var u=Y;Y|=4,ls.current=null,lg(e,t),Fp(t,e),Im(Bo),Ql=!!Fo,Bo=Fo=null,e.current=t,ig(t),Mh(),Y=u,X=o,tn.transition=i}else e.current=t;if(xl&&(xl=!1,Wn=e,ui=l),i=e.pendingLanes,i===0&&(Xn=null),Fh(t.stateNode),Be(e,pe()),n!==null)for(r=e.onRecoverableError,t=0;t<n.length;t++)l=n[t],r(l.value,{componentStack:l.stack,digest:l.digest});if(oi)throw oi=!1,e=iu,iu=null,e;return ui&1&&e.tag!==0&&Wt(),i=e.pendingLanes,i&1?e===ou?zr++:(zr=0,ou=e):zr=0,rt(),null}function Wt(){if(Wn!==null){var e=Cf(ui),n=tn.transition,t=X;try{if(tn.transition=null,X=16>e?16:e,Wn===null)var r=!1;else{if(e=Wn,Wn=null,ui=0,Y&6)throw Error(_(331));var l=Y;for(Y|=4,M=e.current;M!==null;){var i=M,o=i.child;if(M.flags&16){var u=i.deletions;if(u!==null){for(var s=0;s<u.length;s++){var a=u[s];for(M=a;M!==null;){var c=M;switch(c.tag){case 0:case 11:case 15:_r(8,c,i)}var f=c.child;if(f!==null)f.return=c,M=f;else for(;M!==null;){c=M;var d=c.sibling,p=c.return;if(Mp(c),c===a){M=null;break}if(d!==null){d.return=p,M=d;break}M=p}}}var k=i.alternate;if(k!==null){var x=k.child;if(x!==null){k.child=null;do{var I=x.sibling;x.sibling=null,x=I}while(x!==null)}}M=i}}if(i.subtreeFlags&2064&&o!==null)o.return=i,M=o;else e:for(;M!==null;){if(i=M,i.flags&2048)switch(i.tag){case 0:case 11:case 15:_r(9,i,i.return)}var h=i.sibling;if(h!==null){h.return=i.return,M=h;break e}M=i.return}}var m=e.current;for(M=m;M!==null;){o=M;var y=o.child;if(o.subtreeFlags&2064&&y!==null)y.return=o,M=y;else e:for(o=m;M!==null;){if(u=M,u.flags&2048)try{switch(u.tag){case 0:case 11:case 15:wi(9,u)}}catch(N){ce(u,u.return,N)}if(u===o){M=null;break e}var S=u.sibling;if(S!==null){S.return=u.return,M=S;break e}M=u.return}}if(Y=l,rt(),wn&&typeof wn.onPostCommitFiberRoot=="function")try{wn.onPostCommitFiberRoot(di,e)}catch{}r=!0}return r}finally{X=t,tn.transition=n}}return!1}function Va(e,n,t){n=Zt(t,n),n=Cp(e,n,1),e=Gn(e,n,1),n=Le(),e!==null&&(Zr(e,1,n),Be(e,n))}function ce(e,n,t){if(e.tag===3)Va(e,e,t);else for(;n!==null;){if(n.tag===3){Va(n,e,t);break}else if(n.tag===1){var r=n.stateNode;if(typeof n.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(Xn===null||!Xn.has(r))){e=Zt(t,e),e=Np(n,e,1),n=Gn(n,e,1),e=Le(),n!==null&&(Zr(n,1,e),Be(n,e));break}}n=n.return}}function fg(e,n,t){var r=e.pingCache;r!==null&&r.delete(n),n=Le(),e.pingedLanes|=e.suspendedLanes&t,xe===e&&(Se&t)===t&&(ve===4||ve===3&&(Se&130023424)===Se&&500>pe()-os?pt(e,0):is|=t),Be(e,n)}function Qp(e,n){n===0&&(e.mode&1?(n=cl,cl<<=1,!(cl&130023424)&&(cl=4194304)):n=1);var t=Le();e=On(e,n),e!==null&&(Zr(e,n,t),Be(e,t))}function pg(e){var n=e.memoizedState,t=0;n!==null&&(t=n.retryLane),Qp(e,t)}function dg(e,n){var t=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(t=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(_(314))}r!==null&&r.delete(n),Qp(e,t)}var bp;bp=function(e,n,t){if(e!==null)if(e.memoizedProps!==n.pendingProps||Ae.current)je=!0;else{if(!(e.lanes&t)&&!(n.flags&128))return je=!1,eg(e,n,t);je=!!(e.flags&131072)}else je=!1,oe&&n.flags&1048576&&Xf(n,Zl,n.index);switch(n.lanes=0,n.tag){case 2:var r=n.type;Ol(e,n),e=n.pendingProps;var l=Yt(n,_e.current);$t(n,t),l=Ju(null,n,r,e,l,t);var i=es();return n.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(n.tag=1,n.memoizedState=null,n.updateQueue=null,Fe(r)?(i=!0,Xl(n)):i=!1,n.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,Yu(n),l.updater=xi,n.stateNode=l,l._reactInternals=n,Yo(n,r,e,t),n=qo(null,n,r,!0,i,t)):(n.tag=0,oe&&i&&Vu(n),Ie(null,n,l,t),n=n.child),n;case 16:r=n.elementType;e:{switch(Ol(e,n),e=n.pendingProps,l=r._init,r=l(r._payload),n.type=r,l=n.tag=mg(r),e=an(r,e),l){case 0:n=Xo(null,n,r,e,t);break e;case 1:n=La(null,n,r,e,t);break e;case 11:n=za(null,n,r,e,t);break e;case 14:n=Ia(null,n,r,an(r.type,e),t);break e}throw Error(_(306,r,""))}return n;case 0:return r=n.type,l=n.pendingProps,l=n.elementType===r?l:an(r,l),Xo(e,n,r,l,t);case 1:return r=n.type,l=n.pendingProps,l=n.elementType===r?l:an(r,l),La(e,n,r,l,t);case 3:e:{if(zp(n),e===null)throw Error(_(387));r=n.pendingProps,i=n.memoizedState,l=i.element,tp(e,n),ni(n,r,null,t);var o=n.memoizedState;if(r=o.element,i.isDehydrated)if(i={element:r,isDehydrated:!1,cache:o.cache,pendingSuspenseBoundaries:o.pendingSuspenseBoundaries,transitions:o.transitions},n.updateQueue.baseState=i,n.memoizedState=i,n.flags&256){l=Zt(Error(_(423)),n),n=Ra(e,n,r,t,l);break e}else if(r!==l){l=Zt(Error(_(424)),n),n=Ra(e,n,r,t,l);break e}else for(Qe=Yn(n.stateNode.containerInfo.firstChild),Ke=n,oe=!0,fn=null,t=ep(n,null,r,t),n.child=t;t;)t.flags=t.flags&-3|4096,t=t.sibling;else{if(Gt(),r===l){n=Dn(e,n,t);break e}Ie(e,n,r,t)}n=n.child}return n;case 5:return rp(n),e===null&&Qo(n),r=n.type,l=n.pendingProps,i=e!==null?e.memoizedProps:null,o=l.children,Uo(r,l)?o=null:i!==null&&Uo(r,i)&&(n.flags|=32),Tp(e,n),Ie(e,n,o,t),n.child;case 6:return e===null&&Qo(n),null;case 13:return Ip(e,n,t);case 4:return Gu(n,n.stateNode.containerInfo),r=n.pendingProps,e===null?n.child=Xt(n,null,r,t):Ie(e,n,r,t),n.child;case 11:return r=n.type,l=n.pendingProps,l=n.elementType===r?l:an(r,l),za(e,n,r,l,t);case 7:return Ie(e,n,n.pendingProps,t),n.child;case 8:return Ie(e,n,n.pendingProps.children,t),n.child;case 12:return Ie(e,n,n.pendingProps.children,t),n.child;case 10:e:{if(r=n.type._context,l=n.pendingProps,i=n.memoizedProps,o=l.value,ne(Jl,r._currentValue),r._currentValue=o,i!==null)if(hn(i.value,o)){if(i.children===l.children&&!Ae.current){n=Dn(e,n,t);break e}}else for(i=n.child,i!==null&&(i.return=n);i!==null;){var u=i.dependencies;if(u!==null){o=i.child;for(var s=u.firstContext;s!==null;){if(s.context===r){if(i.tag===1){s=In(-1,t&-t),s.tag=2;var a=i.updateQueue;if(a!==null){a=a.shared;var c=a.pending;c===null?s.next=s:(s.next=c.next,c.next=s),a.pending=s}}i.lanes|=t,s=i.alternate,s!==null&&(s.lanes|=t),bo(i.return,t,n),u.lanes|=t;break}s=s.next}}else if(i.tag===10)o=i.type===n.type?null:i.child;else if(i.tag===18){if(o=i.return,o===null)throw Error(_(341));o.lanes|=t,u=o.alternate,u!==null&&(u.lanes|=t),bo(o,t,n),o=i.sibling}else o=i.child;if(o!==null)o.return=i;else for(o=i;o!==null;){if(o===n){o=null;break}if(i=o.sibling,i!==null){i.return=o.return,o=i;break}o=o.return}i=o}Ie(e,n,l.children,t),n=n.child}return n;case 9:return l=n.type,r=n.pendingProps.children,$t(n,t),l=rn(l),r=r(l),n.flags|=1,Ie(e,n,r,t),n.child;case 14:return r=n.type,l=an(r,n.pendingProps),l=an(r.type,l),Ia(e,n,r,l,t);case 15:return Pp(e,n,n.type,n.pendingProps,t);case 17:return r=n.type,l=n.pendingProps,l=n.elementType===r?l:an(r,l),Ol(e,n),n.tag=1,Fe(r)?(e=!0,Xl(n)):e=!1,$t(n,t),Ep(n,r,l),Yo(n,r,l,t),qo(null,n,r,!0,e,t);case 19:return Lp(e,n,t);case 22:return _p(e,n,t)}throw Error(_(156,n.tag))};function Kp(e,n){return xf(e,n)}function hg(e,n,t,r){this.tag=e,this.key=t,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=n,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function nn(e,n,t,r){return new hg(e,n,t,r)}function cs(e){return e=e.prototype,!(!e||!e.isReactComponent)}function mg(e){if(typeof e=="function")return cs(e)?1:0;if(e!=null){if(e=e.$$typeof,e===zu)return 11;if(e===Iu)return 14}return 2}function Zn(e,n){var t=e.alternate;return t===null?(t=nn(e.tag,n,e.key,e.mode),t.elementType=e.elementType,t.type=e.type,t.stateNode=e.stateNode,t.alternate=e,e.alternate=t):(t.pendingProps=n,t.type=e.type,t.flags=0,t.subtreeFlags=0,t.deletions=null),t.flags=e.flags&14680064,t.childLanes=e.childLanes,t.lanes=e.lanes,t.child=e.child,t.memoizedProps=e.memoizedProps,t.memoizedState=e.memoizedState,t.updateQueue=e.updateQueue,n=e.dependencies,t.dependencies=n===null?null:{lanes:n.lanes,firstContext:n.firstContext},t.sibling=e.sibling,t.index=e.index,t.ref=e.ref,t}function jl(e,n,t,r,l,i){var o=2;if(r=e,typeof e=="function")cs(e)&&(o=1);else if(typeof e=="string")o=5;else e:switch(e){case Tt:return dt(t.children,l,i,n);case Tu:o=8,l|=8;break;case vo:return e=nn(12,t,n,l|2),e.elementType=vo,e.lanes=i,e;case ko:return e=nn(13,t,n,l),e.elementType=ko,e.lanes=i,e;case xo:return e=nn(19,t,n,l),e.elementType=xo,e.lanes=i,e;case tf:return Ei(t,l,i,n);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case ef:o=10;break e;case nf:o=9;break e;case zu:o=11;break e;case Iu:o=14;break e;case Bn:o=16,r=null;break e}throw Error(_(130,e==null?e:typeof e,""))}return n=nn(o,t,n,l),n.elementType=e,n.type=r,n.lanes=i,n}function dt(e,n,t,r){return e=nn(7,e,r,n),e.lanes=t,e}function Ei(e,n,t,r){return e=nn(22,e,r,n),e.elementType=tf,e.lanes=t,e.stateNode={isHidden:!1},e}function to(e,n,t){return e=nn(6,e,null,n),e.lanes=t,e}function ro(e,n,t){return n=nn(4,e.children!==null?e.children:[],e.key,n),n.lanes=t,n.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},n}function gg(e,n,t,r,l){this.tag=n,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Ai(0),this.expirationTimes=Ai(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Ai(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function fs(e,n,t,r,l,i,o,u,s){return e=new gg(e,n,t,u,s),n===1?(n=1,i===!0&&(n|=8)):n=0,i=nn(3,null,null,n),e.current=i,i.stateNode=e,i.memoizedState={element:r,isDehydrated:t,cache:null,transitions:null,pendingSuspenseBoundaries:null},Yu(i),e}function yg(e,n,t){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:_t,key:r==null?null:""+r,children:e,containerInfo:n,implementation:t}}function Yp(e){if(!e)return et;e=e._reactInternals;e:{if(xt(e)!==e||e.tag!==1)throw Error(_(170));var n=e;do{switch(n.tag){case 3:n=n.stateNode.context;break e;case 1:if(Fe(n.type)){n=n.stateNode.__reactInternalMemoizedMergedChildContext;break e}}n=n.return}while(n!==null);throw Error(_(171))}if(e.tag===1){var t=e.type;if(Fe(t))return Yf(e,t,n)}return n}function Gp(e,n,t,r,l,i,o,u,s){return e=fs(t,r,!0,e,l,i,o,u,s),e.context=Yp(null),t=e.current,r=Le(),l=qn(t),i=In(r,l),i.callback=n??null,Gn(t,i,l),e.current.lanes=l,Zr(e,l,r),Be(e,r),e}function Ci(e,n,t,r){var l=n.current,i=Le(),o=qn(l);return t=Yp(t),n.context===null?n.context=t:n.pendingContext=t,n=In(i,o),n.payload={element:e},r=r===void 0?null:r,r!==null&&(n.callback=r),e=Gn(l,n,o),e!==null&&(dn(e,l,o,i),Il(e,l,o)),o}function ai(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function Ha(e,n){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var t=e.retryLane;e.retryLane=t!==0&&t<n?t:n}}function ps(e,n){Ha(e,n),(e=e.alternate)&&Ha(e,n)}function vg(){return null}var Xp=typeof reportError=="function"?reportError:function(e){console.error(e)};function ds(e){this._internalRoot=e}Ni.prototype.render=ds.prototype.render=function(e){var n=this._internalRoot;if(n===null)throw Error(_(409));Ci(e,n,null,null)};Ni.prototype.unmount=ds.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var n=e.containerInfo;vt(function(){Ci(null,e,null,null)}),n[Rn]=null}};function Ni(e){this._internalRoot=e}Ni.prototype.unstable_scheduleHydration=function(e){if(e){var n=_f();e={blockedOn:null,target:e,priority:n};for(var t=0;t<Vn.length&&n!==0&&n<Vn[t].priority;t++);Vn.splice(t,0,e),t===0&&zf(e)}};function hs(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function Pi(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function $a(){}function kg(e,n,t,r,l){if(l){if(typeof r=="function"){var i=r;r=function(){var a=ai(o);i.call(a)}}var o=Gp(n,r,e,0,null,!1,!1,"",$a);return e._reactRootContainer=o,e[Rn]=o.current,Vr(e.nodeType===8?e.parentNode:e),vt(),o}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var u=r;r=function(){var a=ai(s);u.call(a)}}var s=fs(e,0,!1,null,null,!1,!1,"",$a);return e._reactRootContainer=s,e[Rn]=s.current,Vr(e.nodeType===8?e.parentNode:e),vt(function(){Ci(n,s,t,r)}),s}function _i(e,n,t,r,l){var i=t._reactRootContainer;if(i){var o=i;if(typeof l=="function"){var u=l;l=function(){var s=ai(o);u.call(s)}}Ci(n,o,e,l)}else o=kg(t,n,e,l,r);return ai(o)}Nf=function(e){switch(e.tag){case 3:var n=e.stateNode;if(n.current.memoizedState.isDehydrated){var t=kr(n.pendingLanes);t!==0&&(Ou(n,t|1),Be(n,pe()),!(Y&6)&&(Jt=pe()+500,rt()))}break;case 13:vt(function(){var r=On(e,1);if(r!==null){var l=Le();dn(r,e,1,l)}}),ps(e,1)}};Du=function(e){if(e.tag===13){var n=On(e,134217728);if(n!==null){var t=Le();dn(n,e,134217728,t)}ps(e,134217728)}};Pf=function(e){if(e.tag===13){var n=qn(e),t=On(e,n);if(t!==null){var r=Le();dn(t,e,n,r)}ps(e,n)}};_f=function(){return X};Tf=function(e,n){var t=X;try{return X=e,n()}finally{X=t}};Io=function(e,n,t){switch(n){case"input":if(Eo(e,t),n=t.name,t.type==="radio"&&n!=null){for(t=e;t.parentNode;)t=t.parentNode;for(t=t.querySelectorAll("input[name="+JSON.stringify(""+n)+'][type="radio"]'),n=0;n<t.length;n++){var r=t[n];if(r!==e&&r.form===e.form){var l=yi(r);if(!l)throw Error(_(90));lf(r),Eo(r,l)}}}break;case"textarea":uf(e,t);break;case"select":n=t.value,n!=null&&Bt(e,!!t.multiple,n,!1)}};hf=us;mf=vt;var xg={usingClientEntryPoint:!1,Events:[el,Rt,yi,pf,df,us]},hr={findFiberByHostInstance:at,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},wg={bundleType:hr.bundleType,version:hr.version,rendererPackageName:hr.rendererPackageName,rendererConfig:hr.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:Mn.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=vf(e),e===null?null:e.stateNode},findFiberByHostInstance:hr.findFiberByHostInstance||vg,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var wl=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!wl.isDisabled&&wl.supportsFiber)try{di=wl.inject(wg),wn=wl}catch{}}Ge.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=xg;Ge.createPortal=function(e,n){var t=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!hs(n))throw Error(_(200));return yg(e,n,null,t)};Ge.createRoot=function(e,n){if(!hs(e))throw Error(_(299));var t=!1,r="",l=Xp;return n!=null&&(n.unstable_strictMode===!0&&(t=!0),n.identifierPrefix!==void 0&&(r=n.identifierPrefix),n.onRecoverableError!==void 0&&(l=n.onRecoverableError)),n=fs(e,1,!1,null,null,t,!1,r,l),e[Rn]=n.current,Vr(e.nodeType===8?e.parentNode:e),new ds(n)};Ge.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var n=e._reactInternals;if(n===void 0)throw typeof e.render=="function"?Error(_(188)):(e=Object.keys(e).join(","),Error(_(268,e)));return e=vf(n),e=e===null?null:e.stateNode,e};Ge.flushSync=function(e){return vt(e)};Ge.hydrate=function(e,n,t){if(!Pi(n))throw Error(_(200));return _i(null,e,n,!0,t)};Ge.hydrateRoot=function(e,n,t){if(!hs(e))throw Error(_(405));var r=t!=null&&t.hydratedSources||null,l=!1,i="",o=Xp;if(t!=null&&(t.unstable_strictMode===!0&&(l=!0),t.identifierPrefix!==void 0&&(i=t.identifierPrefix),t.onRecoverableError!==void 0&&(o=t.onRecoverableError)),n=Gp(n,null,e,1,t??null,l,!1,i,o),e[Rn]=n.current,Vr(e),r)for(e=0;e<r.length;e++)t=r[e],l=t._getVersion,l=l(t._source),n.mutableSourceEagerHydrationData==null?n.mutableSourceEagerHydrationData=[t,l]:n.mutableSourceEagerHydrationData.push(t,l);return new Ni(n)};Ge.render=function(e,n,t){if(!Pi(n))throw Error(_(200));return _i(null,e,n,!1,t)};Ge.unmountComponentAtNode=function(e){if(!Pi(e))throw Error(_(40));return e._reactRootContainer?(vt(function(){_i(null,null,e,!1,function(){e._reactRootContainer=null,e[Rn]=null})}),!0):!1};Ge.unstable_batchedUpdates=us;Ge.unstable_renderSubtreeIntoContainer=function(e,n,t,r){if(!Pi(t))throw Error(_(200));if(e==null||e._reactInternals===void 0)throw Error(_(38));return _i(e,n,t,!1,r)};Ge.version="18.3.1-next-f1338f8080-20240426";function qp(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(qp)}catch(e){console.error(e)}}qp(),Xc.exports=Ge;var Sg=Xc.exports,Zp,Wa=Sg;Zp=Wa.createRoot,Wa.hydrateRoot;/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Eg=e=>e.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase(),Jp=(...e)=>e.filter((n,t,r)=>!!n&&r.indexOf(n)===t).join(" ");/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */var Cg={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Ng=W.forwardRef(({color:e="currentColor",size:n=24,strokeWidth:t=2,absoluteStrokeWidth:r,className:l="",children:i,iconNode:o,...u},s)=>W.createElement("svg",{ref:s,...Cg,width:n,height:n,stroke:e,strokeWidth:r?Number(t)*24/Number(n):t,className:Jp("lucide",l),...u},[...o.map(([a,c])=>W.createElement(a,c)),...Array.isArray(i)?i:[i]]));/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Te=(e,n)=>{const t=W.forwardRef(({className:r,...l},i)=>W.createElement(Ng,{ref:i,iconNode:n,className:Jp(`lucide-${Eg(e)}`,r),...l}));return t.displayName=`${e}`,t};/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const ed=Te("Bot",[["path",{d:"M12 8V4H8",key:"hb8ula"}],["rect",{width:"16",height:"12",x:"4",y:"8",rx:"2",key:"enze0r"}],["path",{d:"M2 14h2",key:"vft8re"}],["path",{d:"M20 14h2",key:"4cs60a"}],["path",{d:"M15 13v2",key:"1xurst"}],["path",{d:"M9 13v2",key:"rq6x2g"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const au=Te("Check",[["path",{d:"M20 6 9 17l-5-5",key:"1gmf2c"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Pg=Te("ChevronRight",[["path",{d:"m9 18 6-6-6-6",key:"mthhwq"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const _g=Te("CircleAlert",[["circle",{cx:"12",cy:"12",r:"10",key:"1mglay"}],["line",{x1:"12",x2:"12",y1:"8",y2:"12",key:"1pkeuh"}],["line",{x1:"12",x2:"12.01",y1:"16",y2:"16",key:"4dfq90"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Tg=Te("CircleX",[["circle",{cx:"12",cy:"12",r:"10",key:"1mglay"}],["path",{d:"m15 9-6 6",key:"1uzhvr"}],["path",{d:"m9 9 6 6",key:"z0biqf"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const nd=Te("Copy",[["rect",{width:"14",height:"14",x:"8",y:"8",rx:"2",ry:"2",key:"17jyea"}],["path",{d:"M4 16c-1.1 0-2-.9-2-2V4c0-1.1.9-2 2-2h10c1.1 0 2 .9 2 2",key:"zix9uf"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const td=Te("Maximize2",[["polyline",{points:"15 3 21 3 21 9",key:"mznyad"}],["polyline",{points:"9 21 3 21 3 15",key:"1avn1i"}],["line",{x1:"21",x2:"14",y1:"3",y2:"10",key:"ota7mn"}],["line",{x1:"3",x2:"10",y1:"21",y2:"14",key:"1atl0r"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const rd=Te("Minimize2",[["polyline",{points:"4 14 10 14 10 20",key:"11kfnr"}],["polyline",{points:"20 10 14 10 14 4",key:"rlmsce"}],["line",{x1:"14",x2:"21",y1:"10",y2:"3",key:"o5lafz"}],["line",{x1:"3",x2:"10",y1:"21",y2:"14",key:"1atl0r"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const zg=Te("Play",[["polygon",{points:"6 3 20 12 6 21 6 3",key:"1oa8hb"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Ig=Te("RotateCcw",[["path",{d:"M3 12a9 9 0 1 0 9-9 9.75 9.75 0 0 0-6.74 2.74L3 8",key:"1357e3"}],["path",{d:"M3 3v5h5",key:"1xhq8a"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Lg=Te("Send",[["path",{d:"M14.536 21.686a.5.5 0 0 0 .937-.024l6.5-19a.496.496 0 0 0-.635-.635l-19 6.5a.5.5 0 0 0-.024.937l7.93 3.18a2 2 0 0 1 1.112 1.11z",key:"1ffxy3"}],["path",{d:"m21.854 2.147-10.94 10.939",key:"12cjpa"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const ms=Te("Terminal",[["polyline",{points:"4 17 10 11 4 5",key:"akl6gq"}],["line",{x1:"12",x2:"20",y1:"19",y2:"19",key:"q2wloq"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Rg=Te("Trash2",[["path",{d:"M3 6h18",key:"d0wm0j"}],["path",{d:"M19 6v14c0 1-1 2-2 2H7c-1 0-2-1-2-2V6",key:"4alrt4"}],["path",{d:"M8 6V4c0-1 1-2 2-2h4c1 0 2 1 2 2v2",key:"v07s0e"}],["line",{x1:"10",x2:"10",y1:"11",y2:"17",key:"1uufr5"}],["line",{x1:"14",x2:"14",y1:"11",y2:"17",key:"xtxkd"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Og=Te("User",[["path",{d:"M19 21v-2a4 4 0 0 0-4-4H9a4 4 0 0 0-4 4v2",key:"975kel"}],["circle",{cx:"12",cy:"7",r:"4",key:"17ys0d"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const ld=Te("WifiOff",[["path",{d:"M12 20h.01",key:"zekei9"}],["path",{d:"M8.5 16.429a5 5 0 0 1 7 0",key:"1bycff"}],["path",{d:"M5 12.859a10 10 0 0 1 5.17-2.69",key:"1dl1wf"}],["path",{d:"M19 12.859a10 10 0 0 0-2.007-1.523",key:"4k23kn"}],["path",{d:"M2 8.82a15 15 0 0 1 4.177-2.643",key:"1grhjp"}],["path",{d:"M22 8.82a15 15 0 0 0-11.288-3.764",key:"z3jwby"}],["path",{d:"m2 2 20 20",key:"1ooewy"}]]);/**
- * @license lucide-react v0.441.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const id=Te("Wifi",[["path",{d:"M12 20h.01",key:"zekei9"}],["path",{d:"M2 8.82a15 15 0 0 1 20 0",key:"dnpr2z"}],["path",{d:"M5 12.859a10 10 0 0 1 14 0",key:"1x1e6c"}],["path",{d:"M8.5 16.429a5 5 0 0 1 7 0",key:"1bycff"}]]);function Dg(){const[e,n]=W.useState(!1),[t,r]=W.useState(!1);return W.useEffect(()=>{const l=o=>n(o.detail.connected),i=o=>r(o.detail.connected);return window.addEventListener("gangaflow:terminal-status",l),window.addEventListener("gangaflow:llm-status",i),()=>{window.removeEventListener("gangaflow:terminal-status",l),window.removeEventListener("gangaflow:llm-status",i)}},[]),C.jsxs("header",{className:"navbar",children:[C.jsxs("div",{className:"navbar-left",children:[C.jsx("div",{className:"navbar-logo",children:C.jsx(ms,{size:18,strokeWidth:2,className:"navbar-logo-icon"})}),C.jsxs("span",{className:"navbar-title",children:["Ganga",C.jsx("span",{className:"navbar-title-accent",children:"Flow"})]}),C.jsx("span",{className:"navbar-badge",children:"beta"})]}),C.jsxs("div",{className:"navbar-center",children:[C.jsx(Qa,{label:"Ganga Shell",connected:e}),C.jsx(Qa,{label:"GangaBot",connected:t})]}),C.jsx("div",{className:"navbar-right",children:C.jsx("span",{className:"navbar-hint",children:"LLM-assisted Ganga interface"})})]})}function Qa({label:e,connected:n}){return C.jsxs("div",{className:`status-pill ${n?"connected":"disconnected"}`,children:[n?C.jsx(id,{size:11,strokeWidth:2.5}):C.jsx(ld,{size:11,strokeWidth:2.5}),C.jsx("span",{children:e}),C.jsx("span",{className:`status-dot ${n?"on":"off"}`})]})}const ba="ws://localhost:8000/ws/terminal/",Mg=/\x1B\[[0-?]*[ -/]*[@-~]|\x1B[()][AB012]|\x1B=|\r/g,Ka=e=>e.replace(Mg,""),qe={CONNECTING:"connecting",CONNECTED:"connected",DISCONNECTED:"disconnected",ERROR:"error"};function jg(){const[e,n]=W.useState([]),[t,r]=W.useState(""),[l,i]=W.useState([]),[o,u]=W.useState(-1),[s,a]=W.useState(qe.DISCONNECTED),[c,f]=W.useState(!1),d=W.useRef(null),p=W.useRef(null),k=W.useRef(null),x=W.useRef("");W.useEffect(()=>{d.current&&(d.current.scrollTop=d.current.scrollHeight)},[e]);const I=W.useCallback((P,L)=>{n(V=>[...V,{type:P,text:L,id:Date.now()+Math.random()}])},[]),h=()=>{var P;return(P=p.current)==null?void 0:P.focus()},m=W.useCallback(()=>{if(k.current&&k.current.readyState<2)return;a(qe.CONNECTING),I("info","─── GangaFlow Terminal ──────────────────────────────"),I("info",`Connecting to shell at ${ba} …`);const P=new WebSocket(ba);k.current=P,P.onopen=()=>{var L;a(qe.CONNECTED),I("success","Connected. Shell is ready."),I("blank",""),(L=p.current)==null||L.focus()},P.onmessage=L=>{const Z=Ka(x.current+L.data).split(`
-`);x.current=Z.pop(),Z.forEach($=>{$.trim()&&I("output",$)})},P.onerror=()=>{a(qe.ERROR),I("error","WebSocket error — is the Django server running?  (daphne ganga_backend.asgi:application)")},P.onclose=L=>{a(qe.DISCONNECTED),x.current.trim()&&(I("output",Ka(x.current)),x.current=""),I("muted",`Shell disconnected (code ${L.code}).`)}},[I]);W.useEffect(()=>(m(),()=>{var P;(P=k.current)==null||P.close()}),[m]),W.useEffect(()=>{window.dispatchEvent(new CustomEvent("gangaflow:terminal-status",{detail:{connected:s===qe.CONNECTED}}))},[s]),W.useEffect(()=>{const P=L=>{const V=k.current;if(!V||V.readyState!==WebSocket.OPEN){I("error","Terminal not connected — cannot run code.");return}L.detail.code.split(`
-`).forEach($=>V.send($+"\r")),V.send("\r")};return window.addEventListener("gangaflow:run-code",P),()=>window.removeEventListener("gangaflow:run-code",P)},[I]);const y=P=>{P.preventDefault();const L=t.trim();if(L){if(L==="clear"||L==="cls"){N(),i(V=>[L,...V]),u(-1),r("");return}if(s!==qe.CONNECTED||!k.current){I("error","Not connected. Click reconnect (↺).");return}k.current.send(L+"\r"),i(V=>[L,...V]),u(-1),r("")}},S=P=>{if(P.key==="ArrowUp"){P.preventDefault();const L=Math.min(o+1,l.length-1);u(L),r(l[L]??"")}else if(P.key==="ArrowDown"){P.preventDefault();const L=Math.max(o-1,-1);u(L),r(L===-1?"":l[L])}},N=()=>{n([]),x.current=""},w=()=>{var P;(P=k.current)==null||P.close(),n([]),x.current="",setTimeout(m,200)},T={[qe.CONNECTING]:{label:"connecting…",cls:"status-connecting"},[qe.CONNECTED]:{label:"connected",cls:"status-connected"},[qe.DISCONNECTED]:{label:"disconnected",cls:"status-disconnected"},[qe.ERROR]:{label:"error",cls:"status-error"}},{label:R,cls:A}=T[s],j=s===qe.CONNECTED;return C.jsxs("div",{className:`terminal-pane ${c?"maximised":""}`,children:[C.jsxs("div",{className:"pane-header",children:[C.jsxs("div",{className:"pane-header-left",children:[C.jsxs("div",{className:"traffic-lights",children:[C.jsx("span",{className:"tl tl-red",title:"Close"}),C.jsx("span",{className:"tl tl-yellow",title:"Minimise"}),C.jsx("span",{className:"tl tl-green",title:"Maximise"})]}),C.jsx(ms,{size:13,className:"pane-header-icon"}),C.jsx("span",{className:"pane-header-title",children:"Ganga Shell"}),C.jsxs("span",{className:`ws-status-badge ${A}`,children:[j?C.jsx(id,{size:10,strokeWidth:2.5}):C.jsx(ld,{size:10,strokeWidth:2.5}),R]})]}),C.jsxs("div",{className:"pane-header-right",children:[C.jsx("button",{className:"header-btn",onClick:w,title:"Reconnect shell",children:C.jsx(Ig,{size:13})}),C.jsx("button",{className:"header-btn",onClick:N,title:"Clear terminal",children:C.jsx(Tg,{size:13})}),C.jsx("button",{className:"header-btn",onClick:()=>f(P=>!P),title:c?"Restore":"Maximise",children:c?C.jsx(rd,{size:13}):C.jsx(td,{size:13})})]})]}),C.jsx("div",{className:"terminal-output",ref:d,onClick:h,children:e.map(P=>C.jsx(Ag,{line:P},P.id))}),C.jsxs("form",{className:"terminal-input-row",onSubmit:y,children:[C.jsxs("span",{className:"terminal-prompt",children:[C.jsx(Pg,{size:13,className:"prompt-chevron"}),C.jsx("span",{className:"prompt-label",children:"ganga"}),C.jsx("span",{className:"prompt-separator",children:" > "})]}),C.jsx("input",{ref:p,className:"terminal-input",type:"text",value:t,onChange:P=>r(P.target.value),onKeyDown:S,placeholder:j?"enter command…":"not connected",autoComplete:"off",spellCheck:!1,autoFocus:!0})]})]})}function Ag({line:e}){const n={info:"line-info",muted:"line-muted",blank:"line-blank",output:"line-output",error:"line-error",warning:"line-warning",success:"line-success",command:"line-command"};return e.type==="blank"?C.jsx("div",{className:"terminal-line line-blank"}):C.jsx("div",{className:`terminal-line ${n[e.type]??"line-output"}`,children:e.text})}function Fg(e,n){const t={};return(e[e.length-1]===""?[...e,""]:e).join((t.padRight?" ":"")+","+(t.padLeft===!1?"":" ")).trim()}const Bg=/^[$_\p{ID_Start}][$_\u{200C}\u{200D}\p{ID_Continue}]*$/u,Ug=/^[$_\p{ID_Start}][-$_\u{200C}\u{200D}\p{ID_Continue}]*$/u,Vg={};function Ya(e,n){return(Vg.jsx?Ug:Bg).test(e)}const Hg=/[ \t\n\f\r]/g;function $g(e){return typeof e=="object"?e.type==="text"?Ga(e.value):!1:Ga(e)}function Ga(e){return e.replace(Hg,"")===""}class tl{constructor(n,t,r){this.normal=t,this.property=n,r&&(this.space=r)}}tl.prototype.normal={};tl.prototype.property={};tl.prototype.space=void 0;function od(e,n){const t={},r={};for(const l of e)Object.assign(t,l.property),Object.assign(r,l.normal);return new tl(t,r,n)}function cu(e){return e.toLowerCase()}class Ve{constructor(n,t){this.attribute=t,this.property=n}}Ve.prototype.attribute="";Ve.prototype.booleanish=!1;Ve.prototype.boolean=!1;Ve.prototype.commaOrSpaceSeparated=!1;Ve.prototype.commaSeparated=!1;Ve.prototype.defined=!1;Ve.prototype.mustUseProperty=!1;Ve.prototype.number=!1;Ve.prototype.overloadedBoolean=!1;Ve.prototype.property="";Ve.prototype.spaceSeparated=!1;Ve.prototype.space=void 0;let Wg=0;const H=wt(),he=wt(),fu=wt(),z=wt(),ee=wt(),Qt=wt(),$e=wt();function wt(){return 2**++Wg}const pu=Object.freeze(Object.defineProperty({__proto__:null,boolean:H,booleanish:he,commaOrSpaceSeparated:$e,commaSeparated:Qt,number:z,overloadedBoolean:fu,spaceSeparated:ee},Symbol.toStringTag,{value:"Module"})),lo=Object.keys(pu);class gs extends Ve{constructor(n,t,r,l){let i=-1;if(super(n,t),Xa(this,"space",l),typeof r=="number")for(;++i<lo.length;){const o=lo[i];Xa(this,lo[i],(r&pu[o])===pu[o])}}}gs.prototype.defined=!0;function Xa(e,n,t){t&&(e[n]=t)}function rr(e){const n={},t={};for(const[r,l]of Object.entries(e.properties)){const i=new gs(r,e.transform(e.attributes||{},r),l,e.space);e.mustUseProperty&&e.mustUseProperty.includes(r)&&(i.mustUseProperty=!0),n[r]=i,t[cu(r)]=r,t[cu(i.attribute)]=r}return new tl(n,t,e.space)}const ud=rr({properties:{ariaActiveDescendant:null,ariaAtomic:he,ariaAutoComplete:null,ariaBusy:he,ariaChecked:he,ariaColCount:z,ariaColIndex:z,ariaColSpan:z,ariaControls:ee,ariaCurrent:null,ariaDescribedBy:ee,ariaDetails:null,ariaDisabled:he,ariaDropEffect:ee,ariaErrorMessage:null,ariaExpanded:he,ariaFlowTo:ee,ariaGrabbed:he,ariaHasPopup:null,ariaHidden:he,ariaInvalid:null,ariaKeyShortcuts:null,ariaLabel:null,ariaLabelledBy:ee,ariaLevel:z,ariaLive:null,ariaModal:he,ariaMultiLine:he,ariaMultiSelectable:he,ariaOrientation:null,ariaOwns:ee,ariaPlaceholder:null,ariaPosInSet:z,ariaPressed:he,ariaReadOnly:he,ariaRelevant:null,ariaRequired:he,ariaRoleDescription:ee,ariaRowCount:z,ariaRowIndex:z,ariaRowSpan:z,ariaSelected:he,ariaSetSize:z,ariaSort:null,ariaValueMax:z,ariaValueMin:z,ariaValueNow:z,ariaValueText:null,role:null},transform(e,n){return n==="role"?n:"aria-"+n.slice(4).toLowerCase()}});function sd(e,n){return n in e?e[n]:n}function ad(e,n){return sd(e,n.toLowerCase())}const Qg=rr({attributes:{acceptcharset:"accept-charset",classname:"class",htmlfor:"for",httpequiv:"http-equiv"},mustUseProperty:["checked","multiple","muted","selected"],properties:{abbr:null,accept:Qt,acceptCharset:ee,accessKey:ee,action:null,allow:null,allowFullScreen:H,allowPaymentRequest:H,allowUserMedia:H,alt:null,as:null,async:H,autoCapitalize:null,autoComplete:ee,autoFocus:H,autoPlay:H,blocking:ee,capture:null,charSet:null,checked:H,cite:null,className:ee,cols:z,colSpan:null,content:null,contentEditable:he,controls:H,controlsList:ee,coords:z|Qt,crossOrigin:null,data:null,dateTime:null,decoding:null,default:H,defer:H,dir:null,dirName:null,disabled:H,download:fu,draggable:he,encType:null,enterKeyHint:null,fetchPriority:null,form:null,formAction:null,formEncType:null,formMethod:null,formNoValidate:H,formTarget:null,headers:ee,height:z,hidden:fu,high:z,href:null,hrefLang:null,htmlFor:ee,httpEquiv:ee,id:null,imageSizes:null,imageSrcSet:null,inert:H,inputMode:null,integrity:null,is:null,isMap:H,itemId:null,itemProp:ee,itemRef:ee,itemScope:H,itemType:ee,kind:null,label:null,lang:null,language:null,list:null,loading:null,loop:H,low:z,manifest:null,max:null,maxLength:z,media:null,method:null,min:null,minLength:z,multiple:H,muted:H,name:null,nonce:null,noModule:H,noValidate:H,onAbort:null,onAfterPrint:null,onAuxClick:null,onBeforeMatch:null,onBeforePrint:null,onBeforeToggle:null,onBeforeUnload:null,onBlur:null,onCancel:null,onCanPlay:null,onCanPlayThrough:null,onChange:null,onClick:null,onClose:null,onContextLost:null,onContextMenu:null,onContextRestored:null,onCopy:null,onCueChange:null,onCut:null,onDblClick:null,onDrag:null,onDragEnd:null,onDragEnter:null,onDragExit:null,onDragLeave:null,onDragOver:null,onDragStart:null,onDrop:null,onDurationChange:null,onEmptied:null,onEnded:null,onError:null,onFocus:null,onFormData:null,onHashChange:null,onInput:null,onInvalid:null,onKeyDown:null,onKeyPress:null,onKeyUp:null,onLanguageChange:null,onLoad:null,onLoadedData:null,onLoadedMetadata:null,onLoadEnd:null,onLoadStart:null,onMessage:null,onMessageError:null,onMouseDown:null,onMouseEnter:null,onMouseLeave:null,onMouseMove:null,onMouseOut:null,onMouseOver:null,onMouseUp:null,onOffline:null,onOnline:null,onPageHide:null,onPageShow:null,onPaste:null,onPause:null,onPlay:null,onPlaying:null,onPopState:null,onProgress:null,onRateChange:null,onRejectionHandled:null,onReset:null,onResize:null,onScroll:null,onScrollEnd:null,onSecurityPolicyViolation:null,onSeeked:null,onSeeking:null,onSelect:null,onSlotChange:null,onStalled:null,onStorage:null,onSubmit:null,onSuspend:null,onTimeUpdate:null,onToggle:null,onUnhandledRejection:null,onUnload:null,onVolumeChange:null,onWaiting:null,onWheel:null,open:H,optimum:z,pattern:null,ping:ee,placeholder:null,playsInline:H,popover:null,popoverTarget:null,popoverTargetAction:null,poster:null,preload:null,readOnly:H,referrerPolicy:null,rel:ee,required:H,reversed:H,rows:z,rowSpan:z,sandbox:ee,scope:null,scoped:H,seamless:H,selected:H,shadowRootClonable:H,shadowRootDelegatesFocus:H,shadowRootMode:null,shape:null,size:z,sizes:null,slot:null,span:z,spellCheck:he,src:null,srcDoc:null,srcLang:null,srcSet:null,start:z,step:null,style:null,tabIndex:z,target:null,title:null,translate:null,type:null,typeMustMatch:H,useMap:null,value:he,width:z,wrap:null,writingSuggestions:null,align:null,aLink:null,archive:ee,axis:null,background:null,bgColor:null,border:z,borderColor:null,bottomMargin:z,cellPadding:null,cellSpacing:null,char:null,charOff:null,classId:null,clear:null,code:null,codeBase:null,codeType:null,color:null,compact:H,declare:H,event:null,face:null,frame:null,frameBorder:null,hSpace:z,leftMargin:z,link:null,longDesc:null,lowSrc:null,marginHeight:z,marginWidth:z,noResize:H,noHref:H,noShade:H,noWrap:H,object:null,profile:null,prompt:null,rev:null,rightMargin:z,rules:null,scheme:null,scrolling:he,standby:null,summary:null,text:null,topMargin:z,valueType:null,version:null,vAlign:null,vLink:null,vSpace:z,allowTransparency:null,autoCorrect:null,autoSave:null,disablePictureInPicture:H,disableRemotePlayback:H,prefix:null,property:null,results:z,security:null,unselectable:null},space:"html",transform:ad}),bg=rr({attributes:{accentHeight:"accent-height",alignmentBaseline:"alignment-baseline",arabicForm:"arabic-form",baselineShift:"baseline-shift",capHeight:"cap-height",className:"class",clipPath:"clip-path",clipRule:"clip-rule",colorInterpolation:"color-interpolation",colorInterpolationFilters:"color-interpolation-filters",colorProfile:"color-profile",colorRendering:"color-rendering",crossOrigin:"crossorigin",dataType:"datatype",dominantBaseline:"dominant-baseline",enableBackground:"enable-background",fillOpacity:"fill-opacity",fillRule:"fill-rule",floodColor:"flood-color",floodOpacity:"flood-opacity",fontFamily:"font-family",fontSize:"font-size",fontSizeAdjust:"font-size-adjust",fontStretch:"font-stretch",fontStyle:"font-style",fontVariant:"font-variant",fontWeight:"font-weight",glyphName:"glyph-name",glyphOrientationHorizontal:"glyph-orientation-horizontal",glyphOrientationVertical:"glyph-orientation-vertical",hrefLang:"hreflang",horizAdvX:"horiz-adv-x",horizOriginX:"horiz-origin-x",horizOriginY:"horiz-origin-y",imageRendering:"image-rendering",letterSpacing:"letter-spacing",lightingColor:"lighting-color",markerEnd:"marker-end",markerMid:"marker-mid",markerStart:"marker-start",navDown:"nav-down",navDownLeft:"nav-down-left",navDownRight:"nav-down-right",navLeft:"nav-left",navNext:"nav-next",navPrev:"nav-prev",navRight:"nav-right",navUp:"nav-up",navUpLeft:"nav-up-left",navUpRight:"nav-up-right",onAbort:"onabort",onActivate:"onactivate",onAfterPrint:"onafterprint",onBeforePrint:"onbeforeprint",onBegin:"onbegin",onCancel:"oncancel",onCanPlay:"oncanplay",onCanPlayThrough:"oncanplaythrough",onChange:"onchange",onClick:"onclick",onClose:"onclose",onCopy:"oncopy",onCueChange:"oncuechange",onCut:"oncut",onDblClick:"ondblclick",onDrag:"ondrag",onDragEnd:"ondragend",onDragEnter:"ondragenter",onDragExit:"ondragexit",onDragLeave:"ondragleave",onDragOver:"ondragover",onDragStart:"ondragstart",onDrop:"ondrop",onDurationChange:"ondurationchange",onEmptied:"onemptied",onEnd:"onend",onEnded:"onended",onError:"onerror",onFocus:"onfocus",onFocusIn:"onfocusin",onFocusOut:"onfocusout",onHashChange:"onhashchange",onInput:"oninput",onInvalid:"oninvalid",onKeyDown:"onkeydown",onKeyPress:"onkeypress",onKeyUp:"onkeyup",onLoad:"onload",onLoadedData:"onloadeddata",onLoadedMetadata:"onloadedmetadata",onLoadStart:"onloadstart",onMessage:"onmessage",onMouseDown:"onmousedown",onMouseEnter:"onmouseenter",onMouseLeave:"onmouseleave",onMouseMove:"onmousemove",onMouseOut:"onmouseout",onMouseOver:"onmouseover",onMouseUp:"onmouseup",onMouseWheel:"onmousewheel",onOffline:"onoffline",onOnline:"ononline",onPageHide:"onpagehide",onPageShow:"onpageshow",onPaste:"onpaste",onPause:"onpause",onPlay:"onplay",onPlaying:"onplaying",onPopState:"onpopstate",onProgress:"onprogress",onRateChange:"onratechange",onRepeat:"onrepeat",onReset:"onreset",onResize:"onresize",onScroll:"onscroll",onSeeked:"onseeked",onSeeking:"onseeking",onSelect:"onselect",onShow:"onshow",onStalled:"onstalled",onStorage:"onstorage",onSubmit:"onsubmit",onSuspend:"onsuspend",onTimeUpdate:"ontimeupdate",onToggle:"ontoggle",onUnload:"onunload",onVolumeChange:"onvolumechange",onWaiting:"onwaiting",onZoom:"onzoom",overlinePosition:"overline-position",overlineThickness:"overline-thickness",paintOrder:"paint-order",panose1:"panose-1",pointerEvents:"pointer-events",referrerPolicy:"referrerpolicy",renderingIntent:"rendering-intent",shapeRendering:"shape-rendering",stopColor:"stop-color",stopOpacity:"stop-opacity",strikethroughPosition:"strikethrough-position",strikethroughThickness:"strikethrough-thickness",strokeDashArray:"stroke-dasharray",strokeDashOffset:"stroke-dashoffset",strokeLineCap:"stroke-linecap",strokeLineJoin:"stroke-linejoin",strokeMiterLimit:"stroke-miterlimit",strokeOpacity:"stroke-opacity",strokeWidth:"stroke-width",tabIndex:"tabindex",textAnchor:"text-anchor",textDecoration:"text-decoration",textRendering:"text-rendering",transformOrigin:"transform-origin",typeOf:"typeof",underlinePosition:"underline-position",underlineThickness:"underline-thickness",unicodeBidi:"unicode-bidi",unicodeRange:"unicode-range",unitsPerEm:"units-per-em",vAlphabetic:"v-alphabetic",vHanging:"v-hanging",vIdeographic:"v-ideographic",vMathematical:"v-mathematical",vectorEffect:"vector-effect",vertAdvY:"vert-adv-y",vertOriginX:"vert-origin-x",vertOriginY:"vert-origin-y",wordSpacing:"word-spacing",writingMode:"writing-mode",xHeight:"x-height",playbackOrder:"playbackorder",timelineBegin:"timelinebegin"},properties:{about:$e,accentHeight:z,accumulate:null,additive:null,alignmentBaseline:null,alphabetic:z,amplitude:z,arabicForm:null,ascent:z,attributeName:null,attributeType:null,azimuth:z,bandwidth:null,baselineShift:null,baseFrequency:null,baseProfile:null,bbox:null,begin:null,bias:z,by:null,calcMode:null,capHeight:z,className:ee,clip:null,clipPath:null,clipPathUnits:null,clipRule:null,color:null,colorInterpolation:null,colorInterpolationFilters:null,colorProfile:null,colorRendering:null,content:null,contentScriptType:null,contentStyleType:null,crossOrigin:null,cursor:null,cx:null,cy:null,d:null,dataType:null,defaultAction:null,descent:z,diffuseConstant:z,direction:null,display:null,dur:null,divisor:z,dominantBaseline:null,download:H,dx:null,dy:null,edgeMode:null,editable:null,elevation:z,enableBackground:null,end:null,event:null,exponent:z,externalResourcesRequired:null,fill:null,fillOpacity:z,fillRule:null,filter:null,filterRes:null,filterUnits:null,floodColor:null,floodOpacity:null,focusable:null,focusHighlight:null,fontFamily:null,fontSize:null,fontSizeAdjust:null,fontStretch:null,fontStyle:null,fontVariant:null,fontWeight:null,format:null,fr:null,from:null,fx:null,fy:null,g1:Qt,g2:Qt,glyphName:Qt,glyphOrientationHorizontal:null,glyphOrientationVertical:null,glyphRef:null,gradientTransform:null,gradientUnits:null,handler:null,hanging:z,hatchContentUnits:null,hatchUnits:null,height:null,href:null,hrefLang:null,horizAdvX:z,horizOriginX:z,horizOriginY:z,id:null,ideographic:z,imageRendering:null,initialVisibility:null,in:null,in2:null,intercept:z,k:z,k1:z,k2:z,k3:z,k4:z,kernelMatrix:$e,kernelUnitLength:null,keyPoints:null,keySplines:null,keyTimes:null,kerning:null,lang:null,lengthAdjust:null,letterSpacing:null,lightingColor:null,limitingConeAngle:z,local:null,markerEnd:null,markerMid:null,markerStart:null,markerHeight:null,markerUnits:null,markerWidth:null,mask:null,maskContentUnits:null,maskUnits:null,mathematical:null,max:null,media:null,mediaCharacterEncoding:null,mediaContentEncodings:null,mediaSize:z,mediaTime:null,method:null,min:null,mode:null,name:null,navDown:null,navDownLeft:null,navDownRight:null,navLeft:null,navNext:null,navPrev:null,navRight:null,navUp:null,navUpLeft:null,navUpRight:null,numOctaves:null,observer:null,offset:null,onAbort:null,onActivate:null,onAfterPrint:null,onBeforePrint:null,onBegin:null,onCancel:null,onCanPlay:null,onCanPlayThrough:null,onChange:null,onClick:null,onClose:null,onCopy:null,onCueChange:null,onCut:null,onDblClick:null,onDrag:null,onDragEnd:null,onDragEnter:null,onDragExit:null,onDragLeave:null,onDragOver:null,onDragStart:null,onDrop:null,onDurationChange:null,onEmptied:null,onEnd:null,onEnded:null,onError:null,onFocus:null,onFocusIn:null,onFocusOut:null,onHashChange:null,onInput:null,onInvalid:null,onKeyDown:null,onKeyPress:null,onKeyUp:null,onLoad:null,onLoadedData:null,onLoadedMetadata:null,onLoadStart:null,onMessage:null,onMouseDown:null,onMouseEnter:null,onMouseLeave:null,onMouseMove:null,onMouseOut:null,onMouseOver:null,onMouseUp:null,onMouseWheel:null,onOffline:null,onOnline:null,onPageHide:null,onPageShow:null,onPaste:null,onPause:null,onPlay:null,onPlaying:null,onPopState:null,onProgress:null,onRateChange:null,onRepeat:null,onReset:null,onResize:null,onScroll:null,onSeeked:null,onSeeking:null,onSelect:null,onShow:null,onStalled:null,onStorage:null,onSubmit:null,onSuspend:null,onTimeUpdate:null,onToggle:null,onUnload:null,onVolumeChange:null,onWaiting:null,onZoom:null,opacity:null,operator:null,order:null,orient:null,orientation:null,origin:null,overflow:null,overlay:null,overlinePosition:z,overlineThickness:z,paintOrder:null,panose1:null,path:null,pathLength:z,patternContentUnits:null,patternTransform:null,patternUnits:null,phase:null,ping:ee,pitch:null,playbackOrder:null,pointerEvents:null,points:null,pointsAtX:z,pointsAtY:z,pointsAtZ:z,preserveAlpha:null,preserveAspectRatio:null,primitiveUnits:null,propagate:null,property:$e,r:null,radius:null,referrerPolicy:null,refX:null,refY:null,rel:$e,rev:$e,renderingIntent:null,repeatCount:null,repeatDur:null,requiredExtensions:$e,requiredFeatures:$e,requiredFonts:$e,requiredFormats:$e,resource:null,restart:null,result:null,rotate:null,rx:null,ry:null,scale:null,seed:null,shapeRendering:null,side:null,slope:null,snapshotTime:null,specularConstant:z,specularExponent:z,spreadMethod:null,spacing:null,startOffset:null,stdDeviation:null,stemh:null,stemv:null,stitchTiles:null,stopColor:null,stopOpacity:null,strikethroughPosition:z,strikethroughThickness:z,string:null,stroke:null,strokeDashArray:$e,strokeDashOffset:null,strokeLineCap:null,strokeLineJoin:null,strokeMiterLimit:z,strokeOpacity:z,strokeWidth:null,style:null,surfaceScale:z,syncBehavior:null,syncBehaviorDefault:null,syncMaster:null,syncTolerance:null,syncToleranceDefault:null,systemLanguage:$e,tabIndex:z,tableValues:null,target:null,targetX:z,targetY:z,textAnchor:null,textDecoration:null,textRendering:null,textLength:null,timelineBegin:null,title:null,transformBehavior:null,type:null,typeOf:$e,to:null,transform:null,transformOrigin:null,u1:null,u2:null,underlinePosition:z,underlineThickness:z,unicode:null,unicodeBidi:null,unicodeRange:null,unitsPerEm:z,values:null,vAlphabetic:z,vMathematical:z,vectorEffect:null,vHanging:z,vIdeographic:z,version:null,vertAdvY:z,vertOriginX:z,vertOriginY:z,viewBox:null,viewTarget:null,visibility:null,width:null,widths:null,wordSpacing:null,writingMode:null,x:null,x1:null,x2:null,xChannelSelector:null,xHeight:z,y:null,y1:null,y2:null,yChannelSelector:null,z:null,zoomAndPan:null},space:"svg",transform:sd}),cd=rr({properties:{xLinkActuate:null,xLinkArcRole:null,xLinkHref:null,xLinkRole:null,xLinkShow:null,xLinkTitle:null,xLinkType:null},space:"xlink",transform(e,n){return"xlink:"+n.slice(5).toLowerCase()}}),fd=rr({attributes:{xmlnsxlink:"xmlns:xlink"},properties:{xmlnsXLink:null,xmlns:null},space:"xmlns",transform:ad}),pd=rr({properties:{xmlBase:null,xmlLang:null,xmlSpace:null},space:"xml",transform(e,n){return"xml:"+n.slice(3).toLowerCase()}}),Kg={classId:"classID",dataType:"datatype",itemId:"itemID",strokeDashArray:"strokeDasharray",strokeDashOffset:"strokeDashoffset",strokeLineCap:"strokeLinecap",strokeLineJoin:"strokeLinejoin",strokeMiterLimit:"strokeMiterlimit",typeOf:"typeof",xLinkActuate:"xlinkActuate",xLinkArcRole:"xlinkArcrole",xLinkHref:"xlinkHref",xLinkRole:"xlinkRole",xLinkShow:"xlinkShow",xLinkTitle:"xlinkTitle",xLinkType:"xlinkType",xmlnsXLink:"xmlnsXlink"},Yg=/[A-Z]/g,qa=/-[a-z]/g,Gg=/^data[-\w.:]+$/i;function Xg(e,n){const t=cu(n);let r=n,l=Ve;if(t in e.normal)return e.property[e.normal[t]];if(t.length>4&&t.slice(0,4)==="data"&&Gg.test(n)){if(n.charAt(4)==="-"){const i=n.slice(5).replace(qa,Zg);r="data"+i.charAt(0).toUpperCase()+i.slice(1)}else{const i=n.slice(4);if(!qa.test(i)){let o=i.replace(Yg,qg);o.charAt(0)!=="-"&&(o="-"+o),n="data"+o}}l=gs}return new l(r,n)}function qg(e){return"-"+e.toLowerCase()}function Zg(e){return e.charAt(1).toUpperCase()}const Jg=od([ud,Qg,cd,fd,pd],"html"),ys=od([ud,bg,cd,fd,pd],"svg");function ey(e){return e.join(" ").trim()}var vs={},Za=/\/\*[^*]*\*+([^/*][^*]*\*+)*\//g,ny=/\n/g,ty=/^\s*/,ry=/^(\*?[-#/*\\\w]+(\[[0-9a-z_-]+\])?)\s*/,ly=/^:\s*/,iy=/^((?:'(?:\\'|.)*?'|"(?:\\"|.)*?"|\([^)]*?\)|[^};])+)/,oy=/^[;\s]*/,uy=/^\s+|\s+$/g,sy=`
-`,Ja="/",ec="*",st="",ay="comment",cy="declaration";function fy(e,n){if(typeof e!="string")throw new TypeError("First argument must be a string");if(!e)return[];n=n||{};var t=1,r=1;function l(k){var x=k.match(ny);x&&(t+=x.length);var I=k.lastIndexOf(sy);r=~I?k.length-I:r+k.length}function i(){var k={line:t,column:r};return function(x){return x.position=new o(k),a(),x}}function o(k){this.start=k,this.end={line:t,column:r},this.source=n.source}o.prototype.content=e;function u(k){var x=new Error(n.source+":"+t+":"+r+": "+k);if(x.reason=k,x.filename=n.source,x.line=t,x.column=r,x.source=e,!n.silent)throw x}function s(k){var x=k.exec(e);if(x){var I=x[0];return l(I),e=e.slice(I.length),x}}function a(){s(ty)}function c(k){var x;for(k=k||[];x=f();)x!==!1&&k.push(x);return k}function f(){var k=i();if(!(Ja!=e.charAt(0)||ec!=e.charAt(1))){for(var x=2;st!=e.charAt(x)&&(ec!=e.charAt(x)||Ja!=e.charAt(x+1));)++x;if(x+=2,st===e.charAt(x-1))return u("End of comment missing");var I=e.slice(2,x-2);return r+=2,l(I),e=e.slice(x),r+=2,k({type:ay,comment:I})}}function d(){var k=i(),x=s(ry);if(x){if(f(),!s(ly))return u("property missing ':'");var I=s(iy),h=k({type:cy,property:nc(x[0].replace(Za,st)),value:I?nc(I[0].replace(Za,st)):st});return s(oy),h}}function p(){var k=[];c(k);for(var x;x=d();)x!==!1&&(k.push(x),c(k));return k}return a(),p()}function nc(e){return e?e.replace(uy,st):st}var py=fy,dy=Bl&&Bl.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(vs,"__esModule",{value:!0});vs.default=my;const hy=dy(py);function my(e,n){let t=null;if(!e||typeof e!="string")return t;const r=(0,hy.default)(e),l=typeof n=="function";return r.forEach(i=>{if(i.type!=="declaration")return;const{property:o,value:u}=i;l?n(o,u,i):u&&(t=t||{},t[o]=u)}),t}var Ti={};Object.defineProperty(Ti,"__esModule",{value:!0});Ti.camelCase=void 0;var gy=/^--[a-zA-Z0-9_-]+$/,yy=/-([a-z])/g,vy=/^[^-]+$/,ky=/^-(webkit|moz|ms|o|khtml)-/,xy=/^-(ms)-/,wy=function(e){return!e||vy.test(e)||gy.test(e)},Sy=function(e,n){return n.toUpperCase()},tc=function(e,n){return"".concat(n,"-")},Ey=function(e,n){return n===void 0&&(n={}),wy(e)?e:(e=e.toLowerCase(),n.reactCompat?e=e.replace(xy,tc):e=e.replace(ky,tc),e.replace(yy,Sy))};Ti.camelCase=Ey;var Cy=Bl&&Bl.__importDefault||function(e){return e&&e.__esModule?e:{default:e}},Ny=Cy(vs),Py=Ti;function du(e,n){var t={};return!e||typeof e!="string"||(0,Ny.default)(e,function(r,l){r&&l&&(t[(0,Py.camelCase)(r,n)]=l)}),t}du.default=du;var _y=du;const Ty=Fc(_y),dd=hd("end"),ks=hd("start");function hd(e){return n;function n(t){const r=t&&t.position&&t.position[e]||{};if(typeof r.line=="number"&&r.line>0&&typeof r.column=="number"&&r.column>0)return{line:r.line,column:r.column,offset:typeof r.offset=="number"&&r.offset>-1?r.offset:void 0}}}function zy(e){const n=ks(e),t=dd(e);if(n&&t)return{start:n,end:t}}function Ir(e){return!e||typeof e!="object"?"":"position"in e||"type"in e?rc(e.position):"start"in e||"end"in e?rc(e):"line"in e||"column"in e?hu(e):""}function hu(e){return lc(e&&e.line)+":"+lc(e&&e.column)}function rc(e){return hu(e&&e.start)+"-"+hu(e&&e.end)}function lc(e){return e&&typeof e=="number"?e:1}class ze extends Error{constructor(n,t,r){super(),typeof t=="string"&&(r=t,t=void 0);let l="",i={},o=!1;if(t&&("line"in t&&"column"in t?i={place:t}:"start"in t&&"end"in t?i={place:t}:"type"in t?i={ancestors:[t],place:t.position}:i={...t}),typeof n=="string"?l=n:!i.cause&&n&&(o=!0,l=n.message,i.cause=n),!i.ruleId&&!i.source&&typeof r=="string"){const s=r.indexOf(":");s===-1?i.ruleId=r:(i.source=r.slice(0,s),i.ruleId=r.slice(s+1))}if(!i.place&&i.ancestors&&i.ancestors){const s=i.ancestors[i.ancestors.length-1];s&&(i.place=s.position)}const u=i.place&&"start"in i.place?i.place.start:i.place;this.ancestors=i.ancestors||void 0,this.cause=i.cause||void 0,this.column=u?u.column:void 0,this.fatal=void 0,this.file="",this.message=l,this.line=u?u.line:void 0,this.name=Ir(i.place)||"1:1",this.place=i.place||void 0,this.reason=this.message,this.ruleId=i.ruleId||void 0,this.source=i.source||void 0,this.stack=o&&i.cause&&typeof i.cause.stack=="string"?i.cause.stack:"",this.actual=void 0,this.expected=void 0,this.note=void 0,this.url=void 0}}ze.prototype.file="";ze.prototype.name="";ze.prototype.reason="";ze.prototype.message="";ze.prototype.stack="";ze.prototype.column=void 0;ze.prototype.line=void 0;ze.prototype.ancestors=void 0;ze.prototype.cause=void 0;ze.prototype.fatal=void 0;ze.prototype.place=void 0;ze.prototype.ruleId=void 0;ze.prototype.source=void 0;const xs={}.hasOwnProperty,Iy=new Map,Ly=/[A-Z]/g,Ry=new Set(["table","tbody","thead","tfoot","tr"]),Oy=new Set(["td","th"]),md="https://github.com/syntax-tree/hast-util-to-jsx-runtime";function Dy(e,n){if(!n||n.Fragment===void 0)throw new TypeError("Expected `Fragment` in options");const t=n.filePath||void 0;let r;if(n.development){if(typeof n.jsxDEV!="function")throw new TypeError("Expected `jsxDEV` in options when `development: true`");r=Hy(t,n.jsxDEV)}else{if(typeof n.jsx!="function")throw new TypeError("Expected `jsx` in production options");if(typeof n.jsxs!="function")throw new TypeError("Expected `jsxs` in production options");r=Vy(t,n.jsx,n.jsxs)}const l={Fragment:n.Fragment,ancestors:[],components:n.components||{},create:r,elementAttributeNameCase:n.elementAttributeNameCase||"react",evaluater:n.createEvaluater?n.createEvaluater():void 0,filePath:t,ignoreInvalidStyle:n.ignoreInvalidStyle||!1,passKeys:n.passKeys!==!1,passNode:n.passNode||!1,schema:n.space==="svg"?ys:Jg,stylePropertyNameCase:n.stylePropertyNameCase||"dom",tableCellAlignToStyle:n.tableCellAlignToStyle!==!1},i=gd(l,e,void 0);return i&&typeof i!="string"?i:l.create(e,l.Fragment,{children:i||void 0},void 0)}function gd(e,n,t){if(n.type==="element")return My(e,n,t);if(n.type==="mdxFlowExpression"||n.type==="mdxTextExpression")return jy(e,n);if(n.type==="mdxJsxFlowElement"||n.type==="mdxJsxTextElement")return Fy(e,n,t);if(n.type==="mdxjsEsm")return Ay(e,n);if(n.type==="root")return By(e,n,t);if(n.type==="text")return Uy(e,n)}function My(e,n,t){const r=e.schema;let l=r;n.tagName.toLowerCase()==="svg"&&r.space==="html"&&(l=ys,e.schema=l),e.ancestors.push(n);const i=vd(e,n.tagName,!1),o=$y(e,n);let u=Ss(e,n);return Ry.has(n.tagName)&&(u=u.filter(function(s){return typeof s=="string"?!$g(s):!0})),yd(e,o,i,n),ws(o,u),e.ancestors.pop(),e.schema=r,e.create(n,i,o,t)}function jy(e,n){if(n.data&&n.data.estree&&e.evaluater){const r=n.data.estree.body[0];return r.type,e.evaluater.evaluateExpression(r.expression)}Xr(e,n.position)}function Ay(e,n){if(n.data&&n.data.estree&&e.evaluater)return e.evaluater.evaluateProgram(n.data.estree);Xr(e,n.position)}function Fy(e,n,t){const r=e.schema;let l=r;n.name==="svg"&&r.space==="html"&&(l=ys,e.schema=l),e.ancestors.push(n);const i=n.name===null?e.Fragment:vd(e,n.name,!0),o=Wy(e,n),u=Ss(e,n);return yd(e,o,i,n),ws(o,u),e.ancestors.pop(),e.schema=r,e.create(n,i,o,t)}function By(e,n,t){const r={};return ws(r,Ss(e,n)),e.create(n,e.Fragment,r,t)}function Uy(e,n){return n.value}function yd(e,n,t,r){typeof t!="string"&&t!==e.Fragment&&e.passNode&&(n.node=r)}function ws(e,n){if(n.length>0){const t=n.length>1?n:n[0];t&&(e.children=t)}}function Vy(e,n,t){return r;function r(l,i,o,u){const a=Array.isArray(o.children)?t:n;return u?a(i,o,u):a(i,o)}}function Hy(e,n){return t;function t(r,l,i,o){const u=Array.isArray(i.children),s=ks(r);return n(l,i,o,u,{columnNumber:s?s.column-1:void 0,fileName:e,lineNumber:s?s.line:void 0},void 0)}}function $y(e,n){const t={};let r,l;for(l in n.properties)if(l!=="children"&&xs.call(n.properties,l)){const i=Qy(e,l,n.properties[l]);if(i){const[o,u]=i;e.tableCellAlignToStyle&&o==="align"&&typeof u=="string"&&Oy.has(n.tagName)?r=u:t[o]=u}}if(r){const i=t.style||(t.style={});i[e.stylePropertyNameCase==="css"?"text-align":"textAlign"]=r}return t}function Wy(e,n){const t={};for(const r of n.attributes)if(r.type==="mdxJsxExpressionAttribute")if(r.data&&r.data.estree&&e.evaluater){const i=r.data.estree.body[0];i.type;const o=i.expression;o.type;const u=o.properties[0];u.type,Object.assign(t,e.evaluater.evaluateExpression(u.argument))}else Xr(e,n.position);else{const l=r.name;let i;if(r.value&&typeof r.value=="object")if(r.value.data&&r.value.data.estree&&e.evaluater){const u=r.value.data.estree.body[0];u.type,i=e.evaluater.evaluateExpression(u.expression)}else Xr(e,n.position);else i=r.value===null?!0:r.value;t[l]=i}return t}function Ss(e,n){const t=[];let r=-1;const l=e.passKeys?new Map:Iy;for(;++r<n.children.length;){const i=n.children[r];let o;if(e.passKeys){const s=i.type==="element"?i.tagName:i.type==="mdxJsxFlowElement"||i.type==="mdxJsxTextElement"?i.name:void 0;if(s){const a=l.get(s)||0;o=s+"-"+a,l.set(s,a+1)}}const u=gd(e,i,o);u!==void 0&&t.push(u)}return t}function Qy(e,n,t){const r=Xg(e.schema,n);if(!(t==null||typeof t=="number"&&Number.isNaN(t))){if(Array.isArray(t)&&(t=r.commaSeparated?Fg(t):ey(t)),r.property==="style"){let l=typeof t=="object"?t:by(e,String(t));return e.stylePropertyNameCase==="css"&&(l=Ky(l)),["style",l]}return[e.elementAttributeNameCase==="react"&&r.space?Kg[r.property]||r.property:r.attribute,t]}}function by(e,n){try{return Ty(n,{reactCompat:!0})}catch(t){if(e.ignoreInvalidStyle)return{};const r=t,l=new ze("Cannot parse `style` attribute",{ancestors:e.ancestors,cause:r,ruleId:"style",source:"hast-util-to-jsx-runtime"});throw l.file=e.filePath||void 0,l.url=md+"#cannot-parse-style-attribute",l}}function vd(e,n,t){let r;if(!t)r={type:"Literal",value:n};else if(n.includes(".")){const l=n.split(".");let i=-1,o;for(;++i<l.length;){const u=Ya(l[i])?{type:"Identifier",name:l[i]}:{type:"Literal",value:l[i]};o=o?{type:"MemberExpression",object:o,property:u,computed:!!(i&&u.type==="Literal"),optional:!1}:u}r=o}else r=Ya(n)&&!/^[a-z]/.test(n)?{type:"Identifier",name:n}:{type:"Literal",value:n};if(r.type==="Literal"){const l=r.value;return xs.call(e.components,l)?e.components[l]:l}if(e.evaluater)return e.evaluater.evaluateExpression(r);Xr(e)}function Xr(e,n){const t=new ze("Cannot handle MDX estrees without `createEvaluater`",{ancestors:e.ancestors,place:n,ruleId:"mdx-estree",source:"hast-util-to-jsx-runtime"});throw t.file=e.filePath||void 0,t.url=md+"#cannot-handle-mdx-estrees-without-createevaluater",t}function Ky(e){const n={};let t;for(t in e)xs.call(e,t)&&(n[Yy(t)]=e[t]);return n}function Yy(e){let n=e.replace(Ly,Gy);return n.slice(0,3)==="ms-"&&(n="-"+n),n}function Gy(e){return"-"+e.toLowerCase()}const io={action:["form"],cite:["blockquote","del","ins","q"],data:["object"],formAction:["button","input"],href:["a","area","base","link"],icon:["menuitem"],itemId:null,manifest:["html"],ping:["a","area"],poster:["video"],src:["audio","embed","iframe","img","input","script","source","track","video"]},Xy={};function qy(e,n){const t=Xy,r=typeof t.includeImageAlt=="boolean"?t.includeImageAlt:!0,l=typeof t.includeHtml=="boolean"?t.includeHtml:!0;return kd(e,r,l)}function kd(e,n,t){if(Zy(e)){if("value"in e)return e.type==="html"&&!t?"":e.value;if(n&&"alt"in e&&e.alt)return e.alt;if("children"in e)return ic(e.children,n,t)}return Array.isArray(e)?ic(e,n,t):""}function ic(e,n,t){const r=[];let l=-1;for(;++l<e.length;)r[l]=kd(e[l],n,t);return r.join("")}function Zy(e){return!!(e&&typeof e=="object")}const oc=document.createElement("i");function Es(e){const n="&"+e+";";oc.innerHTML=n;const t=oc.textContent;return t.charCodeAt(t.length-1)===59&&e!=="semi"||t===n?!1:t}function En(e,n,t,r){const l=e.length;let i=0,o;if(n<0?n=-n>l?0:l+n:n=n>l?l:n,t=t>0?t:0,r.length<1e4)o=Array.from(r),o.unshift(n,t),e.splice(...o);else for(t&&e.splice(n,t);i<r.length;)o=r.slice(i,i+1e4),o.unshift(n,0),e.splice(...o),i+=1e4,n+=1e4}function en(e,n){return e.length>0?(En(e,e.length,0,n),e):n}const uc={}.hasOwnProperty;function Jy(e){const n={};let t=-1;for(;++t<e.length;)e1(n,e[t]);return n}function e1(e,n){let t;for(t in n){const l=(uc.call(e,t)?e[t]:void 0)||(e[t]={}),i=n[t];let o;if(i)for(o in i){uc.call(l,o)||(l[o]=[]);const u=i[o];n1(l[o],Array.isArray(u)?u:u?[u]:[])}}}function n1(e,n){let t=-1;const r=[];for(;++t<n.length;)(n[t].add==="after"?e:r).push(n[t]);En(e,0,0,r)}function xd(e,n){const t=Number.parseInt(e,n);return t<9||t===11||t>13&&t<32||t>126&&t<160||t>55295&&t<57344||t>64975&&t<65008||(t&65535)===65535||(t&65535)===65534||t>1114111?"�":String.fromCodePoint(t)}function bt(e){return e.replace(/[\t\n\r ]+/g," ").replace(/^ | $/g,"").toLowerCase().toUpperCase()}const xn=lt(/[A-Za-z]/),be=lt(/[\dA-Za-z]/),t1=lt(/[#-'*+\--9=?A-Z^-~]/);function mu(e){return e!==null&&(e<32||e===127)}const gu=lt(/\d/),r1=lt(/[\dA-Fa-f]/),l1=lt(/[!-/:-@[-`{-~]/);function B(e){return e!==null&&e<-2}function Ue(e){return e!==null&&(e<0||e===32)}function G(e){return e===-2||e===-1||e===32}const i1=lt(new RegExp("\\p{P}|\\p{S}","u")),o1=lt(/\s/);function lt(e){return n;function n(t){return t!==null&&t>-1&&e.test(String.fromCharCode(t))}}function lr(e){const n=[];let t=-1,r=0,l=0;for(;++t<e.length;){const i=e.charCodeAt(t);let o="";if(i===37&&be(e.charCodeAt(t+1))&&be(e.charCodeAt(t+2)))l=2;else if(i<128)/[!#$&-;=?-Z_a-z~]/.test(String.fromCharCode(i))||(o=String.fromCharCode(i));else if(i>55295&&i<57344){const u=e.charCodeAt(t+1);i<56320&&u>56319&&u<57344?(o=String.fromCharCode(i,u),l=1):o="�"}else o=String.fromCharCode(i);o&&(n.push(e.slice(r,t),encodeURIComponent(o)),r=t+l+1,o=""),l&&(t+=l,l=0)}return n.join("")+e.slice(r)}function te(e,n,t,r){const l=r?r-1:Number.POSITIVE_INFINITY;let i=0;return o;function o(s){return G(s)?(e.enter(t),u(s)):n(s)}function u(s){return G(s)&&i++<l?(e.consume(s),u):(e.exit(t),n(s))}}const u1={tokenize:s1};function s1(e){const n=e.attempt(this.parser.constructs.contentInitial,r,l);let t;return n;function r(u){if(u===null){e.consume(u);return}return e.enter("lineEnding"),e.consume(u),e.exit("lineEnding"),te(e,n,"linePrefix")}function l(u){return e.enter("paragraph"),i(u)}function i(u){const s=e.enter("chunkText",{contentType:"text",previous:t});return t&&(t.next=s),t=s,o(u)}function o(u){if(u===null){e.exit("chunkText"),e.exit("paragraph"),e.consume(u);return}return B(u)?(e.consume(u),e.exit("chunkText"),i):(e.consume(u),o)}}const a1={tokenize:c1},sc={tokenize:f1};function c1(e){const n=this,t=[];let r=0,l,i,o;return u;function u(y){if(r<t.length){const S=t[r];return n.containerState=S[1],e.attempt(S[0].continuation,s,a)(y)}return a(y)}function s(y){if(r++,n.containerState._closeFlow){n.containerState._closeFlow=void 0,l&&m();const S=n.events.length;let N=S,w;for(;N--;)if(n.events[N][0]==="exit"&&n.events[N][1].type==="chunkFlow"){w=n.events[N][1].end;break}h(r);let T=S;for(;T<n.events.length;)n.events[T][1].end={...w},T++;return En(n.events,N+1,0,n.events.slice(S)),n.events.length=T,a(y)}return u(y)}function a(y){if(r===t.length){if(!l)return d(y);if(l.currentConstruct&&l.currentConstruct.concrete)return k(y);n.interrupt=!!(l.currentConstruct&&!l._gfmTableDynamicInterruptHack)}return n.containerState={},e.check(sc,c,f)(y)}function c(y){return l&&m(),h(r),d(y)}function f(y){return n.parser.lazy[n.now().line]=r!==t.length,o=n.now().offset,k(y)}function d(y){return n.containerState={},e.attempt(sc,p,k)(y)}function p(y){return r++,t.push([n.currentConstruct,n.containerState]),d(y)}function k(y){if(y===null){l&&m(),h(0),e.consume(y);return}return l=l||n.parser.flow(n.now()),e.enter("chunkFlow",{_tokenizer:l,contentType:"flow",previous:i}),x(y)}function x(y){if(y===null){I(e.exit("chunkFlow"),!0),h(0),e.consume(y);return}return B(y)?(e.consume(y),I(e.exit("chunkFlow")),r=0,n.interrupt=void 0,u):(e.consume(y),x)}function I(y,S){const N=n.sliceStream(y);if(S&&N.push(null),y.previous=i,i&&(i.next=y),i=y,l.defineSkip(y.start),l.write(N),n.parser.lazy[y.start.line]){let w=l.events.length;for(;w--;)if(l.events[w][1].start.offset<o&&(!l.events[w][1].end||l.events[w][1].end.offset>o))return;const T=n.events.length;let R=T,A,j;for(;R--;)if(n.events[R][0]==="exit"&&n.events[R][1].type==="chunkFlow"){if(A){j=n.events[R][1].end;break}A=!0}for(h(r),w=T;w<n.events.length;)n.events[w][1].end={...j},w++;En(n.events,R+1,0,n.events.slice(T)),n.events.length=w}}function h(y){let S=t.length;for(;S-- >y;){const N=t[S];n.containerState=N[1],N[0].exit.call(n,e)}t.length=y}function m(){l.write([null]),i=void 0,l=void 0,n.containerState._closeFlow=void 0}}function f1(e,n,t){return te(e,e.attempt(this.parser.constructs.document,n,t),"linePrefix",this.parser.constructs.disable.null.includes("codeIndented")?void 0:4)}function ac(e){if(e===null||Ue(e)||o1(e))return 1;if(i1(e))return 2}function Cs(e,n,t){const r=[];let l=-1;for(;++l<e.length;){const i=e[l].resolveAll;i&&!r.includes(i)&&(n=i(n,t),r.push(i))}return n}const yu={name:"attention",resolveAll:p1,tokenize:d1};function p1(e,n){let t=-1,r,l,i,o,u,s,a,c;for(;++t<e.length;)if(e[t][0]==="enter"&&e[t][1].type==="attentionSequence"&&e[t][1]._close){for(r=t;r--;)if(e[r][0]==="exit"&&e[r][1].type==="attentionSequence"&&e[r][1]._open&&n.sliceSerialize(e[r][1]).charCodeAt(0)===n.sliceSerialize(e[t][1]).charCodeAt(0)){if((e[r][1]._close||e[t][1]._open)&&(e[t][1].end.offset-e[t][1].start.offset)%3&&!((e[r][1].end.offset-e[r][1].start.offset+e[t][1].end.offset-e[t][1].start.offset)%3))continue;s=e[r][1].end.offset-e[r][1].start.offset>1&&e[t][1].end.offset-e[t][1].start.offset>1?2:1;const f={...e[r][1].end},d={...e[t][1].start};cc(f,-s),cc(d,s),o={type:s>1?"strongSequence":"emphasisSequence",start:f,end:{...e[r][1].end}},u={type:s>1?"strongSequence":"emphasisSequence",start:{...e[t][1].start},end:d},i={type:s>1?"strongText":"emphasisText",start:{...e[r][1].end},end:{...e[t][1].start}},l={type:s>1?"strong":"emphasis",start:{...o.start},end:{...u.end}},e[r][1].end={...o.start},e[t][1].start={...u.end},a=[],e[r][1].end.offset-e[r][1].start.offset&&(a=en(a,[["enter",e[r][1],n],["exit",e[r][1],n]])),a=en(a,[["enter",l,n],["enter",o,n],["exit",o,n],["enter",i,n]]),a=en(a,Cs(n.parser.constructs.insideSpan.null,e.slice(r+1,t),n)),a=en(a,[["exit",i,n],["enter",u,n],["exit",u,n],["exit",l,n]]),e[t][1].end.offset-e[t][1].start.offset?(c=2,a=en(a,[["enter",e[t][1],n],["exit",e[t][1],n]])):c=0,En(e,r-1,t-r+3,a),t=r+a.length-c-2;break}}for(t=-1;++t<e.length;)e[t][1].type==="attentionSequence"&&(e[t][1].type="data");return e}function d1(e,n){const t=this.parser.constructs.attentionMarkers.null,r=this.previous,l=ac(r);let i;return o;function o(s){return i=s,e.enter("attentionSequence"),u(s)}function u(s){if(s===i)return e.consume(s),u;const a=e.exit("attentionSequence"),c=ac(s),f=!c||c===2&&l||t.includes(s),d=!l||l===2&&c||t.includes(r);return a._open=!!(i===42?f:f&&(l||!d)),a._close=!!(i===42?d:d&&(c||!f)),n(s)}}function cc(e,n){e.column+=n,e.offset+=n,e._bufferIndex+=n}const h1={name:"autolink",tokenize:m1};function m1(e,n,t){let r=0;return l;function l(p){return e.enter("autolink"),e.enter("autolinkMarker"),e.consume(p),e.exit("autolinkMarker"),e.enter("autolinkProtocol"),i}function i(p){return xn(p)?(e.consume(p),o):p===64?t(p):a(p)}function o(p){return p===43||p===45||p===46||be(p)?(r=1,u(p)):a(p)}function u(p){return p===58?(e.consume(p),r=0,s):(p===43||p===45||p===46||be(p))&&r++<32?(e.consume(p),u):(r=0,a(p))}function s(p){return p===62?(e.exit("autolinkProtocol"),e.enter("autolinkMarker"),e.consume(p),e.exit("autolinkMarker"),e.exit("autolink"),n):p===null||p===32||p===60||mu(p)?t(p):(e.consume(p),s)}function a(p){return p===64?(e.consume(p),c):t1(p)?(e.consume(p),a):t(p)}function c(p){return be(p)?f(p):t(p)}function f(p){return p===46?(e.consume(p),r=0,c):p===62?(e.exit("autolinkProtocol").type="autolinkEmail",e.enter("autolinkMarker"),e.consume(p),e.exit("autolinkMarker"),e.exit("autolink"),n):d(p)}function d(p){if((p===45||be(p))&&r++<63){const k=p===45?d:f;return e.consume(p),k}return t(p)}}const zi={partial:!0,tokenize:g1};function g1(e,n,t){return r;function r(i){return G(i)?te(e,l,"linePrefix")(i):l(i)}function l(i){return i===null||B(i)?n(i):t(i)}}const wd={continuation:{tokenize:v1},exit:k1,name:"blockQuote",tokenize:y1};function y1(e,n,t){const r=this;return l;function l(o){if(o===62){const u=r.containerState;return u.open||(e.enter("blockQuote",{_container:!0}),u.open=!0),e.enter("blockQuotePrefix"),e.enter("blockQuoteMarker"),e.consume(o),e.exit("blockQuoteMarker"),i}return t(o)}function i(o){return G(o)?(e.enter("blockQuotePrefixWhitespace"),e.consume(o),e.exit("blockQuotePrefixWhitespace"),e.exit("blockQuotePrefix"),n):(e.exit("blockQuotePrefix"),n(o))}}function v1(e,n,t){const r=this;return l;function l(o){return G(o)?te(e,i,"linePrefix",r.parser.constructs.disable.null.includes("codeIndented")?void 0:4)(o):i(o)}function i(o){return e.attempt(wd,n,t)(o)}}function k1(e){e.exit("blockQuote")}const Sd={name:"characterEscape",tokenize:x1};function x1(e,n,t){return r;function r(i){return e.enter("characterEscape"),e.enter("escapeMarker"),e.consume(i),e.exit("escapeMarker"),l}function l(i){return l1(i)?(e.enter("characterEscapeValue"),e.consume(i),e.exit("characterEscapeValue"),e.exit("characterEscape"),n):t(i)}}const Ed={name:"characterReference",tokenize:w1};function w1(e,n,t){const r=this;let l=0,i,o;return u;function u(f){return e.enter("characterReference"),e.enter("characterReferenceMarker"),e.consume(f),e.exit("characterReferenceMarker"),s}function s(f){return f===35?(e.enter("characterReferenceMarkerNumeric"),e.consume(f),e.exit("characterReferenceMarkerNumeric"),a):(e.enter("characterReferenceValue"),i=31,o=be,c(f))}function a(f){return f===88||f===120?(e.enter("characterReferenceMarkerHexadecimal"),e.consume(f),e.exit("characterReferenceMarkerHexadecimal"),e.enter("characterReferenceValue"),i=6,o=r1,c):(e.enter("characterReferenceValue"),i=7,o=gu,c(f))}function c(f){if(f===59&&l){const d=e.exit("characterReferenceValue");return o===be&&!Es(r.sliceSerialize(d))?t(f):(e.enter("characterReferenceMarker"),e.consume(f),e.exit("characterReferenceMarker"),e.exit("characterReference"),n)}return o(f)&&l++<i?(e.consume(f),c):t(f)}}const fc={partial:!0,tokenize:E1},pc={concrete:!0,name:"codeFenced",tokenize:S1};function S1(e,n,t){const r=this,l={partial:!0,tokenize:N};let i=0,o=0,u;return s;function s(w){return a(w)}function a(w){const T=r.events[r.events.length-1];return i=T&&T[1].type==="linePrefix"?T[2].sliceSerialize(T[1],!0).length:0,u=w,e.enter("codeFenced"),e.enter("codeFencedFence"),e.enter("codeFencedFenceSequence"),c(w)}function c(w){return w===u?(o++,e.consume(w),c):o<3?t(w):(e.exit("codeFencedFenceSequence"),G(w)?te(e,f,"whitespace")(w):f(w))}function f(w){return w===null||B(w)?(e.exit("codeFencedFence"),r.interrupt?n(w):e.check(fc,x,S)(w)):(e.enter("codeFencedFenceInfo"),e.enter("chunkString",{contentType:"string"}),d(w))}function d(w){return w===null||B(w)?(e.exit("chunkString"),e.exit("codeFencedFenceInfo"),f(w)):G(w)?(e.exit("chunkString"),e.exit("codeFencedFenceInfo"),te(e,p,"whitespace")(w)):w===96&&w===u?t(w):(e.consume(w),d)}function p(w){return w===null||B(w)?f(w):(e.enter("codeFencedFenceMeta"),e.enter("chunkString",{contentType:"string"}),k(w))}function k(w){return w===null||B(w)?(e.exit("chunkString"),e.exit("codeFencedFenceMeta"),f(w)):w===96&&w===u?t(w):(e.consume(w),k)}function x(w){return e.attempt(l,S,I)(w)}function I(w){return e.enter("lineEnding"),e.consume(w),e.exit("lineEnding"),h}function h(w){return i>0&&G(w)?te(e,m,"linePrefix",i+1)(w):m(w)}function m(w){return w===null||B(w)?e.check(fc,x,S)(w):(e.enter("codeFlowValue"),y(w))}function y(w){return w===null||B(w)?(e.exit("codeFlowValue"),m(w)):(e.consume(w),y)}function S(w){return e.exit("codeFenced"),n(w)}function N(w,T,R){let A=0;return j;function j($){return w.enter("lineEnding"),w.consume($),w.exit("lineEnding"),P}function P($){return w.enter("codeFencedFence"),G($)?te(w,L,"linePrefix",r.parser.constructs.disable.null.includes("codeIndented")?void 0:4)($):L($)}function L($){return $===u?(w.enter("codeFencedFenceSequence"),V($)):R($)}function V($){return $===u?(A++,w.consume($),V):A>=o?(w.exit("codeFencedFenceSequence"),G($)?te(w,Z,"whitespace")($):Z($)):R($)}function Z($){return $===null||B($)?(w.exit("codeFencedFence"),T($)):R($)}}}function E1(e,n,t){const r=this;return l;function l(o){return o===null?t(o):(e.enter("lineEnding"),e.consume(o),e.exit("lineEnding"),i)}function i(o){return r.parser.lazy[r.now().line]?t(o):n(o)}}const oo={name:"codeIndented",tokenize:N1},C1={partial:!0,tokenize:P1};function N1(e,n,t){const r=this;return l;function l(a){return e.enter("codeIndented"),te(e,i,"linePrefix",5)(a)}function i(a){const c=r.events[r.events.length-1];return c&&c[1].type==="linePrefix"&&c[2].sliceSerialize(c[1],!0).length>=4?o(a):t(a)}function o(a){return a===null?s(a):B(a)?e.attempt(C1,o,s)(a):(e.enter("codeFlowValue"),u(a))}function u(a){return a===null||B(a)?(e.exit("codeFlowValue"),o(a)):(e.consume(a),u)}function s(a){return e.exit("codeIndented"),n(a)}}function P1(e,n,t){const r=this;return l;function l(o){return r.parser.lazy[r.now().line]?t(o):B(o)?(e.enter("lineEnding"),e.consume(o),e.exit("lineEnding"),l):te(e,i,"linePrefix",5)(o)}function i(o){const u=r.events[r.events.length-1];return u&&u[1].type==="linePrefix"&&u[2].sliceSerialize(u[1],!0).length>=4?n(o):B(o)?l(o):t(o)}}const _1={name:"codeText",previous:z1,resolve:T1,tokenize:I1};function T1(e){let n=e.length-4,t=3,r,l;if((e[t][1].type==="lineEnding"||e[t][1].type==="space")&&(e[n][1].type==="lineEnding"||e[n][1].type==="space")){for(r=t;++r<n;)if(e[r][1].type==="codeTextData"){e[t][1].type="codeTextPadding",e[n][1].type="codeTextPadding",t+=2,n-=2;break}}for(r=t-1,n++;++r<=n;)l===void 0?r!==n&&e[r][1].type!=="lineEnding"&&(l=r):(r===n||e[r][1].type==="lineEnding")&&(e[l][1].type="codeTextData",r!==l+2&&(e[l][1].end=e[r-1][1].end,e.splice(l+2,r-l-2),n-=r-l-2,r=l+2),l=void 0);return e}function z1(e){return e!==96||this.events[this.events.length-1][1].type==="characterEscape"}function I1(e,n,t){let r=0,l,i;return o;function o(f){return e.enter("codeText"),e.enter("codeTextSequence"),u(f)}function u(f){return f===96?(e.consume(f),r++,u):(e.exit("codeTextSequence"),s(f))}function s(f){return f===null?t(f):f===32?(e.enter("space"),e.consume(f),e.exit("space"),s):f===96?(i=e.enter("codeTextSequence"),l=0,c(f)):B(f)?(e.enter("lineEnding"),e.consume(f),e.exit("lineEnding"),s):(e.enter("codeTextData"),a(f))}function a(f){return f===null||f===32||f===96||B(f)?(e.exit("codeTextData"),s(f)):(e.consume(f),a)}function c(f){return f===96?(e.consume(f),l++,c):l===r?(e.exit("codeTextSequence"),e.exit("codeText"),n(f)):(i.type="codeTextData",a(f))}}class L1{constructor(n){this.left=n?[...n]:[],this.right=[]}get(n){if(n<0||n>=this.left.length+this.right.length)throw new RangeError("Cannot access index `"+n+"` in a splice buffer of size `"+(this.left.length+this.right.length)+"`");return n<this.left.length?this.left[n]:this.right[this.right.length-n+this.left.length-1]}get length(){return this.left.length+this.right.length}shift(){return this.setCursor(0),this.right.pop()}slice(n,t){const r=t??Number.POSITIVE_INFINITY;return r<this.left.length?this.left.slice(n,r):n>this.left.length?this.right.slice(this.right.length-r+this.left.length,this.right.length-n+this.left.length).reverse():this.left.slice(n).concat(this.right.slice(this.right.length-r+this.left.length).reverse())}splice(n,t,r){const l=t||0;this.setCursor(Math.trunc(n));const i=this.right.splice(this.right.length-l,Number.POSITIVE_INFINITY);return r&&mr(this.left,r),i.reverse()}pop(){return this.setCursor(Number.POSITIVE_INFINITY),this.left.pop()}push(n){this.setCursor(Number.POSITIVE_INFINITY),this.left.push(n)}pushMany(n){this.setCursor(Number.POSITIVE_INFINITY),mr(this.left,n)}unshift(n){this.setCursor(0),this.right.push(n)}unshiftMany(n){this.setCursor(0),mr(this.right,n.reverse())}setCursor(n){if(!(n===this.left.length||n>this.left.length&&this.right.length===0||n<0&&this.left.length===0))if(n<this.left.length){const t=this.left.splice(n,Number.POSITIVE_INFINITY);mr(this.right,t.reverse())}else{const t=this.right.splice(this.left.length+this.right.length-n,Number.POSITIVE_INFINITY);mr(this.left,t.reverse())}}}function mr(e,n){let t=0;if(n.length<1e4)e.push(...n);else for(;t<n.length;)e.push(...n.slice(t,t+1e4)),t+=1e4}function Cd(e){const n={};let t=-1,r,l,i,o,u,s,a;const c=new L1(e);for(;++t<c.length;){for(;t in n;)t=n[t];if(r=c.get(t),t&&r[1].type==="chunkFlow"&&c.get(t-1)[1].type==="listItemPrefix"&&(s=r[1]._tokenizer.events,i=0,i<s.length&&s[i][1].type==="lineEndingBlank"&&(i+=2),i<s.length&&s[i][1].type==="content"))for(;++i<s.length&&s[i][1].type!=="content";)s[i][1].type==="chunkText"&&(s[i][1]._isInFirstContentOfListItem=!0,i++);if(r[0]==="enter")r[1].contentType&&(Object.assign(n,R1(c,t)),t=n[t],a=!0);else if(r[1]._container){for(i=t,l=void 0;i--;)if(o=c.get(i),o[1].type==="lineEnding"||o[1].type==="lineEndingBlank")o[0]==="enter"&&(l&&(c.get(l)[1].type="lineEndingBlank"),o[1].type="lineEnding",l=i);else if(!(o[1].type==="linePrefix"||o[1].type==="listItemIndent"))break;l&&(r[1].end={...c.get(l)[1].start},u=c.slice(l,t),u.unshift(r),c.splice(l,t-l+1,u))}}return En(e,0,Number.POSITIVE_INFINITY,c.slice(0)),!a}function R1(e,n){const t=e.get(n)[1],r=e.get(n)[2];let l=n-1;const i=[];let o=t._tokenizer;o||(o=r.parser[t.contentType](t.start),t._contentTypeTextTrailing&&(o._contentTypeTextTrailing=!0));const u=o.events,s=[],a={};let c,f,d=-1,p=t,k=0,x=0;const I=[x];for(;p;){for(;e.get(++l)[1]!==p;);i.push(l),p._tokenizer||(c=r.sliceStream(p),p.next||c.push(null),f&&o.defineSkip(p.start),p._isInFirstContentOfListItem&&(o._gfmTasklistFirstContentOfListItem=!0),o.write(c),p._isInFirstContentOfListItem&&(o._gfmTasklistFirstContentOfListItem=void 0)),f=p,p=p.next}for(p=t;++d<u.length;)u[d][0]==="exit"&&u[d-1][0]==="enter"&&u[d][1].type===u[d-1][1].type&&u[d][1].start.line!==u[d][1].end.line&&(x=d+1,I.push(x),p._tokenizer=void 0,p.previous=void 0,p=p.next);for(o.events=[],p?(p._tokenizer=void 0,p.previous=void 0):I.pop(),d=I.length;d--;){const h=u.slice(I[d],I[d+1]),m=i.pop();s.push([m,m+h.length-1]),e.splice(m,2,h)}for(s.reverse(),d=-1;++d<s.length;)a[k+s[d][0]]=k+s[d][1],k+=s[d][1]-s[d][0]-1;return a}const O1={resolve:M1,tokenize:j1},D1={partial:!0,tokenize:A1};function M1(e){return Cd(e),e}function j1(e,n){let t;return r;function r(u){return e.enter("content"),t=e.enter("chunkContent",{contentType:"content"}),l(u)}function l(u){return u===null?i(u):B(u)?e.check(D1,o,i)(u):(e.consume(u),l)}function i(u){return e.exit("chunkContent"),e.exit("content"),n(u)}function o(u){return e.consume(u),e.exit("chunkContent"),t.next=e.enter("chunkContent",{contentType:"content",previous:t}),t=t.next,l}}function A1(e,n,t){const r=this;return l;function l(o){return e.exit("chunkContent"),e.enter("lineEnding"),e.consume(o),e.exit("lineEnding"),te(e,i,"linePrefix")}function i(o){if(o===null||B(o))return t(o);const u=r.events[r.events.length-1];return!r.parser.constructs.disable.null.includes("codeIndented")&&u&&u[1].type==="linePrefix"&&u[2].sliceSerialize(u[1],!0).length>=4?n(o):e.interrupt(r.parser.constructs.flow,t,n)(o)}}function Nd(e,n,t,r,l,i,o,u,s){const a=s||Number.POSITIVE_INFINITY;let c=0;return f;function f(h){return h===60?(e.enter(r),e.enter(l),e.enter(i),e.consume(h),e.exit(i),d):h===null||h===32||h===41||mu(h)?t(h):(e.enter(r),e.enter(o),e.enter(u),e.enter("chunkString",{contentType:"string"}),x(h))}function d(h){return h===62?(e.enter(i),e.consume(h),e.exit(i),e.exit(l),e.exit(r),n):(e.enter(u),e.enter("chunkString",{contentType:"string"}),p(h))}function p(h){return h===62?(e.exit("chunkString"),e.exit(u),d(h)):h===null||h===60||B(h)?t(h):(e.consume(h),h===92?k:p)}function k(h){return h===60||h===62||h===92?(e.consume(h),p):p(h)}function x(h){return!c&&(h===null||h===41||Ue(h))?(e.exit("chunkString"),e.exit(u),e.exit(o),e.exit(r),n(h)):c<a&&h===40?(e.consume(h),c++,x):h===41?(e.consume(h),c--,x):h===null||h===32||h===40||mu(h)?t(h):(e.consume(h),h===92?I:x)}function I(h){return h===40||h===41||h===92?(e.consume(h),x):x(h)}}function Pd(e,n,t,r,l,i){const o=this;let u=0,s;return a;function a(p){return e.enter(r),e.enter(l),e.consume(p),e.exit(l),e.enter(i),c}function c(p){return u>999||p===null||p===91||p===93&&!s||p===94&&!u&&"_hiddenFootnoteSupport"in o.parser.constructs?t(p):p===93?(e.exit(i),e.enter(l),e.consume(p),e.exit(l),e.exit(r),n):B(p)?(e.enter("lineEnding"),e.consume(p),e.exit("lineEnding"),c):(e.enter("chunkString",{contentType:"string"}),f(p))}function f(p){return p===null||p===91||p===93||B(p)||u++>999?(e.exit("chunkString"),c(p)):(e.consume(p),s||(s=!G(p)),p===92?d:f)}function d(p){return p===91||p===92||p===93?(e.consume(p),u++,f):f(p)}}function _d(e,n,t,r,l,i){let o;return u;function u(d){return d===34||d===39||d===40?(e.enter(r),e.enter(l),e.consume(d),e.exit(l),o=d===40?41:d,s):t(d)}function s(d){return d===o?(e.enter(l),e.consume(d),e.exit(l),e.exit(r),n):(e.enter(i),a(d))}function a(d){return d===o?(e.exit(i),s(o)):d===null?t(d):B(d)?(e.enter("lineEnding"),e.consume(d),e.exit("lineEnding"),te(e,a,"linePrefix")):(e.enter("chunkString",{contentType:"string"}),c(d))}function c(d){return d===o||d===null||B(d)?(e.exit("chunkString"),a(d)):(e.consume(d),d===92?f:c)}function f(d){return d===o||d===92?(e.consume(d),c):c(d)}}function Lr(e,n){let t;return r;function r(l){return B(l)?(e.enter("lineEnding"),e.consume(l),e.exit("lineEnding"),t=!0,r):G(l)?te(e,r,t?"linePrefix":"lineSuffix")(l):n(l)}}const F1={name:"definition",tokenize:U1},B1={partial:!0,tokenize:V1};function U1(e,n,t){const r=this;let l;return i;function i(p){return e.enter("definition"),o(p)}function o(p){return Pd.call(r,e,u,t,"definitionLabel","definitionLabelMarker","definitionLabelString")(p)}function u(p){return l=bt(r.sliceSerialize(r.events[r.events.length-1][1]).slice(1,-1)),p===58?(e.enter("definitionMarker"),e.consume(p),e.exit("definitionMarker"),s):t(p)}function s(p){return Ue(p)?Lr(e,a)(p):a(p)}function a(p){return Nd(e,c,t,"definitionDestination","definitionDestinationLiteral","definitionDestinationLiteralMarker","definitionDestinationRaw","definitionDestinationString")(p)}function c(p){return e.attempt(B1,f,f)(p)}function f(p){return G(p)?te(e,d,"whitespace")(p):d(p)}function d(p){return p===null||B(p)?(e.exit("definition"),r.parser.defined.push(l),n(p)):t(p)}}function V1(e,n,t){return r;function r(u){return Ue(u)?Lr(e,l)(u):t(u)}function l(u){return _d(e,i,t,"definitionTitle","definitionTitleMarker","definitionTitleString")(u)}function i(u){return G(u)?te(e,o,"whitespace")(u):o(u)}function o(u){return u===null||B(u)?n(u):t(u)}}const H1={name:"hardBreakEscape",tokenize:$1};function $1(e,n,t){return r;function r(i){return e.enter("hardBreakEscape"),e.consume(i),l}function l(i){return B(i)?(e.exit("hardBreakEscape"),n(i)):t(i)}}const W1={name:"headingAtx",resolve:Q1,tokenize:b1};function Q1(e,n){let t=e.length-2,r=3,l,i;return e[r][1].type==="whitespace"&&(r+=2),t-2>r&&e[t][1].type==="whitespace"&&(t-=2),e[t][1].type==="atxHeadingSequence"&&(r===t-1||t-4>r&&e[t-2][1].type==="whitespace")&&(t-=r+1===t?2:4),t>r&&(l={type:"atxHeadingText",start:e[r][1].start,end:e[t][1].end},i={type:"chunkText",start:e[r][1].start,end:e[t][1].end,contentType:"text"},En(e,r,t-r+1,[["enter",l,n],["enter",i,n],["exit",i,n],["exit",l,n]])),e}function b1(e,n,t){let r=0;return l;function l(c){return e.enter("atxHeading"),i(c)}function i(c){return e.enter("atxHeadingSequence"),o(c)}function o(c){return c===35&&r++<6?(e.consume(c),o):c===null||Ue(c)?(e.exit("atxHeadingSequence"),u(c)):t(c)}function u(c){return c===35?(e.enter("atxHeadingSequence"),s(c)):c===null||B(c)?(e.exit("atxHeading"),n(c)):G(c)?te(e,u,"whitespace")(c):(e.enter("atxHeadingText"),a(c))}function s(c){return c===35?(e.consume(c),s):(e.exit("atxHeadingSequence"),u(c))}function a(c){return c===null||c===35||Ue(c)?(e.exit("atxHeadingText"),u(c)):(e.consume(c),a)}}const K1=["address","article","aside","base","basefont","blockquote","body","caption","center","col","colgroup","dd","details","dialog","dir","div","dl","dt","fieldset","figcaption","figure","footer","form","frame","frameset","h1","h2","h3","h4","h5","h6","head","header","hr","html","iframe","legend","li","link","main","menu","menuitem","nav","noframes","ol","optgroup","option","p","param","search","section","summary","table","tbody","td","tfoot","th","thead","title","tr","track","ul"],dc=["pre","script","style","textarea"],Y1={concrete:!0,name:"htmlFlow",resolveTo:q1,tokenize:Z1},G1={partial:!0,tokenize:ev},X1={partial:!0,tokenize:J1};function q1(e){let n=e.length;for(;n--&&!(e[n][0]==="enter"&&e[n][1].type==="htmlFlow"););return n>1&&e[n-2][1].type==="linePrefix"&&(e[n][1].start=e[n-2][1].start,e[n+1][1].start=e[n-2][1].start,e.splice(n-2,2)),e}function Z1(e,n,t){const r=this;let l,i,o,u,s;return a;function a(v){return c(v)}function c(v){return e.enter("htmlFlow"),e.enter("htmlFlowData"),e.consume(v),f}function f(v){return v===33?(e.consume(v),d):v===47?(e.consume(v),i=!0,x):v===63?(e.consume(v),l=3,r.interrupt?n:g):xn(v)?(e.consume(v),o=String.fromCharCode(v),I):t(v)}function d(v){return v===45?(e.consume(v),l=2,p):v===91?(e.consume(v),l=5,u=0,k):xn(v)?(e.consume(v),l=4,r.interrupt?n:g):t(v)}function p(v){return v===45?(e.consume(v),r.interrupt?n:g):t(v)}function k(v){const ge="CDATA[";return v===ge.charCodeAt(u++)?(e.consume(v),u===ge.length?r.interrupt?n:L:k):t(v)}function x(v){return xn(v)?(e.consume(v),o=String.fromCharCode(v),I):t(v)}function I(v){if(v===null||v===47||v===62||Ue(v)){const ge=v===47,on=o.toLowerCase();return!ge&&!i&&dc.includes(on)?(l=1,r.interrupt?n(v):L(v)):K1.includes(o.toLowerCase())?(l=6,ge?(e.consume(v),h):r.interrupt?n(v):L(v)):(l=7,r.interrupt&&!r.parser.lazy[r.now().line]?t(v):i?m(v):y(v))}return v===45||be(v)?(e.consume(v),o+=String.fromCharCode(v),I):t(v)}function h(v){return v===62?(e.consume(v),r.interrupt?n:L):t(v)}function m(v){return G(v)?(e.consume(v),m):j(v)}function y(v){return v===47?(e.consume(v),j):v===58||v===95||xn(v)?(e.consume(v),S):G(v)?(e.consume(v),y):j(v)}function S(v){return v===45||v===46||v===58||v===95||be(v)?(e.consume(v),S):N(v)}function N(v){return v===61?(e.consume(v),w):G(v)?(e.consume(v),N):y(v)}function w(v){return v===null||v===60||v===61||v===62||v===96?t(v):v===34||v===39?(e.consume(v),s=v,T):G(v)?(e.consume(v),w):R(v)}function T(v){return v===s?(e.consume(v),s=null,A):v===null||B(v)?t(v):(e.consume(v),T)}function R(v){return v===null||v===34||v===39||v===47||v===60||v===61||v===62||v===96||Ue(v)?N(v):(e.consume(v),R)}function A(v){return v===47||v===62||G(v)?y(v):t(v)}function j(v){return v===62?(e.consume(v),P):t(v)}function P(v){return v===null||B(v)?L(v):G(v)?(e.consume(v),P):t(v)}function L(v){return v===45&&l===2?(e.consume(v),de):v===60&&l===1?(e.consume(v),fe):v===62&&l===4?(e.consume(v),K):v===63&&l===3?(e.consume(v),g):v===93&&l===5?(e.consume(v),F):B(v)&&(l===6||l===7)?(e.exit("htmlFlowData"),e.check(G1,q,V)(v)):v===null||B(v)?(e.exit("htmlFlowData"),V(v)):(e.consume(v),L)}function V(v){return e.check(X1,Z,q)(v)}function Z(v){return e.enter("lineEnding"),e.consume(v),e.exit("lineEnding"),$}function $(v){return v===null||B(v)?V(v):(e.enter("htmlFlowData"),L(v))}function de(v){return v===45?(e.consume(v),g):L(v)}function fe(v){return v===47?(e.consume(v),o="",D):L(v)}function D(v){if(v===62){const ge=o.toLowerCase();return dc.includes(ge)?(e.consume(v),K):L(v)}return xn(v)&&o.length<8?(e.consume(v),o+=String.fromCharCode(v),D):L(v)}function F(v){return v===93?(e.consume(v),g):L(v)}function g(v){return v===62?(e.consume(v),K):v===45&&l===2?(e.consume(v),g):L(v)}function K(v){return v===null||B(v)?(e.exit("htmlFlowData"),q(v)):(e.consume(v),K)}function q(v){return e.exit("htmlFlow"),n(v)}}function J1(e,n,t){const r=this;return l;function l(o){return B(o)?(e.enter("lineEnding"),e.consume(o),e.exit("lineEnding"),i):t(o)}function i(o){return r.parser.lazy[r.now().line]?t(o):n(o)}}function ev(e,n,t){return r;function r(l){return e.enter("lineEnding"),e.consume(l),e.exit("lineEnding"),e.attempt(zi,n,t)}}const nv={name:"htmlText",tokenize:tv};function tv(e,n,t){const r=this;let l,i,o;return u;function u(g){return e.enter("htmlText"),e.enter("htmlTextData"),e.consume(g),s}function s(g){return g===33?(e.consume(g),a):g===47?(e.consume(g),N):g===63?(e.consume(g),y):xn(g)?(e.consume(g),R):t(g)}function a(g){return g===45?(e.consume(g),c):g===91?(e.consume(g),i=0,k):xn(g)?(e.consume(g),m):t(g)}function c(g){return g===45?(e.consume(g),p):t(g)}function f(g){return g===null?t(g):g===45?(e.consume(g),d):B(g)?(o=f,fe(g)):(e.consume(g),f)}function d(g){return g===45?(e.consume(g),p):f(g)}function p(g){return g===62?de(g):g===45?d(g):f(g)}function k(g){const K="CDATA[";return g===K.charCodeAt(i++)?(e.consume(g),i===K.length?x:k):t(g)}function x(g){return g===null?t(g):g===93?(e.consume(g),I):B(g)?(o=x,fe(g)):(e.consume(g),x)}function I(g){return g===93?(e.consume(g),h):x(g)}function h(g){return g===62?de(g):g===93?(e.consume(g),h):x(g)}function m(g){return g===null||g===62?de(g):B(g)?(o=m,fe(g)):(e.consume(g),m)}function y(g){return g===null?t(g):g===63?(e.consume(g),S):B(g)?(o=y,fe(g)):(e.consume(g),y)}function S(g){return g===62?de(g):y(g)}function N(g){return xn(g)?(e.consume(g),w):t(g)}function w(g){return g===45||be(g)?(e.consume(g),w):T(g)}function T(g){return B(g)?(o=T,fe(g)):G(g)?(e.consume(g),T):de(g)}function R(g){return g===45||be(g)?(e.consume(g),R):g===47||g===62||Ue(g)?A(g):t(g)}function A(g){return g===47?(e.consume(g),de):g===58||g===95||xn(g)?(e.consume(g),j):B(g)?(o=A,fe(g)):G(g)?(e.consume(g),A):de(g)}function j(g){return g===45||g===46||g===58||g===95||be(g)?(e.consume(g),j):P(g)}function P(g){return g===61?(e.consume(g),L):B(g)?(o=P,fe(g)):G(g)?(e.consume(g),P):A(g)}function L(g){return g===null||g===60||g===61||g===62||g===96?t(g):g===34||g===39?(e.consume(g),l=g,V):B(g)?(o=L,fe(g)):G(g)?(e.consume(g),L):(e.consume(g),Z)}function V(g){return g===l?(e.consume(g),l=void 0,$):g===null?t(g):B(g)?(o=V,fe(g)):(e.consume(g),V)}function Z(g){return g===null||g===34||g===39||g===60||g===61||g===96?t(g):g===47||g===62||Ue(g)?A(g):(e.consume(g),Z)}function $(g){return g===47||g===62||Ue(g)?A(g):t(g)}function de(g){return g===62?(e.consume(g),e.exit("htmlTextData"),e.exit("htmlText"),n):t(g)}function fe(g){return e.exit("htmlTextData"),e.enter("lineEnding"),e.consume(g),e.exit("lineEnding"),D}function D(g){return G(g)?te(e,F,"linePrefix",r.parser.constructs.disable.null.includes("codeIndented")?void 0:4)(g):F(g)}function F(g){return e.enter("htmlTextData"),o(g)}}const Ns={name:"labelEnd",resolveAll:ov,resolveTo:uv,tokenize:sv},rv={tokenize:av},lv={tokenize:cv},iv={tokenize:fv};function ov(e){let n=-1;const t=[];for(;++n<e.length;){const r=e[n][1];if(t.push(e[n]),r.type==="labelImage"||r.type==="labelLink"||r.type==="labelEnd"){const l=r.type==="labelImage"?4:2;r.type="data",n+=l}}return e.length!==t.length&&En(e,0,e.length,t),e}function uv(e,n){let t=e.length,r=0,l,i,o,u;for(;t--;)if(l=e[t][1],i){if(l.type==="link"||l.type==="labelLink"&&l._inactive)break;e[t][0]==="enter"&&l.type==="labelLink"&&(l._inactive=!0)}else if(o){if(e[t][0]==="enter"&&(l.type==="labelImage"||l.type==="labelLink")&&!l._balanced&&(i=t,l.type!=="labelLink")){r=2;break}}else l.type==="labelEnd"&&(o=t);const s={type:e[i][1].type==="labelLink"?"link":"image",start:{...e[i][1].start},end:{...e[e.length-1][1].end}},a={type:"label",start:{...e[i][1].start},end:{...e[o][1].end}},c={type:"labelText",start:{...e[i+r+2][1].end},end:{...e[o-2][1].start}};return u=[["enter",s,n],["enter",a,n]],u=en(u,e.slice(i+1,i+r+3)),u=en(u,[["enter",c,n]]),u=en(u,Cs(n.parser.constructs.insideSpan.null,e.slice(i+r+4,o-3),n)),u=en(u,[["exit",c,n],e[o-2],e[o-1],["exit",a,n]]),u=en(u,e.slice(o+1)),u=en(u,[["exit",s,n]]),En(e,i,e.length,u),e}function sv(e,n,t){const r=this;let l=r.events.length,i,o;for(;l--;)if((r.events[l][1].type==="labelImage"||r.events[l][1].type==="labelLink")&&!r.events[l][1]._balanced){i=r.events[l][1];break}return u;function u(d){return i?i._inactive?f(d):(o=r.parser.defined.includes(bt(r.sliceSerialize({start:i.end,end:r.now()}))),e.enter("labelEnd"),e.enter("labelMarker"),e.consume(d),e.exit("labelMarker"),e.exit("labelEnd"),s):t(d)}function s(d){return d===40?e.attempt(rv,c,o?c:f)(d):d===91?e.attempt(lv,c,o?a:f)(d):o?c(d):f(d)}function a(d){return e.attempt(iv,c,f)(d)}function c(d){return n(d)}function f(d){return i._balanced=!0,t(d)}}function av(e,n,t){return r;function r(f){return e.enter("resource"),e.enter("resourceMarker"),e.consume(f),e.exit("resourceMarker"),l}function l(f){return Ue(f)?Lr(e,i)(f):i(f)}function i(f){return f===41?c(f):Nd(e,o,u,"resourceDestination","resourceDestinationLiteral","resourceDestinationLiteralMarker","resourceDestinationRaw","resourceDestinationString",32)(f)}function o(f){return Ue(f)?Lr(e,s)(f):c(f)}function u(f){return t(f)}function s(f){return f===34||f===39||f===40?_d(e,a,t,"resourceTitle","resourceTitleMarker","resourceTitleString")(f):c(f)}function a(f){return Ue(f)?Lr(e,c)(f):c(f)}function c(f){return f===41?(e.enter("resourceMarker"),e.consume(f),e.exit("resourceMarker"),e.exit("resource"),n):t(f)}}function cv(e,n,t){const r=this;return l;function l(u){return Pd.call(r,e,i,o,"reference","referenceMarker","referenceString")(u)}function i(u){return r.parser.defined.includes(bt(r.sliceSerialize(r.events[r.events.length-1][1]).slice(1,-1)))?n(u):t(u)}function o(u){return t(u)}}function fv(e,n,t){return r;function r(i){return e.enter("reference"),e.enter("referenceMarker"),e.consume(i),e.exit("referenceMarker"),l}function l(i){return i===93?(e.enter("referenceMarker"),e.consume(i),e.exit("referenceMarker"),e.exit("reference"),n):t(i)}}const pv={name:"labelStartImage",resolveAll:Ns.resolveAll,tokenize:dv};function dv(e,n,t){const r=this;return l;function l(u){return e.enter("labelImage"),e.enter("labelImageMarker"),e.consume(u),e.exit("labelImageMarker"),i}function i(u){return u===91?(e.enter("labelMarker"),e.consume(u),e.exit("labelMarker"),e.exit("labelImage"),o):t(u)}function o(u){return u===94&&"_hiddenFootnoteSupport"in r.parser.constructs?t(u):n(u)}}const hv={name:"labelStartLink",resolveAll:Ns.resolveAll,tokenize:mv};function mv(e,n,t){const r=this;return l;function l(o){return e.enter("labelLink"),e.enter("labelMarker"),e.consume(o),e.exit("labelMarker"),e.exit("labelLink"),i}function i(o){return o===94&&"_hiddenFootnoteSupport"in r.parser.constructs?t(o):n(o)}}const uo={name:"lineEnding",tokenize:gv};function gv(e,n){return t;function t(r){return e.enter("lineEnding"),e.consume(r),e.exit("lineEnding"),te(e,n,"linePrefix")}}const Al={name:"thematicBreak",tokenize:yv};function yv(e,n,t){let r=0,l;return i;function i(a){return e.enter("thematicBreak"),o(a)}function o(a){return l=a,u(a)}function u(a){return a===l?(e.enter("thematicBreakSequence"),s(a)):r>=3&&(a===null||B(a))?(e.exit("thematicBreak"),n(a)):t(a)}function s(a){return a===l?(e.consume(a),r++,s):(e.exit("thematicBreakSequence"),G(a)?te(e,u,"whitespace")(a):u(a))}}const De={continuation:{tokenize:wv},exit:Ev,name:"list",tokenize:xv},vv={partial:!0,tokenize:Cv},kv={partial:!0,tokenize:Sv};function xv(e,n,t){const r=this,l=r.events[r.events.length-1];let i=l&&l[1].type==="linePrefix"?l[2].sliceSerialize(l[1],!0).length:0,o=0;return u;function u(p){const k=r.containerState.type||(p===42||p===43||p===45?"listUnordered":"listOrdered");if(k==="listUnordered"?!r.containerState.marker||p===r.containerState.marker:gu(p)){if(r.containerState.type||(r.containerState.type=k,e.enter(k,{_container:!0})),k==="listUnordered")return e.enter("listItemPrefix"),p===42||p===45?e.check(Al,t,a)(p):a(p);if(!r.interrupt||p===49)return e.enter("listItemPrefix"),e.enter("listItemValue"),s(p)}return t(p)}function s(p){return gu(p)&&++o<10?(e.consume(p),s):(!r.interrupt||o<2)&&(r.containerState.marker?p===r.containerState.marker:p===41||p===46)?(e.exit("listItemValue"),a(p)):t(p)}function a(p){return e.enter("listItemMarker"),e.consume(p),e.exit("listItemMarker"),r.containerState.marker=r.containerState.marker||p,e.check(zi,r.interrupt?t:c,e.attempt(vv,d,f))}function c(p){return r.containerState.initialBlankLine=!0,i++,d(p)}function f(p){return G(p)?(e.enter("listItemPrefixWhitespace"),e.consume(p),e.exit("listItemPrefixWhitespace"),d):t(p)}function d(p){return r.containerState.size=i+r.sliceSerialize(e.exit("listItemPrefix"),!0).length,n(p)}}function wv(e,n,t){const r=this;return r.containerState._closeFlow=void 0,e.check(zi,l,i);function l(u){return r.containerState.furtherBlankLines=r.containerState.furtherBlankLines||r.containerState.initialBlankLine,te(e,n,"listItemIndent",r.containerState.size+1)(u)}function i(u){return r.containerState.furtherBlankLines||!G(u)?(r.containerState.furtherBlankLines=void 0,r.containerState.initialBlankLine=void 0,o(u)):(r.containerState.furtherBlankLines=void 0,r.containerState.initialBlankLine=void 0,e.attempt(kv,n,o)(u))}function o(u){return r.containerState._closeFlow=!0,r.interrupt=void 0,te(e,e.attempt(De,n,t),"linePrefix",r.parser.constructs.disable.null.includes("codeIndented")?void 0:4)(u)}}function Sv(e,n,t){const r=this;return te(e,l,"listItemIndent",r.containerState.size+1);function l(i){const o=r.events[r.events.length-1];return o&&o[1].type==="listItemIndent"&&o[2].sliceSerialize(o[1],!0).length===r.containerState.size?n(i):t(i)}}function Ev(e){e.exit(this.containerState.type)}function Cv(e,n,t){const r=this;return te(e,l,"listItemPrefixWhitespace",r.parser.constructs.disable.null.includes("codeIndented")?void 0:5);function l(i){const o=r.events[r.events.length-1];return!G(i)&&o&&o[1].type==="listItemPrefixWhitespace"?n(i):t(i)}}const hc={name:"setextUnderline",resolveTo:Nv,tokenize:Pv};function Nv(e,n){let t=e.length,r,l,i;for(;t--;)if(e[t][0]==="enter"){if(e[t][1].type==="content"){r=t;break}e[t][1].type==="paragraph"&&(l=t)}else e[t][1].type==="content"&&e.splice(t,1),!i&&e[t][1].type==="definition"&&(i=t);const o={type:"setextHeading",start:{...e[r][1].start},end:{...e[e.length-1][1].end}};return e[l][1].type="setextHeadingText",i?(e.splice(l,0,["enter",o,n]),e.splice(i+1,0,["exit",e[r][1],n]),e[r][1].end={...e[i][1].end}):e[r][1]=o,e.push(["exit",o,n]),e}function Pv(e,n,t){const r=this;let l;return i;function i(a){let c=r.events.length,f;for(;c--;)if(r.events[c][1].type!=="lineEnding"&&r.events[c][1].type!=="linePrefix"&&r.events[c][1].type!=="content"){f=r.events[c][1].type==="paragraph";break}return!r.parser.lazy[r.now().line]&&(r.interrupt||f)?(e.enter("setextHeadingLine"),l=a,o(a)):t(a)}function o(a){return e.enter("setextHeadingLineSequence"),u(a)}function u(a){return a===l?(e.consume(a),u):(e.exit("setextHeadingLineSequence"),G(a)?te(e,s,"lineSuffix")(a):s(a))}function s(a){return a===null||B(a)?(e.exit("setextHeadingLine"),n(a)):t(a)}}const _v={tokenize:Tv};function Tv(e){const n=this,t=e.attempt(zi,r,e.attempt(this.parser.constructs.flowInitial,l,te(e,e.attempt(this.parser.constructs.flow,l,e.attempt(O1,l)),"linePrefix")));return t;function r(i){if(i===null){e.consume(i);return}return e.enter("lineEndingBlank"),e.consume(i),e.exit("lineEndingBlank"),n.currentConstruct=void 0,t}function l(i){if(i===null){e.consume(i);return}return e.enter("lineEnding"),e.consume(i),e.exit("lineEnding"),n.currentConstruct=void 0,t}}const zv={resolveAll:zd()},Iv=Td("string"),Lv=Td("text");function Td(e){return{resolveAll:zd(e==="text"?Rv:void 0),tokenize:n};function n(t){const r=this,l=this.parser.constructs[e],i=t.attempt(l,o,u);return o;function o(c){return a(c)?i(c):u(c)}function u(c){if(c===null){t.consume(c);return}return t.enter("data"),t.consume(c),s}function s(c){return a(c)?(t.exit("data"),i(c)):(t.consume(c),s)}function a(c){if(c===null)return!0;const f=l[c];let d=-1;if(f)for(;++d<f.length;){const p=f[d];if(!p.previous||p.previous.call(r,r.previous))return!0}return!1}}}function zd(e){return n;function n(t,r){let l=-1,i;for(;++l<=t.length;)i===void 0?t[l]&&t[l][1].type==="data"&&(i=l,l++):(!t[l]||t[l][1].type!=="data")&&(l!==i+2&&(t[i][1].end=t[l-1][1].end,t.splice(i+2,l-i-2),l=i+2),i=void 0);return e?e(t,r):t}}function Rv(e,n){let t=0;for(;++t<=e.length;)if((t===e.length||e[t][1].type==="lineEnding")&&e[t-1][1].type==="data"){const r=e[t-1][1],l=n.sliceStream(r);let i=l.length,o=-1,u=0,s;for(;i--;){const a=l[i];if(typeof a=="string"){for(o=a.length;a.charCodeAt(o-1)===32;)u++,o--;if(o)break;o=-1}else if(a===-2)s=!0,u++;else if(a!==-1){i++;break}}if(n._contentTypeTextTrailing&&t===e.length&&(u=0),u){const a={type:t===e.length||s||u<2?"lineSuffix":"hardBreakTrailing",start:{_bufferIndex:i?o:r.start._bufferIndex+o,_index:r.start._index+i,line:r.end.line,column:r.end.column-u,offset:r.end.offset-u},end:{...r.end}};r.end={...a.start},r.start.offset===r.end.offset?Object.assign(r,a):(e.splice(t,0,["enter",a,n],["exit",a,n]),t+=2)}t++}return e}const Ov={42:De,43:De,45:De,48:De,49:De,50:De,51:De,52:De,53:De,54:De,55:De,56:De,57:De,62:wd},Dv={91:F1},Mv={[-2]:oo,[-1]:oo,32:oo},jv={35:W1,42:Al,45:[hc,Al],60:Y1,61:hc,95:Al,96:pc,126:pc},Av={38:Ed,92:Sd},Fv={[-5]:uo,[-4]:uo,[-3]:uo,33:pv,38:Ed,42:yu,60:[h1,nv],91:hv,92:[H1,Sd],93:Ns,95:yu,96:_1},Bv={null:[yu,zv]},Uv={null:[42,95]},Vv={null:[]},Hv=Object.freeze(Object.defineProperty({__proto__:null,attentionMarkers:Uv,contentInitial:Dv,disable:Vv,document:Ov,flow:jv,flowInitial:Mv,insideSpan:Bv,string:Av,text:Fv},Symbol.toStringTag,{value:"Module"}));function $v(e,n,t){let r={_bufferIndex:-1,_index:0,line:t&&t.line||1,column:t&&t.column||1,offset:t&&t.offset||0};const l={},i=[];let o=[],u=[];const s={attempt:T(N),check:T(w),consume:m,enter:y,exit:S,interrupt:T(w,{interrupt:!0})},a={code:null,containerState:{},defineSkip:x,events:[],now:k,parser:e,previous:null,sliceSerialize:d,sliceStream:p,write:f};let c=n.tokenize.call(a,s);return n.resolveAll&&i.push(n),a;function f(P){return o=en(o,P),I(),o[o.length-1]!==null?[]:(R(n,0),a.events=Cs(i,a.events,a),a.events)}function d(P,L){return Qv(p(P),L)}function p(P){return Wv(o,P)}function k(){const{_bufferIndex:P,_index:L,line:V,column:Z,offset:$}=r;return{_bufferIndex:P,_index:L,line:V,column:Z,offset:$}}function x(P){l[P.line]=P.column,j()}function I(){let P;for(;r._index<o.length;){const L=o[r._index];if(typeof L=="string")for(P=r._index,r._bufferIndex<0&&(r._bufferIndex=0);r._index===P&&r._bufferIndex<L.length;)h(L.charCodeAt(r._bufferIndex));else h(L)}}function h(P){c=c(P)}function m(P){B(P)?(r.line++,r.column=1,r.offset+=P===-3?2:1,j()):P!==-1&&(r.column++,r.offset++),r._bufferIndex<0?r._index++:(r._bufferIndex++,r._bufferIndex===o[r._index].length&&(r._bufferIndex=-1,r._index++)),a.previous=P}function y(P,L){const V=L||{};return V.type=P,V.start=k(),a.events.push(["enter",V,a]),u.push(V),V}function S(P){const L=u.pop();return L.end=k(),a.events.push(["exit",L,a]),L}function N(P,L){R(P,L.from)}function w(P,L){L.restore()}function T(P,L){return V;function V(Z,$,de){let fe,D,F,g;return Array.isArray(Z)?q(Z):"tokenize"in Z?q([Z]):K(Z);function K(re){return mn;function mn(jn){const St=jn!==null&&re[jn],Et=jn!==null&&re.null,ll=[...Array.isArray(St)?St:St?[St]:[],...Array.isArray(Et)?Et:Et?[Et]:[]];return q(ll)(jn)}}function q(re){return fe=re,D=0,re.length===0?de:v(re[D])}function v(re){return mn;function mn(jn){return g=A(),F=re,re.partial||(a.currentConstruct=re),re.name&&a.parser.constructs.disable.null.includes(re.name)?on():re.tokenize.call(L?Object.assign(Object.create(a),L):a,s,ge,on)(jn)}}function ge(re){return P(F,g),$}function on(re){return g.restore(),++D<fe.length?v(fe[D]):de}}}function R(P,L){P.resolveAll&&!i.includes(P)&&i.push(P),P.resolve&&En(a.events,L,a.events.length-L,P.resolve(a.events.slice(L),a)),P.resolveTo&&(a.events=P.resolveTo(a.events,a))}function A(){const P=k(),L=a.previous,V=a.currentConstruct,Z=a.events.length,$=Array.from(u);return{from:Z,restore:de};function de(){r=P,a.previous=L,a.currentConstruct=V,a.events.length=Z,u=$,j()}}function j(){r.line in l&&r.column<2&&(r.column=l[r.line],r.offset+=l[r.line]-1)}}function Wv(e,n){const t=n.start._index,r=n.start._bufferIndex,l=n.end._index,i=n.end._bufferIndex;let o;if(t===l)o=[e[t].slice(r,i)];else{if(o=e.slice(t,l),r>-1){const u=o[0];typeof u=="string"?o[0]=u.slice(r):o.shift()}i>0&&o.push(e[l].slice(0,i))}return o}function Qv(e,n){let t=-1;const r=[];let l;for(;++t<e.length;){const i=e[t];let o;if(typeof i=="string")o=i;else switch(i){case-5:{o="\r";break}case-4:{o=`
-`;break}case-3:{o=`\r
-`;break}case-2:{o=n?" ":"	";break}case-1:{if(!n&&l)continue;o=" ";break}default:o=String.fromCharCode(i)}l=i===-2,r.push(o)}return r.join("")}function bv(e){const r={constructs:Jy([Hv,...(e||{}).extensions||[]]),content:l(u1),defined:[],document:l(a1),flow:l(_v),lazy:{},string:l(Iv),text:l(Lv)};return r;function l(i){return o;function o(u){return $v(r,i,u)}}}function Kv(e){for(;!Cd(e););return e}const mc=/[\0\t\n\r]/g;function Yv(){let e=1,n="",t=!0,r;return l;function l(i,o,u){const s=[];let a,c,f,d,p;for(i=n+(typeof i=="string"?i.toString():new TextDecoder(o||void 0).decode(i)),f=0,n="",t&&(i.charCodeAt(0)===65279&&f++,t=void 0);f<i.length;){if(mc.lastIndex=f,a=mc.exec(i),d=a&&a.index!==void 0?a.index:i.length,p=i.charCodeAt(d),!a){n=i.slice(f);break}if(p===10&&f===d&&r)s.push(-3),r=void 0;else switch(r&&(s.push(-5),r=void 0),f<d&&(s.push(i.slice(f,d)),e+=d-f),p){case 0:{s.push(65533),e++;break}case 9:{for(c=Math.ceil(e/4)*4,s.push(-2);e++<c;)s.push(-1);break}case 10:{s.push(-4),e=1;break}default:r=!0,e=1}f=d+1}return u&&(r&&s.push(-5),n&&s.push(n),s.push(null)),s}}const Gv=/\\([!-/:-@[-`{-~])|&(#(?:\d{1,7}|x[\da-f]{1,6})|[\da-z]{1,31});/gi;function Xv(e){return e.replace(Gv,qv)}function qv(e,n,t){if(n)return n;if(t.charCodeAt(0)===35){const l=t.charCodeAt(1),i=l===120||l===88;return xd(t.slice(i?2:1),i?16:10)}return Es(t)||e}const Id={}.hasOwnProperty;function Zv(e,n,t){return n&&typeof n=="object"&&(t=n,n=void 0),Jv(t)(Kv(bv(t).document().write(Yv()(e,n,!0))))}function Jv(e){const n={transforms:[],canContainEols:["emphasis","fragment","heading","paragraph","strong"],enter:{autolink:i(Ds),autolinkProtocol:A,autolinkEmail:A,atxHeading:i(Ls),blockQuote:i(Et),characterEscape:A,characterReference:A,codeFenced:i(ll),codeFencedFenceInfo:o,codeFencedFenceMeta:o,codeIndented:i(ll,o),codeText:i(Hd,o),codeTextData:A,data:A,codeFlowValue:A,definition:i($d),definitionDestinationString:o,definitionLabelString:o,definitionTitleString:o,emphasis:i(Wd),hardBreakEscape:i(Rs),hardBreakTrailing:i(Rs),htmlFlow:i(Os,o),htmlFlowData:A,htmlText:i(Os,o),htmlTextData:A,image:i(Qd),label:o,link:i(Ds),listItem:i(bd),listItemValue:d,listOrdered:i(Ms,f),listUnordered:i(Ms),paragraph:i(Kd),reference:v,referenceString:o,resourceDestinationString:o,resourceTitleString:o,setextHeading:i(Ls),strong:i(Yd),thematicBreak:i(Xd)},exit:{atxHeading:s(),atxHeadingSequence:N,autolink:s(),autolinkEmail:St,autolinkProtocol:jn,blockQuote:s(),characterEscapeValue:j,characterReferenceMarkerHexadecimal:on,characterReferenceMarkerNumeric:on,characterReferenceValue:re,characterReference:mn,codeFenced:s(I),codeFencedFence:x,codeFencedFenceInfo:p,codeFencedFenceMeta:k,codeFlowValue:j,codeIndented:s(h),codeText:s($),codeTextData:j,data:j,definition:s(),definitionDestinationString:S,definitionLabelString:m,definitionTitleString:y,emphasis:s(),hardBreakEscape:s(L),hardBreakTrailing:s(L),htmlFlow:s(V),htmlFlowData:j,htmlText:s(Z),htmlTextData:j,image:s(fe),label:F,labelText:D,lineEnding:P,link:s(de),listItem:s(),listOrdered:s(),listUnordered:s(),paragraph:s(),referenceString:ge,resourceDestinationString:g,resourceTitleString:K,resource:q,setextHeading:s(R),setextHeadingLineSequence:T,setextHeadingText:w,strong:s(),thematicBreak:s()}};Ld(n,(e||{}).mdastExtensions||[]);const t={};return r;function r(E){let O={type:"root",children:[]};const U={stack:[O],tokenStack:[],config:n,enter:u,exit:a,buffer:o,resume:c,data:t},b=[];let J=-1;for(;++J<E.length;)if(E[J][1].type==="listOrdered"||E[J][1].type==="listUnordered")if(E[J][0]==="enter")b.push(J);else{const un=b.pop();J=l(E,un,J)}for(J=-1;++J<E.length;){const un=n[E[J][0]];Id.call(un,E[J][1].type)&&un[E[J][1].type].call(Object.assign({sliceSerialize:E[J][2].sliceSerialize},U),E[J][1])}if(U.tokenStack.length>0){const un=U.tokenStack[U.tokenStack.length-1];(un[1]||gc).call(U,void 0,un[0])}for(O.position={start:Fn(E.length>0?E[0][1].start:{line:1,column:1,offset:0}),end:Fn(E.length>0?E[E.length-2][1].end:{line:1,column:1,offset:0})},J=-1;++J<n.transforms.length;)O=n.transforms[J](O)||O;return O}function l(E,O,U){let b=O-1,J=-1,un=!1,it,Cn,ir,or;for(;++b<=U;){const He=E[b];switch(He[1].type){case"listUnordered":case"listOrdered":case"blockQuote":{He[0]==="enter"?J++:J--,or=void 0;break}case"lineEndingBlank":{He[0]==="enter"&&(it&&!or&&!J&&!ir&&(ir=b),or=void 0);break}case"linePrefix":case"listItemValue":case"listItemMarker":case"listItemPrefix":case"listItemPrefixWhitespace":break;default:or=void 0}if(!J&&He[0]==="enter"&&He[1].type==="listItemPrefix"||J===-1&&He[0]==="exit"&&(He[1].type==="listUnordered"||He[1].type==="listOrdered")){if(it){let Ct=b;for(Cn=void 0;Ct--;){const Nn=E[Ct];if(Nn[1].type==="lineEnding"||Nn[1].type==="lineEndingBlank"){if(Nn[0]==="exit")continue;Cn&&(E[Cn][1].type="lineEndingBlank",un=!0),Nn[1].type="lineEnding",Cn=Ct}else if(!(Nn[1].type==="linePrefix"||Nn[1].type==="blockQuotePrefix"||Nn[1].type==="blockQuotePrefixWhitespace"||Nn[1].type==="blockQuoteMarker"||Nn[1].type==="listItemIndent"))break}ir&&(!Cn||ir<Cn)&&(it._spread=!0),it.end=Object.assign({},Cn?E[Cn][1].start:He[1].end),E.splice(Cn||b,0,["exit",it,He[2]]),b++,U++}if(He[1].type==="listItemPrefix"){const Ct={type:"listItem",_spread:!1,start:Object.assign({},He[1].start),end:void 0};it=Ct,E.splice(b,0,["enter",Ct,He[2]]),b++,U++,ir=void 0,or=!0}}}return E[O][1]._spread=un,U}function i(E,O){return U;function U(b){u.call(this,E(b),b),O&&O.call(this,b)}}function o(){this.stack.push({type:"fragment",children:[]})}function u(E,O,U){this.stack[this.stack.length-1].children.push(E),this.stack.push(E),this.tokenStack.push([O,U||void 0]),E.position={start:Fn(O.start),end:void 0}}function s(E){return O;function O(U){E&&E.call(this,U),a.call(this,U)}}function a(E,O){const U=this.stack.pop(),b=this.tokenStack.pop();if(b)b[0].type!==E.type&&(O?O.call(this,E,b[0]):(b[1]||gc).call(this,E,b[0]));else throw new Error("Cannot close `"+E.type+"` ("+Ir({start:E.start,end:E.end})+"): it’s not open");U.position.end=Fn(E.end)}function c(){return qy(this.stack.pop())}function f(){this.data.expectingFirstListItemValue=!0}function d(E){if(this.data.expectingFirstListItemValue){const O=this.stack[this.stack.length-2];O.start=Number.parseInt(this.sliceSerialize(E),10),this.data.expectingFirstListItemValue=void 0}}function p(){const E=this.resume(),O=this.stack[this.stack.length-1];O.lang=E}function k(){const E=this.resume(),O=this.stack[this.stack.length-1];O.meta=E}function x(){this.data.flowCodeInside||(this.buffer(),this.data.flowCodeInside=!0)}function I(){const E=this.resume(),O=this.stack[this.stack.length-1];O.value=E.replace(/^(\r?\n|\r)|(\r?\n|\r)$/g,""),this.data.flowCodeInside=void 0}function h(){const E=this.resume(),O=this.stack[this.stack.length-1];O.value=E.replace(/(\r?\n|\r)$/g,"")}function m(E){const O=this.resume(),U=this.stack[this.stack.length-1];U.label=O,U.identifier=bt(this.sliceSerialize(E)).toLowerCase()}function y(){const E=this.resume(),O=this.stack[this.stack.length-1];O.title=E}function S(){const E=this.resume(),O=this.stack[this.stack.length-1];O.url=E}function N(E){const O=this.stack[this.stack.length-1];if(!O.depth){const U=this.sliceSerialize(E).length;O.depth=U}}function w(){this.data.setextHeadingSlurpLineEnding=!0}function T(E){const O=this.stack[this.stack.length-1];O.depth=this.sliceSerialize(E).codePointAt(0)===61?1:2}function R(){this.data.setextHeadingSlurpLineEnding=void 0}function A(E){const U=this.stack[this.stack.length-1].children;let b=U[U.length-1];(!b||b.type!=="text")&&(b=Gd(),b.position={start:Fn(E.start),end:void 0},U.push(b)),this.stack.push(b)}function j(E){const O=this.stack.pop();O.value+=this.sliceSerialize(E),O.position.end=Fn(E.end)}function P(E){const O=this.stack[this.stack.length-1];if(this.data.atHardBreak){const U=O.children[O.children.length-1];U.position.end=Fn(E.end),this.data.atHardBreak=void 0;return}!this.data.setextHeadingSlurpLineEnding&&n.canContainEols.includes(O.type)&&(A.call(this,E),j.call(this,E))}function L(){this.data.atHardBreak=!0}function V(){const E=this.resume(),O=this.stack[this.stack.length-1];O.value=E}function Z(){const E=this.resume(),O=this.stack[this.stack.length-1];O.value=E}function $(){const E=this.resume(),O=this.stack[this.stack.length-1];O.value=E}function de(){const E=this.stack[this.stack.length-1];if(this.data.inReference){const O=this.data.referenceType||"shortcut";E.type+="Reference",E.referenceType=O,delete E.url,delete E.title}else delete E.identifier,delete E.label;this.data.referenceType=void 0}function fe(){const E=this.stack[this.stack.length-1];if(this.data.inReference){const O=this.data.referenceType||"shortcut";E.type+="Reference",E.referenceType=O,delete E.url,delete E.title}else delete E.identifier,delete E.label;this.data.referenceType=void 0}function D(E){const O=this.sliceSerialize(E),U=this.stack[this.stack.length-2];U.label=Xv(O),U.identifier=bt(O).toLowerCase()}function F(){const E=this.stack[this.stack.length-1],O=this.resume(),U=this.stack[this.stack.length-1];if(this.data.inReference=!0,U.type==="link"){const b=E.children;U.children=b}else U.alt=O}function g(){const E=this.resume(),O=this.stack[this.stack.length-1];O.url=E}function K(){const E=this.resume(),O=this.stack[this.stack.length-1];O.title=E}function q(){this.data.inReference=void 0}function v(){this.data.referenceType="collapsed"}function ge(E){const O=this.resume(),U=this.stack[this.stack.length-1];U.label=O,U.identifier=bt(this.sliceSerialize(E)).toLowerCase(),this.data.referenceType="full"}function on(E){this.data.characterReferenceType=E.type}function re(E){const O=this.sliceSerialize(E),U=this.data.characterReferenceType;let b;U?(b=xd(O,U==="characterReferenceMarkerNumeric"?10:16),this.data.characterReferenceType=void 0):b=Es(O);const J=this.stack[this.stack.length-1];J.value+=b}function mn(E){const O=this.stack.pop();O.position.end=Fn(E.end)}function jn(E){j.call(this,E);const O=this.stack[this.stack.length-1];O.url=this.sliceSerialize(E)}function St(E){j.call(this,E);const O=this.stack[this.stack.length-1];O.url="mailto:"+this.sliceSerialize(E)}function Et(){return{type:"blockquote",children:[]}}function ll(){return{type:"code",lang:null,meta:null,value:""}}function Hd(){return{type:"inlineCode",value:""}}function $d(){return{type:"definition",identifier:"",label:null,title:null,url:""}}function Wd(){return{type:"emphasis",children:[]}}function Ls(){return{type:"heading",depth:0,children:[]}}function Rs(){return{type:"break"}}function Os(){return{type:"html",value:""}}function Qd(){return{type:"image",title:null,url:"",alt:null}}function Ds(){return{type:"link",title:null,url:"",children:[]}}function Ms(E){return{type:"list",ordered:E.type==="listOrdered",start:null,spread:E._spread,children:[]}}function bd(E){return{type:"listItem",spread:E._spread,checked:null,children:[]}}function Kd(){return{type:"paragraph",children:[]}}function Yd(){return{type:"strong",children:[]}}function Gd(){return{type:"text",value:""}}function Xd(){return{type:"thematicBreak"}}}function Fn(e){return{line:e.line,column:e.column,offset:e.offset}}function Ld(e,n){let t=-1;for(;++t<n.length;){const r=n[t];Array.isArray(r)?Ld(e,r):e0(e,r)}}function e0(e,n){let t;for(t in n)if(Id.call(n,t))switch(t){case"canContainEols":{const r=n[t];r&&e[t].push(...r);break}case"transforms":{const r=n[t];r&&e[t].push(...r);break}case"enter":case"exit":{const r=n[t];r&&Object.assign(e[t],r);break}}}function gc(e,n){throw e?new Error("Cannot close `"+e.type+"` ("+Ir({start:e.start,end:e.end})+"): a different token (`"+n.type+"`, "+Ir({start:n.start,end:n.end})+") is open"):new Error("Cannot close document, a token (`"+n.type+"`, "+Ir({start:n.start,end:n.end})+") is still open")}function n0(e){const n=this;n.parser=t;function t(r){return Zv(r,{...n.data("settings"),...e,extensions:n.data("micromarkExtensions")||[],mdastExtensions:n.data("fromMarkdownExtensions")||[]})}}function t0(e,n){const t={type:"element",tagName:"blockquote",properties:{},children:e.wrap(e.all(n),!0)};return e.patch(n,t),e.applyData(n,t)}function r0(e,n){const t={type:"element",tagName:"br",properties:{},children:[]};return e.patch(n,t),[e.applyData(n,t),{type:"text",value:`
-`}]}function l0(e,n){const t=n.value?n.value+`
-`:"",r={},l=n.lang?n.lang.split(/\s+/):[];l.length>0&&(r.className=["language-"+l[0]]);let i={type:"element",tagName:"code",properties:r,children:[{type:"text",value:t}]};return n.meta&&(i.data={meta:n.meta}),e.patch(n,i),i=e.applyData(n,i),i={type:"element",tagName:"pre",properties:{},children:[i]},e.patch(n,i),i}function i0(e,n){const t={type:"element",tagName:"del",properties:{},children:e.all(n)};return e.patch(n,t),e.applyData(n,t)}function o0(e,n){const t={type:"element",tagName:"em",properties:{},children:e.all(n)};return e.patch(n,t),e.applyData(n,t)}function u0(e,n){const t=typeof e.options.clobberPrefix=="string"?e.options.clobberPrefix:"user-content-",r=String(n.identifier).toUpperCase(),l=lr(r.toLowerCase()),i=e.footnoteOrder.indexOf(r);let o,u=e.footnoteCounts.get(r);u===void 0?(u=0,e.footnoteOrder.push(r),o=e.footnoteOrder.length):o=i+1,u+=1,e.footnoteCounts.set(r,u);const s={type:"element",tagName:"a",properties:{href:"#"+t+"fn-"+l,id:t+"fnref-"+l+(u>1?"-"+u:""),dataFootnoteRef:!0,ariaDescribedBy:["footnote-label"]},children:[{type:"text",value:String(o)}]};e.patch(n,s);const a={type:"element",tagName:"sup",properties:{},children:[s]};return e.patch(n,a),e.applyData(n,a)}function s0(e,n){const t={type:"element",tagName:"h"+n.depth,properties:{},children:e.all(n)};return e.patch(n,t),e.applyData(n,t)}function a0(e,n){if(e.options.allowDangerousHtml){const t={type:"raw",value:n.value};return e.patch(n,t),e.applyData(n,t)}}function Rd(e,n){const t=n.referenceType;let r="]";if(t==="collapsed"?r+="[]":t==="full"&&(r+="["+(n.label||n.identifier)+"]"),n.type==="imageReference")return[{type:"text",value:"!["+n.alt+r}];const l=e.all(n),i=l[0];i&&i.type==="text"?i.value="["+i.value:l.unshift({type:"text",value:"["});const o=l[l.length-1];return o&&o.type==="text"?o.value+=r:l.push({type:"text",value:r}),l}function c0(e,n){const t=String(n.identifier).toUpperCase(),r=e.definitionById.get(t);if(!r)return Rd(e,n);const l={src:lr(r.url||""),alt:n.alt};r.title!==null&&r.title!==void 0&&(l.title=r.title);const i={type:"element",tagName:"img",properties:l,children:[]};return e.patch(n,i),e.applyData(n,i)}function f0(e,n){const t={src:lr(n.url)};n.alt!==null&&n.alt!==void 0&&(t.alt=n.alt),n.title!==null&&n.title!==void 0&&(t.title=n.title);const r={type:"element",tagName:"img",properties:t,children:[]};return e.patch(n,r),e.applyData(n,r)}function p0(e,n){const t={type:"text",value:n.value.replace(/\r?\n|\r/g," ")};e.patch(n,t);const r={type:"element",tagName:"code",properties:{},children:[t]};return e.patch(n,r),e.applyData(n,r)}function d0(e,n){const t=String(n.identifier).toUpperCase(),r=e.definitionById.get(t);if(!r)return Rd(e,n);const l={href:lr(r.url||"")};r.title!==null&&r.title!==void 0&&(l.title=r.title);const i={type:"element",tagName:"a",properties:l,children:e.all(n)};return e.patch(n,i),e.applyData(n,i)}function h0(e,n){const t={href:lr(n.url)};n.title!==null&&n.title!==void 0&&(t.title=n.title);const r={type:"element",tagName:"a",properties:t,children:e.all(n)};return e.patch(n,r),e.applyData(n,r)}function m0(e,n,t){const r=e.all(n),l=t?g0(t):Od(n),i={},o=[];if(typeof n.checked=="boolean"){const c=r[0];let f;c&&c.type==="element"&&c.tagName==="p"?f=c:(f={type:"element",tagName:"p",properties:{},children:[]},r.unshift(f)),f.children.length>0&&f.children.unshift({type:"text",value:" "}),f.children.unshift({type:"element",tagName:"input",properties:{type:"checkbox",checked:n.checked,disabled:!0},children:[]}),i.className=["task-list-item"]}let u=-1;for(;++u<r.length;){const c=r[u];(l||u!==0||c.type!=="element"||c.tagName!=="p")&&o.push({type:"text",value:`
-`}),c.type==="element"&&c.tagName==="p"&&!l?o.push(...c.children):o.push(c)}const s=r[r.length-1];s&&(l||s.type!=="element"||s.tagName!=="p")&&o.push({type:"text",value:`
-`});const a={type:"element",tagName:"li",properties:i,children:o};return e.patch(n,a),e.applyData(n,a)}function g0(e){let n=!1;if(e.type==="list"){n=e.spread||!1;const t=e.children;let r=-1;for(;!n&&++r<t.length;)n=Od(t[r])}return n}function Od(e){const n=e.spread;return n??e.children.length>1}function y0(e,n){const t={},r=e.all(n);let l=-1;for(typeof n.start=="number"&&n.start!==1&&(t.start=n.start);++l<r.length;){const o=r[l];if(o.type==="element"&&o.tagName==="li"&&o.properties&&Array.isArray(o.properties.className)&&o.properties.className.includes("task-list-item")){t.className=["contains-task-list"];break}}const i={type:"element",tagName:n.ordered?"ol":"ul",properties:t,children:e.wrap(r,!0)};return e.patch(n,i),e.applyData(n,i)}function v0(e,n){const t={type:"element",tagName:"p",properties:{},children:e.all(n)};return e.patch(n,t),e.applyData(n,t)}function k0(e,n){const t={type:"root",children:e.wrap(e.all(n))};return e.patch(n,t),e.applyData(n,t)}function x0(e,n){const t={type:"element",tagName:"strong",properties:{},children:e.all(n)};return e.patch(n,t),e.applyData(n,t)}function w0(e,n){const t=e.all(n),r=t.shift(),l=[];if(r){const o={type:"element",tagName:"thead",properties:{},children:e.wrap([r],!0)};e.patch(n.children[0],o),l.push(o)}if(t.length>0){const o={type:"element",tagName:"tbody",properties:{},children:e.wrap(t,!0)},u=ks(n.children[1]),s=dd(n.children[n.children.length-1]);u&&s&&(o.position={start:u,end:s}),l.push(o)}const i={type:"element",tagName:"table",properties:{},children:e.wrap(l,!0)};return e.patch(n,i),e.applyData(n,i)}function S0(e,n,t){const r=t?t.children:void 0,i=(r?r.indexOf(n):1)===0?"th":"td",o=t&&t.type==="table"?t.align:void 0,u=o?o.length:n.children.length;let s=-1;const a=[];for(;++s<u;){const f=n.children[s],d={},p=o?o[s]:void 0;p&&(d.align=p);let k={type:"element",tagName:i,properties:d,children:[]};f&&(k.children=e.all(f),e.patch(f,k),k=e.applyData(f,k)),a.push(k)}const c={type:"element",tagName:"tr",properties:{},children:e.wrap(a,!0)};return e.patch(n,c),e.applyData(n,c)}function E0(e,n){const t={type:"element",tagName:"td",properties:{},children:e.all(n)};return e.patch(n,t),e.applyData(n,t)}const yc=9,vc=32;function C0(e){const n=String(e),t=/\r?\n|\r/g;let r=t.exec(n),l=0;const i=[];for(;r;)i.push(kc(n.slice(l,r.index),l>0,!0),r[0]),l=r.index+r[0].length,r=t.exec(n);return i.push(kc(n.slice(l),l>0,!1)),i.join("")}function kc(e,n,t){let r=0,l=e.length;if(n){let i=e.codePointAt(r);for(;i===yc||i===vc;)r++,i=e.codePointAt(r)}if(t){let i=e.codePointAt(l-1);for(;i===yc||i===vc;)l--,i=e.codePointAt(l-1)}return l>r?e.slice(r,l):""}function N0(e,n){const t={type:"text",value:C0(String(n.value))};return e.patch(n,t),e.applyData(n,t)}function P0(e,n){const t={type:"element",tagName:"hr",properties:{},children:[]};return e.patch(n,t),e.applyData(n,t)}const _0={blockquote:t0,break:r0,code:l0,delete:i0,emphasis:o0,footnoteReference:u0,heading:s0,html:a0,imageReference:c0,image:f0,inlineCode:p0,linkReference:d0,link:h0,listItem:m0,list:y0,paragraph:v0,root:k0,strong:x0,table:w0,tableCell:E0,tableRow:S0,text:N0,thematicBreak:P0,toml:Sl,yaml:Sl,definition:Sl,footnoteDefinition:Sl};function Sl(){}const Dd=-1,Ii=0,Rr=1,ci=2,Ps=3,_s=4,Ts=5,zs=6,Md=7,jd=8,xc=typeof self=="object"?self:globalThis,T0=(e,n)=>{const t=(l,i)=>(e.set(i,l),l),r=l=>{if(e.has(l))return e.get(l);const[i,o]=n[l];switch(i){case Ii:case Dd:return t(o,l);case Rr:{const u=t([],l);for(const s of o)u.push(r(s));return u}case ci:{const u=t({},l);for(const[s,a]of o)u[r(s)]=r(a);return u}case Ps:return t(new Date(o),l);case _s:{const{source:u,flags:s}=o;return t(new RegExp(u,s),l)}case Ts:{const u=t(new Map,l);for(const[s,a]of o)u.set(r(s),r(a));return u}case zs:{const u=t(new Set,l);for(const s of o)u.add(r(s));return u}case Md:{const{name:u,message:s}=o;return t(new xc[u](s),l)}case jd:return t(BigInt(o),l);case"BigInt":return t(Object(BigInt(o)),l);case"ArrayBuffer":return t(new Uint8Array(o).buffer,o);case"DataView":{const{buffer:u}=new Uint8Array(o);return t(new DataView(u),o)}}return t(new xc[i](o),l)};return r},wc=e=>T0(new Map,e)(0),Pt="",{toString:z0}={},{keys:I0}=Object,gr=e=>{const n=typeof e;if(n!=="object"||!e)return[Ii,n];const t=z0.call(e).slice(8,-1);switch(t){case"Array":return[Rr,Pt];case"Object":return[ci,Pt];case"Date":return[Ps,Pt];case"RegExp":return[_s,Pt];case"Map":return[Ts,Pt];case"Set":return[zs,Pt];case"DataView":return[Rr,t]}return t.includes("Array")?[Rr,t]:t.includes("Error")?[Md,t]:[ci,t]},El=([e,n])=>e===Ii&&(n==="function"||n==="symbol"),L0=(e,n,t,r)=>{const l=(o,u)=>{const s=r.push(o)-1;return t.set(u,s),s},i=o=>{if(t.has(o))return t.get(o);let[u,s]=gr(o);switch(u){case Ii:{let c=o;switch(s){case"bigint":u=jd,c=o.toString();break;case"function":case"symbol":if(e)throw new TypeError("unable to serialize "+s);c=null;break;case"undefined":return l([Dd],o)}return l([u,c],o)}case Rr:{if(s){let d=o;return s==="DataView"?d=new Uint8Array(o.buffer):s==="ArrayBuffer"&&(d=new Uint8Array(o)),l([s,[...d]],o)}const c=[],f=l([u,c],o);for(const d of o)c.push(i(d));return f}case ci:{if(s)switch(s){case"BigInt":return l([s,o.toString()],o);case"Boolean":case"Number":case"String":return l([s,o.valueOf()],o)}if(n&&"toJSON"in o)return i(o.toJSON());const c=[],f=l([u,c],o);for(const d of I0(o))(e||!El(gr(o[d])))&&c.push([i(d),i(o[d])]);return f}case Ps:return l([u,o.toISOString()],o);case _s:{const{source:c,flags:f}=o;return l([u,{source:c,flags:f}],o)}case Ts:{const c=[],f=l([u,c],o);for(const[d,p]of o)(e||!(El(gr(d))||El(gr(p))))&&c.push([i(d),i(p)]);return f}case zs:{const c=[],f=l([u,c],o);for(const d of o)(e||!El(gr(d)))&&c.push(i(d));return f}}const{message:a}=o;return l([u,{name:s,message:a}],o)};return i},Sc=(e,{json:n,lossy:t}={})=>{const r=[];return L0(!(n||t),!!n,new Map,r)(e),r},fi=typeof structuredClone=="function"?(e,n)=>n&&("json"in n||"lossy"in n)?wc(Sc(e,n)):structuredClone(e):(e,n)=>wc(Sc(e,n));function R0(e,n){const t=[{type:"text",value:"↩"}];return n>1&&t.push({type:"element",tagName:"sup",properties:{},children:[{type:"text",value:String(n)}]}),t}function O0(e,n){return"Back to reference "+(e+1)+(n>1?"-"+n:"")}function D0(e){const n=typeof e.options.clobberPrefix=="string"?e.options.clobberPrefix:"user-content-",t=e.options.footnoteBackContent||R0,r=e.options.footnoteBackLabel||O0,l=e.options.footnoteLabel||"Footnotes",i=e.options.footnoteLabelTagName||"h2",o=e.options.footnoteLabelProperties||{className:["sr-only"]},u=[];let s=-1;for(;++s<e.footnoteOrder.length;){const a=e.footnoteById.get(e.footnoteOrder[s]);if(!a)continue;const c=e.all(a),f=String(a.identifier).toUpperCase(),d=lr(f.toLowerCase());let p=0;const k=[],x=e.footnoteCounts.get(f);for(;x!==void 0&&++p<=x;){k.length>0&&k.push({type:"text",value:" "});let m=typeof t=="string"?t:t(s,p);typeof m=="string"&&(m={type:"text",value:m}),k.push({type:"element",tagName:"a",properties:{href:"#"+n+"fnref-"+d+(p>1?"-"+p:""),dataFootnoteBackref:"",ariaLabel:typeof r=="string"?r:r(s,p),className:["data-footnote-backref"]},children:Array.isArray(m)?m:[m]})}const I=c[c.length-1];if(I&&I.type==="element"&&I.tagName==="p"){const m=I.children[I.children.length-1];m&&m.type==="text"?m.value+=" ":I.children.push({type:"text",value:" "}),I.children.push(...k)}else c.push(...k);const h={type:"element",tagName:"li",properties:{id:n+"fn-"+d},children:e.wrap(c,!0)};e.patch(a,h),u.push(h)}if(u.length!==0)return{type:"element",tagName:"section",properties:{dataFootnotes:!0,className:["footnotes"]},children:[{type:"element",tagName:i,properties:{...fi(o),id:"footnote-label"},children:[{type:"text",value:l}]},{type:"text",value:`
-`},{type:"element",tagName:"ol",properties:{},children:e.wrap(u,!0)},{type:"text",value:`
-`}]}}const Ad=function(e){if(e==null)return F0;if(typeof e=="function")return Li(e);if(typeof e=="object")return Array.isArray(e)?M0(e):j0(e);if(typeof e=="string")return A0(e);throw new Error("Expected function, string, or object as test")};function M0(e){const n=[];let t=-1;for(;++t<e.length;)n[t]=Ad(e[t]);return Li(r);function r(...l){let i=-1;for(;++i<n.length;)if(n[i].apply(this,l))return!0;return!1}}function j0(e){const n=e;return Li(t);function t(r){const l=r;let i;for(i in e)if(l[i]!==n[i])return!1;return!0}}function A0(e){return Li(n);function n(t){return t&&t.type===e}}function Li(e){return n;function n(t,r,l){return!!(B0(t)&&e.call(this,t,typeof r=="number"?r:void 0,l||void 0))}}function F0(){return!0}function B0(e){return e!==null&&typeof e=="object"&&"type"in e}const Fd=[],U0=!0,Ec=!1,V0="skip";function H0(e,n,t,r){let l;typeof n=="function"&&typeof t!="function"?(r=t,t=n):l=n;const i=Ad(l),o=r?-1:1;u(e,void 0,[])();function u(s,a,c){const f=s&&typeof s=="object"?s:{};if(typeof f.type=="string"){const p=typeof f.tagName=="string"?f.tagName:typeof f.name=="string"?f.name:void 0;Object.defineProperty(d,"name",{value:"node ("+(s.type+(p?"<"+p+">":""))+")"})}return d;function d(){let p=Fd,k,x,I;if((!n||i(s,a,c[c.length-1]||void 0))&&(p=$0(t(s,c)),p[0]===Ec))return p;if("children"in s&&s.children){const h=s;if(h.children&&p[0]!==V0)for(x=(r?h.children.length:-1)+o,I=c.concat(h);x>-1&&x<h.children.length;){const m=h.children[x];if(k=u(m,x,I)(),k[0]===Ec)return k;x=typeof k[1]=="number"?k[1]:x+o}}return p}}}function $0(e){return Array.isArray(e)?e:typeof e=="number"?[U0,e]:e==null?Fd:[e]}function Bd(e,n,t,r){let l,i,o;typeof n=="function"&&typeof t!="function"?(i=void 0,o=n,l=t):(i=n,o=t,l=r),H0(e,i,u,l);function u(s,a){const c=a[a.length-1],f=c?c.children.indexOf(s):void 0;return o(s,f,c)}}const vu={}.hasOwnProperty,W0={};function Q0(e,n){const t=n||W0,r=new Map,l=new Map,i=new Map,o={..._0,...t.handlers},u={all:a,applyData:K0,definitionById:r,footnoteById:l,footnoteCounts:i,footnoteOrder:[],handlers:o,one:s,options:t,patch:b0,wrap:G0};return Bd(e,function(c){if(c.type==="definition"||c.type==="footnoteDefinition"){const f=c.type==="definition"?r:l,d=String(c.identifier).toUpperCase();f.has(d)||f.set(d,c)}}),u;function s(c,f){const d=c.type,p=u.handlers[d];if(vu.call(u.handlers,d)&&p)return p(u,c,f);if(u.options.passThrough&&u.options.passThrough.includes(d)){if("children"in c){const{children:x,...I}=c,h=fi(I);return h.children=u.all(c),h}return fi(c)}return(u.options.unknownHandler||Y0)(u,c,f)}function a(c){const f=[];if("children"in c){const d=c.children;let p=-1;for(;++p<d.length;){const k=u.one(d[p],c);if(k){if(p&&d[p-1].type==="break"&&(!Array.isArray(k)&&k.type==="text"&&(k.value=Cc(k.value)),!Array.isArray(k)&&k.type==="element")){const x=k.children[0];x&&x.type==="text"&&(x.value=Cc(x.value))}Array.isArray(k)?f.push(...k):f.push(k)}}}return f}}function b0(e,n){e.position&&(n.position=zy(e))}function K0(e,n){let t=n;if(e&&e.data){const r=e.data.hName,l=e.data.hChildren,i=e.data.hProperties;if(typeof r=="string")if(t.type==="element")t.tagName=r;else{const o="children"in t?t.children:[t];t={type:"element",tagName:r,properties:{},children:o}}t.type==="element"&&i&&Object.assign(t.properties,fi(i)),"children"in t&&t.children&&l!==null&&l!==void 0&&(t.children=l)}return t}function Y0(e,n){const t=n.data||{},r="value"in n&&!(vu.call(t,"hProperties")||vu.call(t,"hChildren"))?{type:"text",value:n.value}:{type:"element",tagName:"div",properties:{},children:e.all(n)};return e.patch(n,r),e.applyData(n,r)}function G0(e,n){const t=[];let r=-1;for(n&&t.push({type:"text",value:`
-`});++r<e.length;)r&&t.push({type:"text",value:`
-`}),t.push(e[r]);return n&&e.length>0&&t.push({type:"text",value:`
-`}),t}function Cc(e){let n=0,t=e.charCodeAt(n);for(;t===9||t===32;)n++,t=e.charCodeAt(n);return e.slice(n)}function Nc(e,n){const t=Q0(e,n),r=t.one(e,void 0),l=D0(t),i=Array.isArray(r)?{type:"root",children:r}:r||{type:"root",children:[]};return l&&i.children.push({type:"text",value:`
-`},l),i}function X0(e,n){return e&&"run"in e?async function(t,r){const l=Nc(t,{file:r,...n});await e.run(l,r)}:function(t,r){return Nc(t,{file:r,...e||n})}}function Pc(e){if(e)throw e}var Fl=Object.prototype.hasOwnProperty,Ud=Object.prototype.toString,_c=Object.defineProperty,Tc=Object.getOwnPropertyDescriptor,zc=function(n){return typeof Array.isArray=="function"?Array.isArray(n):Ud.call(n)==="[object Array]"},Ic=function(n){if(!n||Ud.call(n)!=="[object Object]")return!1;var t=Fl.call(n,"constructor"),r=n.constructor&&n.constructor.prototype&&Fl.call(n.constructor.prototype,"isPrototypeOf");if(n.constructor&&!t&&!r)return!1;var l;for(l in n);return typeof l>"u"||Fl.call(n,l)},Lc=function(n,t){_c&&t.name==="__proto__"?_c(n,t.name,{enumerable:!0,configurable:!0,value:t.newValue,writable:!0}):n[t.name]=t.newValue},Rc=function(n,t){if(t==="__proto__")if(Fl.call(n,t)){if(Tc)return Tc(n,t).value}else return;return n[t]},q0=function e(){var n,t,r,l,i,o,u=arguments[0],s=1,a=arguments.length,c=!1;for(typeof u=="boolean"&&(c=u,u=arguments[1]||{},s=2),(u==null||typeof u!="object"&&typeof u!="function")&&(u={});s<a;++s)if(n=arguments[s],n!=null)for(t in n)r=Rc(u,t),l=Rc(n,t),u!==l&&(c&&l&&(Ic(l)||(i=zc(l)))?(i?(i=!1,o=r&&zc(r)?r:[]):o=r&&Ic(r)?r:{},Lc(u,{name:t,newValue:e(c,o,l)})):typeof l<"u"&&Lc(u,{name:t,newValue:l}));return u};const so=Fc(q0);function ku(e){if(typeof e!="object"||e===null)return!1;const n=Object.getPrototypeOf(e);return(n===null||n===Object.prototype||Object.getPrototypeOf(n)===null)&&!(Symbol.toStringTag in e)&&!(Symbol.iterator in e)}function Z0(){const e=[],n={run:t,use:r};return n;function t(...l){let i=-1;const o=l.pop();if(typeof o!="function")throw new TypeError("Expected function as last argument, not "+o);u(null,...l);function u(s,...a){const c=e[++i];let f=-1;if(s){o(s);return}for(;++f<l.length;)(a[f]===null||a[f]===void 0)&&(a[f]=l[f]);l=a,c?J0(c,u)(...a):o(null,...a)}}function r(l){if(typeof l!="function")throw new TypeError("Expected `middelware` to be a function, not "+l);return e.push(l),n}}function J0(e,n){let t;return r;function r(...o){const u=e.length>o.length;let s;u&&o.push(l);try{s=e.apply(this,o)}catch(a){const c=a;if(u&&t)throw c;return l(c)}u||(s&&s.then&&typeof s.then=="function"?s.then(i,l):s instanceof Error?l(s):i(s))}function l(o,...u){t||(t=!0,n(o,...u))}function i(o){l(null,o)}}const vn={basename:ek,dirname:nk,extname:tk,join:rk,sep:"/"};function ek(e,n){if(n!==void 0&&typeof n!="string")throw new TypeError('"ext" argument must be a string');rl(e);let t=0,r=-1,l=e.length,i;if(n===void 0||n.length===0||n.length>e.length){for(;l--;)if(e.codePointAt(l)===47){if(i){t=l+1;break}}else r<0&&(i=!0,r=l+1);return r<0?"":e.slice(t,r)}if(n===e)return"";let o=-1,u=n.length-1;for(;l--;)if(e.codePointAt(l)===47){if(i){t=l+1;break}}else o<0&&(i=!0,o=l+1),u>-1&&(e.codePointAt(l)===n.codePointAt(u--)?u<0&&(r=l):(u=-1,r=o));return t===r?r=o:r<0&&(r=e.length),e.slice(t,r)}function nk(e){if(rl(e),e.length===0)return".";let n=-1,t=e.length,r;for(;--t;)if(e.codePointAt(t)===47){if(r){n=t;break}}else r||(r=!0);return n<0?e.codePointAt(0)===47?"/":".":n===1&&e.codePointAt(0)===47?"//":e.slice(0,n)}function tk(e){rl(e);let n=e.length,t=-1,r=0,l=-1,i=0,o;for(;n--;){const u=e.codePointAt(n);if(u===47){if(o){r=n+1;break}continue}t<0&&(o=!0,t=n+1),u===46?l<0?l=n:i!==1&&(i=1):l>-1&&(i=-1)}return l<0||t<0||i===0||i===1&&l===t-1&&l===r+1?"":e.slice(l,t)}function rk(...e){let n=-1,t;for(;++n<e.length;)rl(e[n]),e[n]&&(t=t===void 0?e[n]:t+"/"+e[n]);return t===void 0?".":lk(t)}function lk(e){rl(e);const n=e.codePointAt(0)===47;let t=ik(e,!n);return t.length===0&&!n&&(t="."),t.length>0&&e.codePointAt(e.length-1)===47&&(t+="/"),n?"/"+t:t}function ik(e,n){let t="",r=0,l=-1,i=0,o=-1,u,s;for(;++o<=e.length;){if(o<e.length)u=e.codePointAt(o);else{if(u===47)break;u=47}if(u===47){if(!(l===o-1||i===1))if(l!==o-1&&i===2){if(t.length<2||r!==2||t.codePointAt(t.length-1)!==46||t.codePointAt(t.length-2)!==46){if(t.length>2){if(s=t.lastIndexOf("/"),s!==t.length-1){s<0?(t="",r=0):(t=t.slice(0,s),r=t.length-1-t.lastIndexOf("/")),l=o,i=0;continue}}else if(t.length>0){t="",r=0,l=o,i=0;continue}}n&&(t=t.length>0?t+"/..":"..",r=2)}else t.length>0?t+="/"+e.slice(l+1,o):t=e.slice(l+1,o),r=o-l-1;l=o,i=0}else u===46&&i>-1?i++:i=-1}return t}function rl(e){if(typeof e!="string")throw new TypeError("Path must be a string. Received "+JSON.stringify(e))}const ok={cwd:uk};function uk(){return"/"}function xu(e){return!!(e!==null&&typeof e=="object"&&"href"in e&&e.href&&"protocol"in e&&e.protocol&&e.auth===void 0)}function sk(e){if(typeof e=="string")e=new URL(e);else if(!xu(e)){const n=new TypeError('The "path" argument must be of type string or an instance of URL. Received `'+e+"`");throw n.code="ERR_INVALID_ARG_TYPE",n}if(e.protocol!=="file:"){const n=new TypeError("The URL must be of scheme file");throw n.code="ERR_INVALID_URL_SCHEME",n}return ak(e)}function ak(e){if(e.hostname!==""){const r=new TypeError('File URL host must be "localhost" or empty on darwin');throw r.code="ERR_INVALID_FILE_URL_HOST",r}const n=e.pathname;let t=-1;for(;++t<n.length;)if(n.codePointAt(t)===37&&n.codePointAt(t+1)===50){const r=n.codePointAt(t+2);if(r===70||r===102){const l=new TypeError("File URL path must not include encoded / characters");throw l.code="ERR_INVALID_FILE_URL_PATH",l}}return decodeURIComponent(n)}const ao=["history","path","basename","stem","extname","dirname"];class Vd{constructor(n){let t;n?xu(n)?t={path:n}:typeof n=="string"||ck(n)?t={value:n}:t=n:t={},this.cwd="cwd"in t?"":ok.cwd(),this.data={},this.history=[],this.messages=[],this.value,this.map,this.result,this.stored;let r=-1;for(;++r<ao.length;){const i=ao[r];i in t&&t[i]!==void 0&&t[i]!==null&&(this[i]=i==="history"?[...t[i]]:t[i])}let l;for(l in t)ao.includes(l)||(this[l]=t[l])}get basename(){return typeof this.path=="string"?vn.basename(this.path):void 0}set basename(n){fo(n,"basename"),co(n,"basename"),this.path=vn.join(this.dirname||"",n)}get dirname(){return typeof this.path=="string"?vn.dirname(this.path):void 0}set dirname(n){Oc(this.basename,"dirname"),this.path=vn.join(n||"",this.basename)}get extname(){return typeof this.path=="string"?vn.extname(this.path):void 0}set extname(n){if(co(n,"extname"),Oc(this.dirname,"extname"),n){if(n.codePointAt(0)!==46)throw new Error("`extname` must start with `.`");if(n.includes(".",1))throw new Error("`extname` cannot contain multiple dots")}this.path=vn.join(this.dirname,this.stem+(n||""))}get path(){return this.history[this.history.length-1]}set path(n){xu(n)&&(n=sk(n)),fo(n,"path"),this.path!==n&&this.history.push(n)}get stem(){return typeof this.path=="string"?vn.basename(this.path,this.extname):void 0}set stem(n){fo(n,"stem"),co(n,"stem"),this.path=vn.join(this.dirname||"",n+(this.extname||""))}fail(n,t,r){const l=this.message(n,t,r);throw l.fatal=!0,l}info(n,t,r){const l=this.message(n,t,r);return l.fatal=void 0,l}message(n,t,r){const l=new ze(n,t,r);return this.path&&(l.name=this.path+":"+l.name,l.file=this.path),l.fatal=!1,this.messages.push(l),l}toString(n){return this.value===void 0?"":typeof this.value=="string"?this.value:new TextDecoder(n||void 0).decode(this.value)}}function co(e,n){if(e&&e.includes(vn.sep))throw new Error("`"+n+"` cannot be a path: did not expect `"+vn.sep+"`")}function fo(e,n){if(!e)throw new Error("`"+n+"` cannot be empty")}function Oc(e,n){if(!e)throw new Error("Setting `"+n+"` requires `path` to be set too")}function ck(e){return!!(e&&typeof e=="object"&&"byteLength"in e&&"byteOffset"in e)}const fk=function(e){const r=this.constructor.prototype,l=r[e],i=function(){return l.apply(i,arguments)};return Object.setPrototypeOf(i,r),i},pk={}.hasOwnProperty;class Is extends fk{constructor(){super("copy"),this.Compiler=void 0,this.Parser=void 0,this.attachers=[],this.compiler=void 0,this.freezeIndex=-1,this.frozen=void 0,this.namespace={},this.parser=void 0,this.transformers=Z0()}copy(){const n=new Is;let t=-1;for(;++t<this.attachers.length;){const r=this.attachers[t];n.use(...r)}return n.data(so(!0,{},this.namespace)),n}data(n,t){return typeof n=="string"?arguments.length===2?(mo("data",this.frozen),this.namespace[n]=t,this):pk.call(this.namespace,n)&&this.namespace[n]||void 0:n?(mo("data",this.frozen),this.namespace=n,this):this.namespace}freeze(){if(this.frozen)return this;const n=this;for(;++this.freezeIndex<this.attachers.length;){const[t,...r]=this.attachers[this.freezeIndex];if(r[0]===!1)continue;r[0]===!0&&(r[0]=void 0);const l=t.call(n,...r);typeof l=="function"&&this.transformers.use(l)}return this.frozen=!0,this.freezeIndex=Number.POSITIVE_INFINITY,this}parse(n){this.freeze();const t=Cl(n),r=this.parser||this.Parser;return po("parse",r),r(String(t),t)}process(n,t){const r=this;return this.freeze(),po("process",this.parser||this.Parser),ho("process",this.compiler||this.Compiler),t?l(void 0,t):new Promise(l);function l(i,o){const u=Cl(n),s=r.parse(u);r.run(s,u,function(c,f,d){if(c||!f||!d)return a(c);const p=f,k=r.stringify(p,d);mk(k)?d.value=k:d.result=k,a(c,d)});function a(c,f){c||!f?o(c):i?i(f):t(void 0,f)}}}processSync(n){let t=!1,r;return this.freeze(),po("processSync",this.parser||this.Parser),ho("processSync",this.compiler||this.Compiler),this.process(n,l),Mc("processSync","process",t),r;function l(i,o){t=!0,Pc(i),r=o}}run(n,t,r){Dc(n),this.freeze();const l=this.transformers;return!r&&typeof t=="function"&&(r=t,t=void 0),r?i(void 0,r):new Promise(i);function i(o,u){const s=Cl(t);l.run(n,s,a);function a(c,f,d){const p=f||n;c?u(c):o?o(p):r(void 0,p,d)}}}runSync(n,t){let r=!1,l;return this.run(n,t,i),Mc("runSync","run",r),l;function i(o,u){Pc(o),l=u,r=!0}}stringify(n,t){this.freeze();const r=Cl(t),l=this.compiler||this.Compiler;return ho("stringify",l),Dc(n),l(n,r)}use(n,...t){const r=this.attachers,l=this.namespace;if(mo("use",this.frozen),n!=null)if(typeof n=="function")s(n,t);else if(typeof n=="object")Array.isArray(n)?u(n):o(n);else throw new TypeError("Expected usable value, not `"+n+"`");return this;function i(a){if(typeof a=="function")s(a,[]);else if(typeof a=="object")if(Array.isArray(a)){const[c,...f]=a;s(c,f)}else o(a);else throw new TypeError("Expected usable value, not `"+a+"`")}function o(a){if(!("plugins"in a)&&!("settings"in a))throw new Error("Expected usable value but received an empty preset, which is probably a mistake: presets typically come with `plugins` and sometimes with `settings`, but this has neither");u(a.plugins),a.settings&&(l.settings=so(!0,l.settings,a.settings))}function u(a){let c=-1;if(a!=null)if(Array.isArray(a))for(;++c<a.length;){const f=a[c];i(f)}else throw new TypeError("Expected a list of plugins, not `"+a+"`")}function s(a,c){let f=-1,d=-1;for(;++f<r.length;)if(r[f][0]===a){d=f;break}if(d===-1)r.push([a,...c]);else if(c.length>0){let[p,...k]=c;const x=r[d][1];ku(x)&&ku(p)&&(p=so(!0,x,p)),r[d]=[a,p,...k]}}}}const dk=new Is().freeze();function po(e,n){if(typeof n!="function")throw new TypeError("Cannot `"+e+"` without `parser`")}function ho(e,n){if(typeof n!="function")throw new TypeError("Cannot `"+e+"` without `compiler`")}function mo(e,n){if(n)throw new Error("Cannot call `"+e+"` on a frozen processor.\nCreate a new processor first, by calling it: use `processor()` instead of `processor`.")}function Dc(e){if(!ku(e)||typeof e.type!="string")throw new TypeError("Expected node, got `"+e+"`")}function Mc(e,n,t){if(!t)throw new Error("`"+e+"` finished async. Use `"+n+"` instead")}function Cl(e){return hk(e)?e:new Vd(e)}function hk(e){return!!(e&&typeof e=="object"&&"message"in e&&"messages"in e)}function mk(e){return typeof e=="string"||gk(e)}function gk(e){return!!(e&&typeof e=="object"&&"byteLength"in e&&"byteOffset"in e)}const yk="https://github.com/remarkjs/react-markdown/blob/main/changelog.md",jc=[],Ac={allowDangerousHtml:!0},vk=/^(https?|ircs?|mailto|xmpp)$/i,kk=[{from:"astPlugins",id:"remove-buggy-html-in-markdown-parser"},{from:"allowDangerousHtml",id:"remove-buggy-html-in-markdown-parser"},{from:"allowNode",id:"replace-allownode-allowedtypes-and-disallowedtypes",to:"allowElement"},{from:"allowedTypes",id:"replace-allownode-allowedtypes-and-disallowedtypes",to:"allowedElements"},{from:"className",id:"remove-classname"},{from:"disallowedTypes",id:"replace-allownode-allowedtypes-and-disallowedtypes",to:"disallowedElements"},{from:"escapeHtml",id:"remove-buggy-html-in-markdown-parser"},{from:"includeElementIndex",id:"#remove-includeelementindex"},{from:"includeNodeIndex",id:"change-includenodeindex-to-includeelementindex"},{from:"linkTarget",id:"remove-linktarget"},{from:"plugins",id:"change-plugins-to-remarkplugins",to:"remarkPlugins"},{from:"rawSourcePos",id:"#remove-rawsourcepos"},{from:"renderers",id:"change-renderers-to-components",to:"components"},{from:"source",id:"change-source-to-children",to:"children"},{from:"sourcePos",id:"#remove-sourcepos"},{from:"transformImageUri",id:"#add-urltransform",to:"urlTransform"},{from:"transformLinkUri",id:"#add-urltransform",to:"urlTransform"}];function xk(e){const n=wk(e),t=Sk(e);return Ek(n.runSync(n.parse(t),t),e)}function wk(e){const n=e.rehypePlugins||jc,t=e.remarkPlugins||jc,r=e.remarkRehypeOptions?{...e.remarkRehypeOptions,...Ac}:Ac;return dk().use(n0).use(t).use(X0,r).use(n)}function Sk(e){const n=e.children||"",t=new Vd;return typeof n=="string"&&(t.value=n),t}function Ek(e,n){const t=n.allowedElements,r=n.allowElement,l=n.components,i=n.disallowedElements,o=n.skipHtml,u=n.unwrapDisallowed,s=n.urlTransform||Ck;for(const c of kk)Object.hasOwn(n,c.from)&&(""+c.from+(c.to?"use `"+c.to+"` instead":"remove it")+yk+c.id,void 0);return Bd(e,a),Dy(e,{Fragment:C.Fragment,components:l,ignoreInvalidStyle:!0,jsx:C.jsx,jsxs:C.jsxs,passKeys:!0,passNode:!0});function a(c,f,d){if(c.type==="raw"&&d&&typeof f=="number")return o?d.children.splice(f,1):d.children[f]={type:"text",value:c.value},f;if(c.type==="element"){let p;for(p in io)if(Object.hasOwn(io,p)&&Object.hasOwn(c.properties,p)){const k=c.properties[p],x=io[p];(x===null||x.includes(c.tagName))&&(c.properties[p]=s(String(k||""),p,c))}}if(c.type==="element"){let p=t?!t.includes(c.tagName):i?i.includes(c.tagName):!1;if(!p&&r&&typeof f=="number"&&(p=!r(c,f,d)),p&&d&&typeof f=="number")return u&&c.children?d.children.splice(f,1,...c.children):d.children.splice(f,1),f}}}function Ck(e){const n=e.indexOf(":"),t=e.indexOf("?"),r=e.indexOf("#"),l=e.indexOf("/");return n===-1||l!==-1&&n>l||t!==-1&&n>t||r!==-1&&n>r||vk.test(e.slice(0,n))?e:""}const Nk="http://localhost:8000/api/chat/",go=()=>({id:1,role:"assistant",text:`Hello! I'm **GangaBot**, your AI assistant for Ganga — CERN's job management framework.
-
-Ask me anything about Ganga or describe the job you want to run, and I'll generate the commands for you.`,timestamp:new Date});function Pk(){const[e,n]=W.useState([go()]),[t,r]=W.useState(""),[l,i]=W.useState(!1),[o,u]=W.useState(null),[s,a]=W.useState(()=>localStorage.getItem("gangaflow_session_id")),[c,f]=W.useState(!1),d=W.useRef(null),p=W.useRef(null);W.useEffect(()=>{var h;(h=d.current)==null||h.scrollIntoView({behavior:"smooth"})},[e]),W.useEffect(()=>{const h=p.current;h&&(h.style.height="auto",h.style.height=Math.min(h.scrollHeight,160)+"px")},[t]),W.useEffect(()=>{s&&fetch(`http://localhost:8000/api/chat/${s}/history/`).then(h=>h.ok?h.json():null).then(h=>{if(!h||!h.messages.length)return;const m=h.messages.map((y,S)=>({id:S+10,role:y.role,text:y.content,timestamp:new Date(y.timestamp)}));n([go(),...m])}).catch(()=>{})},[]);const k=async h=>{h==null||h.preventDefault();const m=t.trim();if(!m||l)return;u(null);const y={id:Date.now(),role:"user",text:m,timestamp:new Date},S={id:Date.now()+1,role:"assistant",text:"…",pending:!0,timestamp:new Date};n(N=>[...N,y,S]),r(""),i(!0);try{const N=await fetch(Nk,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({message:m,session_id:s})}),w=await N.json();if(!N.ok)throw new Error(w.error||`Server error ${N.status}`);w.session_id&&w.session_id!==s&&(a(w.session_id),localStorage.setItem("gangaflow_session_id",w.session_id)),n(T=>T.map(R=>R.pending?{...R,text:w.reply,pending:!1}:R)),window.dispatchEvent(new CustomEvent("gangaflow:llm-status",{detail:{connected:!0}}))}catch(N){u(N.message),n(w=>w.filter(T=>!T.pending)),window.dispatchEvent(new CustomEvent("gangaflow:llm-status",{detail:{connected:!1}}))}finally{i(!1)}},x=h=>{h.key==="Enter"&&!h.shiftKey&&(h.preventDefault(),k())},I=()=>{n([go()]),a(null),u(null),localStorage.removeItem("gangaflow_session_id")};return C.jsxs("div",{className:`chat-pane ${c?"maximised":""}`,children:[C.jsxs("div",{className:"pane-header chat-header",children:[C.jsxs("div",{className:"pane-header-left",children:[C.jsx("div",{className:"bot-avatar-small",children:C.jsx(ed,{size:13,strokeWidth:2})}),C.jsx("span",{className:"pane-header-title",children:"GangaBot"}),C.jsx("span",{className:"chat-model-badge",children:"GPT-OSS-120b"}),s&&C.jsx("span",{className:"session-badge",title:`Session: ${s}`,children:"session active"})]}),C.jsxs("div",{className:"pane-header-right",children:[C.jsx("button",{className:"header-btn",onClick:I,title:"New session",children:C.jsx(Rg,{size:13})}),C.jsx("button",{className:"header-btn",onClick:()=>f(h=>!h),title:c?"Restore":"Maximise",children:c?C.jsx(rd,{size:13}):C.jsx(td,{size:13})})]})]}),C.jsxs("div",{className:"chat-messages",children:[e.map(h=>C.jsx(Tk,{message:h},h.id)),o&&C.jsxs("div",{className:"chat-error",children:[C.jsx(_g,{size:13}),C.jsx("span",{children:o})]}),C.jsx("div",{ref:d})]}),C.jsxs("div",{className:"chat-input-area",children:[C.jsxs("form",{className:"chat-input-form",onSubmit:k,children:[C.jsx("textarea",{ref:p,className:"chat-input",value:t,onChange:h=>r(h.target.value),onKeyDown:x,placeholder:l?"GangaBot is thinking…":"Ask GangaBot… (Shift+Enter for new line)",rows:1,spellCheck:!1,disabled:l}),C.jsx("button",{type:"submit",className:`send-btn ${t.trim()&&!l?"active":""}`,disabled:!t.trim()||l,title:"Send (Enter)",children:C.jsx(Lg,{size:15,strokeWidth:2.5})})]}),C.jsx("p",{className:"chat-hint",children:"GangaBot can write and execute Ganga code directly in the terminal."})]})]})}function _k({code:e}){const[n,t]=W.useState(!1),[r,l]=W.useState(!1),i=()=>{navigator.clipboard.writeText(e).then(()=>{t(!0),setTimeout(()=>t(!1),1500)})},o=()=>{window.dispatchEvent(new CustomEvent("gangaflow:run-code",{detail:{code:e}})),l(!0),setTimeout(()=>l(!1),1500)};return C.jsxs("div",{className:"msg-code-block",children:[C.jsxs("div",{className:"msg-code-header",children:[C.jsx(ms,{size:11}),C.jsx("span",{children:"ganga"}),C.jsxs("div",{className:"code-block-actions",children:[C.jsxs("button",{className:`code-action-btn code-run-btn${r?" code-ran":""}`,onClick:o,title:"Run in terminal",children:[r?C.jsx(au,{size:11}):C.jsx(zg,{size:11}),C.jsx("span",{children:r?"Sent!":"Run"})]}),C.jsx("button",{className:`code-action-btn code-copy-btn${n?" code-copied":""}`,onClick:i,title:"Copy code",children:n?C.jsx(au,{size:11}):C.jsx(nd,{size:11})})]})]}),C.jsx("pre",{children:C.jsx("code",{children:e})})]})}function Tk({message:e}){const[n,t]=W.useState(!1),r=e.role==="user",l=e.role==="assistant",i=()=>{navigator.clipboard.writeText(e.text).then(()=>{t(!0),setTimeout(()=>t(!1),1500)})},o={code({node:u,inline:s,className:a,children:c,...f}){const d=String(c).replace(/\n$/,"");return s?C.jsx("code",{className:"msg-inline-code",...f,children:d}):C.jsx(_k,{code:d})}};return C.jsxs("div",{className:`chat-message ${r?"user":"bot"}`,children:[l&&C.jsx("div",{className:"msg-avatar bot-avatar",children:C.jsx(ed,{size:14,strokeWidth:2})}),C.jsxs("div",{className:"msg-bubble-wrap",children:[C.jsx("div",{className:`msg-bubble ${r?"bubble-user":"bubble-bot"}`,children:C.jsx("div",{className:"msg-body",children:e.pending?C.jsxs("span",{className:"typing-indicator",children:[C.jsx("span",{}),C.jsx("span",{}),C.jsx("span",{})]}):C.jsx(xk,{components:o,children:e.text})})}),C.jsxs("div",{className:`msg-meta ${r?"meta-right":"meta-left"}`,children:[C.jsx("span",{className:"msg-time",children:e.timestamp.toLocaleTimeString([],{hour:"2-digit",minute:"2-digit"})}),l&&!e.pending&&C.jsx("button",{className:"msg-copy-btn",onClick:i,title:"Copy message",children:n?C.jsx(au,{size:11}):C.jsx(nd,{size:11})})]})]}),r&&C.jsx("div",{className:"msg-avatar user-avatar",children:C.jsx(Og,{size:14,strokeWidth:2})})]})}function zk(){return C.jsxs("div",{className:"app-shell",children:[C.jsx(Dg,{}),C.jsxs("div",{className:"main-layout",children:[C.jsx(jg,{}),C.jsx("div",{className:"pane-divider"}),C.jsx(Pk,{})]})]})}Zp(document.getElementById("root")).render(C.jsx(zk,{}));
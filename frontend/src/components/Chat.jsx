@@ -1,9 +1,10 @@
 import { useState, useRef, useEffect } from 'react'
 import ReactMarkdown from 'react-markdown'
 import { Bot, User, Copy, Check, Terminal, Send, Trash2, Maximize2, Minimize2, AlertCircle, Play } from 'lucide-react'
+import { TERMINAL_ID } from './Terminal'
 import './Chat.css'
 
-const API_URL = 'http://localhost:8000/api/chat/'
+const API_URL = 'http://localhost:8000/api/chat/stream/'
 
 // ── Boot message ──────────────────────────────────────────────────────────────
 const bootMessage = () => ({
@@ -71,27 +72,56 @@ export default function Chat() {
     setLoading(true)
 
     try {
+      // The backend pipes each finished code block into the terminal as it streams
       const res = await fetch(API_URL, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ message: text, session_id: sessionId }),
+        body: JSON.stringify({ message: text, session_id: sessionId, terminal_id: TERMINAL_ID }),
       })
 
-      const data = await res.json()
-
       if (!res.ok) {
+        const data = await res.json().catch(() => ({}))
         throw new Error(data.error || `Server error ${res.status}`)
       }
 
-      // Persist session ID in localStorage for page refreshes
-      if (data.session_id && data.session_id !== sessionId) {
-        setSessionId(data.session_id)
-        localStorage.setItem('gangaflow_session_id', data.session_id)
+      // Newline-delimited JSON events: session → delta… / block… → done | error
+      const reader  = res.body.getReader()
+      const decoder = new TextDecoder()
+      let buffer = ''
+      let reply  = ''
+      for (;;) {
+        const { value, done } = await reader.read()
+        if (done) break
+        buffer += decoder.decode(value, { stream: true })
+        const events = buffer.split('\n')
+        buffer = events.pop()   // last segment may be incomplete
+
+        for (const line of events) {
+          if (!line.trim()) continue
+          const evt = JSON.parse(line)
+          if (evt.type === 'session' && evt.session_id !== sessionId) {
+            // Persist session ID in localStorage for page refreshes
+            setSessionId(evt.session_id)
+            localStorage.setItem('gangaflow_session_id', evt.session_id)
+          } else if (evt.type === 'delta') {
+            reply += evt.text
+          } else if (evt.type === 'done') {
+            reply = evt.reply
+          } else if (evt.type === 'error') {
+            throw new Error(evt.error)
+          }
+        }
+
+        // Grow the pending bubble as the reply arrives
+        const partial = reply
+        if (partial) {
+          setMessages(prev => prev.map(m => m.pending ? { ...m, text: partial, streaming: true } : m))
+        }
       }
 
-      // Replace the pending bubble with the real reply
+      // Finalise the bubble with the complete reply
       setMessages(prev => prev.map(m =>
-        m.pending ? { ...m, text: data.reply, pending: false } : m
+        m.pending ? { ...m, text: reply, pending: false, streaming: false } : m
       ))
       window.dispatchEvent(new CustomEvent('gangaflow:llm-status', { detail: { connected: true } }))
     } catch (err) {
@@ -277,7 +307,7 @@ function ChatMessage({ message }) {
       <div className="msg-bubble-wrap">
         <div className={`msg-bubble ${isUser ? 'bubble-user' : 'bubble-bot'}`}>
           <div className="msg-body">
-            {message.pending ? (
+            {message.pending && !message.streaming ? (
               <span className="typing-indicator">
                 <span /><span /><span />
               </span>
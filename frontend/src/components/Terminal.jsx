@@ -8,6 +8,10 @@ import './Terminal.css'
 
 const WS_URL = 'ws://localhost:8000/ws/terminal/'
 
+// Identifies this terminal to the backend so GangaBot's streamed code blocks
+// can be piped straight into its PTY (Chat sends it with each message)
+export const TERMINAL_ID = crypto.randomUUID()
+
 // Strip any residual ANSI escape codes the backend might have missed
 const ANSI_RE = /\x1B\[[0-?]*[ -/]*[@-~]|\x1B[()][AB012]|\x1B=|\r/g
 const stripAnsi = (str) => str.replace(ANSI_RE, '')
@@ -56,7 +60,7 @@ export default function Terminal() {
     appendLine('info', '─── GangaFlow Terminal ──────────────────────────────')
     appendLine('info', `Connecting to shell at ${WS_URL} …`)
 
-    const ws = new WebSocket(WS_URL)
+    const ws = new WebSocket(`${WS_URL}?id=${TERMINAL_ID}`)
     wsRef.current = ws
 
     ws.onopen = () => {
@@ -113,10 +117,8 @@ export default function Terminal() {
         appendLine('error', 'Terminal not connected — cannot run code.')
         return
       }
-      const lines = evt.detail.code.split('\n')
-      lines.forEach(line => ws.send(line + '\r'))
-      // Send a blank line to close any open Python block
-      ws.send('\r')
+      // Send the whole block in one write, plus a blank line to close any open Python block
+      ws.send(evt.detail.code.split('\n').join('\r') + '\r\r')
     }
     window.addEventListener('gangaflow:run-code', handler)
     return () => window.removeEventListener('gangaflow:run-code', handler)
@@ -126,7 +128,11 @@ export default function Terminal() {
   const handleSubmit = (e) => {
     e.preventDefault()
     const cmd = input.trim()
-    if (!cmd) return
+    if (!cmd) {
+      // Bare Enter — also runs the oldest GangaBot block waiting for confirmation
+      if (status === STATUS.CONNECTED && wsRef.current) wsRef.current.send('\r')
+      return
+    }
 
     // Handle clear locally — PTY clear output is stripped by the ANSI filter
     if (cmd === 'clear' || cmd === 'cls') {
@@ -3,6 +3,10 @@ import react from '@vitejs/plugin-react'
 
 export default defineConfig({
   plugins: [react()],
+  build: {
+    // .vite/manifest.json lists the content-hashed files Django caches forever
+    manifest: true,
+  },
   server: {
     port: 3000,
     proxy: {
@@ -10,11 +10,19 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+from dotenv import load_dotenv
+
+from assistant.assets import add_headers, immutable_file_test
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+load_dotenv(BASE_DIR / ".env")
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
@@ -45,7 +53,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",   # ← must be first
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "assistant.middleware.FrontendWhiteNoiseMiddleware",   # WhiteNoise, minus .vite/
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -75,13 +83,50 @@ TEMPLATES = [
 WSGI_APPLICATION = "ganga_backend.wsgi.application"
 ASGI_APPLICATION  = "ganga_backend.asgi.application"
 
-# Channel layer — in-memory for development
-# Switch to channels_redis for production
-CHANNEL_LAYERS = {
-    "default": {
-        "BACKEND": "channels.layers.InMemoryChannelLayer",
+# Channel layer + PTY registry — chosen with GANGAFLOW_CHANNEL_LAYER in .env:
+#   memory  one Daphne worker (default)
+#   sqlite  several workers on one host, shared through a local SQLite file
+#   redis   several workers on one or more hosts (pip install channels-redis)
+# Every worker must use the same setting; see `manage.py runworkers`.
+CHANNEL_LAYER_KIND = os.environ.get("GANGAFLOW_CHANNEL_LAYER", "memory")
+CHANNEL_LAYER_PATH = os.environ.get("GANGAFLOW_CHANNEL_LAYER_PATH", str(BASE_DIR / "channel_layer.sqlite3"))
+REDIS_URL          = os.environ.get("GANGAFLOW_REDIS_URL", "redis://localhost:6379/0")
+
+if CHANNEL_LAYER_KIND == "sqlite":
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "assistant.layers.SQLiteChannelLayer",
+            "CONFIG": {"path": CHANNEL_LAYER_PATH},
+        }
     }
-}
+    PTY_REGISTRY = {
+        "BACKEND": "assistant.registry.SQLitePtyRegistry",
+        "CONFIG": {"path": CHANNEL_LAYER_PATH},
+    }
+elif CHANNEL_LAYER_KIND == "redis":
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "channels_redis.core.RedisChannelLayer",
+            "CONFIG": {"hosts": [REDIS_URL]},
+        }
+    }
+    PTY_REGISTRY = {
+        "BACKEND": "assistant.registry.RedisPtyRegistry",
+        "CONFIG": {"url": REDIS_URL},
+    }
+elif CHANNEL_LAYER_KIND == "memory":
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "channels.layers.InMemoryChannelLayer",
+        }
+    }
+    PTY_REGISTRY = {
+        "BACKEND": "assistant.registry.MemoryPtyRegistry",
+    }
+else:
+    raise ImproperlyConfigured(
+        f"GANGAFLOW_CHANNEL_LAYER must be 'memory', 'sqlite' or 'redis', not {CHANNEL_LAYER_KIND!r}."
+    )
 
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
@@ -140,6 +185,11 @@ STATIC_URL = "static/"
 WHITENOISE_ROOT = BASE_DIR / "frontend" / "dist"
 WHITENOISE_INDEX_FILE = True   # serve index.html at /
 
+# `manage.py compressassets` adds .gz/.br variants. The hashed files in Vite's
+# .vite/manifest.json are cached forever; everything else is always revalidated
+WHITENOISE_IMMUTABLE_FILE_TEST = immutable_file_test
+WHITENOISE_ADD_HEADERS_FUNCTION = add_headers
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 